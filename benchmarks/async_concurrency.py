@@ -0,0 +1,211 @@
+"""
+Concurrency scaling of the threaded WSGI mode against the ASGI mode of
+serve.py, one process each, at an increasing number of open connections.
+
+The load mimics a check-in rush: every client sends, for 'seconds', a
+check-in of a seeded attendee then a read of the event and a page of its
+attendees, keeping its connection open when the server allows it. A
+repeated check-in (409) counts as an answer.
+Connections the server never answers within 'timeout' are reported as
+starved. The WSGI mode closes the connection after each response, so its
+clients connect again for every request and wait in the accept queue and
+then for one of its threads.
+
+Needs uvicorn and aiosqlite for the ASGI mode.
+
+Usage: python -m benchmarks.async_concurrency [--connections 8 32 128] [--threads 8]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import signal
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.server_workers import ROOT, free_port, request, wait_until_ready
+
+ANSWERED = (200, 304, 409)
+
+
+class Client:
+    """One HTTP/1.1 connection, opened again whenever the server closes it"""
+
+    def __init__(self, port: int):
+        self.port = port
+        self.reader = self.writer = None
+
+    async def send(self, method: str, path: str) -> int:
+        if self.writer is None:
+            self.reader, self.writer = await asyncio.open_connection(
+                "127.0.0.1", self.port
+            )
+        self.writer.write(
+            f"{method} {path} HTTP/1.1\r\nHost: bench\r\n"
+            "Content-Length: 0\r\n\r\n".encode()
+        )
+        await self.writer.drain()
+        head = await self.reader.readuntil(b"\r\n\r\n")
+        lines = head.decode("latin-1").split("\r\n")
+        headers = {}
+        for line in lines[1:]:
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip()
+        await self.reader.readexactly(int(headers.get("content-length", 0)))
+        if headers.get("connection", "").lower() == "close":
+            self.close()
+        return int(lines[0].split()[1])
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+            self.reader = self.writer = None
+
+
+async def connection_loop(port, event_id, attendee_ids, deadline, timeout, stats):
+    client = Client(port)
+    served = 0
+    try:
+        paths = iter(attendee_ids)
+        while time.monotonic() < deadline:
+            attendee_id = next(paths, attendee_ids[0])
+            for method, path in (
+                ("POST", f"/attendees/{attendee_id}/check-in"),
+                ("GET", f"/events/{event_id}"),
+                ("GET", f"/events/{event_id}/attendees?limit=20"),
+            ):
+                started = time.perf_counter()
+                status = await asyncio.wait_for(client.send(method, path), timeout)
+                stats["latencies"].append(time.perf_counter() - started)
+                if status in ANSWERED:
+                    served += 1
+                else:
+                    stats["errors"] += 1
+    except asyncio.TimeoutError:
+        stats["starved"] += served == 0
+        stats["errors"] += served > 0
+    except (OSError, asyncio.IncompleteReadError):
+        stats["errors"] += 1
+    finally:
+        client.close()
+
+
+async def load(port, event_id, attendee_ids, connections, seconds, timeout):
+    stats = {"latencies": [], "errors": 0, "starved": 0}
+    deadline = time.monotonic() + seconds
+    share = max(1, len(attendee_ids) // connections)
+    await asyncio.gather(
+        *(
+            connection_loop(
+                port,
+                event_id,
+                attendee_ids[index * share : (index + 1) * share] or attendee_ids,
+                deadline,
+                timeout,
+                stats,
+            )
+            for index in range(connections)
+        )
+    )
+    return stats
+
+
+def seed(port: int, attendees: int) -> tuple[str, list[str]]:
+    # pylint: disable-next=import-outside-toplevel
+    import http.client
+
+    connection = http.client.HTTPConnection("127.0.0.1", port)
+    _, data = request(
+        connection, "POST", "/events", {"title": "Check-in rush", "slug": "rush"}
+    )
+    event_id = json.loads(data)["created_event"]["event_id"]
+    attendee_ids = []
+    for index in range(attendees):
+        _, data = request(
+            connection,
+            "POST",
+            f"/events/{event_id}/attendee",
+            {"name": "Seeded Attendee", "email": f"seed{index}@gmail.com"},
+        )
+        attendee_ids.append(json.loads(data)["attendee"]["attendee_id"])
+    connection.close()
+    return event_id, attendee_ids
+
+
+def run(mode: str, connections: int, args) -> dict:
+    with tempfile.TemporaryDirectory() as directory:
+        port = free_port()
+        environ = {
+            **os.environ,
+            "PYTHONPATH": str(ROOT),
+            "DATABASE_URL": f"sqlite:///{Path(directory) / 'bench.db'}",
+            "SERVER_HOST": "127.0.0.1",
+            "SERVER_PORT": str(port),
+            "SERVER_MODE": mode,
+            "SERVER_WORKERS": "1",
+            "SERVER_THREADS": str(args.threads),
+        }
+        server = subprocess.Popen(
+            [sys.executable, str(ROOT / "serve.py")],
+            env=environ,
+            cwd=directory,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        try:
+            wait_until_ready(port)
+            event_id, attendee_ids = seed(port, args.attendees)
+            stats = asyncio.run(
+                load(
+                    port,
+                    event_id,
+                    attendee_ids,
+                    connections,
+                    args.seconds,
+                    args.timeout,
+                )
+            )
+        finally:
+            server.send_signal(signal.SIGTERM)
+            try:
+                server.wait(timeout=30)
+            except subprocess.TimeoutExpired:
+                server.kill()
+    latencies = sorted(stats["latencies"])
+    stats["throughput"] = len(latencies) / args.seconds
+    stats["p50"] = latencies[len(latencies) // 2] if latencies else 0.0
+    stats["p99"] = latencies[int(len(latencies) * 0.99)] if latencies else 0.0
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--connections", type=int, nargs="+", default=[8, 32, 128])
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--timeout", type=float, default=5.0)
+    parser.add_argument("--attendees", type=int, default=500)
+    args = parser.parse_args()
+
+    print(
+        f"{args.threads} threads for the WSGI mode, {args.seconds:g}s per run,"
+        f" {os.cpu_count()} CPU(s)"
+    )
+    for connections in args.connections:
+        for mode in ("threaded", "asgi"):
+            stats = run(mode, connections, args)
+            print(
+                f"  {connections:>4} connections  {mode:<8}"
+                f" {stats['throughput']:7.0f} req/s"
+                f"   p50 {stats['p50'] * 1e3:7.1f} ms"
+                f"   p99 {stats['p99'] * 1e3:7.1f} ms"
+                f"   starved {stats['starved']:>3}   errors {stats['errors']}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+"""
+Writes per second of concurrent registrations and check-ins on SQLite, each
+committed on its own against committed in groups by the GroupCommitWriter.
+
+Every thread stands for a request thread of the server: it registers an
+attendee, then checks them in, each write inside a unit of work of its own
+like a request. The database is recreated for every case.
+
+Usage: python -m benchmarks.group_commit [--threads 16] [--writes 4000]
+    [--synchronous normal full] [--window-ms 0 2] [--max-batch 64]
+"""
+
+import argparse
+import tempfile
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+
+from src.drivers.database.connection import DBConnection
+from src.drivers.database.group_commit import GroupCommitSettings, GroupCommitWriter
+from src.drivers.database.migrations import apply_migrations
+from src.drivers.database.settings import DatabaseSettings
+from src.modules.events.dao.attendee import AttendeeDAO
+from src.modules.events.dao.check_in import CheckInDAO
+from src.modules.events.dao.event import EventDAO
+from src.modules.events.dtos.attendee import AttendeeRegistrationStatus
+from src.modules.events.dtos.check_in import CheckInStatus
+from src.modules.events.entities.attendee import AttendeeEntity
+from src.modules.events.entities.event import EventEntity
+from src.modules.events.repositories.attendee import AttendeeRepository
+from src.modules.events.repositories.check_in import CheckInRepository
+
+
+def write_concurrently(
+    directory: Path,
+    synchronous: str,
+    threads: int,
+    writes: int,
+    group_commit: GroupCommitSettings,
+) -> float:
+    """Writes per second of 'threads' threads sharing 'writes' writes"""
+    connection = DBConnection(
+        DatabaseSettings(
+            url=f"sqlite:///{directory / f'{time.monotonic_ns()}.db'}",
+            synchronous=synchronous,
+            pool_size=threads,
+        )
+    )
+    connection.make_connection()
+    apply_migrations(connection.get_engine())
+    EventDAO(connection=connection).create_event(
+        EventEntity(
+            id="event",
+            title="Benchmark",
+            details=None,
+            slug="benchmark",
+            maximum_attendees=None,
+            created_at=datetime.now(),
+        )
+    )
+    writer = GroupCommitWriter(connection=connection, settings=group_commit)
+    attendees = AttendeeRepository(
+        dao=AttendeeDAO(connection=connection), writer=writer
+    )
+    check_ins = CheckInRepository(dao=CheckInDAO(connection=connection), writer=writer)
+    # Each attendee is one registration and one check-in.
+    per_thread = writes // threads // 2
+    failures = []
+    start = threading.Barrier(threads + 1)
+
+    def request_thread(number: int):
+        start.wait()
+        for index in range(per_thread):
+            attendee = AttendeeEntity(
+                attendee_id=None,
+                name="Benchmark Attendee",
+                email=f"{number}-{index}@bench.io",
+                event_id="event",
+            )
+            with connection.unit_of_work():
+                status = attendees.register_in_event(data=attendee)
+            with connection.unit_of_work():
+                check_in_status, _ = check_ins.check_in_attendee(
+                    attendee_id=attendee.id
+                )
+            if (status, check_in_status) != (
+                AttendeeRegistrationStatus.CREATED,
+                CheckInStatus.CREATED,
+            ):
+                failures.append((status, check_in_status))
+
+    workers = [
+        threading.Thread(target=request_thread, args=(number,))
+        for number in range(threads)
+    ]
+    for worker in workers:
+        worker.start()
+    start.wait()
+    started = time.perf_counter()
+    for worker in workers:
+        worker.join()
+    elapsed = time.perf_counter() - started
+    writer.close()
+    connection.disconnect()
+    if failures:
+        raise RuntimeError(f"{len(failures)} writes failed, e.g. {failures[0]}.")
+    return per_thread * threads * 2 / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--threads", type=int, default=16)
+    parser.add_argument("--writes", type=int, default=4000)
+    parser.add_argument("--synchronous", nargs="+", default=["normal", "full"])
+    parser.add_argument("--window-ms", nargs="+", type=float, default=[0.0, 2.0])
+    parser.add_argument("--max-batch", type=int, default=64)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        for synchronous in args.synchronous:
+            baseline = write_concurrently(
+                Path(directory),
+                synchronous,
+                args.threads,
+                args.writes,
+                GroupCommitSettings(enabled=False),
+            )
+            print(
+                f"synchronous={synchronous:<6} per-request commits"
+                f"      {baseline:>8.0f} writes/s"
+            )
+            for window_ms in args.window_ms:
+                grouped = write_concurrently(
+                    Path(directory),
+                    synchronous,
+                    args.threads,
+                    args.writes,
+                    GroupCommitSettings(
+                        enabled=True, window_ms=window_ms, max_batch=args.max_batch
+                    ),
+                )
+                print(
+                    f"synchronous={synchronous:<6} group commit {window_ms:>4.1f} ms"
+                    f"  {grouped:>8.0f} writes/s  x{grouped / baseline:.2f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
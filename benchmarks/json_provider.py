@@ -0,0 +1,84 @@
+"""
+Cost of turning a participants page into a JSON response with Flask's default
+provider against the application provider, with and without orjson.
+
+Usage: python -m benchmarks.json_provider [--attendees 100] [--calls 2000]
+"""
+
+import argparse
+import timeit
+from datetime import datetime, timedelta
+
+from flask import Flask
+from flask.json.provider import DefaultJSONProvider
+
+from src.api.json_provider import FastJSONProvider, orjson
+from src.modules.events.dtos.attendee import AttendeeDTO
+
+
+def participants_payload(size: int) -> dict:
+    """A page shaped like GET /events/<event_id>/attendees"""
+    start = datetime(2024, 1, 1, 9, 0)
+    attendees = [
+        AttendeeDTO(
+            attendee_id=f"3fa85f64-5717-4562-b3fc-{index:012d}",
+            name=f"Attendee Number {index}",
+            email=f"attendee{index}@gmail.com",
+            event_id="9e107d9d-372b-4b1f-8f6e-35b5a9a1b9b4",
+            created_at=start + timedelta(minutes=index),
+            checked_in_at=start + timedelta(hours=1) if index % 2 else None,
+        )
+        for index in range(size)
+    ]
+    return {
+        "attendees": attendees,
+        "total": size * 10,
+        "page_offset": 0,
+        "next_cursor": "WyJBdHRlbmRlZSIsICIzZmE4NWY2NCJd",
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--attendees", type=int, default=100)
+    parser.add_argument("--calls", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    payload = participants_payload(args.attendees)
+    providers = {"flask default": DefaultJSONProvider, "fast, json": FastJSONProvider}
+    if orjson is not None:
+        providers["fast, orjson"] = FastJSONProvider
+
+    print(
+        f"participants page of {args.attendees} attendees,"
+        f" {args.calls} calls, best of {args.repeat}"
+    )
+    for name, provider_class in providers.items():
+        app = Flask(__name__)
+        provider = provider_class(app)
+        if provider_class is FastJSONProvider:
+            provider.use_orjson = name.endswith("orjson")
+        app.json = provider
+        with app.app_context():
+            body = app.json.response(payload).get_data()
+
+            def respond(app=app):
+                for _ in range(args.calls):
+                    app.json.response(payload)
+
+            def parse(app=app, body=body):
+                for _ in range(args.calls):
+                    app.json.loads(body)
+
+            respond_time = min(timeit.repeat(respond, number=1, repeat=args.repeat))
+            parse_time = min(timeit.repeat(parse, number=1, repeat=args.repeat))
+        print(
+            f"  {name:<14} response {respond_time / args.calls * 1e6:8.1f} us"
+            f"   parse {parse_time / args.calls * 1e6:7.1f} us"
+            f"   {len(body)} bytes"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+"""
+Cost of a full participants page, from the query to the response body, through
+entities and DTOs as it was built before against the row projection sent as
+it is read.
+
+Usage: python -m benchmarks.listing_projection [--limit 100] [--calls 500]
+"""
+
+import argparse
+import tempfile
+import timeit
+from datetime import datetime, timedelta
+from functools import partial
+from pathlib import Path
+
+from flask import Flask
+
+from src.api.json_provider import FastJSONProvider
+from src.drivers.database.connection import DBConnection
+from src.drivers.database.migrations import apply_migrations
+from src.drivers.database.settings import DatabaseSettings
+from src.modules.events.dao import statements
+from src.modules.events.dao.attendee import AttendeeDAO
+from src.modules.events.dtos.attendee import AttendeeDTO, AttendeePageDTO
+from src.modules.events.entities.attendee import AttendeeEntity
+from src.modules.events.repositories.attendee import AttendeeRepository
+from src.modules.events.services.attendee import AttendeeService
+
+EVENT_ID = "9e107d9d-372b-4b1f-8f6e-35b5a9a1b9b4"
+
+
+def seed(connection: DBConnection, attendees: int):
+    start = datetime(2024, 1, 1, 9, 0)
+    with connection.begin() as db_connection:
+        db_connection.execute(
+            statements.INSERT_EVENT,
+            {
+                "id": EVENT_ID,
+                "title": "Benchmark",
+                "details": None,
+                "slug": "benchmark",
+                "maximum_attendees": None,
+                "created_at": start,
+            },
+        )
+        db_connection.execute(
+            statements.REGISTER_ATTENDEE_IN_EVENT,
+            [
+                {
+                    "attendee_id": f"3fa85f64-5717-4562-b3fc-{index:012d}",
+                    "name": f"Attendee Number {index}",
+                    "email": f"attendee{index}@gmail.com",
+                    "event_id": EVENT_ID,
+                    "created_at": start + timedelta(seconds=index),
+                }
+                for index in range(attendees)
+            ],
+        )
+
+
+def entity_page(
+    connection: DBConnection, event_id: str, query: str, offset: int, limit: int
+) -> AttendeePageDTO:
+    """The page as it was built before the row projection: entities, then DTOs"""
+    search, params = statements.search_params(query)
+    with connection.connect() as db_connection:
+        rows = db_connection.execute(
+            statements.participants_page_with_total(search, keyset=False),
+            {"id": event_id, "offset": offset, "limit": limit, **params},
+        ).fetchall()
+    entities = [
+        AttendeeEntity(row[1], row[2], row[3], row[5], row[4], row[6])
+        for row in rows
+        if row[1] is not None
+    ]
+    return AttendeePageDTO(
+        attendees=[
+            AttendeeDTO(
+                attendee.id,
+                attendee.name,
+                attendee.email,
+                attendee.event_id,
+                attendee.created_at,
+                attendee.checked_in_at,
+            )
+            for attendee in entities
+        ],
+        total=int(rows[0][0]),
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--attendees", type=int, default=1000)
+    parser.add_argument("--limit", type=int, default=100)
+    parser.add_argument("--calls", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    app = Flask(__name__)
+    app.json = FastJSONProvider(app)
+    with tempfile.TemporaryDirectory() as directory, app.app_context():
+        connection = DBConnection(
+            DatabaseSettings(url=f"sqlite:///{Path(directory) / 'bench.db'}")
+        )
+        connection.make_connection()
+        apply_migrations(connection.get_engine())
+        seed(connection, args.attendees)
+        service = AttendeeService(
+            repository=AttendeeRepository(dao=AttendeeDAO(connection=connection)),
+            event_service=None,
+        )
+        pages = {
+            "entities + DTOs": partial(entity_page, connection),
+            "row projection": service.get_event_attendee_rows,
+        }
+        bodies = set()
+        print(
+            f"participants page of {args.limit} attendees,"
+            f" {args.calls} calls, best of {args.repeat}"
+        )
+        for name, get_page in pages.items():
+
+            def respond(get_page=get_page):
+                for _ in range(args.calls):
+                    page = get_page(
+                        event_id=EVENT_ID, query="", offset=0, limit=args.limit
+                    )
+                    app.json.response(
+                        {"attendees": page.attendees, "total": page.total}
+                    )
+
+            page = get_page(event_id=EVENT_ID, query="", offset=0, limit=args.limit)
+            body = app.json.response({"attendees": page.attendees, "total": page.total})
+            bodies.add(body.get_data())
+            elapsed = min(timeit.repeat(respond, number=1, repeat=args.repeat))
+            print(f"  {name:<16} {elapsed / args.calls * 1e6:8.1f} us per page")
+        assert len(bodies) == 1, "both paths should send the same body"
+        connection.disconnect()
+
+
+if __name__ == "__main__":
+    main()
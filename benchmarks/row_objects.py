@@ -0,0 +1,142 @@
+"""
+Time and memory to turn attendee rows into entities and then DTOs, with the
+keyword-built classes with a __dict__ used before against the slotted,
+positional ones.
+
+Usage: python -m benchmarks.row_objects [--rows 100000]
+"""
+
+import argparse
+import gc
+import time
+import tracemalloc
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import TypedDict, Unpack
+
+from src.modules.events.dtos.attendee import AttendeeDTO
+from src.modules.events.entities.attendee import AttendeeEntity
+
+
+class LegacyAttendeeAttributes(TypedDict):
+    attendee_id: str | None
+    name: str
+    email: str
+    event_id: str
+    created_at: datetime | None
+    checked_in_at: datetime | None
+
+
+class LegacyAttendeeEntity:
+    """AttendeeEntity as it was: keyword arguments and a __dict__"""
+
+    def __init__(self, **attendee_info: Unpack[LegacyAttendeeAttributes]):
+        self.id = attendee_info["attendee_id"]
+        self.name = attendee_info["name"]
+        self.email = attendee_info["email"]
+        self.event_id = attendee_info["event_id"]
+        self.created_at = attendee_info["created_at"] or datetime.now()
+        self.checked_in_at = attendee_info["checked_in_at"]
+
+
+@dataclass
+class LegacyAttendeeDTO:
+    """AttendeeDTO as it was: a dataclass with a __dict__"""
+
+    attendee_id: str
+    name: str
+    email: str
+    event_id: str
+    created_at: datetime
+    checked_in_at: datetime | None
+
+
+def legacy(rows):
+    entities = [
+        LegacyAttendeeEntity(
+            attendee_id=row[0],
+            name=row[1],
+            email=row[2],
+            created_at=row[3],
+            event_id=row[4],
+            checked_in_at=row[5],
+        )
+        for row in rows
+    ]
+    return [
+        LegacyAttendeeDTO(
+            attendee_id=attendee.id,
+            name=attendee.name,
+            email=attendee.email,
+            event_id=attendee.event_id,
+            created_at=attendee.created_at,
+            checked_in_at=attendee.checked_in_at,
+        )
+        for attendee in entities
+    ], entities
+
+
+def slotted(rows):
+    entities = [
+        AttendeeEntity(row[0], row[1], row[2], row[4], row[3], row[5]) for row in rows
+    ]
+    return [
+        AttendeeDTO(
+            attendee.id,
+            attendee.name,
+            attendee.email,
+            attendee.event_id,
+            attendee.created_at,
+            attendee.checked_in_at,
+        )
+        for attendee in entities
+    ], entities
+
+
+def measure(build, rows) -> tuple[float, int]:
+    """Seconds to build every object and bytes they hold once built"""
+    gc.collect()
+    started = time.perf_counter()
+    build(rows)
+    elapsed = time.perf_counter() - started
+    gc.collect()
+    tracemalloc.start()
+    built = build(rows)
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del built
+    return elapsed, allocated
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000)
+    args = parser.parse_args()
+
+    start = datetime(2024, 1, 1, 9, 0)
+    rows = [
+        (
+            f"3fa85f64-5717-4562-b3fc-{index:012d}",
+            f"Attendee Number {index}",
+            f"attendee{index}@gmail.com",
+            start + timedelta(seconds=index),
+            "9e107d9d-372b-4b1f-8f6e-35b5a9a1b9b4",
+            None,
+        )
+        for index in range(args.rows)
+    ]
+    print(f"{args.rows} attendee rows to entities and DTOs")
+    for name, build in (
+        ("keywords + __dict__", legacy),
+        ("slotted, positional", slotted),
+    ):
+        elapsed, allocated = measure(build, rows)
+        print(
+            f"  {name:<20} {elapsed * 1e3:8.1f} ms"
+            f"   {allocated / 2**20:7.1f} MiB"
+            f"   {allocated / args.rows:6.0f} B/row"
+        )
+
+
+if __name__ == "__main__":
+    main()
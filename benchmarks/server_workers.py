@@ -0,0 +1,176 @@
+"""
+Throughput and tail latency of serve.py on SQLite for a grid of worker and
+thread counts, under a read-mostly mix with a share of registrations.
+
+Each combination starts the server on a fresh database, then 'clients'
+processes with keep-alive connections send requests for 'seconds':
+80% participant pages, 15% event reads and 5% registrations.
+
+Usage: python -m benchmarks.server_workers [--workers 1 2 4] [--threads 1 4 8]
+"""
+
+import argparse
+import http.client
+import json
+import multiprocessing
+import os
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def free_port() -> int:
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        return probe.getsockname()[1]
+
+
+def request(connection, method: str, path: str, body=None):
+    headers = {"Content-Type": "application/json"} if body is not None else {}
+    payload = json.dumps(body) if body is not None else None
+    connection.request(method, path, body=payload, headers=headers)
+    response = connection.getresponse()
+    data = response.read()
+    return response.status, data
+
+
+def wait_until_ready(port: int, timeout: float = 15.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            connection = http.client.HTTPConnection("127.0.0.1", port, timeout=2)
+            request(connection, "GET", "/events")
+            connection.close()
+            return
+        except OSError:
+            time.sleep(0.1)
+    raise RuntimeError("The server did not start.")
+
+
+def seed(port: int, attendees: int) -> str:
+    connection = http.client.HTTPConnection("127.0.0.1", port)
+    _, data = request(
+        connection, "POST", "/events", {"title": "Benchmark", "slug": "benchmark"}
+    )
+    event_id = json.loads(data)["created_event"]["event_id"]
+    for index in range(attendees):
+        request(
+            connection,
+            "POST",
+            f"/events/{event_id}/attendee",
+            {"name": "Seeded Attendee", "email": f"seed{index}@gmail.com"},
+        )
+    connection.close()
+    return event_id
+
+
+def client(port: int, event_id: str, seconds: float, index: int, results):
+    connection = http.client.HTTPConnection("127.0.0.1", port, timeout=30)
+    latencies, errors, sent = [], 0, 0
+    deadline = time.monotonic() + seconds
+    while time.monotonic() < deadline:
+        sent += 1
+        roll = sent % 20
+        started = time.perf_counter()
+        try:
+            if roll == 0:
+                status, _ = request(
+                    connection,
+                    "POST",
+                    f"/events/{event_id}/attendee",
+                    {"name": "Load Attendee", "email": f"c{index}n{sent}@gmail.com"},
+                )
+            elif roll < 4:
+                status, _ = request(connection, "GET", f"/events/{event_id}")
+            else:
+                status, _ = request(
+                    connection, "GET", f"/events/{event_id}/attendees?limit=20"
+                )
+        except (OSError, http.client.HTTPException):
+            connection.close()
+            connection = http.client.HTTPConnection("127.0.0.1", port, timeout=30)
+            status = 0
+        latencies.append(time.perf_counter() - started)
+        errors += status >= 400 or status == 0
+    connection.close()
+    results.put((latencies, errors))
+
+
+def run(workers: int, threads: int, args) -> tuple[float, float, int]:
+    with tempfile.TemporaryDirectory() as directory:
+        port = free_port()
+        environ = {
+            **os.environ,
+            "PYTHONPATH": str(ROOT),
+            "DATABASE_URL": f"sqlite:///{Path(directory) / 'bench.db'}",
+            "SERVER_HOST": "127.0.0.1",
+            "SERVER_PORT": str(port),
+            "SERVER_MODE": "prefork",
+            "SERVER_WORKERS": str(workers),
+            "SERVER_THREADS": str(threads),
+        }
+        server = subprocess.Popen(
+            [sys.executable, str(ROOT / "serve.py")],
+            env=environ,
+            cwd=directory,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        try:
+            wait_until_ready(port)
+            event_id = seed(port, args.attendees)
+            results = multiprocessing.Queue()
+            clients = [
+                multiprocessing.Process(
+                    target=client, args=(port, event_id, args.seconds, index, results)
+                )
+                for index in range(args.clients)
+            ]
+            for process in clients:
+                process.start()
+            latencies, errors = [], 0
+            for _ in clients:
+                client_latencies, client_errors = results.get()
+                latencies.extend(client_latencies)
+                errors += client_errors
+            for process in clients:
+                process.join()
+        finally:
+            server.send_signal(signal.SIGTERM)
+            server.wait(timeout=60)
+    latencies.sort()
+    p99 = latencies[int(len(latencies) * 0.99)] if latencies else 0.0
+    return len(latencies) / args.seconds, p99, errors
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 4, 8])
+    parser.add_argument("--clients", type=int, default=16)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--attendees", type=int, default=200)
+    args = parser.parse_args()
+
+    print(
+        f"{args.clients} keep-alive clients for {args.seconds:g}s,"
+        f" {os.cpu_count()} CPU(s)"
+    )
+    for workers in args.workers:
+        for threads in args.threads:
+            throughput, p99, errors = run(workers, threads, args)
+            print(
+                f"  workers {workers}  threads {threads:<2}"
+                f" {throughput:8.0f} req/s   p99 {p99 * 1e3:7.1f} ms"
+                f"   errors {errors}"
+            )
+
+
+if __name__ == "__main__":
+    main()
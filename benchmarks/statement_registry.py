@@ -0,0 +1,93 @@
+"""
+Per-call overhead of building a text() statement on every call against
+reusing the statements of the registry, on the hot DAO lookups.
+
+Usage: python -m benchmarks.statement_registry [--calls 20000]
+"""
+
+import argparse
+import tempfile
+from datetime import datetime
+import timeit
+from pathlib import Path
+
+from sqlalchemy import text
+
+from src.drivers.database.connection import DBConnection
+from src.drivers.database.migrations import apply_migrations
+from src.drivers.database.settings import DatabaseSettings
+from src.modules.events.dao import statements
+from src.modules.events.dao.event import EventDAO
+
+
+def check_event_exists_with_text(connection: DBConnection, event_id: str) -> bool:
+    """The lookup as it was written before the registry"""
+    with connection.connect() as db_connection:
+        check_event_existence_query = text(
+            """
+            SELECT
+            CASE WHEN EXISTS(
+                SELECT events.id
+                FROM events
+                WHERE events.id = :id
+            )
+            THEN CAST(1 AS BIT)
+            ELSE CAST (0 AS BIT) END;
+            """
+        )
+        result = db_connection.execute(check_event_existence_query, {"id": event_id})
+        return bool(result.scalar())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--calls", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        connection = DBConnection(
+            DatabaseSettings(url=f"sqlite:///{Path(directory) / 'bench.db'}")
+        )
+        connection.make_connection()
+        apply_migrations(connection.get_engine())
+        with connection.begin() as db_connection:
+            db_connection.execute(
+                statements.INSERT_EVENT,
+                {
+                    "id": "event",
+                    "title": "Benchmark",
+                    "details": None,
+                    "slug": "benchmark",
+                    "maximum_attendees": None,
+                    "created_at": datetime.now(),
+                },
+            )
+        dao = EventDAO(connection=connection)
+
+        def with_text():
+            for _ in range(args.calls):
+                check_event_exists_with_text(connection, "event")
+
+        def with_registry():
+            for _ in range(args.calls):
+                dao.check_event_exists(event_id="event")
+
+        def with_registry_in_unit_of_work():
+            with connection.unit_of_work():
+                with_registry()
+
+        cases = {
+            "text() per call": with_text,
+            "statement registry": with_registry,
+            "registry, one connection": with_registry_in_unit_of_work,
+        }
+        print(f"check_event_exists, {args.calls} calls, best of {args.repeat}")
+        for name, case in cases.items():
+            best = min(timeit.repeat(case, number=1, repeat=args.repeat))
+            print(f"  {name:<26} {best / args.calls * 1e6:8.2f} us/call")
+        connection.disconnect()
+
+
+if __name__ == "__main__":
+    main()
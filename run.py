@@ -1,4 +1,10 @@
-from src.api.server import app
+import logging
+
+logging.basicConfig(level=logging.INFO)
+
+from src.api.server import create_app
+
+app = create_app()
 
 
 if __name__ == "__main__":
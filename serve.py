@@ -0,0 +1,35 @@
+"""
+Production entry point, next to run.py which starts the development server.
+See src/api/serving.py for the modes and their settings.
+
+Usage: python serve.py [--config server.json]
+"""
+
+import argparse
+import logging
+import os
+
+from src.api.server import create_app
+from src.api.serving import (
+    CONFIG_FILE_VARIABLE,
+    load_server_settings,
+    serve,
+    serve_asgi,
+)
+
+logging.basicConfig(
+    level=logging.INFO, format="%(asctime)s [%(process)d] %(levelname)s %(message)s"
+)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serve the pass-in API.")
+    parser.add_argument("--config", help="JSON file with the server settings")
+    args = parser.parse_args()
+    if args.config:
+        os.environ[CONFIG_FILE_VARIABLE] = args.config
+    settings = load_server_settings()
+    if settings.mode == "asgi":
+        serve_asgi(settings)
+    else:
+        serve(create_app(), settings)
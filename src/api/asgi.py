@@ -0,0 +1,384 @@
+"""
+Entry point of the ASGI application, the asyncio counterpart of the Flask one.
+
+It answers the routes of the Flask application with the same bodies, status
+codes and cache validators, but for the bulk import, the batched
+check-ins and the export which stay on the Flask one. Every request is a
+coroutine awaiting the async controllers, services and DAOs (SQLAlchemy
+asyncio on aiosqlite): a request waiting on the database or on a slow
+client holds no thread, and connections are kept alive. The queries themselves still
+run one per pooled connection, and on a local SQLite file they are short
+and CPU bound, so the throughput of a process does not change (see
+benchmarks/async_concurrency.py); what changes is how many waiting
+requests and open connections it can hold.
+
+'create_asgi_app' takes the same DATABASE_SETTINGS and APPLY_MIGRATIONS
+options as the Flask factory, and 'src.api.asgi:app' is the application
+built from the environment. Response compression is left to the proxy in
+front of it. Serve it with 'SERVER_MODE=asgi python serve.py', or with any
+ASGI server, e.g. 'uvicorn --factory src.api.asgi:create_asgi_app'.
+"""
+
+import logging
+from dataclasses import dataclass, field
+from functools import wraps
+from http import HTTPMethod, HTTPStatus
+from json import JSONDecodeError, loads
+from typing import Any, Awaitable, Callable, Mapping
+from urllib.parse import parse_qsl
+
+from werkzeug.exceptions import MethodNotAllowed, NotFound
+from werkzeug.routing import Map, RequestRedirect, Rule
+
+from src.api.caching import CachePolicy
+from src.api.composer.async_attendee import async_attendee_composer
+from src.api.composer.async_check_in import async_check_in_composer
+from src.api.composer.async_event import async_event_composer
+from src.api.composer.container import container
+from src.api.json_provider import dumps_bytes
+from src.api.routes.attendees import PARTICIPANTS_POLICY
+from src.api.routes.events import EVENT_LIST_POLICY, EVENT_POLICY
+from src.api.types import HttpRequest, HttpResponse
+from src.drivers.database.migrations import apply_migrations
+from src.drivers.database.types import AsyncConnectionInterface
+from src.modules.events.dtos.event import EventVersionDTO
+from src.modules.events.exc.http import HttpResponseError
+from src.utils.http_cache import http_date, is_not_modified, version_etag
+
+logger = logging.getLogger(__name__)
+
+_app = None
+
+
+@dataclass
+class AsgiRequest:
+    """What the views read from an HTTP request"""
+
+    method: str
+    path: str
+    host_url: str
+    args: list[tuple[str, str]] = field(default_factory=list)
+    headers: dict[str, str] = field(default_factory=dict)
+    body: bytes = b""
+
+    def arg(self, name: str, default: str | None = None) -> str | None:
+        """The first value of a query string argument"""
+        return next((value for key, value in self.args if key == name), default)
+
+    def json(self) -> Any:
+        """
+        The body parsed as JSON.
+        Raises: HttpResponseError when the body is not JSON, like Flask's get_json
+        """
+        content_type = self.headers.get("content-type", "").split(";")[0].strip()
+        if content_type != "application/json" and not content_type.endswith("+json"):
+            raise HttpResponseError(
+                title="Unsupported Media Type.",
+                details="The request body should be 'application/json'.",
+                status=HTTPStatus.UNSUPPORTED_MEDIA_TYPE,
+            )
+        try:
+            return loads(self.body)
+        except (JSONDecodeError, UnicodeDecodeError) as exc:
+            raise HttpResponseError(
+                title="Bad Request.",
+                details="The request body is not valid JSON.",
+                status=HTTPStatus.BAD_REQUEST,
+            ) from exc
+
+
+View = Callable[..., Awaitable[HttpResponse]]
+
+
+def conditional(
+    policy: CachePolicy, version_of: Callable[..., Awaitable[EventVersionDTO | None]]
+):
+    """
+    The asyncio counterpart of src.api.caching.conditional: the marker is
+    read before the view runs and a current client copy gets a 304.
+    """
+
+    def decorator(view: View) -> View:
+        @wraps(view)
+        async def wrapper(request: AsgiRequest, **view_args) -> HttpResponse:
+            marker = await version_of(**view_args)
+            headers = {"Cache-Control": policy.cache_control}
+            if marker is not None:
+                etag = version_etag(marker.version, request.path, sorted(request.args))
+                headers["ETag"] = etag
+                headers["Last-Modified"] = http_date(marker.updated_at)
+                if is_not_modified(
+                    request.headers.get("if-none-match"),
+                    request.headers.get("if-modified-since"),
+                    etag,
+                    marker.updated_at,
+                ):
+                    return HttpResponse(
+                        payload={}, status=HTTPStatus.NOT_MODIFIED, headers=headers
+                    )
+            response = await view(request, **view_args)
+            if response.status == HTTPStatus.OK:
+                response.headers = {**(response.headers or {}), **headers}
+            return response
+
+        return wrapper
+
+    return decorator
+
+
+async def events_version():
+    return await async_event_composer().get_version(request=HttpRequest(body=None))
+
+
+async def event_version(event_id):
+    return await async_event_composer().get_version(
+        request=HttpRequest(body=None, params={"event_id": event_id})
+    )
+
+
+async def create_event_route(request: AsgiRequest):
+    data_request = HttpRequest(body=request.json(), params=None)
+    return await async_event_composer().create_event(request=data_request)
+
+
+@conditional(EVENT_LIST_POLICY, version_of=events_version)
+async def get_event_routes(request: AsgiRequest):
+    data_request = HttpRequest(
+        body=None,
+        params={
+            "page_offset": request.arg("page_offset", "0"),
+            "query": request.arg("query", ""),
+            "limit": request.arg("limit"),
+            "cursor": request.arg("cursor"),
+        },
+    )
+    return await async_event_composer().get_events(request=data_request)
+
+
+@conditional(EVENT_POLICY, version_of=event_version)
+async def get_event_route(_request: AsgiRequest, event_id):
+    data_request = HttpRequest(body=None, params={"event_id": event_id})
+    return await async_event_composer().get_event(request=data_request)
+
+
+async def create_attendee(request: AsgiRequest, event_id):
+    data_request = HttpRequest(body=request.json(), params={"event_id": event_id})
+    return await async_attendee_composer().register_attendee(request=data_request)
+
+
+@conditional(PARTICIPANTS_POLICY, version_of=event_version)
+async def get_participants(request: AsgiRequest, event_id):
+    data_request = HttpRequest(
+        body=None,
+        params={
+            "event_id": event_id,
+            "page_offset": request.arg("page_offset", "0"),
+            "query": request.arg("query", ""),
+            "limit": request.arg("limit"),
+            "cursor": request.arg("cursor"),
+        },
+    )
+    return await async_attendee_composer().get_event_participants(request=data_request)
+
+
+async def get_badge(request: AsgiRequest, attendee_id):
+    data_request = HttpRequest(
+        body=None,
+        params={"attendee_id": attendee_id},
+        options={"base_url": f"{request.host_url}/attendees"},
+        headers={"If-None-Match": request.headers.get("if-none-match")},
+    )
+    return await async_attendee_composer().get_attendee_badge(request=data_request)
+
+
+async def make_check_in_route(_request: AsgiRequest, attendee_id):
+    data_request = HttpRequest(body=None, params={"attendee_id": attendee_id})
+    return await async_check_in_composer().make_checkin(request=data_request)
+
+
+ROUTES = Map(
+    [
+        Rule("/events", methods=[HTTPMethod.POST], endpoint=create_event_route),
+        Rule("/events", methods=[HTTPMethod.GET], endpoint=get_event_routes),
+        Rule("/events/<event_id>", methods=[HTTPMethod.GET], endpoint=get_event_route),
+        Rule(
+            "/events/<event_id>/attendee",
+            methods=[HTTPMethod.POST],
+            endpoint=create_attendee,
+        ),
+        Rule(
+            "/events/<event_id>/attendees",
+            methods=[HTTPMethod.GET],
+            endpoint=get_participants,
+        ),
+        Rule(
+            "/attendees/<attendee_id>/badge",
+            methods=[HTTPMethod.GET],
+            endpoint=get_badge,
+        ),
+        Rule(
+            "/attendees/<attendee_id>/check-in",
+            methods=[HTTPMethod.POST],
+            endpoint=make_check_in_route,
+        ),
+    ]
+)
+
+
+def _error(title: str, details: str, status: HTTPStatus) -> HttpResponse:
+    return HttpResponse(payload={"title": title, "details": details}, status=status)
+
+
+class AsgiApplication:
+    """Routes HTTP requests to the async controllers and closes the pool on shutdown"""
+
+    def __init__(self, connection: AsyncConnectionInterface, routes: Map = ROUTES):
+        self.__connection = connection
+        self.__routes = routes
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "lifespan":
+            await self.__lifespan(receive, send)
+            return
+        if scope["type"] != "http":
+            raise ValueError(f"Unsupported ASGI scope type {scope['type']!r}.")
+        request = await self.__read_request(scope, receive)
+        response = await self.dispatch(request, scheme=scope.get("scheme", "http"))
+        await self.__send_response(request, response, send)
+
+    async def dispatch(
+        self, request: AsgiRequest, scheme: str = "http"
+    ) -> HttpResponse:
+        """Run the view matching the request and turn its errors into responses"""
+        host = request.headers.get("host", "localhost")
+        adapter = self.__routes.bind(host, url_scheme=scheme)
+        try:
+            if request.method == HTTPMethod.OPTIONS:
+                return self.__options(request, adapter.allowed_methods(request.path))
+            view, view_args = adapter.match(request.path, method=request.method)
+            return await view(request, **view_args)
+        except HttpResponseError as exc:
+            return _error(exc.title, exc.details, exc.status)
+        except RequestRedirect as exc:
+            return HttpResponse(
+                payload={},
+                status=HTTPStatus.PERMANENT_REDIRECT,
+                headers={"Location": exc.new_url},
+            )
+        except MethodNotAllowed as exc:
+            response = _error(
+                "Method Not Allowed.",
+                f"The method {request.method} is not allowed for this URL.",
+                HTTPStatus.METHOD_NOT_ALLOWED,
+            )
+            response.headers = {"Allow": ", ".join(exc.valid_methods or [])}
+            return response
+        except NotFound:
+            return _error(
+                "Not Found.", "The requested URL was not found.", HTTPStatus.NOT_FOUND
+            )
+        except Exception:  # pylint: disable=broad-exception-caught
+            logger.exception("Error on %s %s", request.method, request.path)
+            return _error(
+                "Internal Server Error.",
+                "The server could not complete the request.",
+                HTTPStatus.INTERNAL_SERVER_ERROR,
+            )
+
+    @staticmethod
+    def __options(request: AsgiRequest, methods: list[str]) -> HttpResponse:
+        """Answer a CORS preflight, allowing any origin like the Flask application"""
+        if not methods:
+            raise NotFound()
+        allowed = ", ".join(sorted({*methods, HTTPMethod.OPTIONS}))
+        headers = {"Allow": allowed}
+        if "access-control-request-method" in request.headers:
+            headers["Access-Control-Allow-Methods"] = allowed
+            requested_headers = request.headers.get("access-control-request-headers")
+            if requested_headers:
+                headers["Access-Control-Allow-Headers"] = requested_headers
+        return HttpResponse(payload={}, status=HTTPStatus.OK, headers=headers)
+
+    @staticmethod
+    async def __read_request(scope, receive) -> AsgiRequest:
+        headers = {
+            name.decode("latin-1").lower(): value.decode("latin-1")
+            for name, value in scope["headers"]
+        }
+        body = bytearray()
+        more_body = True
+        while more_body:
+            message = await receive()
+            body += message.get("body", b"")
+            more_body = message.get("more_body", False)
+        host = headers.get("host", "localhost")
+        return AsgiRequest(
+            method=scope["method"],
+            path=scope["path"],
+            host_url=f"{scope.get('scheme', 'http')}://{host}/",
+            args=parse_qsl(
+                scope["query_string"].decode("latin-1"), keep_blank_values=True
+            ),
+            headers=headers,
+            body=bytes(body),
+        )
+
+    @staticmethod
+    async def __send_response(request: AsgiRequest, response: HttpResponse, send):
+        headers = dict(response.headers or {})
+        body = b""
+        if response.status != HTTPStatus.NOT_MODIFIED and request.method not in (
+            HTTPMethod.OPTIONS,
+        ):
+            body = dumps_bytes(response.payload)
+            headers["Content-Type"] = "application/json"
+        headers["Content-Length"] = str(len(body))
+        if "origin" in request.headers:
+            headers["Access-Control-Allow-Origin"] = "*"
+        await send(
+            {
+                "type": "http.response.start",
+                "status": int(response.status),
+                "headers": [
+                    (name.encode("latin-1"), str(value).encode("latin-1"))
+                    for name, value in headers.items()
+                ],
+            }
+        )
+        await send(
+            {
+                "type": "http.response.body",
+                "body": b"" if request.method == HTTPMethod.HEAD else body,
+            }
+        )
+
+    async def __lifespan(self, receive, send):
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                # The engine is created by the first request, in the worker.
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                await self.__connection.disconnect()
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+
+def create_asgi_app(config: Mapping[str, Any] | None = None) -> AsgiApplication:
+    """Build a configured ASGI application, the database is left for the first request"""
+    options = {"APPLY_MIGRATIONS": True, "DATABASE_SETTINGS": None, **(config or {})}
+    connection = container.resolve(AsyncConnectionInterface)
+    if options["DATABASE_SETTINGS"] is not None:
+        connection.configure(options["DATABASE_SETTINGS"])
+    if options["APPLY_MIGRATIONS"]:
+        connection.on_engine_created(apply_migrations)
+    return AsgiApplication(connection=connection)
+
+
+def __getattr__(name: str):
+    global _app  # pylint: disable=global-statement
+    if name != "app":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    if _app is None:
+        _app = create_asgi_app()
+    return _app
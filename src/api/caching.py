@@ -0,0 +1,55 @@
+from dataclasses import dataclass
+from functools import wraps
+from http import HTTPStatus
+from typing import Callable
+
+from flask import make_response, request
+
+from src.modules.events.dtos.event import EventVersionDTO
+from src.utils.http_cache import http_date, is_not_modified, version_etag
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    """How clients and proxies may keep the responses of a route"""
+
+    cache_control: str
+
+
+def conditional(policy: CachePolicy, version_of: Callable[..., EventVersionDTO | None]):
+    """
+    Answer a GET route with 304 Not Modified when the client copy is current.
+    'version_of' receives the route arguments and returns the change marker of
+    the data behind the route. The marker is read before the route runs, so
+    a matching client skips the route and its queries altogether. Without a
+    marker (e.g. an unknown event) the route runs and answers as usual.
+    """
+
+    def decorator(view):
+        @wraps(view)
+        def wrapper(**view_args):
+            marker = version_of(**view_args)
+            headers = {"Cache-Control": policy.cache_control}
+            if marker is not None:
+                etag = version_etag(
+                    marker.version,
+                    request.path,
+                    sorted(request.args.items(multi=True)),
+                )
+                headers["ETag"] = etag
+                headers["Last-Modified"] = http_date(marker.updated_at)
+                if is_not_modified(
+                    request.headers.get("If-None-Match"),
+                    request.headers.get("If-Modified-Since"),
+                    etag,
+                    marker.updated_at,
+                ):
+                    return ("", HTTPStatus.NOT_MODIFIED, headers)
+            response = make_response(view(**view_args))
+            if response.status_code == HTTPStatus.OK:
+                response.headers.update(headers)
+            return response
+
+        return wrapper
+
+    return decorator
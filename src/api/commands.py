@@ -0,0 +1,24 @@
+import click
+
+from src.api.composer.container import container
+from src.drivers.database.counters import find_counter_drift, repair_counter_drift
+from src.drivers.database.types import ConnectionInterface
+
+
+@click.command("reconcile-counters")
+@click.option(
+    "--repair", is_flag=True, help="Recompute the counters of the drifted events."
+)
+def reconcile_counters_command(repair: bool):
+    """Compare the events counters with the registered attendees and check-ins"""
+    engine = container.resolve(ConnectionInterface).get_engine()
+    drifts = repair_counter_drift(engine) if repair else find_counter_drift(engine)
+    for drift in drifts:
+        click.echo(
+            f"{drift.event_id}: attendees {drift.stored_attendee_count}"
+            f" -> {drift.actual_attendee_count},"
+            f" check-ins {drift.stored_checked_in_count}"
+            f" -> {drift.actual_checked_in_count}"
+        )
+    action = "repaired" if repair else "found"
+    click.echo(f"{len(drifts)} event(s) with drifted counters {action}.")
@@ -0,0 +1,52 @@
+from src.api.composer.container import Container, container
+from src.api.controllers.async_attendee import (
+    AsyncAttendeeController,
+    AsyncAttendeeControllerInterface,
+)
+from src.drivers.database.types import AsyncConnectionInterface
+from src.modules.events.dao.async_attendee import (
+    AsyncAttendeeDAO,
+    AsyncAttendeeDaoInterface,
+)
+from src.modules.events.repositories.async_attendee import (
+    AsyncAttendeeRepository,
+    AsyncAttendeeRepositoryInterface,
+)
+from src.modules.events.services.async_attendee import (
+    AsyncAttendeeService,
+    AsyncAttendeeServiceInterface,
+)
+from src.utils.cache import TTLCache
+
+
+def _async_attendee_service(resolver: Container) -> AsyncAttendeeServiceInterface:
+    return AsyncAttendeeService(
+        repository=resolver.resolve(AsyncAttendeeRepositoryInterface),
+        # Badges never change, so they are only dropped to make room for others.
+        credential_cache=TTLCache(max_size=4096, ttl=float("inf")),
+    )
+
+
+container.register(
+    AsyncAttendeeDaoInterface,
+    lambda resolver: AsyncAttendeeDAO(
+        connection=resolver.resolve(AsyncConnectionInterface)
+    ),
+)
+container.register(
+    AsyncAttendeeRepositoryInterface,
+    lambda resolver: AsyncAttendeeRepository(
+        dao=resolver.resolve(AsyncAttendeeDaoInterface)
+    ),
+)
+container.register(AsyncAttendeeServiceInterface, _async_attendee_service)
+container.register(
+    AsyncAttendeeControllerInterface,
+    lambda resolver: AsyncAttendeeController(
+        service=resolver.resolve(AsyncAttendeeServiceInterface)
+    ),
+)
+
+
+def async_attendee_composer() -> AsyncAttendeeControllerInterface:
+    return container.resolve(AsyncAttendeeControllerInterface)
@@ -0,0 +1,47 @@
+from src.api.composer.container import container
+from src.api.controllers.async_check_in import (
+    AsyncCheckInController,
+    AsyncCheckInControllerInterface,
+)
+from src.drivers.database.types import AsyncConnectionInterface
+from src.modules.events.dao.async_check_in import (
+    AsyncCheckInDAO,
+    AsyncCheckInDaoInterface,
+)
+from src.modules.events.repositories.async_check_in import (
+    AsyncCheckInRepository,
+    AsyncCheckInRepositoryInterface,
+)
+from src.modules.events.services.async_check_in import (
+    AsyncCheckInService,
+    AsyncCheckInServiceInterface,
+)
+
+container.register(
+    AsyncCheckInDaoInterface,
+    lambda resolver: AsyncCheckInDAO(
+        connection=resolver.resolve(AsyncConnectionInterface)
+    ),
+)
+container.register(
+    AsyncCheckInRepositoryInterface,
+    lambda resolver: AsyncCheckInRepository(
+        dao=resolver.resolve(AsyncCheckInDaoInterface)
+    ),
+)
+container.register(
+    AsyncCheckInServiceInterface,
+    lambda resolver: AsyncCheckInService(
+        repository=resolver.resolve(AsyncCheckInRepositoryInterface)
+    ),
+)
+container.register(
+    AsyncCheckInControllerInterface,
+    lambda resolver: AsyncCheckInController(
+        service=resolver.resolve(AsyncCheckInServiceInterface)
+    ),
+)
+
+
+def async_check_in_composer() -> AsyncCheckInControllerInterface:
+    return container.resolve(AsyncCheckInControllerInterface)
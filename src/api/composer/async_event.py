@@ -0,0 +1,42 @@
+from src.api.composer.container import container
+from src.api.controllers.async_event import (
+    AsyncEventController,
+    AsyncEventControllerInterface,
+)
+from src.drivers.database.types import AsyncConnectionInterface
+from src.modules.events.dao.async_event import AsyncEventDAO, AsyncEventDaoInterface
+from src.modules.events.repositories.async_event import (
+    AsyncEventRepository,
+    AsyncEventRepositoryInterface,
+)
+from src.modules.events.services.async_event import (
+    AsyncEventService,
+    AsyncEventServiceInterface,
+)
+
+container.register(
+    AsyncEventDaoInterface,
+    lambda resolver: AsyncEventDAO(
+        connection=resolver.resolve(AsyncConnectionInterface)
+    ),
+)
+container.register(
+    AsyncEventRepositoryInterface,
+    lambda resolver: AsyncEventRepository(dao=resolver.resolve(AsyncEventDaoInterface)),
+)
+container.register(
+    AsyncEventServiceInterface,
+    lambda resolver: AsyncEventService(
+        repository=resolver.resolve(AsyncEventRepositoryInterface)
+    ),
+)
+container.register(
+    AsyncEventControllerInterface,
+    lambda resolver: AsyncEventController(
+        service=resolver.resolve(AsyncEventServiceInterface)
+    ),
+)
+
+
+def async_event_composer() -> AsyncEventControllerInterface:
+    return container.resolve(AsyncEventControllerInterface)
@@ -1,25 +1,55 @@
-from src.api.composer.event import event_service_composer
+from src.api.composer.container import Container, container
+
+# Registers the event service the attendee service depends on.
+from src.api.composer import event as _  # pylint: disable=unused-import
 from src.api.controllers.attendee import AttendeeController, AttendeeControllerInterface
-from src.drivers.database.connection import connection
-from src.modules.events.dao.attendee import AttendeeDAO
-from src.modules.events.repositories.attendee import AttendeeRepository
+from src.drivers.database.group_commit import GroupCommitWriter
+from src.drivers.database.types import ConnectionInterface
+from src.modules.events.dao.attendee import AttendeeDAO, AttendeeDaoInterface
+from src.modules.events.repositories.attendee import (
+    AttendeeRepository,
+    AttendeeRepositoryInterface,
+)
 from src.modules.events.services.attendee import (
     AttendeeService,
     AttendeeServiceInterface,
 )
+from src.modules.events.services.event import EventServiceInterface
+from src.utils.cache import TTLCache
 
 
-def attendee_service_composer() -> AttendeeServiceInterface:
-    attendee_dao = AttendeeDAO(connection=connection)
-    attendee_repository = AttendeeRepository(dao=attendee_dao)
-    event_service = event_service_composer()
-    attendee_service = AttendeeService(
-        event_service=event_service, repository=attendee_repository
+def _attendee_service(resolver: Container) -> AttendeeServiceInterface:
+    return AttendeeService(
+        event_service=resolver.resolve(EventServiceInterface),
+        repository=resolver.resolve(AttendeeRepositoryInterface),
+        # Badges never change, so they are only dropped to make room for others.
+        credential_cache=TTLCache(max_size=4096, ttl=float("inf")),
     )
-    return attendee_service
+
+
+container.register(
+    AttendeeDaoInterface,
+    lambda resolver: AttendeeDAO(connection=resolver.resolve(ConnectionInterface)),
+)
+container.register(
+    AttendeeRepositoryInterface,
+    lambda resolver: AttendeeRepository(
+        dao=resolver.resolve(AttendeeDaoInterface),
+        writer=resolver.resolve(GroupCommitWriter),
+    ),
+)
+container.register(AttendeeServiceInterface, _attendee_service)
+container.register(
+    AttendeeControllerInterface,
+    lambda resolver: AttendeeController(
+        service=resolver.resolve(AttendeeServiceInterface)
+    ),
+)
+
+
+def attendee_service_composer() -> AttendeeServiceInterface:
+    return container.resolve(AttendeeServiceInterface)
 
 
 def attendee_composer() -> AttendeeControllerInterface:
-    attendee_service = attendee_service_composer()
-    controller = AttendeeController(service=attendee_service)
-    return controller
+    return container.resolve(AttendeeControllerInterface)
@@ -1,22 +1,42 @@
-from src.api.composer.attendee import attendee_service_composer
+from src.api.composer.container import container
 from src.api.controllers.check_in import CheckInController, CheckInControllerInterface
-from src.drivers.database.connection import connection
-from src.modules.events.dao.check_in import CheckInDAO
-from src.modules.events.repositories.check_in import CheckInRepository
+from src.drivers.database.group_commit import GroupCommitWriter
+from src.drivers.database.types import ConnectionInterface
+from src.modules.events.dao.check_in import CheckInDAO, CheckInDaoInterface
+from src.modules.events.repositories.check_in import (
+    CheckInRepository,
+    CheckInRepositoryInterface,
+)
 from src.modules.events.services.check_in import CheckInService, CheckInServiceInterface
 
+container.register(
+    CheckInDaoInterface,
+    lambda resolver: CheckInDAO(connection=resolver.resolve(ConnectionInterface)),
+)
+container.register(
+    CheckInRepositoryInterface,
+    lambda resolver: CheckInRepository(
+        dao=resolver.resolve(CheckInDaoInterface),
+        writer=resolver.resolve(GroupCommitWriter),
+    ),
+)
+container.register(
+    CheckInServiceInterface,
+    lambda resolver: CheckInService(
+        repository=resolver.resolve(CheckInRepositoryInterface)
+    ),
+)
+container.register(
+    CheckInControllerInterface,
+    lambda resolver: CheckInController(
+        service=resolver.resolve(CheckInServiceInterface)
+    ),
+)
+
 
 def check_in_service_composer() -> CheckInServiceInterface:
-    check_in_dao = CheckInDAO(connection=connection)
-    check_in_repository = CheckInRepository(dao=check_in_dao)
-    attendee_service = attendee_service_composer()
-    check_in_service = CheckInService(
-        repository=check_in_repository, attendee_service=attendee_service
-    )
-    return check_in_service
+    return container.resolve(CheckInServiceInterface)
 
 
 def check_in_composer() -> CheckInControllerInterface:
-    check_in_service = check_in_service_composer()
-    controller = CheckInController(service=check_in_service)
-    return controller
+    return container.resolve(CheckInControllerInterface)
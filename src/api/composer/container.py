@@ -0,0 +1,100 @@
+"""
+This module contains the dependency container shared by the composers.
+
+Every DAO, repository, service and controller is registered once under its
+interface and built on the first 'resolve', then the same instance is handed
+to everyone asking for it. The event service seen by the attendee service is
+the one the event routes use, so their caches see each other's
+invalidations, and each worker holds a single copy of the graph.
+
+Tests replace a dependency with 'override' and drop every built instance
+with 'reset', so the next resolve builds a fresh graph around the fakes.
+"""
+
+import threading
+from typing import Any, Callable, TypeVar
+
+from src.drivers.database.connection import connection
+from src.drivers.database.group_commit import GroupCommitWriter
+from src.drivers.database.types import AsyncConnectionInterface, ConnectionInterface
+
+T = TypeVar("T")
+
+Provider = Callable[["Container"], Any]
+
+
+class Container:
+    """Lazy singletons keyed by the type they are resolved as"""
+
+    def __init__(self):
+        self.__providers: dict[type, Provider] = {}
+        self.__instances: dict[type, Any] = {}
+        self.__overrides: dict[type, Any] = {}
+        self.__resolving: set[type] = set()
+        self.__lock = threading.RLock()
+
+    def register(self, key: type[T], provider: Callable[["Container"], T]):
+        """Set how the instance of 'key' is built, dropping the one already built"""
+        with self.__lock:
+            self.__providers[key] = provider
+            self.__instances.pop(key, None)
+
+    def resolve(self, key: type[T]) -> T:
+        """
+        The shared instance of 'key', built with its dependencies on first use.
+        Raises: LookupError when nothing is registered for 'key',
+            RuntimeError when its providers depend on each other in a cycle
+        """
+        instance = self.__overrides.get(key, self.__instances.get(key))
+        if instance is not None:
+            return instance
+        with self.__lock:
+            if key in self.__overrides:
+                return self.__overrides[key]
+            if key in self.__instances:
+                return self.__instances[key]
+            provider = self.__providers.get(key)
+            if provider is None:
+                raise LookupError(f"No provider is registered for {key.__name__}.")
+            if key in self.__resolving:
+                raise RuntimeError(
+                    f"Circular dependency while building {key.__name__}."
+                )
+            self.__resolving.add(key)
+            try:
+                instance = provider(self)
+            finally:
+                self.__resolving.discard(key)
+            self.__instances[key] = instance
+            return instance
+
+    def override(self, key: type[T], instance: T):
+        """Hand 'instance' to whoever resolves 'key' from now on"""
+        with self.__lock:
+            self.__overrides[key] = instance
+            self.__instances.clear()
+
+    def reset(self):
+        """Forget the built instances and the overrides, keeping the providers"""
+        with self.__lock:
+            self.__instances.clear()
+            self.__overrides.clear()
+
+
+def _async_connection(_resolver: Container) -> AsyncConnectionInterface:
+    # Only the ASGI application loads the asyncio engine.
+    # pylint: disable-next=import-outside-toplevel
+    from src.drivers.database.async_connection import async_connection
+
+    return async_connection
+
+
+container = Container()
+container.register(ConnectionInterface, lambda _: connection)
+container.register(AsyncConnectionInterface, _async_connection)
+container.register(
+    GroupCommitWriter,
+    lambda resolver: GroupCommitWriter(
+        connection=resolver.resolve(ConnectionInterface)
+    ),
+)
@@ -1,18 +1,48 @@
+from src.api.composer.container import Container, container
 from src.api.controllers.event import EventController, EventControllerInterface
-from src.drivers.database.connection import connection
-from src.modules.events.dao.event import EventDAO
-from src.modules.events.repositories.event import EventRepository
+from src.drivers.database.types import ConnectionInterface
+from src.modules.events.dao.event import EventDAO, EventDaoInterface
+from src.modules.events.repositories.cached_event import (
+    DEFAULT_CACHE_SIZE,
+    DEFAULT_TTL,
+    CachedEventRepository,
+)
+from src.modules.events.repositories.event import (
+    EventRepository,
+    EventRepositoryInterface,
+)
 from src.modules.events.services.event import EventService, EventServiceInterface
+from src.utils.cache import TTLCache
+
+
+def _event_repository(resolver: Container) -> EventRepositoryInterface:
+    # A single cached repository per worker, so an invalidation reaches all readers.
+    return CachedEventRepository(
+        repository=EventRepository(dao=resolver.resolve(EventDaoInterface)),
+        cache=TTLCache(max_size=DEFAULT_CACHE_SIZE, ttl=DEFAULT_TTL),
+    )
+
+
+container.register(
+    EventDaoInterface,
+    lambda resolver: EventDAO(connection=resolver.resolve(ConnectionInterface)),
+)
+container.register(EventRepositoryInterface, _event_repository)
+container.register(
+    EventServiceInterface,
+    lambda resolver: EventService(
+        repository=resolver.resolve(EventRepositoryInterface)
+    ),
+)
+container.register(
+    EventControllerInterface,
+    lambda resolver: EventController(service=resolver.resolve(EventServiceInterface)),
+)
 
 
 def event_service_composer() -> EventServiceInterface:
-    event_dao = EventDAO(connection=connection)
-    event_repository = EventRepository(dao=event_dao)
-    event_service = EventService(repository=event_repository)
-    return event_service
+    return container.resolve(EventServiceInterface)
 
 
 def event_composer() -> EventControllerInterface:
-    event_service = event_service_composer()
-    controller = EventController(service=event_service)
-    return controller
+    return container.resolve(EventControllerInterface)
@@ -0,0 +1,320 @@
+"""
+This module contains the WSGI middleware that compresses the responses.
+
+The encoding is negotiated from 'Accept-Encoding' among zstd, br and gzip;
+zstd and br are offered only when 'zstandard' and 'brotli' are installed.
+Responses under 'minimum_size' bytes, error and empty responses, bodies that
+are already encoded and media types that are compressed by nature (images,
+archives) are sent as they are, so they do not pay CPU for nothing.
+
+Bodies of a known length are compressed at once. Streamed bodies are
+compressed chunk by chunk as the application yields them, after the first
+'minimum_size' bytes show that compression is worth it.
+
+The settings are read from the environment:
+
+    COMPRESSION_ENABLED        true
+    COMPRESSION_MINIMUM_SIZE   512 (bytes)
+    COMPRESSION_GZIP_LEVEL     6 (1-9)
+    COMPRESSION_BROTLI_QUALITY 4 (0-11)
+    COMPRESSION_ZSTD_LEVEL     3 (1-22)
+"""
+
+import os
+import zlib
+from dataclasses import dataclass, fields, replace
+from itertools import chain
+from typing import Callable, Iterable, Iterator, Mapping
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - brotli is optional
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - zstandard is optional
+    zstandard = None
+
+COMPRESSIBLE_TYPES = (
+    "application/json",
+    "application/x-ndjson",
+    "application/javascript",
+    "application/xml",
+    "image/svg+xml",
+)
+
+_SKIPPED_STATUSES = (204, 206, 304)
+
+
+@dataclass(frozen=True)
+class CompressionSettings:
+    """How and from which size the responses are compressed"""
+
+    enabled: bool = True
+    minimum_size: int = 512
+    gzip_level: int = 6
+    brotli_quality: int = 4
+    zstd_level: int = 3
+
+    def __post_init__(self):
+        for name, low, high in (
+            ("gzip_level", 1, 9),
+            ("brotli_quality", 0, 11),
+            ("zstd_level", 1, 22),
+        ):
+            if not low <= getattr(self, name) <= high:
+                raise ValueError(
+                    f"Invalid compression setting {name}={getattr(self, name)!r},"
+                    f" expected a value from {low} to {high}."
+                )
+        if self.minimum_size < 0:
+            raise ValueError("The compression minimum size cannot be negative.")
+
+
+def load_compression_settings(
+    environ: Mapping[str, str] | None = None,
+) -> CompressionSettings:
+    """
+    Build the settings from the defaults and the COMPRESSION_* variables.
+    Raises: ValueError when a value is invalid
+    """
+    environ = os.environ if environ is None else environ
+    values = {}
+    for field in fields(CompressionSettings):
+        variable = f"COMPRESSION_{field.name.upper()}"
+        if variable not in environ:
+            continue
+        raw = environ[variable].strip().lower()
+        if isinstance(field.default, bool):
+            values[field.name] = raw in ("1", "true", "yes", "on")
+            continue
+        try:
+            values[field.name] = int(raw)
+        except ValueError as exc:
+            raise ValueError(
+                f"Invalid compression setting {variable}={raw!r}."
+            ) from exc
+    return replace(CompressionSettings(), **values)
+
+
+class _Compressor:
+    """A streaming compressor with the same calls for every encoding"""
+
+    def __init__(self, compress: Callable[[bytes], bytes], finish: Callable[[], bytes]):
+        self.compress = compress
+        self.finish = finish
+
+
+def _gzip(settings: CompressionSettings) -> _Compressor:
+    compressor = zlib.compressobj(settings.gzip_level, zlib.DEFLATED, 31)
+    return _Compressor(compressor.compress, compressor.flush)
+
+
+def _brotli(settings: CompressionSettings) -> _Compressor:
+    compressor = brotli.Compressor(quality=settings.brotli_quality)
+    return _Compressor(compressor.process, compressor.finish)
+
+
+def _zstd(settings: CompressionSettings) -> _Compressor:
+    compressor = zstandard.ZstdCompressor(level=settings.zstd_level).compressobj()
+    return _Compressor(compressor.compress, compressor.flush)
+
+
+def available_encodings() -> dict[str, Callable[[CompressionSettings], _Compressor]]:
+    """The encodings this process can produce, in order of preference"""
+    encodings = {}
+    if zstandard is not None:
+        encodings["zstd"] = _zstd
+    if brotli is not None:
+        encodings["br"] = _brotli
+    encodings["gzip"] = _gzip
+    return encodings
+
+
+def negotiate_encoding(accept_encoding: str, offered: Iterable[str]) -> str | None:
+    """
+    Pick the offered encoding the client prefers, None to send the body as it is.
+    Ties in quality are broken by the order of 'offered'.
+    """
+    qualities: dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        name, _, parameters = item.strip().partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        quality = 1.0
+        for parameter in parameters.split(";"):
+            key, _, value = parameter.strip().partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        qualities[name] = quality
+    best, best_quality = None, 0.0
+    for encoding in offered:
+        quality = qualities.get(encoding, qualities.get("*", 0.0))
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+def _is_compressible(content_type: str) -> bool:
+    media_type = content_type.split(";", 1)[0].strip().lower()
+    return (
+        media_type.startswith("text/")
+        or media_type in COMPRESSIBLE_TYPES
+        or media_type.endswith(("+json", "+xml"))
+    )
+
+
+class CompressionMiddleware:
+    """Compress the responses of a WSGI application"""
+
+    def __init__(self, app, settings: CompressionSettings | None = None):
+        self.__app = app
+        self.__settings = settings or CompressionSettings()
+        self.__encodings = available_encodings()
+
+    def __call__(self, environ, start_response):
+        accept_encoding = environ.get("HTTP_ACCEPT_ENCODING", "")
+        if (
+            not self.__settings.enabled
+            or not accept_encoding
+            or environ.get("REQUEST_METHOD") == "HEAD"
+        ):
+            return self.__app(environ, start_response)
+
+        captured = {}
+
+        def capture_start_response(status, headers, exc_info=None):
+            captured["status"] = status
+            captured["headers"] = headers
+            captured["exc_info"] = exc_info
+            return captured.setdefault("body", []).append
+
+        app_iter = self.__app(environ, capture_start_response)
+        try:
+            chunks = iter(app_iter)
+            # The application only starts the response once it is iterated
+            # when it streams, so the first chunk is read before deciding.
+            first = next(chunks, None)
+        except BaseException:
+            _close(app_iter)
+            raise
+        status, headers = captured["status"], captured["headers"]
+        written = captured.get("body", [])
+        head = [*written, *([] if first is None else [first])]
+
+        encoding = self.__pick_encoding(status, headers, accept_encoding)
+        if encoding is None:
+            start_response(status, headers, captured["exc_info"])
+            return _chain(head, chunks, app_iter)
+
+        content_length = _header(headers, "Content-Length")
+        if content_length is not None:
+            if int(content_length) < self.__settings.minimum_size:
+                start_response(status, _vary(headers), captured["exc_info"])
+                return _chain(head, chunks, app_iter)
+            try:
+                body = b"".join([*head, *chunks])
+            finally:
+                _close(app_iter)
+            compressor = self.__encodings[encoding](self.__settings)
+            compressed = compressor.compress(body) + compressor.finish()
+            headers = _encoded(headers, encoding, len(compressed))
+            start_response(status, headers, captured["exc_info"])
+            return [compressed]
+
+        # A streamed body: buffer up to the threshold to learn whether it is small.
+        size = sum(len(chunk) for chunk in head)
+        while size < self.__settings.minimum_size:
+            chunk = next(chunks, None)
+            if chunk is None:
+                _close(app_iter)
+                body = b"".join(head)
+                headers = _vary(headers) + [("Content-Length", str(len(body)))]
+                start_response(status, headers, captured["exc_info"])
+                return [body]
+            head.append(chunk)
+            size += len(chunk)
+        compressor = self.__encodings[encoding](self.__settings)
+        start_response(status, _encoded(headers, encoding), captured["exc_info"])
+        return _compress_stream(compressor, head, chunks, app_iter)
+
+    def __pick_encoding(self, status: str, headers, accept_encoding: str):
+        status_code = int(status.split(" ", 1)[0])
+        if not 200 <= status_code < 400 or status_code in _SKIPPED_STATUSES:
+            return None
+        if _header(headers, "Content-Encoding") not in (None, "identity"):
+            return None
+        if "no-transform" in (_header(headers, "Cache-Control") or "").lower():
+            return None
+        if not _is_compressible(_header(headers, "Content-Type") or ""):
+            return None
+        return negotiate_encoding(accept_encoding, self.__encodings)
+
+
+def _header(headers, name: str) -> str | None:
+    name = name.lower()
+    for key, value in headers:
+        if key.lower() == name:
+            return value
+    return None
+
+
+def _vary(headers) -> list[tuple[str, str]]:
+    """The headers with 'Accept-Encoding' added to Vary"""
+    vary = _header(headers, "Vary")
+    if vary is None:
+        return [*headers, ("Vary", "Accept-Encoding")]
+    if "accept-encoding" in vary.lower() or vary.strip() == "*":
+        return list(headers)
+    return [
+        (key, f"{value}, Accept-Encoding" if key.lower() == "vary" else value)
+        for key, value in headers
+    ]
+
+
+def _encoded(headers, encoding: str, length: int | None = None):
+    """The headers describing the compressed body"""
+    result = []
+    for key, value in _vary(headers):
+        lower = key.lower()
+        if lower == "content-length":
+            continue
+        if lower == "etag" and not value.startswith("W/"):
+            # The bytes differ from the identity body: the tag cannot be strong.
+            value = f"W/{value}"
+        result.append((key, value))
+    result.append(("Content-Encoding", encoding))
+    if length is not None:
+        result.append(("Content-Length", str(length)))
+    return result
+
+
+def _close(app_iter):
+    close = getattr(app_iter, "close", None)
+    if close is not None:
+        close()
+
+
+def _chain(head: list[bytes], chunks: Iterator[bytes], app_iter) -> Iterator[bytes]:
+    try:
+        yield from chain(head, chunks)
+    finally:
+        _close(app_iter)
+
+
+def _compress_stream(
+    compressor: _Compressor, head: list[bytes], chunks: Iterator[bytes], app_iter
+) -> Iterator[bytes]:
+    try:
+        for chunk in chain(head, chunks):
+            data = compressor.compress(chunk)
+            if data:
+                yield data
+        yield compressor.finish()
+    finally:
+        _close(app_iter)
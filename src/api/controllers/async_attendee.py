@@ -0,0 +1,74 @@
+from abc import ABC, abstractmethod
+from http import HTTPStatus
+
+from src.api.controllers.attendee import (
+    attendee_id_param,
+    attendee_registration,
+    badge_response,
+    participant_page_params,
+    participants_payload,
+)
+from src.api.types import HttpRequest, HttpResponse
+from src.modules.events.exc.attendee import (
+    AttendeeNotCreatedError,
+    AttendeeNotFoundError,
+)
+from src.modules.events.exc.http import map_exception_to_http_response
+from src.modules.events.services.async_attendee import AsyncAttendeeServiceInterface
+
+
+class AsyncAttendeeControllerInterface(ABC):
+    @abstractmethod
+    async def register_attendee(self, request: HttpRequest) -> HttpResponse:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_event_participants(self, request: HttpRequest) -> HttpResponse:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_attendee_badge(self, request: HttpRequest) -> HttpResponse:
+        raise NotImplementedError
+
+
+class AsyncAttendeeController(AsyncAttendeeControllerInterface):
+    def __init__(self, service: AsyncAttendeeServiceInterface):
+        self.__service = service
+
+    async def get_attendee_badge(self, request):
+        try:
+            attendee_id = attendee_id_param(request)
+            data = await self.__service.get_attendee_event_credential(
+                attendee_id=attendee_id
+            )
+            if not data:
+                raise AttendeeNotFoundError(
+                    "Cannot find the attendee badge for this attendee."
+                )
+            return badge_response(request, data)
+        except Exception as exc:
+            raise map_exception_to_http_response(exc) from exc
+
+    async def get_event_participants(self, request):
+        try:
+            event_id, offset, query, limit, after = participant_page_params(request)
+            page = await self.__service.get_event_attendee_rows(
+                event_id=event_id, offset=offset, query=query, limit=limit, after=after
+            )
+            result_payload = participants_payload(page, offset, limit)
+            return HttpResponse(payload=result_payload, status=HTTPStatus.OK)
+        except Exception as exc:
+            raise map_exception_to_http_response(exc) from exc
+
+    async def register_attendee(self, request):
+        try:
+            data = attendee_registration(request)
+            result_data = await self.__service.register_attendee_in_event(data=data)
+            if not result_data:
+                raise AttendeeNotCreatedError(
+                    message="An error occurs while registering the given attendee."
+                )
+            response_payload = {"attendee": result_data}
+            return HttpResponse(payload=response_payload, status=HTTPStatus.OK)
+        except Exception as exc:
+            raise map_exception_to_http_response(exc) from exc
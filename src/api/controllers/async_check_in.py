@@ -0,0 +1,33 @@
+from abc import ABC, abstractmethod
+from http import HTTPStatus
+
+from src.api.controllers.check_in import check_in_attendee_id
+from src.api.types import HttpRequest, HttpResponse
+from src.modules.events.exc.check_in import CheckInNotRegistered
+from src.modules.events.exc.http import map_exception_to_http_response
+from src.modules.events.services.async_check_in import AsyncCheckInServiceInterface
+
+
+class AsyncCheckInControllerInterface(ABC):
+    @abstractmethod
+    async def make_checkin(self, request: HttpRequest) -> HttpResponse:
+        raise NotImplementedError
+
+
+class AsyncCheckInController(AsyncCheckInControllerInterface):
+    def __init__(self, service: AsyncCheckInServiceInterface):
+        self.__service = service
+
+    async def make_checkin(self, request):
+        try:
+            check_in = await self.__service.make_event_check_in(
+                attendee_id=check_in_attendee_id(request)
+            )
+            if not check_in:
+                raise CheckInNotRegistered(
+                    "Cannot register check-in for this attendee."
+                )
+            response_payload = {"check_in": check_in}
+            return HttpResponse(payload=response_payload, status=HTTPStatus.OK)
+        except Exception as exc:
+            raise map_exception_to_http_response(exc=exc) from exc
@@ -0,0 +1,79 @@
+from abc import ABC, abstractmethod
+from http import HTTPStatus
+
+from src.api.controllers.event import (
+    event_id_param,
+    event_page_params,
+    event_registration,
+    events_payload,
+)
+from src.api.types import HttpRequest, HttpResponse
+from src.modules.events.dtos.event import EventVersionDTO
+from src.modules.events.exc.event import EventNotCreatedError, EventNotFoundError
+from src.modules.events.exc.http import map_exception_to_http_response
+from src.modules.events.services.async_event import AsyncEventServiceInterface
+
+
+class AsyncEventControllerInterface(ABC):
+    @abstractmethod
+    async def create_event(self, request: HttpRequest) -> HttpResponse:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_event(self, request: HttpRequest) -> HttpResponse:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_events(self, request: HttpRequest) -> HttpResponse:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_version(self, request: HttpRequest) -> EventVersionDTO | None:
+        raise NotImplementedError
+
+
+class AsyncEventController(AsyncEventControllerInterface):
+    def __init__(self, service: AsyncEventServiceInterface):
+        self.__service = service
+
+    async def create_event(self, request):
+        try:
+            input_data = event_registration(request)
+            created_event = await self.__service.create_event(data=input_data)
+            if not created_event:
+                raise EventNotCreatedError("An error ocurred while creating the event.")
+            response_payload = {"created_event": created_event}
+            return HttpResponse(payload=response_payload, status=HTTPStatus.OK)
+        except Exception as exc:
+            raise map_exception_to_http_response(exc=exc) from exc
+
+    async def get_event(self, request):
+        try:
+            event_id = event_id_param(request)
+            event_found = await self.__service.get_event_data(event_id=event_id)
+            if not event_found:
+                raise EventNotFoundError("Event not found.")
+            response_payload = {"event": event_found}
+            return HttpResponse(payload=response_payload, status=HTTPStatus.OK)
+        except Exception as exc:
+            raise map_exception_to_http_response(exc=exc) from exc
+
+    async def get_events(self, request):
+        try:
+            page_offset, query, limit, after = event_page_params(request)
+            events = await self.__service.list_event_rows(
+                offset=page_offset, query=query, limit=limit, after=after
+            )
+            response_payload = events_payload(events, page_offset, limit)
+            return HttpResponse(payload=response_payload, status=HTTPStatus.OK)
+        except Exception as exc:
+            raise map_exception_to_http_response(exc=exc) from exc
+
+    async def get_version(self, request):
+        """The change marker of the given event, or of the listing without one"""
+        event_id = (request.params or {}).get("event_id")
+        if event_id is None:
+            return await self.__service.get_events_version()
+        if not (event_id and isinstance(event_id, str)):
+            return None
+        return await self.__service.get_event_version(event_id=event_id)
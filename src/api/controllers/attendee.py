@@ -1,13 +1,39 @@
 from abc import ABC, abstractmethod
 from http import HTTPStatus
+from typing import Iterator
+from src.api.json_provider import dumps_bytes
 from src.api.types import HttpRequest, HttpResponse
-from src.modules.events.dtos.attendee import AttendeeRegistrationDTO
+from src.modules.events.dtos.attendee import (
+    AttendeePageDTO,
+    AttendeeRegistrationDTO,
+    AttendeeRow,
+)
+from src.modules.events.dtos.event_credentials import EventCredentialsDTO
 from src.modules.events.exc.attendee import (
     AttendeeNotCreatedError,
     AttendeeNotFoundError,
 )
+from src.modules.events.exc.common import UnsupportedMediaTypeError
 from src.modules.events.exc.http import map_exception_to_http_response
 from src.modules.events.services.attendee import AttendeeServiceInterface
+from src.utils.http_cache import etag_matches, strong_etag
+from src.utils.pagination import decode_cursor, encode_cursor, parse_page_size
+from src.utils.records import record_reader, stream_lines, write_csv, write_ndjson
+
+# Columns of the CSV export; its name and email columns import it elsewhere.
+EXPORT_COLUMNS = (
+    "attendee_id",
+    "name",
+    "email",
+    "event_id",
+    "created_at",
+    "checked_in_at",
+)
+
+EXPORT_MEDIA_TYPES = {
+    "csv": "text/csv; charset=utf-8",
+    "ndjson": "application/x-ndjson",
+}
 
 
 class AttendeeControllerInterface(ABC):
@@ -15,92 +41,210 @@ class AttendeeControllerInterface(ABC):
     def register_attendee(self, request: HttpRequest) -> HttpResponse:
         raise NotImplementedError
 
+    @abstractmethod
+    def import_attendees(self, request: HttpRequest) -> HttpResponse:
+        raise NotImplementedError
+
     @abstractmethod
     def get_event_participants(self, request: HttpRequest) -> HttpResponse:
         raise NotImplementedError
 
+    @abstractmethod
+    def export_event_participants(self, request: HttpRequest) -> HttpResponse:
+        raise NotImplementedError
+
     @abstractmethod
     def get_attendee_badge(self, request: HttpRequest) -> HttpResponse:
         raise NotImplementedError
 
 
+def badge_response(request: HttpRequest, data: EventCredentialsDTO) -> HttpResponse:
+    """The badge of the attendee, or 304 when the client copy is current"""
+    attendee_id = request.params["attendee_id"]
+    qrcode_url = None
+    if request.options and request.options.get("base_url"):
+        qrcode_url = f"{request.options.get("base_url")}/{attendee_id}/check-in"
+    response_payload = {
+        "badge_data": {
+            "name": data.name,
+            "email": data.email,
+            "event_title": data.event_title,
+            "qrcode_url": qrcode_url,
+        }
+    }
+    etag = strong_etag(response_payload)
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if_none_match = (request.headers or {}).get("If-None-Match")
+    if etag_matches(if_none_match, etag):
+        return HttpResponse(payload={}, status=HTTPStatus.NOT_MODIFIED, headers=headers)
+    return HttpResponse(payload=response_payload, status=HTTPStatus.OK, headers=headers)
+
+
+def attendee_id_param(request: HttpRequest) -> str:
+    """Read the 'attendee_id' route parameter of a badge"""
+    if not (
+        request.params
+        and request.params["attendee_id"]
+        and isinstance(request.params["attendee_id"], str)
+    ):
+        raise TypeError("You provided an invalid attendee id.")
+    return request.params["attendee_id"]
+
+
+def participant_page_params(
+    request: HttpRequest,
+) -> tuple[str, int, str, int, tuple[str, str] | None]:
+    """Read the event id, offset, search query, page size and cursor of a page"""
+    if not (
+        request.params
+        and request.params.get("event_id", None)
+        and isinstance(request.params.get("event_id", None), str)
+    ):
+        raise TypeError("You provided an invalid event id.")
+    query = request.params.get("query", "")
+    event_id = request.params.get("event_id", None)
+    offset = 0
+    if str(request.params.get("page_offset", None)).isnumeric():
+        offset = int(request.params.get("page_offset"))
+    limit = parse_page_size(request.params.get("limit"))
+    after = None
+    if request.params.get("cursor"):
+        after = decode_cursor(str(request.params["cursor"]), size=2)
+    return event_id, offset, query, limit, after
+
+
+def participants_payload(page: AttendeePageDTO, offset: int, limit: int) -> dict:
+    """The body of a page of attendees, with the cursor of the next one when full"""
+    data = page.attendees
+    next_cursor = None
+    if len(data) == limit:
+        next_cursor = encode_cursor(data[-1]["name"], data[-1]["attendee_id"])
+    return {
+        "attendees": data,
+        "total": page.total,
+        "page_offset": offset,
+        "next_cursor": next_cursor,
+    }
+
+
+def attendee_registration(request: HttpRequest) -> AttendeeRegistrationDTO:
+    """Read the attendee to register from the body and the route of the request"""
+    if not request.body:
+        raise TypeError(
+            "The request should have the required fields:\n"
+            " - 'name' : minimum of 4 chracteres without numbers or special chracteres\n"
+            " - 'email': a valid email string\n"
+        )
+    if not (request.params and request.params.get("event_id")):
+        raise TypeError("You should provide the 'event_id' route parameter")
+    return AttendeeRegistrationDTO(
+        email=request.body.get("email", ""),
+        event_id=request.params.get("event_id", ""),
+        name=request.body.get("name", ""),
+    )
+
+
+def attendee_import(request: HttpRequest) -> tuple[str, Iterator[dict | None]]:
+    """Read the event id and the records of a bulk import, from the body stream"""
+    if not (
+        request.params
+        and request.params.get("event_id")
+        and isinstance(request.params.get("event_id"), str)
+    ):
+        raise TypeError("You provided an invalid event id.")
+    reader = record_reader((request.headers or {}).get("Content-Type") or "")
+    if reader is None:
+        raise UnsupportedMediaTypeError(
+            "The body should be NDJSON ('application/x-ndjson') or CSV ('text/csv')."
+        )
+    lines = stream_lines((request.options or {})["stream"])
+    return request.params["event_id"], reader(lines)
+
+
+def participant_export_params(request: HttpRequest) -> tuple[str, str]:
+    """Read the event id and the format, 'csv' by default, of an export"""
+    if not (
+        request.params
+        and request.params.get("event_id")
+        and isinstance(request.params.get("event_id"), str)
+    ):
+        raise TypeError("You provided an invalid event id.")
+    export_format = request.params.get("format") or "csv"
+    if export_format not in EXPORT_MEDIA_TYPES:
+        raise ValueError("The export format should be 'csv' or 'ndjson'.")
+    return request.params["event_id"], export_format
+
+
+def export_response(
+    event_id: str, export_format: str, batches: Iterator[list[AttendeeRow]]
+) -> HttpResponse:
+    """The export streamed as a download, written as the batches are read"""
+    if export_format == "csv":
+        body = write_csv(EXPORT_COLUMNS, batches)
+    else:
+        body = write_ndjson(batches, dumps_bytes)
+    headers = {
+        "Content-Type": EXPORT_MEDIA_TYPES[export_format],
+        "Content-Disposition": (
+            f'attachment; filename="attendees-{event_id}.{export_format}"'
+        ),
+        "Cache-Control": "private, no-store",
+    }
+    return HttpResponse(payload={}, status=HTTPStatus.OK, headers=headers, body=body)
+
+
 class AttendeeController(AttendeeControllerInterface):
     def __init__(self, service: AttendeeServiceInterface):
         self.__service = service
 
     def get_attendee_badge(self, request):
         try:
-            if not (
-                request.params
-                and request.params["attendee_id"]
-                and isinstance(request.params["attendee_id"], str)
-            ):
-                raise TypeError("You provided an invalid attendee id.")
-            attendee_id = request.params["attendee_id"]
+            attendee_id = attendee_id_param(request)
             data = self.__service.get_attendee_event_credential(attendee_id=attendee_id)
             if not data:
                 raise AttendeeNotFoundError(
                     "Cannot find the attendee badge for this attendee."
                 )
-            qrcode_url = None
-            if request.options and request.options.get("base_url"):
-                qrcode_url = f"{request.options.get("base_url")}/{attendee_id}/check-in"
+            return badge_response(request, data)
+
+        except Exception as exc:
+            raise map_exception_to_http_response(exc) from exc
+
+    def import_attendees(self, request):
+        try:
+            event_id, records = attendee_import(request)
+            report = self.__service.import_attendees(event_id=event_id, records=records)
             response_payload = {
-                "badge_data": {
-                    "name": data.name,
-                    "email": data.email,
-                    "event_title": data.event_title,
-                    "qrcode_url": qrcode_url,
-                }
+                "created": report.created,
+                "rejected": report.rejected,
+                "rows": report.rows,
             }
             return HttpResponse(payload=response_payload, status=HTTPStatus.OK)
-
         except Exception as exc:
             raise map_exception_to_http_response(exc) from exc
 
     def get_event_participants(self, request):
         try:
-            if not (
-                request.params
-                and request.params.get("event_id", None)
-                and isinstance(request.params.get("event_id", None), str)
-            ):
-                raise TypeError("You provided an invalid event id.")
-            query = request.params.get("query", "")
-            event_id = request.params.get("event_id", None)
-            offset = 0
-            if str(request.params.get("page_offset", None)).isnumeric():
-                offset = int(request.params.get("page_offset"))
-            total = self.__service.get_total_attendees_in_event(
-                event_id=event_id, query=query
-            )
-            data = self.__service.get_event_attendees(
-                event_id=event_id, offset=offset, query=query
+            event_id, offset, query, limit, after = participant_page_params(request)
+            page = self.__service.get_event_attendee_rows(
+                event_id=event_id, offset=offset, query=query, limit=limit, after=after
             )
-            result_payload = {
-                "attendees": data or [],
-                "total": total,
-                "page_offset": offset,
-            }
+            result_payload = participants_payload(page, offset, limit)
             return HttpResponse(payload=result_payload, status=HTTPStatus.OK)
         except Exception as exc:
             raise map_exception_to_http_response(exc) from exc
 
+    def export_event_participants(self, request):
+        try:
+            event_id, export_format = participant_export_params(request)
+            batches = self.__service.export_event_attendees(event_id=event_id)
+            return export_response(event_id, export_format, batches)
+        except Exception as exc:
+            raise map_exception_to_http_response(exc) from exc
+
     def register_attendee(self, request: HttpRequest) -> HttpResponse:
         try:
-            if not request.body:
-                raise TypeError(
-                    "The request should have the required fields:\n"
-                    " - 'name' : minimum of 4 chracteres without numbers or special chracteres\n"
-                    " - 'email': a valid email string\n"
-                )
-            if not (request.params and request.params.get("event_id")):
-                raise TypeError("You should provide the 'event_id' route parameter")
-            data = AttendeeRegistrationDTO(
-                email=request.body.get("email", ""),
-                event_id=request.params.get("event_id", ""),
-                name=request.body.get("name", ""),
-            )
+            data = attendee_registration(request)
             result_data = self.__service.register_attendee_in_event(data=data)
             if not result_data:
                 raise AttendeeNotCreatedError(
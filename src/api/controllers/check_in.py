@@ -1,9 +1,12 @@
 from abc import ABC, abstractmethod
+from datetime import datetime, timezone
 from http import HTTPStatus
 
 
 from src.api.types import HttpRequest, HttpResponse
+from src.modules.events.dtos.check_in import CheckInScanDTO
 from src.modules.events.exc.check_in import CheckInNotRegistered
+from src.modules.events.exc.common import ValidationError
 from src.modules.events.exc.http import map_exception_to_http_response
 from src.modules.events.services.check_in import CheckInServiceInterface
 
@@ -13,6 +16,61 @@ class CheckInControllerInterface(ABC):
     def make_checkin(self, request: HttpRequest) -> HttpResponse:
         raise NotImplementedError
 
+    @abstractmethod
+    def sync_check_ins(self, request: HttpRequest) -> HttpResponse:
+        raise NotImplementedError
+
+
+# One IN query per batch: its ids fit the 999 bound parameters that
+# sqlite allows before 3.32 (SQLITE_MAX_VARIABLE_NUMBER).
+CHECK_IN_BATCH_LIMIT = 999
+
+
+def check_in_attendee_id(request: HttpRequest) -> str:
+    """Read the 'attendee_id' route parameter of a check-in"""
+    if not request.params or not request.params.get("attendee_id"):
+        raise TypeError("You should provide the attendee_id parameter.")
+    attendee_id = request.params.get("attendee_id")
+    if not isinstance(attendee_id, str):
+        raise TypeError("'attendee_id' should be a string.")
+    return attendee_id
+
+
+def scan_time(value) -> datetime:
+    """
+    Read an ISO 8601 scan time as a naive UTC datetime, like the check-ins
+    made online; a time without offset is taken as UTC.
+    """
+    try:
+        scanned_at = datetime.fromisoformat(value)
+    except (TypeError, ValueError) as exc:
+        raise ValidationError(
+            "The scan time should be an ISO 8601 date and time."
+        ) from exc
+    if scanned_at.tzinfo is not None:
+        scanned_at = scanned_at.astimezone(timezone.utc).replace(tzinfo=None)
+    return scanned_at
+
+
+def check_in_scans(request: HttpRequest) -> list[CheckInScanDTO]:
+    """Read the scans of a check-in batch from the body of the request"""
+    items = request.body.get("check_ins") if isinstance(request.body, dict) else None
+    if not isinstance(items, list) or not all(isinstance(i, dict) for i in items):
+        raise TypeError(
+            "The request should have a 'check_ins' list of objects with"
+            " 'attendee_id', 'scanned_at' and 'device_id'."
+        )
+    if len(items) > CHECK_IN_BATCH_LIMIT:
+        raise ValueError(f"A batch holds at most {CHECK_IN_BATCH_LIMIT} check-ins.")
+    return [
+        CheckInScanDTO(
+            attendee_id=item.get("attendee_id"),
+            scanned_at=scan_time(item.get("scanned_at")),
+            device_id=item.get("device_id"),
+        )
+        for item in items
+    ]
+
 
 class CheckInController(CheckInControllerInterface):
     def __init__(self, service: CheckInServiceInterface):
@@ -20,13 +78,8 @@ class CheckInController(CheckInControllerInterface):
 
     def make_checkin(self, request):
         try:
-            if not request.params or not request.params.get("attendee_id"):
-                raise TypeError("You should provide the attendee_id parameter.")
-            attendee_id = request.params.get("attendee_id")
-            if not isinstance(attendee_id, str):
-                raise TypeError("'attendee_id' should be a string.")
             check_in = self.__service.make_event_check_in(
-                attendee_id=request.params["attendee_id"]
+                attendee_id=check_in_attendee_id(request)
             )
             if not check_in:
                 raise CheckInNotRegistered(
@@ -36,3 +89,10 @@ class CheckInController(CheckInControllerInterface):
             return HttpResponse(payload=response_payload, status=HTTPStatus.OK)
         except Exception as exc:
             raise map_exception_to_http_response(exc=exc) from exc
+
+    def sync_check_ins(self, request):
+        try:
+            results = self.__service.sync_check_ins(scans=check_in_scans(request))
+            return HttpResponse(payload={"check_ins": results}, status=HTTPStatus.OK)
+        except Exception as exc:
+            raise map_exception_to_http_response(exc=exc) from exc
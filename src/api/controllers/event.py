@@ -1,10 +1,21 @@
 from abc import ABC, abstractmethod
+from datetime import datetime
 from http import HTTPStatus
 from src.api.types import HttpRequest, HttpResponse
-from src.modules.events.dtos.event import EventRegistrationDTO
+from src.modules.events.dtos.event import (
+    EventRegistrationDTO,
+    EventRow,
+    EventVersionDTO,
+)
 from src.modules.events.exc.event import EventNotCreatedError, EventNotFoundError
 from src.modules.events.exc.http import map_exception_to_http_response
 from src.modules.events.services.event import EventServiceInterface
+from src.utils.pagination import (
+    DEFAULT_PAGE_SIZE,
+    decode_cursor,
+    encode_cursor,
+    parse_page_size,
+)
 
 
 class EventControllerInterface(ABC):
@@ -20,6 +31,74 @@ class EventControllerInterface(ABC):
     def get_events(self, request: HttpRequest) -> HttpResponse:
         raise NotImplementedError
 
+    @abstractmethod
+    def get_version(self, request: HttpRequest) -> EventVersionDTO | None:
+        raise NotImplementedError
+
+
+def event_registration(request: HttpRequest) -> EventRegistrationDTO:
+    """Read the event to create from the body of the request"""
+    if not request.body:
+        raise TypeError(
+            "The request should have the required fields:\n"
+            " - 'title' : a string with at least 3 chracteres.\n"
+            " - 'slug': a string with at least 3 chracteres.\n"
+            " - 'details': [Optional] should be a string.\n"
+            " - 'maximum_attendees': [Optional] should be an integer.\n"
+        )
+    return EventRegistrationDTO(
+        title=request.body.get("title", ""),
+        details=request.body.get("details", ""),
+        maximum_attendees=request.body.get("maximum_attendees", None),
+        slug=request.body.get("slug"),
+    )
+
+
+def event_id_param(request: HttpRequest) -> str:
+    """Read the 'event_id' route parameter"""
+    if not request.params or not request.params["event_id"]:
+        raise TypeError("You should provide the 'event_id' parameter.")
+    event_id = request.params["event_id"]
+    if not isinstance(event_id, str):
+        raise TypeError("You provided an invalid event id.")
+    return event_id
+
+
+def event_page_params(
+    request: HttpRequest,
+) -> tuple[int, str, int, tuple[datetime, str] | None]:
+    """Read the offset, search query, page size and cursor of a listing"""
+    page_offset = 0
+    query = ""
+    limit = DEFAULT_PAGE_SIZE
+    after = None
+    if request.params:
+        if str(request.params.get("page_offset", "0")).isdigit():
+            page_offset = int(request.params.get("page_offset", "0"))
+        query = str(request.params.get("query", ""))
+        limit = parse_page_size(request.params.get("limit"))
+        if request.params.get("cursor"):
+            created_at, event_id = decode_cursor(str(request.params["cursor"]), size=2)
+            try:
+                after = (datetime.fromisoformat(created_at), event_id)
+            except (TypeError, ValueError) as exc:
+                raise ValueError("You provided an invalid cursor.") from exc
+    return page_offset, query, limit, after
+
+
+def events_payload(events: list[EventRow], page_offset: int, limit: int) -> dict:
+    """The body of a listing page, with the cursor of the next one when full"""
+    next_cursor = None
+    if len(events) == limit:
+        last = events[-1]
+        next_cursor = encode_cursor(last["created_at"], last["event_id"])
+    return {
+        "events": events,
+        "page_offset": page_offset,
+        "quantity": len(events),
+        "next_cursor": next_cursor,
+    }
+
 
 class EventController(EventControllerInterface):
     def __init__(self, service: EventServiceInterface):
@@ -27,20 +106,7 @@ class EventController(EventControllerInterface):
 
     def create_event(self, request):
         try:
-            if not request.body:
-                raise TypeError(
-                    "The request should have the required fields:\n"
-                    " - 'title' : a string with at least 3 chracteres.\n"
-                    " - 'slug': a string with at least 3 chracteres.\n"
-                    " - 'details': [Optional] should be a string.\n"
-                    " - 'maximum_attendees': [Optional] should be an integer.\n"
-                )
-            input_data = EventRegistrationDTO(
-                title=request.body.get("title", ""),
-                details=request.body.get("details", ""),
-                maximum_attendees=request.body.get("maximum_attendees", None),
-                slug=request.body.get("slug"),
-            )
+            input_data = event_registration(request)
             created_event = self.__service.create_event(data=input_data)
             if not created_event:
                 raise EventNotCreatedError("An error ocurred while creating the event.")
@@ -51,11 +117,7 @@ class EventController(EventControllerInterface):
 
     def get_event(self, request):
         try:
-            if not request.params or not request.params["event_id"]:
-                raise TypeError("You should provide the 'event_id' parameter.")
-            event_id = request.params["event_id"]
-            if not isinstance(event_id, str):
-                raise TypeError("You provided an invalid event id.")
+            event_id = event_id_param(request)
             event_found = self.__service.get_event_data(event_id=event_id)
             if not event_found:
                 raise EventNotFoundError("Event not found.")
@@ -66,19 +128,24 @@ class EventController(EventControllerInterface):
 
     def get_events(self, request):
         try:
-            page_offset = 0
-            query = ""
-            if request.params:
-                if str(request.params.get("page_offset", "0")).isdigit():
-                    page_offset = int(request.params.get("page_offset", "0"))
-                query = str(request.params.get("query", ""))
-            events = self.__service.list_events(offset=page_offset, query=query)
-            response_payload = {
-                "events": events,
-                "page_offset": page_offset,
-                "quantity": len(events),
-            }
+            page_offset, query, limit, after = event_page_params(request)
+            events = self.__service.list_event_rows(
+                offset=page_offset, query=query, limit=limit, after=after
+            )
+            response_payload = events_payload(events, page_offset, limit)
             return HttpResponse(payload=response_payload, status=HTTPStatus.OK)
 
         except Exception as exc:
             raise map_exception_to_http_response(exc=exc) from exc
+
+    def get_version(self, request):
+        """
+        The change marker of the given event, or of the listing without one.
+        An unknown or invalid event has no marker, so its request runs as usual.
+        """
+        event_id = (request.params or {}).get("event_id")
+        if event_id is None:
+            return self.__service.get_events_version()
+        if not (event_id and isinstance(event_id, str)):
+            return None
+        return self.__service.get_event_version(event_id=event_id)
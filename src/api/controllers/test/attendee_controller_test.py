@@ -1,3 +1,4 @@
+import io
 from datetime import datetime
 from http import HTTPStatus
 from unittest.mock import MagicMock
@@ -7,12 +8,22 @@ from pytest import raises
 
 from src.api.controllers.attendee import AttendeeController
 from src.api.types import HttpRequest
-from src.modules.events.dtos.attendee import AttendeeDTO, AttendeeRegistrationDTO
+from src.modules.events.dtos.attendee import (
+    AttendeeImportReportDTO,
+    AttendeeImportRowDTO,
+    AttendeeImportStatus,
+    AttendeePageDTO,
+    AttendeeRegistrationDTO,
+    AttendeeRow,
+)
 
 
 from src.modules.events.dtos.event_credentials import EventCredentialsDTO
+from src.modules.events.exc.event import EventNotFoundError, EventSoldOutError
 from src.modules.events.exc.http import HttpResponseError
 from src.modules.events.services.attendee import AttendeeServiceInterface
+from src.utils.pagination import decode_cursor, encode_cursor
+from src.utils.records import read_csv, read_ndjson
 
 
 class TestAttendeeController:
@@ -111,6 +122,23 @@ class TestAttendeeController:
             exc.value.details == "An error occurs while registering the given attendee."
         )
 
+    def test_create_attendee_in_a_sold_out_event(self):
+        controller = AttendeeController(service=self.service)
+        request = HttpRequest(
+            body={"name": "henrique", "email": "a@gmail.com"},
+            params={"event_id": "teste"},
+        )
+        self.service.register_attendee_in_event.side_effect = EventSoldOutError(
+            "This registration failed because the event has sold out."
+        )
+        with raises(HttpResponseError) as exc:
+            controller.register_attendee(request=request)
+        assert exc.value.status == HTTPStatus.CONFLICT
+        assert exc.value.title == "Event Sold Out."
+        assert exc.value.details == (
+            "This registration failed because the event has sold out."
+        )
+
     def test_create_attendee(self):
         controller = AttendeeController(service=self.service)
         request = HttpRequest(
@@ -136,7 +164,7 @@ class TestAttendeeController:
         with raises(HttpResponseError) as exc:
             controller.get_event_participants(request=request)
         self.service.register_attendee_in_event.assert_not_called()
-        self.service.get_total_attendees_in_event.assert_not_called()
+        self.service.get_event_attendee_rows.assert_not_called()
         assert exc.value.status == HTTPStatus.BAD_REQUEST
         assert exc.value.details == "You provided an invalid event id."
 
@@ -146,7 +174,7 @@ class TestAttendeeController:
         with raises(HttpResponseError) as exc:
             controller.get_event_participants(request=request)
         self.service.register_attendee_in_event.assert_not_called()
-        self.service.get_total_attendees_in_event.assert_not_called()
+        self.service.get_event_attendee_rows.assert_not_called()
 
         assert exc.value.status == HTTPStatus.BAD_REQUEST
         assert exc.value.details == "You provided an invalid event id."
@@ -157,7 +185,6 @@ class TestAttendeeController:
         with raises(HttpResponseError) as exc:
             controller.get_event_participants(request=request)
         self.service.register_attendee_in_event.assert_not_called()
-        self.service.get_total_attendees_in_event.assert_not_called()
         assert exc.value.status == HTTPStatus.BAD_REQUEST
         assert exc.value.details == "You provided an invalid event id."
 
@@ -166,26 +193,27 @@ class TestAttendeeController:
         request = HttpRequest(
             body=None, params={"event_id": "267", "page_offset": 0, "query": ""}
         )
-        self.service.get_event_attendees.return_value = None
-        self.service.get_total_attendees_in_event.return_value = 0
-        response = controller.get_event_participants(request=request)
-        self.service.get_total_attendees_in_event.assert_called_with(
-            event_id=request.params["event_id"], query=""
+        self.service.get_event_attendee_rows.return_value = AttendeePageDTO(
+            attendees=[], total=0
         )
-        self.service.get_event_attendees.assert_called_with(
+        response = controller.get_event_participants(request=request)
+        self.service.get_event_attendee_rows.assert_called_once_with(
             event_id=request.params["event_id"],
             offset=request.params["page_offset"],
             query=request.params["query"],
+            limit=10,
+            after=None,
         )
         assert response.payload["attendees"] == []
         assert response.payload["total"] == 0
+        assert response.payload["next_cursor"] is None
         assert response.status == HTTPStatus.OK
 
     def test_get_event_participants(self):
         controller = AttendeeController(service=self.service)
         request = HttpRequest(body=None, params={"event_id": "267"})
         attendees = [
-            AttendeeDTO(
+            AttendeeRow(
                 attendee_id="any",
                 checked_in_at=datetime.now(),
                 created_at=datetime.now(),
@@ -194,21 +222,70 @@ class TestAttendeeController:
                 name="any name",
             )
         ]
-        self.service.get_event_attendees.return_value = attendees
-        self.service.get_total_attendees_in_event.return_value = 1
-        response = controller.get_event_participants(request=request)
-        self.service.get_total_attendees_in_event.assert_called_with(
-            event_id=request.params["event_id"], query=""
+        self.service.get_event_attendee_rows.return_value = AttendeePageDTO(
+            attendees=attendees, total=1
         )
-        self.service.get_event_attendees.assert_called_with(
+        response = controller.get_event_participants(request=request)
+        self.service.get_event_attendee_rows.assert_called_once_with(
             event_id=request.params["event_id"],
             offset=0,
             query="",
+            limit=10,
+            after=None,
         )
         assert response.payload["attendees"] == attendees
         assert response.payload["total"] > 0
         assert response.status == HTTPStatus.OK
 
+    def test_get_event_participants_with_cursor(self):
+        controller = AttendeeController(service=self.service)
+        request = HttpRequest(
+            body=None,
+            params={
+                "event_id": "267",
+                "cursor": encode_cursor("Zed name", "zed-id"),
+                "limit": "1",
+            },
+        )
+        attendees = [
+            AttendeeRow(
+                attendee_id="any",
+                checked_in_at=None,
+                created_at=datetime.now(),
+                email="any@email.com.br",
+                event_id=request.params["event_id"],
+                name="any name",
+            )
+        ]
+        self.service.get_event_attendee_rows.return_value = AttendeePageDTO(
+            attendees=attendees, total=3
+        )
+        response = controller.get_event_participants(request=request)
+        self.service.get_event_attendee_rows.assert_called_once_with(
+            event_id=request.params["event_id"],
+            offset=0,
+            query="",
+            limit=1,
+            after=("Zed name", "zed-id"),
+        )
+        assert decode_cursor(response.payload["next_cursor"], size=2) == (
+            "any name",
+            "any",
+        )
+        assert response.payload["total"] == 3
+        assert response.status == HTTPStatus.OK
+
+    def test_get_event_participants_event_not_found(self):
+        controller = AttendeeController(service=self.service)
+        request = HttpRequest(body=None, params={"event_id": "267"})
+        self.service.get_event_attendee_rows.side_effect = EventNotFoundError(
+            "The given event not exists."
+        )
+        with raises(HttpResponseError) as exc:
+            controller.get_event_participants(request=request)
+        assert exc.value.status == HTTPStatus.NOT_FOUND
+        assert exc.value.details == "The given event not exists."
+
     def test_get_attendee_badge_without_params(self):
         controller = AttendeeController(service=self.service)
         request = HttpRequest(body=None, params=None)
@@ -295,3 +372,112 @@ class TestAttendeeController:
             "event_title": service_response.event_title,
         }
         assert response.status == HTTPStatus.OK
+
+    def test_get_attendee_badge_is_tagged(self):
+        controller = AttendeeController(service=self.service)
+        self.service.get_attendee_event_credential.return_value = EventCredentialsDTO(
+            event_title="title", email="a@gmail.com", name="name"
+        )
+        request = HttpRequest(body=None, params={"attendee_id": "267"})
+        response = controller.get_attendee_badge(request=request)
+        etag = response.headers["ETag"]
+        assert etag.startswith('"') and etag.endswith('"')
+        assert controller.get_attendee_badge(request=request).headers["ETag"] == etag
+
+        request.headers = {"If-None-Match": f'"other", {etag}'}
+        response = controller.get_attendee_badge(request=request)
+        assert response.status == HTTPStatus.NOT_MODIFIED
+        assert response.payload == {}
+        assert response.headers["ETag"] == etag
+
+        request.headers = {"If-None-Match": '"other"'}
+        response = controller.get_attendee_badge(request=request)
+        assert response.status == HTTPStatus.OK
+
+    def test_import_attendees_reads_the_stream(self):
+        controller = AttendeeController(service=self.service)
+        self.service.import_attendees.return_value = AttendeeImportReportDTO(
+            rows=[AttendeeImportRowDTO(row=1, status=AttendeeImportStatus.CREATED)],
+            created=1,
+            rejected=0,
+        )
+        request = HttpRequest(
+            body=None,
+            params={"event_id": "ev-1"},
+            options={"stream": io.BytesIO(b'{"name": "Ada", "email": "a@b.io"}\n')},
+            headers={"Content-Type": "application/x-ndjson; charset=utf-8"},
+        )
+        response = controller.import_attendees(request=request)
+        assert response.status == HTTPStatus.OK
+        assert (response.payload["created"], response.payload["rejected"]) == (1, 0)
+        kwargs = self.service.import_attendees.call_args.kwargs
+        assert kwargs["event_id"] == "ev-1"
+        assert list(kwargs["records"]) == [{"name": "Ada", "email": "a@b.io"}]
+
+    def test_import_attendees_of_unknown_format(self):
+        controller = AttendeeController(service=self.service)
+        request = HttpRequest(
+            body=None,
+            params={"event_id": "ev-1"},
+            options={"stream": io.BytesIO(b"")},
+            headers={"Content-Type": "application/json"},
+        )
+        with raises(HttpResponseError) as exc:
+            controller.import_attendees(request=request)
+        assert exc.value.status == HTTPStatus.UNSUPPORTED_MEDIA_TYPE
+        self.service.import_attendees.assert_not_called()
+
+    def test_export_participants_as_csv(self):
+        controller = AttendeeController(service=self.service)
+        row = AttendeeRow(
+            attendee_id="a-1",
+            name="Ada Lovelace",
+            email="ada@gmail.com",
+            event_id="ev-1",
+            created_at=datetime(2024, 1, 2, 10, 30),
+            checked_in_at=None,
+        )
+        self.service.export_event_attendees.return_value = iter([[row], [row]])
+        request = HttpRequest(body=None, params={"event_id": "ev-1", "format": "csv"})
+        response = controller.export_event_participants(request=request)
+        assert response.status == HTTPStatus.OK
+        assert response.headers["Content-Type"] == "text/csv; charset=utf-8"
+        assert "attendees-ev-1.csv" in response.headers["Content-Disposition"]
+        records = list(read_csv(b"".join(response.body).splitlines(keepends=True)))
+        assert records[0] == {
+            "attendee_id": "a-1",
+            "name": "Ada Lovelace",
+            "email": "ada@gmail.com",
+            "event_id": "ev-1",
+            "created_at": "2024-01-02T10:30:00",
+            "checked_in_at": "",
+        }
+        assert len(records) == 2
+
+    def test_export_participants_as_ndjson(self):
+        controller = AttendeeController(service=self.service)
+        row = AttendeeRow(
+            attendee_id="a-1",
+            name="Ada Lovelace",
+            email="ada@gmail.com",
+            event_id="ev-1",
+            created_at=datetime(2024, 1, 2, 10, 30),
+            checked_in_at=None,
+        )
+        self.service.export_event_attendees.return_value = iter([[row], []])
+        request = HttpRequest(
+            body=None, params={"event_id": "ev-1", "format": "ndjson"}
+        )
+        response = controller.export_event_participants(request=request)
+        assert response.headers["Content-Type"] == "application/x-ndjson"
+        assert list(read_ndjson(response.body)) == [
+            {**row, "created_at": "2024-01-02T10:30:00"}
+        ]
+
+    def test_export_participants_of_unknown_format(self):
+        controller = AttendeeController(service=self.service)
+        request = HttpRequest(body=None, params={"event_id": "ev-1", "format": "xlsx"})
+        with raises(HttpResponseError) as exc:
+            controller.export_event_participants(request=request)
+        assert exc.value.status == HTTPStatus.BAD_REQUEST
+        self.service.export_event_attendees.assert_not_called()
@@ -4,9 +4,10 @@ from unittest.mock import MagicMock
 
 from pytest import raises
 
-from src.api.controllers.check_in import CheckInController
+from src.api.controllers.check_in import CHECK_IN_BATCH_LIMIT, CheckInController
 from src.api.types import HttpRequest
 from src.modules.events.dtos.check_in import CheckInDTO
+from src.modules.events.exc.check_in import AlreadyCheckedInError
 from src.modules.events.exc.http import (
     HttpResponseError,
 )
@@ -71,3 +72,62 @@ class TestCheckInController:
         self.service.make_event_check_in.assert_not_called()
         assert exc.value.status == HTTPStatus.BAD_REQUEST
         assert exc.value.details == "'attendee_id' should be a string."
+
+    def test_make_check_in_twice_is_a_conflict(self):
+        controller = CheckInController(service=self.service)
+        request = HttpRequest(body=None, params={"attendee_id": "23"})
+        self.service.make_event_check_in.side_effect = AlreadyCheckedInError(
+            "Attendee has already made a check in."
+        )
+        with raises(HttpResponseError) as exc:
+            controller.make_checkin(request=request)
+        assert exc.value.status == HTTPStatus.CONFLICT
+        assert exc.value.details == "Attendee has already made a check in."
+
+    def test_sync_check_ins_reads_the_scans(self):
+        controller = CheckInController(service=self.service)
+        self.service.sync_check_ins.return_value = []
+        request = HttpRequest(
+            body={
+                "check_ins": [
+                    {
+                        "attendee_id": "23",
+                        "scanned_at": "2024-05-01T10:00:00+02:00",
+                        "device_id": "door-1",
+                    },
+                    {
+                        "attendee_id": "24",
+                        "scanned_at": "2024-05-01T08:30:00",
+                        "device_id": "door-1",
+                    },
+                ]
+            }
+        )
+        response = controller.sync_check_ins(request=request)
+        assert response.status == HTTPStatus.OK
+        assert response.payload == {"check_ins": []}
+        scans = self.service.sync_check_ins.call_args.kwargs["scans"]
+        assert [scan.scanned_at for scan in scans] == [
+            datetime(2024, 5, 1, 8),
+            datetime(2024, 5, 1, 8, 30),
+        ]
+
+    def test_sync_check_ins_with_invalid_scans(self):
+        controller = CheckInController(service=self.service)
+        for body, status in (
+            (None, HTTPStatus.BAD_REQUEST),
+            ({"check_ins": ["23"]}, HTTPStatus.BAD_REQUEST),
+            ({"check_ins": [{}] * (CHECK_IN_BATCH_LIMIT + 1)}, HTTPStatus.BAD_REQUEST),
+            (
+                {"check_ins": [{"attendee_id": "23", "scanned_at": "2024-05-01"}]},
+                HTTPStatus.UNPROCESSABLE_ENTITY,
+            ),
+            (
+                {"check_ins": [{"attendee_id": "23", "scanned_at": "now"}]},
+                HTTPStatus.UNPROCESSABLE_ENTITY,
+            ),
+        ):
+            with raises(HttpResponseError) as exc:
+                controller.sync_check_ins(request=HttpRequest(body=body))
+            assert exc.value.status == status
+        self.service.sync_check_ins.assert_not_called()
@@ -10,11 +10,14 @@ from src.modules.events.dtos.event import (
     EventDTO,
     EventDTOWithAmount,
     EventRegistrationDTO,
+    EventRow,
+    EventVersionDTO,
 )
 from src.modules.events.exc.http import (
     HttpResponseError,
 )
 from src.modules.events.services.event import EventServiceInterface
+from src.utils.pagination import decode_cursor, encode_cursor
 
 
 class TestEventController:
@@ -87,7 +90,7 @@ class TestEventController:
         controller = EventController(service=self.service)
         request = HttpRequest(body=None)
         event_response = [
-            EventDTOWithAmount(
+            EventRow(
                 created_at=datetime.now(),
                 details="anything",
                 event_id="anything too",
@@ -97,10 +100,12 @@ class TestEventController:
                 attendee_amount=2,
             )
         ]
-        self.service.list_events.return_value = event_response
+        self.service.list_event_rows.return_value = event_response
 
         result = controller.get_events(request=request)
-        self.service.list_events.assert_called_with(offset=0, query="")
+        self.service.list_event_rows.assert_called_with(
+            offset=0, query="", limit=10, after=None
+        )
 
         assert result.status == HTTPStatus.OK
         assert result.payload["events"] == event_response
@@ -109,7 +114,7 @@ class TestEventController:
         controller = EventController(service=self.service)
         request = HttpRequest(body=None, params={"query": "any"})
         event_response = [
-            EventDTOWithAmount(
+            EventRow(
                 created_at=datetime.now(),
                 details="anything",
                 event_id="anything too",
@@ -119,11 +124,11 @@ class TestEventController:
                 attendee_amount=2,
             )
         ]
-        self.service.list_events.return_value = event_response
+        self.service.list_event_rows.return_value = event_response
 
         result = controller.get_events(request=request)
-        self.service.list_events.assert_called_with(
-            offset=0, query=request.params["query"]
+        self.service.list_event_rows.assert_called_with(
+            offset=0, query=request.params["query"], limit=10, after=None
         )
 
         assert result.status == HTTPStatus.OK
@@ -133,7 +138,7 @@ class TestEventController:
         controller = EventController(service=self.service)
         request = HttpRequest(body=None, params={"page_offset": "2"})
         event_response = [
-            EventDTOWithAmount(
+            EventRow(
                 created_at=datetime.now(),
                 details="anything",
                 event_id="anything too",
@@ -143,10 +148,12 @@ class TestEventController:
                 attendee_amount=2,
             )
         ]
-        self.service.list_events.return_value = event_response
+        self.service.list_event_rows.return_value = event_response
 
         result = controller.get_events(request=request)
-        self.service.list_events.assert_called_with(offset=2, query="")
+        self.service.list_event_rows.assert_called_with(
+            offset=2, query="", limit=10, after=None
+        )
 
         assert result.status == HTTPStatus.OK
         assert result.payload["events"] == event_response
@@ -155,7 +162,7 @@ class TestEventController:
         controller = EventController(service=self.service)
         request = HttpRequest(body=None, params={"page_offset": "-2"})
         event_response = [
-            EventDTOWithAmount(
+            EventRow(
                 created_at=datetime.now(),
                 details="anything",
                 event_id="anything too",
@@ -165,21 +172,87 @@ class TestEventController:
                 attendee_amount=2,
             )
         ]
-        self.service.list_events.return_value = event_response
+        self.service.list_event_rows.return_value = event_response
 
         result = controller.get_events(request=request)
-        self.service.list_events.assert_called_with(offset=0, query="")
+        self.service.list_event_rows.assert_called_with(
+            offset=0, query="", limit=10, after=None
+        )
 
         assert result.status == HTTPStatus.OK
         assert result.payload["events"] == event_response
 
+    def test_get_event_list_with_cursor(self):
+        controller = EventController(service=self.service)
+        created_at = datetime(2024, 1, 1, 10, 30)
+        request = HttpRequest(
+            body=None,
+            params={"cursor": encode_cursor(created_at, "last-id"), "limit": "1"},
+        )
+        event_response = [
+            EventRow(
+                created_at=created_at,
+                details="anything",
+                event_id="anything too",
+                maximum_attendees=None,
+                slug="any-slug",
+                title="any title",
+                attendee_amount=2,
+            )
+        ]
+        self.service.list_event_rows.return_value = event_response
+
+        result = controller.get_events(request=request)
+        self.service.list_event_rows.assert_called_with(
+            offset=0, query="", limit=1, after=(created_at, "last-id")
+        )
+
+        assert result.status == HTTPStatus.OK
+        assert decode_cursor(result.payload["next_cursor"], size=2) == (
+            str(created_at),
+            "anything too",
+        )
+
+    def test_get_event_list_last_page_has_no_cursor(self):
+        controller = EventController(service=self.service)
+        request = HttpRequest(body=None, params={"limit": "5"})
+        self.service.list_event_rows.return_value = []
+
+        result = controller.get_events(request=request)
+        self.service.list_event_rows.assert_called_with(
+            offset=0, query="", limit=5, after=None
+        )
+        assert result.payload["next_cursor"] is None
+
+    def test_get_event_list_with_invalid_cursor(self):
+        controller = EventController(service=self.service)
+        request = HttpRequest(body=None, params={"cursor": "not a cursor"})
+        with raises(HttpResponseError) as exc:
+            controller.get_events(request=request)
+        self.service.list_event_rows.assert_not_called()
+        assert exc.value.status == HTTPStatus.BAD_REQUEST
+        assert exc.value.details == "You provided an invalid cursor."
+
+    def test_get_event_list_with_invalid_cursor_timestamp(self):
+        controller = EventController(service=self.service)
+        request = HttpRequest(
+            body=None, params={"cursor": encode_cursor("yesterday", "last-id")}
+        )
+        with raises(HttpResponseError) as exc:
+            controller.get_events(request=request)
+        self.service.list_event_rows.assert_not_called()
+        assert exc.value.status == HTTPStatus.BAD_REQUEST
+        assert exc.value.details == "You provided an invalid cursor."
+
     def test_get_event_list_goes_wrong(self):
         controller = EventController(service=self.service)
         request = HttpRequest(body=None, params={"page_offset": "-2"})
-        self.service.list_events.side_effect = Exception("any")
+        self.service.list_event_rows.side_effect = Exception("any")
         with raises(HttpResponseError) as exc:
             controller.get_events(request=request)
-        self.service.list_events.assert_called_with(offset=0, query="")
+        self.service.list_event_rows.assert_called_with(
+            offset=0, query="", limit=10, after=None
+        )
 
         assert exc.value.status == HTTPStatus.INTERNAL_SERVER_ERROR
         assert exc.value.details == "any"
@@ -330,3 +403,20 @@ class TestEventController:
         self.service.create_event.assert_called_once_with(data=input_data)
         assert response.payload["created_event"] == response_data
         assert response.status == HTTPStatus.OK
+
+    def test_get_version(self):
+        controller = EventController(service=self.service)
+        marker = EventVersionDTO(version=2, updated_at=datetime(2024, 1, 1))
+        self.service.get_events_version.return_value = marker
+        self.service.get_event_version.return_value = marker
+        assert controller.get_version(request=HttpRequest(body=None)) is marker
+        self.service.get_events_version.assert_called_once_with()
+        request = HttpRequest(body=None, params={"event_id": "12"})
+        assert controller.get_version(request=request) is marker
+        self.service.get_event_version.assert_called_once_with(event_id="12")
+
+    def test_get_version_of_invalid_event(self):
+        controller = EventController(service=self.service)
+        request = HttpRequest(body=None, params={"event_id": ""})
+        assert controller.get_version(request=request) is None
+        self.service.get_event_version.assert_not_called()
@@ -0,0 +1,70 @@
+"""
+This module builds the Flask application.
+
+'create_app' wires the application without touching the database: the
+engine is created by the first request of the process (or by the first
+command that needs it), and the pending migrations run right then, once per
+engine. A pre-forking server may therefore build the application in its
+master process, and every worker still opens its own connections.
+
+Options read from 'config', on top of the Flask ones:
+
+    DATABASE_SETTINGS  DatabaseSettings of the engine, else read from the environment
+    APPLY_MIGRATIONS   True, migrate the schema when the engine is created
+    COMPRESSION        CompressionSettings, else read from the environment
+    GROUP_COMMIT       GroupCommitSettings, else read from the environment
+"""
+
+from typing import Any, Mapping
+
+from flask import Flask
+from flask_cors import CORS
+
+from src.api.commands import reconcile_counters_command
+from src.api.composer.container import container
+from src.api.compression import CompressionMiddleware, load_compression_settings
+from src.api.json_provider import FastJSONProvider
+from src.api.routes.attendees import attendee_blueprint
+from src.api.routes.check_ins import check_in_blueprint
+from src.api.routes.events import event_blueprint
+from src.api.unit_of_work import register_unit_of_work
+from src.drivers.database.group_commit import (
+    GroupCommitWriter,
+    load_group_commit_settings,
+)
+from src.drivers.database.migrations import apply_migrations
+from src.drivers.database.types import ConnectionInterface
+
+
+def create_app(config: Mapping[str, Any] | None = None) -> Flask:
+    """Build a configured application, the database is left for the first request"""
+    app = Flask(__name__)
+    app.config.update(
+        APPLY_MIGRATIONS=True,
+        DATABASE_SETTINGS=None,
+        COMPRESSION=None,
+        GROUP_COMMIT=None,
+    )
+    app.config.from_mapping(config or {})
+
+    connection = container.resolve(ConnectionInterface)
+    if app.config["DATABASE_SETTINGS"] is not None:
+        connection.configure(app.config["DATABASE_SETTINGS"])
+    if app.config["APPLY_MIGRATIONS"]:
+        connection.on_engine_created(apply_migrations)
+    container.resolve(GroupCommitWriter).configure(
+        app.config["GROUP_COMMIT"] or load_group_commit_settings()
+    )
+
+    app.json = FastJSONProvider(app)
+    app.wsgi_app = CompressionMiddleware(
+        app.wsgi_app, app.config["COMPRESSION"] or load_compression_settings()
+    )
+    CORS(app=app)
+    register_unit_of_work(app=app, connection=connection)
+
+    app.register_blueprint(event_blueprint)
+    app.register_blueprint(attendee_blueprint)
+    app.register_blueprint(check_in_blueprint)
+    app.cli.add_command(reconcile_counters_command)
+    return app
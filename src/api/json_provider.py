@@ -0,0 +1,79 @@
+"""
+This module contains the JSON provider installed on the Flask application.
+
+Responses are built from dataclasses (DTOs and entities) holding datetimes.
+Flask's default provider copies every dataclass through 'dataclasses.asdict'
+and formats datetimes as HTTP dates; this one reads the fields in place and
+writes datetimes as ISO-8601. When orjson is installed it serializes and
+parses the bodies natively, otherwise the standard library is used.
+"""
+
+import dataclasses
+import decimal
+import json
+import uuid
+from datetime import date, datetime, time
+from enum import Enum
+from functools import cache
+from typing import Any
+
+from flask import Response
+from flask.json.provider import JSONProvider
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+
+
+@cache
+def _field_names(cls: type) -> tuple[str, ...]:
+    return tuple(field.name for field in dataclasses.fields(cls))
+
+
+def _default(obj: Any) -> Any:
+    """Convert the values the json module does not know, one level at a time"""
+    if isinstance(obj, (datetime, date, time)):
+        return obj.isoformat()
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        # Nested values are converted when the encoder reaches them.
+        return {name: getattr(obj, name) for name in _field_names(type(obj))}
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, (decimal.Decimal, uuid.UUID)):
+        return str(obj)
+    if hasattr(obj, "__html__"):
+        return str(obj.__html__())
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps_bytes(obj: Any, use_orjson: bool = orjson is not None) -> bytes:
+    """Serialize a response body the way the provider does, without an app"""
+    if use_orjson:
+        return orjson.dumps(obj, default=_default, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(
+        obj, default=_default, ensure_ascii=False, separators=(",", ":")
+    ).encode()
+
+
+class FastJSONProvider(JSONProvider):
+    """Serialize with orjson when available, else with a single-pass json encoder"""
+
+    use_orjson: bool = orjson is not None
+    mimetype = "application/json"
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return self.dumps_bytes(obj).decode()
+
+    def dumps_bytes(self, obj: Any) -> bytes:
+        """Serialize straight to the bytes sent in the response body"""
+        return dumps_bytes(obj, use_orjson=self.use_orjson)
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        if self.use_orjson:
+            return orjson.loads(s)
+        return json.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(self.dumps_bytes(obj), mimetype=self.mimetype)
@@ -1,12 +1,16 @@
-from http import HTTPMethod
-from flask import Blueprint, request, jsonify
+from http import HTTPMethod, HTTPStatus
+from flask import Blueprint, Response, request, jsonify
 
+from src.api.caching import CachePolicy, conditional
 from src.api.composer.attendee import attendee_composer
+from src.api.routes.events import event_version
 from src.api.types import HttpRequest, HttpResponse
 from src.modules.events.exc.http import HttpResponseError
 
 attendee_blueprint = Blueprint("attendee", __name__)
-attendee_controller = attendee_composer()
+
+# Attendee pages carry e-mails: only the client may keep them, revalidating.
+PARTICIPANTS_POLICY = CachePolicy(cache_control="private, no-cache")
 
 
 @attendee_blueprint.route("/events/<event_id>/attendee", methods=[HTTPMethod.POST])
@@ -14,7 +18,29 @@ def create_attendee(event_id):
     try:
         data_json = request.get_json()
         data_request = HttpRequest(body=data_json, params={"event_id": event_id})
-        response = attendee_controller.register_attendee(request=data_request)
+        response = attendee_composer().register_attendee(request=data_request)
+        return (jsonify(response.payload), response.status)
+
+    except HttpResponseError as exc:
+        response = HttpResponse(
+            payload={"title": exc.title, "details": exc.details}, status=exc.status
+        )
+        return (jsonify(response.payload), response.status)
+
+
+@attendee_blueprint.route(
+    "/events/<event_id>/attendees:bulk", methods=[HTTPMethod.POST]
+)
+def import_attendees(event_id):
+    try:
+        # The rows are read from the stream while they are registered.
+        data_request = HttpRequest(
+            body=None,
+            params={"event_id": event_id},
+            options={"stream": request.stream},
+            headers={"Content-Type": request.content_type},
+        )
+        response = attendee_composer().import_attendees(request=data_request)
         return (jsonify(response.payload), response.status)
 
     except HttpResponseError as exc:
@@ -25,6 +51,7 @@ def create_attendee(event_id):
 
 
 @attendee_blueprint.route("/events/<event_id>/attendees", methods=[HTTPMethod.GET])
+@conditional(PARTICIPANTS_POLICY, version_of=event_version)
 def get_participants(event_id):
     try:
         data_request = HttpRequest(
@@ -33,11 +60,36 @@ def get_participants(event_id):
                 "event_id": event_id,
                 "page_offset": request.args.get("page_offset", "0", type=str),
                 "query": request.args.get("query", "", type=str),
+                "limit": request.args.get("limit", None, type=str),
+                "cursor": request.args.get("cursor", None, type=str),
             },
         )
-        response = attendee_controller.get_event_participants(request=data_request)
+        response = attendee_composer().get_event_participants(request=data_request)
+        return (jsonify(response.payload), response.status)
+
+    except HttpResponseError as exc:
+        response = HttpResponse(
+            payload={"title": exc.title, "details": exc.details}, status=exc.status
+        )
         return (jsonify(response.payload), response.status)
 
+
+@attendee_blueprint.route(
+    "/events/<event_id>/attendees/export", methods=[HTTPMethod.GET]
+)
+def export_participants(event_id):
+    try:
+        data_request = HttpRequest(
+            body=None,
+            params={
+                "event_id": event_id,
+                "format": request.args.get("format", "csv", type=str),
+            },
+        )
+        response = attendee_composer().export_event_participants(request=data_request)
+        # The rows are read while the body is sent, after the request ends.
+        return Response(response.body, status=response.status, headers=response.headers)
+
     except HttpResponseError as exc:
         response = HttpResponse(
             payload={"title": exc.title, "details": exc.details}, status=exc.status
@@ -52,9 +104,12 @@ def get_badge(attendee_id):
             body=None,
             params={"attendee_id": attendee_id},
             options={"base_url": f"{request.host_url}/attendees"},
+            headers={"If-None-Match": request.headers.get("If-None-Match")},
         )
-        response = attendee_controller.get_attendee_badge(request=data_request)
-        return (jsonify(response.payload), response.status)
+        response = attendee_composer().get_attendee_badge(request=data_request)
+        if response.status == HTTPStatus.NOT_MODIFIED:
+            return ("", response.status, response.headers)
+        return (jsonify(response.payload), response.status, response.headers)
 
     except HttpResponseError as exc:
         response = HttpResponse(
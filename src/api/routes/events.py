@@ -1,12 +1,26 @@
 from http import HTTPMethod
 from flask import Blueprint, request, jsonify
 
+from src.api.caching import CachePolicy, conditional
 from src.api.composer.event import event_composer
 from src.api.types import HttpRequest, HttpResponse
 from src.modules.events.exc.http import HttpResponseError
 
 event_blueprint = Blueprint("event", __name__)
-event_controller = event_composer()
+
+# Listings are revalidated on every poll, the 304 skips the page query.
+EVENT_LIST_POLICY = CachePolicy(cache_control="public, no-cache")
+EVENT_POLICY = CachePolicy(cache_control="public, max-age=5, must-revalidate")
+
+
+def events_version():
+    return event_composer().get_version(request=HttpRequest(body=None))
+
+
+def event_version(event_id):
+    return event_composer().get_version(
+        request=HttpRequest(body=None, params={"event_id": event_id})
+    )
 
 
 @event_blueprint.route("/events", methods=[HTTPMethod.POST])
@@ -14,7 +28,7 @@ def create_event_route():
     try:
         data_json = request.get_json()
         data_request = HttpRequest(body=data_json, params=None)
-        response = event_controller.create_event(request=data_request)
+        response = event_composer().create_event(request=data_request)
         return (jsonify(response.payload), response.status)
 
     except HttpResponseError as exc:
@@ -25,6 +39,7 @@ def create_event_route():
 
 
 @event_blueprint.route("/events", methods=[HTTPMethod.GET])
+@conditional(EVENT_LIST_POLICY, version_of=events_version)
 def get_event_routes():
     try:
         data_request = HttpRequest(
@@ -32,9 +47,11 @@ def get_event_routes():
             params={
                 "page_offset": request.args.get("page_offset", "0", type=str),
                 "query": request.args.get("query", "", type=str),
+                "limit": request.args.get("limit", None, type=str),
+                "cursor": request.args.get("cursor", None, type=str),
             },
         )
-        response = event_controller.get_events(request=data_request)
+        response = event_composer().get_events(request=data_request)
         return (jsonify(response.payload), response.status)
 
     except HttpResponseError as exc:
@@ -45,10 +62,11 @@ def get_event_routes():
 
 
 @event_blueprint.route("/events/<event_id>", methods=[HTTPMethod.GET])
+@conditional(EVENT_POLICY, version_of=event_version)
 def get_event_route(event_id):
     try:
         data_request = HttpRequest(body=None, params={"event_id": event_id})
-        response = event_controller.get_event(request=data_request)
+        response = event_composer().get_event(request=data_request)
         return (jsonify(response.payload), response.status)
 
     except HttpResponseError as exc:
@@ -1,16 +1,32 @@
-from flask import Flask
-from flask_cors import CORS
+"""
+Entry point of the WSGI application.
 
-from src.drivers.database.connection import connection
+Importing this module is meant to be close to free: Flask, SQLAlchemy and
+the routes are only loaded when the application is built, either by
+'create_app' or by the first access to 'app', the application built from
+the environment that 'src.api.server:app' names for the WSGI servers.
+"""
 
-connection.make_connection()
-app = Flask(__name__)
-CORS(app=app)
+from typing import TYPE_CHECKING, Any, Mapping
 
-from .routes.events import event_blueprint
-from .routes.attendees import attendee_blueprint
-from .routes.check_ins import check_in_blueprint
+if TYPE_CHECKING:
+    from flask import Flask
 
-app.register_blueprint(event_blueprint)
-app.register_blueprint(attendee_blueprint)
-app.register_blueprint(check_in_blueprint)
+_app = None
+
+
+def create_app(config: Mapping[str, Any] | None = None) -> "Flask":
+    """Build a new application, see src.api.factory for the options"""
+    # pylint: disable-next=import-outside-toplevel
+    from src.api.factory import create_app as build_app
+
+    return build_app(config)
+
+
+def __getattr__(name: str):
+    global _app  # pylint: disable=global-statement
+    if name != "app":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    if _app is None:
+        _app = create_app()
+    return _app
@@ -0,0 +1,424 @@
+"""
+This module contains the production launcher of the application.
+
+Three modes are offered, all without the debugger and the reloader of run.py:
+
+    prefork   A master process binds the socket, builds the application and
+              forks 'workers' processes that serve it with 'threads' threads
+              each. A worker is replaced after 'max_requests' requests (plus
+              a random jitter, so they do not restart together) or once its
+              resident memory passes 'max_memory' MiB. SIGTERM or SIGINT on
+              the master stops accepting, lets the workers finish their
+              requests for up to 'graceful_timeout' seconds, then each one
+              closes its database pool.
+    threaded  One process with a pool of 'threads' threads, for development
+              and for platforms without fork.
+    asgi      The ASGI application of src.api.asgi on uvicorn (an optional
+              dependency, like aiosqlite), 'workers' processes each running
+              one event loop; 'threads' and 'max_memory' do not apply.
+
+The settings are read from a JSON file pointed by 'SERVER_CONFIG_FILE' and
+then from the environment, so a variable always overrides the file:
+
+    SERVER_MODE                 prefork | threaded | asgi
+    SERVER_HOST                 0.0.0.0
+    SERVER_PORT                 4444
+    SERVER_WORKERS              2
+    SERVER_THREADS              4
+    SERVER_MAX_REQUESTS         5000 (0 never recycles)
+    SERVER_MAX_REQUESTS_JITTER  500
+    SERVER_MAX_MEMORY           256 (MiB of resident memory, 0 never recycles)
+    SERVER_GRACEFUL_TIMEOUT     30 (seconds to drain before a worker is killed)
+    SERVER_KEEPALIVE            5 (seconds a silent client holds a thread; the
+                                WSGI modes close the connection after each
+                                response, the asgi mode keeps it this long)
+    SERVER_BACKLOG              2048
+
+The file uses the same names in lower case, e.g. {"workers": 4}.
+
+Measure with benchmarks/server_workers.py on the target machine before
+changing the defaults. SQLite takes one writer at a time, so workers beyond
+the number of cores mostly queue on the write lock while each one adds its
+memory and its cache; the threads overlap the time spent in sqlite and in
+the socket, where the GIL is released. On a single core every combination
+tops out at the same throughput and the extra processes only lengthen the
+tail (p99 of ~100 ms with one worker, ~300 ms with two), so run one worker
+there.
+"""
+
+import json
+import logging
+import os
+import random
+import signal
+import socket
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, fields, replace
+from typing import Mapping
+
+from werkzeug.serving import BaseWSGIServer, WSGIRequestHandler
+
+from src.api.composer.container import container
+from src.drivers.database.types import ConnectionInterface
+
+logger = logging.getLogger(__name__)
+
+CONFIG_FILE_VARIABLE = "SERVER_CONFIG_FILE"
+
+MODES = ("prefork", "threaded", "asgi")
+
+
+@dataclass(frozen=True)
+class ServerSettings:
+    """How many processes and threads serve the application and for how long"""
+
+    mode: str = "prefork"
+    host: str = "0.0.0.0"
+    port: int = 4444
+    workers: int = 2
+    threads: int = 4
+    max_requests: int = 5000
+    max_requests_jitter: int = 500
+    max_memory: int = 256
+    graceful_timeout: float = 30.0
+    keepalive: float = 5.0
+    backlog: int = 2048
+
+    def __post_init__(self):
+        if self.mode not in MODES:
+            raise ValueError(
+                f"Invalid server setting mode={self.mode!r},"
+                f" expected one of {', '.join(MODES)}."
+            )
+        for name in ("workers", "threads"):
+            if getattr(self, name) < 1:
+                raise ValueError(f"The server setting {name} should be at least 1.")
+        for name in ("max_requests", "max_requests_jitter", "max_memory"):
+            if getattr(self, name) < 0:
+                raise ValueError(f"The server setting {name} cannot be negative.")
+
+
+def _convert(name: str, value):
+    """Cast a raw value from the file or the environment to the field type"""
+    default = getattr(ServerSettings, name)
+    try:
+        if isinstance(default, int):
+            return int(value)
+        if isinstance(default, float):
+            return float(value)
+    except (TypeError, ValueError) as exc:
+        raise ValueError(f"Invalid server setting {name}={value!r}.") from exc
+    return str(value).strip().lower() if name == "mode" else str(value)
+
+
+def load_server_settings(environ: Mapping[str, str] | None = None) -> ServerSettings:
+    """
+    Build the settings from the defaults, the config file and the environment.
+    Raises: ValueError when a value is invalid or the file has unknown keys
+    """
+    environ = os.environ if environ is None else environ
+    names = {field.name for field in fields(ServerSettings)}
+    values = {}
+    config_file = environ.get(CONFIG_FILE_VARIABLE)
+    if config_file:
+        with open(config_file, encoding="utf-8") as file:
+            content = json.load(file)
+        unknown = set(content) - names
+        if unknown:
+            raise ValueError(
+                f"Unknown server settings in {config_file}:"
+                f" {', '.join(sorted(unknown))}."
+            )
+        values.update(content)
+    for name in names:
+        variable = f"SERVER_{name.upper()}"
+        if variable in environ:
+            values[name] = environ[variable]
+    return replace(
+        ServerSettings(),
+        **{name: _convert(name, value) for name, value in values.items()},
+    )
+
+
+def resident_memory() -> int:
+    """Resident memory of this process in bytes, the peak where not available"""
+    try:
+        with open("/proc/self/statm", encoding="ascii") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        # pylint: disable-next=import-outside-toplevel
+        import resource
+
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+
+
+class PooledWSGIServer(BaseWSGIServer):
+    """
+    A WSGI server handing each connection to a fixed pool of threads.
+    It stops by itself after 'max_requests' requests or once the process
+    holds more than 'max_memory' bytes, and closing it waits for the
+    requests in progress.
+    """
+
+    multithread = True
+
+    def __init__(
+        self,
+        app,
+        threads: int,
+        keepalive: float,
+        fd: int | None = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        max_requests: int = 0,
+        max_memory: int = 0,
+    ):
+        handler = type(
+            "TimeoutRequestHandler",
+            (WSGIRequestHandler,),
+            {"protocol_version": "HTTP/1.1", "timeout": keepalive},
+        )
+        super().__init__(host, port, self.__count(app), handler=handler, fd=fd)
+        self.__executor = ThreadPoolExecutor(
+            max_workers=threads, thread_name_prefix="request"
+        )
+        self.__max_requests = max_requests
+        self.__max_memory = max_memory
+        self.__served = 0
+        self.__lock = threading.Lock()
+        self.__stopping = threading.Event()
+
+    def __count(self, app):
+        def counted_app(environ, start_response):
+            try:
+                return app(environ, start_response)
+            finally:
+                self.__request_done()
+
+        return counted_app
+
+    def __request_done(self):
+        with self.__lock:
+            self.__served += 1
+            served = self.__served
+        if self.__max_requests and served >= self.__max_requests:
+            self.stop(f"served {served} requests")
+        elif self.__max_memory and resident_memory() > self.__max_memory:
+            self.stop(f"holds more than {self.__max_memory // 2**20} MiB")
+
+    @property
+    def served(self) -> int:
+        """The requests answered so far"""
+        return self.__served
+
+    def stop(self, reason: str = "asked to stop"):
+        """Stop accepting connections, from any thread but the serving one"""
+        if self.__stopping.is_set():
+            return
+        self.__stopping.set()
+        logger.info("Worker %s stopping: %s.", os.getpid(), reason)
+        threading.Thread(target=self.shutdown, daemon=True).start()
+
+    def process_request(self, request, client_address):
+        self.__executor.submit(self.__process, request, client_address)
+
+    def __process(self, request, client_address):
+        try:
+            self.finish_request(request, client_address)
+        except Exception:  # pylint: disable=broad-exception-caught
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+
+    def serve_forever(self, poll_interval: float = 0.5):
+        try:
+            super().serve_forever(poll_interval=poll_interval)
+        finally:
+            # Drain: the connections already accepted are answered first.
+            self.__executor.shutdown(wait=True)
+
+
+def _close_database():
+    container.resolve(ConnectionInterface).disconnect()
+
+
+def _listening_socket(settings: ServerSettings) -> socket.socket:
+    listener = socket.create_server(
+        (settings.host, settings.port), backlog=settings.backlog, reuse_port=False
+    )
+    # Every worker waits on this socket: the ones losing the race for a
+    # connection must get an error instead of blocking in accept().
+    listener.setblocking(False)
+    listener.set_inheritable(True)
+    return listener
+
+
+def serve_threaded(app, settings: ServerSettings):
+    """Serve in this process until SIGTERM or SIGINT, then drain and close"""
+    server = PooledWSGIServer(
+        app,
+        threads=settings.threads,
+        keepalive=settings.keepalive,
+        host=settings.host,
+        port=settings.port,
+    )
+    for signum in (signal.SIGTERM, signal.SIGINT):
+        signal.signal(signum, lambda *_: server.stop("signal received"))
+    logger.info(
+        "Serving on %s:%s with %s threads.",
+        settings.host,
+        server.port,
+        settings.threads,
+    )
+    try:
+        server.serve_forever()
+    finally:
+        _close_database()
+
+
+class PreforkServer:
+    """A master process keeping 'workers' forked copies of the application alive"""
+
+    def __init__(self, app, settings: ServerSettings):
+        self.__app = app
+        self.__settings = settings
+        self.__workers: dict[int, float] = {}
+        self.__stopping = False
+        self.__listener: socket.socket | None = None
+
+    @property
+    def port(self) -> int | None:
+        return self.__listener.getsockname()[1] if self.__listener else None
+
+    def run(self):
+        self.__listener = _listening_socket(self.__settings)
+        signal.signal(signal.SIGTERM, self.__stop)
+        signal.signal(signal.SIGINT, self.__stop)
+        logger.info(
+            "Serving on %s:%s with %s workers of %s threads.",
+            self.__settings.host,
+            self.port,
+            self.__settings.workers,
+            self.__settings.threads,
+        )
+        try:
+            while not self.__stopping:
+                self.__reap()
+                while len(self.__workers) < self.__settings.workers:
+                    self.__spawn()
+                time.sleep(0.2)
+            self.__drain()
+        finally:
+            self.__listener.close()
+            _close_database()
+
+    def __stop(self, *_):
+        self.__stopping = True
+
+    def __spawn(self):
+        pid = os.fork()
+        if pid == 0:  # pragma: no cover - runs in the worker
+            code = 1
+            try:
+                code = self.__work()
+            except BaseException:  # pylint: disable=broad-exception-caught
+                logger.exception("Worker %s failed.", os.getpid())
+            finally:
+                # Never return into the loop of the master.
+                logging.shutdown()
+                os._exit(code)
+        self.__workers[pid] = time.monotonic()
+
+    def __work(self) -> int:
+        # Ctrl-C reaches the whole process group: only the master handles it.
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+        settings = self.__settings
+        jitter = random.randint(0, settings.max_requests_jitter)
+        server = PooledWSGIServer(
+            self.__app,
+            threads=settings.threads,
+            keepalive=settings.keepalive,
+            fd=self.__listener.fileno(),
+            host=settings.host,
+            max_requests=settings.max_requests + jitter if settings.max_requests else 0,
+            max_memory=settings.max_memory * 2**20,
+        )
+        signal.signal(signal.SIGTERM, lambda *_: server.stop("signal received"))
+        try:
+            server.serve_forever()
+        finally:
+            _close_database()
+        return 0
+
+    def __reap(self):
+        while self.__workers:
+            pid, status = os.waitpid(-1, os.WNOHANG)
+            if pid == 0:
+                return
+            started = self.__workers.pop(pid, None)
+            code = os.waitstatus_to_exitcode(status)
+            if code != 0:
+                logger.warning("Worker %s exited with %s.", pid, code)
+                if started is not None and time.monotonic() - started < 1:
+                    # Do not spin when the workers die as soon as they start.
+                    time.sleep(1)
+
+    def __drain(self):
+        for pid in self.__workers:
+            self.__signal(pid, signal.SIGTERM)
+        deadline = time.monotonic() + self.__settings.graceful_timeout
+        while self.__workers and time.monotonic() < deadline:
+            self.__reap()
+            time.sleep(0.05)
+        for pid in self.__workers:
+            logger.warning("Worker %s did not drain in time, killing it.", pid)
+            self.__signal(pid, signal.SIGKILL)
+            os.waitpid(pid, 0)
+        self.__workers.clear()
+
+    @staticmethod
+    def __signal(pid: int, signum: int):
+        try:
+            os.kill(pid, signum)
+        except ProcessLookupError:
+            pass
+
+
+def serve_asgi(settings: ServerSettings):
+    """Serve the ASGI application on uvicorn until SIGTERM or SIGINT"""
+    try:
+        # pylint: disable-next=import-outside-toplevel
+        import uvicorn
+    except ImportError as exc:
+        raise RuntimeError(
+            "The asgi mode needs uvicorn and aiosqlite: pip install uvicorn aiosqlite"
+        ) from exc
+    uvicorn.run(
+        "src.api.asgi:create_asgi_app",
+        factory=True,
+        host=settings.host,
+        port=settings.port,
+        workers=settings.workers,
+        backlog=settings.backlog,
+        timeout_keep_alive=max(1, round(settings.keepalive)),
+        timeout_graceful_shutdown=round(settings.graceful_timeout),
+        limit_max_requests=settings.max_requests or None,
+        limit_max_requests_jitter=settings.max_requests_jitter,
+        log_config=None,
+    )
+
+
+def serve(app, settings: ServerSettings | None = None):
+    """Run the application with the given settings, or the ones of the environment"""
+    settings = settings or load_server_settings()
+    if settings.mode == "asgi":
+        raise ValueError("The asgi mode serves src.api.asgi, see serve_asgi.")
+    if settings.mode == "prefork" and hasattr(os, "fork"):
+        PreforkServer(app, settings).run()
+    else:
+        serve_threaded(app, settings)
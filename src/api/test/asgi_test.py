@@ -0,0 +1,150 @@
+import asyncio
+import json
+
+from pytest import fixture, importorskip
+
+from src.api.asgi import create_asgi_app
+from src.api.composer.container import container
+from src.api.server import create_app
+from src.drivers.database.async_connection import AsyncDBConnection
+from src.drivers.database.connection import DBConnection
+from src.drivers.database.settings import DatabaseSettings
+from src.drivers.database.types import AsyncConnectionInterface, ConnectionInterface
+
+
+class AsgiClient:
+    """Sends requests through the ASGI callable, all on one event loop"""
+
+    def __init__(self, app):
+        self.app = app
+        self.runner = asyncio.Runner()
+
+    def call(self, method, path, body=None, headers=()):
+        """One request: (status, headers, body)"""
+        path, _, query = path.partition("?")
+        raw_headers = [(b"host", b"testserver"), *headers]
+        data = b""
+        if body is not None:
+            data = json.dumps(body).encode()
+            raw_headers.append((b"content-type", b"application/json"))
+        scope = {
+            "type": "http",
+            "method": method,
+            "path": path,
+            "query_string": query.encode(),
+            "headers": raw_headers,
+        }
+        messages = []
+
+        async def receive():
+            return {"type": "http.request", "body": data, "more_body": False}
+
+        async def send(message):
+            messages.append(message)
+
+        self.runner.run(self.app(scope, receive, send))
+        start = messages[0]
+        response_headers = {
+            name.decode(): value.decode() for name, value in start["headers"]
+        }
+        content = b"".join(message.get("body", b"") for message in messages[1:])
+        return (
+            start["status"],
+            response_headers,
+            json.loads(content) if content else None,
+        )
+
+
+@fixture(name="client")
+def asgi_client(tmp_path):
+    connection = AsyncDBConnection(DatabaseSettings(url=f"sqlite:///{tmp_path / 'db'}"))
+    container.override(AsyncConnectionInterface, connection)
+    client = AsgiClient(create_asgi_app())
+    yield client
+    client.runner.run(connection.disconnect())
+    client.runner.close()
+    container.reset()
+
+
+def test_routing_errors_need_no_database(client, tmp_path):
+    status, _, body = client.call("GET", "/nowhere")
+    assert (status, body["title"]) == (404, "Not Found.")
+    status, headers, _ = client.call("DELETE", "/events")
+    assert status == 405
+    assert set(headers["Allow"].split(", ")) == {"GET", "HEAD", "POST"}
+    status, headers, body = client.call(
+        "OPTIONS",
+        "/events",
+        headers=[
+            (b"origin", b"https://a.b"),
+            (b"access-control-request-method", b"POST"),
+        ],
+    )
+    assert (status, body) == (200, None)
+    assert headers["Access-Control-Allow-Origin"] == "*"
+    assert "POST" in headers["Access-Control-Allow-Methods"]
+    status, _, _ = client.call(
+        "POST", "/events", headers=[(b"content-type", b"text/plain")]
+    )
+    assert status == 415
+    assert not (tmp_path / "db").exists()
+
+
+def test_answers_like_the_flask_application(client, tmp_path):
+    importorskip("aiosqlite")
+    blocking = DBConnection(DatabaseSettings(url=f"sqlite:///{tmp_path / 'flask'}"))
+    container.override(ConnectionInterface, blocking)
+    flask_client = create_app({"TESTING": True}).test_client()
+    try:
+        event = {"title": "PyCon", "slug": "pycon", "maximum_attendees": 1}
+        status, _, created = client.call("POST", "/events", event)
+        flask_created = flask_client.post("/events", json=event).get_json()
+        assert status == 200
+        assert created.keys() == flask_created.keys()
+        event_id = created["created_event"]["event_id"]
+        flask_event_id = flask_created["created_event"]["event_id"]
+
+        status, _, duplicate = client.call("POST", "/events", event)
+        flask_duplicate = flask_client.post("/events", json=event)
+        assert (status, duplicate) == (
+            flask_duplicate.status_code,
+            flask_duplicate.get_json(),
+        )
+
+        attendee = {"name": "Ada Lovelace", "email": "ada@gmail.com"}
+        status, _, registered = client.call(
+            "POST", f"/events/{event_id}/attendee", attendee
+        )
+        assert status == 200
+        attendee_id = registered["attendee"]["attendee_id"]
+        flask_client.post(f"/events/{flask_event_id}/attendee", json=attendee)
+        status, _, sold_out = client.call(
+            "POST",
+            f"/events/{event_id}/attendee",
+            {"name": "Other", "email": "other@gmail.com"},
+        )
+        assert (
+            sold_out
+            == flask_client.post(
+                f"/events/{flask_event_id}/attendee",
+                json={"name": "Other", "email": "other@gmail.com"},
+            ).get_json()
+        )
+
+        status, headers, page = client.call("GET", f"/events/{event_id}/attendees")
+        flask_page = flask_client.get(f"/events/{flask_event_id}/attendees")
+        assert status == 200
+        assert page["total"] == flask_page.get_json()["total"] == 1
+        assert headers["Cache-Control"] == flask_page.headers["Cache-Control"]
+        status, _, body = client.call(
+            "GET",
+            f"/events/{event_id}/attendees",
+            headers=[(b"if-none-match", headers["ETag"].encode())],
+        )
+        assert (status, body) == (304, None)
+
+        assert client.call("POST", f"/attendees/{attendee_id}/check-in")[0] == 200
+        assert client.call("POST", f"/attendees/{attendee_id}/check-in")[0] == 409
+        assert client.call("GET", "/attendees/missing/badge")[0] == 404
+    finally:
+        blocking.disconnect()
@@ -0,0 +1,79 @@
+from datetime import datetime
+
+from flask import Flask
+from pytest import fixture
+
+from src.api.caching import CachePolicy, conditional
+from src.modules.events.dtos.event import EventVersionDTO
+
+
+@fixture(name="state")
+def route_state():
+    return {
+        "marker": EventVersionDTO(version=1, updated_at=datetime(2024, 1, 1, 12)),
+        "calls": 0,
+    }
+
+
+@fixture(name="client")
+def flask_client(state):
+    app = Flask(__name__)
+
+    @app.route("/items/<item_id>")
+    @conditional(
+        CachePolicy(cache_control="private, no-cache"),
+        version_of=lambda item_id: state["marker"],
+    )
+    def get_item(item_id):
+        state["calls"] += 1
+        return {"item": item_id}
+
+    return app.test_client()
+
+
+def test_response_is_tagged(client, state):
+    response = client.get("/items/1?page=2")
+    assert response.status_code == 200
+    assert response.headers["ETag"].startswith('W/"')
+    assert response.headers["Last-Modified"] == "Mon, 01 Jan 2024 12:00:00 GMT"
+    assert response.headers["Cache-Control"] == "private, no-cache"
+    assert client.get("/items/1?page=3").headers["ETag"] != response.headers["ETag"]
+
+
+def test_matching_etag_skips_the_route(client, state):
+    etag = client.get("/items/1").headers["ETag"]
+    response = client.get("/items/1", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.data == b""
+    assert response.headers["ETag"] == etag
+    assert state["calls"] == 1
+
+    state["marker"] = EventVersionDTO(version=2, updated_at=datetime(2024, 1, 2))
+    response = client.get("/items/1", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+    assert state["calls"] == 2
+
+
+def test_if_modified_since(client, state):
+    last_modified = client.get("/items/1").headers["Last-Modified"]
+    response = client.get("/items/1", headers={"If-Modified-Since": last_modified})
+    assert response.status_code == 304
+    response = client.get(
+        "/items/1", headers={"If-Modified-Since": "Sun, 31 Dec 2023 12:00:00 GMT"}
+    )
+    assert response.status_code == 200
+    # An entity tag always takes precedence over the date.
+    response = client.get(
+        "/items/1",
+        headers={"If-Modified-Since": last_modified, "If-None-Match": '"other"'},
+    )
+    assert response.status_code == 200
+
+
+def test_route_runs_without_marker(client, state):
+    state["marker"] = None
+    response = client.get("/items/1", headers={"If-None-Match": "*"})
+    assert response.status_code == 200
+    assert "ETag" not in response.headers
+    assert response.headers["Cache-Control"] == "private, no-cache"
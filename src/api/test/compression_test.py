@@ -0,0 +1,141 @@
+import gzip
+
+from flask import Flask, Response
+from pytest import fixture, mark, raises
+
+from src.api.compression import (
+    CompressionMiddleware,
+    CompressionSettings,
+    brotli,
+    load_compression_settings,
+    negotiate_encoding,
+    zstandard,
+)
+
+LARGE = [
+    {"name": f"Attendee {index}", "email": f"a{index}@gmail.com"}
+    for index in range(100)
+]
+
+
+@fixture(name="client")
+def compressed_client():
+    app = Flask(__name__)
+
+    @app.get("/large")
+    def large():
+        response = app.json.response(LARGE)
+        response.headers["ETag"] = '"strong"'
+        return response
+
+    @app.get("/small")
+    def small():
+        return {"ok": True}
+
+    @app.get("/error")
+    def error():
+        return app.json.response(LARGE), 500
+
+    @app.get("/image")
+    def image():
+        return Response(b"\x89PNG" * 1000, mimetype="image/png")
+
+    @app.get("/encoded")
+    def encoded():
+        response = Response(gzip.compress(b"x" * 2000), mimetype="text/plain")
+        response.headers["Content-Encoding"] = "gzip"
+        return response
+
+    @app.get("/stream")
+    def stream():
+        return Response(
+            (f"line {index}\n" for index in range(1000)),
+            mimetype="application/x-ndjson",
+        )
+
+    @app.get("/short-stream")
+    def short_stream():
+        return Response((line for line in ("a\n", "b\n")), mimetype="text/csv")
+
+    app.wsgi_app = CompressionMiddleware(
+        app.wsgi_app, CompressionSettings(minimum_size=512)
+    )
+    return app.test_client()
+
+
+def gzip_get(client, path: str):
+    return client.get(path, headers={"Accept-Encoding": "gzip"})
+
+
+def test_large_response_is_compressed(client):
+    response = gzip_get(client, "/large")
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert response.headers["Vary"] == "Accept-Encoding"
+    assert response.headers["ETag"] == 'W/"strong"'
+    assert int(response.headers["Content-Length"]) == len(response.data)
+    identity = client.get("/large")
+    assert "Content-Encoding" not in identity.headers
+    assert gzip.decompress(response.data) == identity.data
+    assert len(response.data) < len(identity.data) / 4
+
+
+def test_small_and_incompressible_responses_are_skipped(client):
+    small = gzip_get(client, "/small")
+    assert "Content-Encoding" not in small.headers
+    assert small.headers["Vary"] == "Accept-Encoding"
+    assert "Content-Encoding" not in gzip_get(client, "/image").headers
+    error = gzip_get(client, "/error")
+    assert error.status_code == 500
+    assert "Content-Encoding" not in error.headers
+    # Already gzipped by the route: compressed once, not twice.
+    assert gzip.decompress(gzip_get(client, "/encoded").data) == b"x" * 2000
+
+
+def test_streamed_response_is_compressed_as_it_goes(client):
+    response = gzip_get(client, "/stream")
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert "Content-Length" not in response.headers
+    lines = gzip.decompress(response.data).decode().splitlines()
+    assert lines[0] == "line 0" and lines[-1] == "line 999"
+
+
+def test_short_stream_is_sent_as_it_is(client):
+    response = gzip_get(client, "/short-stream")
+    assert "Content-Encoding" not in response.headers
+    assert response.headers["Content-Length"] == "4"
+    assert response.data == b"a\nb\n"
+
+
+@mark.skipif(brotli is None, reason="brotli is not installed")
+def test_brotli_is_negotiated(client):
+    response = client.get("/large", headers={"Accept-Encoding": "gzip, br"})
+    assert response.headers["Content-Encoding"] == "br"
+    assert brotli.decompress(response.data) == client.get("/large").data
+
+
+@mark.skipif(zstandard is None, reason="zstandard is not installed")
+def test_zstd_is_negotiated(client):
+    response = client.get("/stream", headers={"Accept-Encoding": "zstd"})
+    assert response.headers["Content-Encoding"] == "zstd"
+    reader = zstandard.ZstdDecompressor().decompressobj()
+    assert reader.decompress(response.data).startswith(b"line 0\n")
+
+
+def test_negotiate_encoding():
+    offered = ["zstd", "br", "gzip"]
+    assert negotiate_encoding("gzip, deflate", offered) == "gzip"
+    assert negotiate_encoding("gzip;q=0.5, br;q=0.8", offered) == "br"
+    assert negotiate_encoding("*;q=0.1, zstd;q=0", offered) == "br"
+    assert negotiate_encoding("identity", offered) is None
+    assert negotiate_encoding("gzip;q=0", offered) is None
+
+
+def test_settings_from_environment():
+    settings = load_compression_settings(
+        {"COMPRESSION_MINIMUM_SIZE": "1024", "COMPRESSION_ENABLED": "false"}
+    )
+    assert settings == CompressionSettings(enabled=False, minimum_size=1024)
+    with raises(ValueError):
+        load_compression_settings({"COMPRESSION_GZIP_LEVEL": "10"})
+    with raises(ValueError):
+        load_compression_settings({"COMPRESSION_ZSTD_LEVEL": "fast"})
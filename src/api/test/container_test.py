@@ -0,0 +1,109 @@
+from unittest.mock import MagicMock
+
+from pytest import fixture, raises
+
+from src.api.composer.attendee import attendee_composer, attendee_service_composer
+from src.api.composer.check_in import check_in_composer
+from src.api.composer.container import Container, container
+from src.api.composer.event import event_composer, event_service_composer
+from src.modules.events.dtos.attendee import (
+    AttendeeRegistrationDTO,
+    AttendeeRegistrationStatus,
+)
+from src.modules.events.repositories.attendee import AttendeeRepositoryInterface
+from src.modules.events.repositories.event import EventRepositoryInterface
+
+
+class Repository:
+    pass
+
+
+class Service:
+    def __init__(self, repository: Repository):
+        self.repository = repository
+
+
+class Controller:
+    def __init__(self, service: Service):
+        self.service = service
+
+
+@fixture(name="builds")
+def counted_builds():
+    return []
+
+
+@fixture(name="graph")
+def small_graph(builds):
+    graph = Container()
+
+    def provide(cls, *dependencies):
+        def build(resolver):
+            instance = cls(*(resolver.resolve(key) for key in dependencies))
+            builds.append(cls)
+            return instance
+
+        return build
+
+    graph.register(Repository, provide(Repository))
+    graph.register(Service, provide(Service, Repository))
+    graph.register(Controller, provide(Controller, Service))
+    return graph
+
+
+@fixture(name="shared", autouse=True)
+def reset_shared_container():
+    container.reset()
+    yield container
+    container.reset()
+
+
+def test_instances_are_built_lazily_once(graph, builds):
+    assert not builds
+    controller = graph.resolve(Controller)
+    assert graph.resolve(Controller) is controller
+    assert graph.resolve(Service) is controller.service
+    assert builds == [Repository, Service, Controller]
+
+
+def test_reset_builds_a_new_graph(graph, builds):
+    controller = graph.resolve(Controller)
+    graph.reset()
+    assert graph.resolve(Controller) is not controller
+    assert builds.count(Service) == 2
+
+
+def test_override_is_injected_into_dependents(graph):
+    fake = Repository()
+    graph.resolve(Controller)
+    graph.override(Repository, fake)
+    assert graph.resolve(Controller).service.repository is fake
+    graph.reset()
+    assert graph.resolve(Repository) is not fake
+
+
+def test_unknown_and_circular_dependencies_fail(graph):
+    with raises(LookupError):
+        graph.resolve(int)
+    graph.register(Repository, lambda resolver: resolver.resolve(Controller))
+    with raises(RuntimeError):
+        graph.resolve(Controller)
+
+
+def test_composers_share_one_instance_per_type():
+    assert event_composer() is event_composer()
+    assert attendee_composer() is attendee_composer()
+    assert check_in_composer() is check_in_composer()
+    assert event_service_composer() is event_service_composer()
+
+
+def test_attendee_writes_invalidate_the_shared_event_repository(shared):
+    events = MagicMock(spec=EventRepositoryInterface)
+    attendees = MagicMock(spec=AttendeeRepositoryInterface)
+    attendees.register_in_event.return_value = AttendeeRegistrationStatus.CREATED
+    shared.override(EventRepositoryInterface, events)
+    shared.override(AttendeeRepositoryInterface, attendees)
+    attendee_service_composer().register_attendee_in_event(
+        AttendeeRegistrationDTO(name="Maria Silva", email="m@gmail.com", event_id="1")
+    )
+    events.invalidate_event.assert_called_once_with(event_id="1")
@@ -0,0 +1,73 @@
+from datetime import datetime
+
+from flask import Flask, jsonify
+from flask import request as flask_request
+from pytest import fixture, mark, param
+
+from src.api.json_provider import FastJSONProvider, orjson
+from src.modules.events.dtos.attendee import AttendeeDTO, AttendeeRegistrationStatus
+
+engines = [
+    param(False, id="json"),
+    param(
+        True,
+        id="orjson",
+        marks=mark.skipif(orjson is None, reason="orjson is not installed"),
+    ),
+]
+
+
+@fixture(name="app", params=engines)
+def flask_app(request):
+    app = Flask(__name__)
+    provider = FastJSONProvider(app)
+    provider.use_orjson = request.param
+    app.json = provider
+
+    @app.post("/echo")
+    def echo():
+        return jsonify({"received": flask_request.get_json()})
+
+    return app
+
+
+attendee = AttendeeDTO(
+    attendee_id="at-1",
+    name="Maria Silva",
+    email="maria@gmail.com",
+    event_id="ev-1",
+    created_at=datetime(2024, 1, 2, 10, 30, 0, 5),
+    checked_in_at=None,
+)
+
+
+def test_dataclasses_and_datetimes_are_serialized(app):
+    with app.app_context():
+        body = app.json.loads(
+            app.json.dumps(
+                {"attendees": [attendee], "status": AttendeeRegistrationStatus.CREATED}
+            )
+        )
+    assert body == {
+        "attendees": [
+            {
+                "attendee_id": "at-1",
+                "name": "Maria Silva",
+                "email": "maria@gmail.com",
+                "event_id": "ev-1",
+                "created_at": "2024-01-02T10:30:00.000005",
+                "checked_in_at": None,
+            }
+        ],
+        "status": AttendeeRegistrationStatus.CREATED.value,
+    }
+
+
+def test_requests_and_responses_go_through_the_provider(app):
+    client = app.test_client()
+    response = client.post("/echo", json={"name": "José"})
+    assert response.status_code == 200
+    assert response.mimetype == "application/json"
+    assert response.get_json() == {"received": {"name": "José"}}
+    response = client.post("/echo", data="{not json", content_type="application/json")
+    assert response.status_code == 400
@@ -0,0 +1,94 @@
+import subprocess
+import sys
+from pathlib import Path
+
+from pytest import fixture
+
+from src.api.composer.container import container
+from src.api.server import create_app
+from src.drivers.database.connection import DBConnection
+from src.drivers.database.group_commit import GroupCommitSettings, GroupCommitWriter
+from src.drivers.database.settings import DatabaseSettings
+from src.drivers.database.types import ConnectionInterface
+
+ROOT = Path(__file__).resolve().parents[3]
+
+# Python itself is not counted, only what 'import src.api.server' adds to it.
+IMPORT_BUDGET_SECONDS = 0.15
+
+MEASURE_IMPORT = """
+import sys, time
+started = time.perf_counter()
+import src.api.server
+elapsed = time.perf_counter() - started
+print(elapsed, "flask" in sys.modules, "sqlalchemy" in sys.modules)
+"""
+
+
+@fixture(name="connection")
+def database_connection(tmp_path):
+    connection = DBConnection(DatabaseSettings(url=f"sqlite:///{tmp_path / 'db'}"))
+    container.override(ConnectionInterface, connection)
+    yield connection
+    connection.disconnect()
+    container.reset()
+
+
+def test_import_stays_within_budget(tmp_path):
+    result = subprocess.run(
+        [sys.executable, "-c", MEASURE_IMPORT],
+        cwd=tmp_path,
+        env={"PYTHONPATH": str(ROOT)},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    elapsed, flask_loaded, sqlalchemy_loaded = result.stdout.split()
+    assert float(elapsed) < IMPORT_BUDGET_SECONDS
+    assert (flask_loaded, sqlalchemy_loaded) == ("False", "False")
+    assert not list(tmp_path.iterdir())
+
+
+def test_database_waits_for_the_first_request(connection, tmp_path):
+    app = create_app({"TESTING": True})
+    assert not (tmp_path / "db").exists()
+    client = app.test_client()
+    response = client.post("/events", json={"title": "PyCon", "slug": "pycon"})
+    assert response.status_code == 200
+    assert (tmp_path / "db").exists()
+    assert client.get("/events").get_json()["quantity"] == 1
+    assert create_app({"TESTING": True}).test_client().get("/events").status_code == 200
+
+
+def test_export_streams_after_the_request(connection):
+    client = create_app({"TESTING": True}).test_client()
+    event = client.post("/events", json={"title": "PyCon", "slug": "pycon"})
+    event_id = event.get_json()["created_event"]["event_id"]
+    client.post(
+        f"/events/{event_id}/attendee",
+        json={"name": "Ada Lovelace", "email": "ada@gmail.com"},
+    )
+    response = client.get(f"/events/{event_id}/attendees/export?format=ndjson")
+    assert response.status_code == 200
+    assert response.is_streamed
+    assert response.get_data().count(b"ada@gmail.com") == 1
+    response.close()
+    assert connection.get_engine().pool.checkedout() == 0
+    missing = client.get("/events/missing/attendees/export")
+    assert missing.status_code == 404
+
+
+def test_group_commit_serves_registrations_and_check_ins(connection):
+    settings = GroupCommitSettings(enabled=True, window_ms=1, max_batch=8)
+    client = create_app({"TESTING": True, "GROUP_COMMIT": settings}).test_client()
+    event = client.post("/events", json={"title": "PyCon", "slug": "pycon"})
+    event_id = event.get_json()["created_event"]["event_id"]
+    attendee = {"name": "Ada Lovelace", "email": "ada@gmail.com"}
+    registered = client.post(f"/events/{event_id}/attendee", json=attendee)
+    assert registered.status_code == 200
+    assert client.post(f"/events/{event_id}/attendee", json=attendee).status_code == 409
+    attendee_id = registered.get_json()["attendee"]["attendee_id"]
+    assert client.post(f"/attendees/{attendee_id}/check-in").status_code == 200
+    assert client.post(f"/attendees/{attendee_id}/check-in").status_code == 409
+    assert client.get(f"/events/{event_id}/attendees").get_json()["total"] == 1
+    container.resolve(GroupCommitWriter).close()
@@ -0,0 +1,63 @@
+import http.client
+import json
+import threading
+
+from pytest import raises
+
+from src.api.serving import PooledWSGIServer, ServerSettings, load_server_settings
+
+
+def hello_app(_environ, start_response):
+    start_response("200 OK", [("Content-Type", "text/plain"), ("Content-Length", "5")])
+    return [b"hello"]
+
+
+def test_settings_come_from_the_file_then_the_environment(tmp_path):
+    config_file = tmp_path / "server.json"
+    config_file.write_text(json.dumps({"workers": 3, "threads": 6}))
+    settings = load_server_settings(
+        {
+            "SERVER_CONFIG_FILE": str(config_file),
+            "SERVER_THREADS": "8",
+            "SERVER_MODE": "Threaded",
+            "SERVER_GRACEFUL_TIMEOUT": "2.5",
+        }
+    )
+    assert settings == ServerSettings(
+        mode="threaded", workers=3, threads=8, graceful_timeout=2.5
+    )
+    assert load_server_settings({}) == ServerSettings()
+
+
+def test_invalid_settings_are_rejected(tmp_path):
+    with raises(ValueError):
+        load_server_settings({"SERVER_WORKERS": "many"})
+    with raises(ValueError):
+        load_server_settings({"SERVER_WORKERS": "0"})
+    with raises(ValueError):
+        load_server_settings({"SERVER_MODE": "forking"})
+    config_file = tmp_path / "server.json"
+    config_file.write_text(json.dumps({"worker": 3}))
+    with raises(ValueError):
+        load_server_settings({"SERVER_CONFIG_FILE": str(config_file)})
+
+
+def test_server_stops_after_max_requests():
+    server = PooledWSGIServer(hello_app, threads=2, keepalive=1, max_requests=3)
+    thread = threading.Thread(target=server.serve_forever)
+    thread.start()
+    try:
+        connection = http.client.HTTPConnection("127.0.0.1", server.port, timeout=5)
+        for _ in range(3):
+            connection.request("GET", "/")
+            response = connection.getresponse()
+            assert response.status == 200
+            assert response.read() == b"hello"
+        connection.close()
+        thread.join(timeout=10)
+        assert not thread.is_alive()
+        assert server.served == 3
+    finally:
+        server.stop()
+        thread.join(timeout=10)
+        server.server_close()
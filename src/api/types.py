@@ -1,5 +1,6 @@
 from dataclasses import dataclass
 from http import HTTPStatus
+from typing import Iterator
 
 
 @dataclass
@@ -7,9 +8,13 @@ class HttpRequest:
     body: dict | None
     params: dict | None = None
     options: dict | None = None
+    headers: dict | None = None
 
 
 @dataclass
 class HttpResponse:
     payload: dict
     status: HTTPStatus
+    headers: dict | None = None
+    # Sent in place of the payload, chunk by chunk, when set.
+    body: Iterator[bytes] | None = None
@@ -0,0 +1,31 @@
+from flask import Flask, Response, g
+
+from src.drivers.database.types import ConnectionInterface
+
+
+def register_unit_of_work(app: Flask, connection: ConnectionInterface):
+    """
+    Bind a unit of work to each request, so every DAO call of the request
+    shares one connection and the work is committed once at the end.
+    Error responses and unhandled exceptions roll the work back.
+    """
+
+    @app.before_request
+    def start_unit_of_work():
+        g.unit_of_work = connection.unit_of_work().start()
+
+    @app.after_request
+    def finish_unit_of_work(response: Response) -> Response:
+        unit_of_work = g.get("unit_of_work")
+        if unit_of_work is not None:
+            if response.status_code < 400:
+                unit_of_work.commit()
+            else:
+                unit_of_work.rollback()
+        return response
+
+    @app.teardown_request
+    def close_unit_of_work(_exc: BaseException | None):
+        unit_of_work = g.pop("unit_of_work", None)
+        if unit_of_work is not None:
+            unit_of_work.close()
@@ -0,0 +1,140 @@
+"""
+This module contains the asyncio engine used by the ASGI application.
+
+It reads the same DatabaseSettings as DBConnection and swaps the driver of
+a sqlite url for aiosqlite, so both stacks work on the same database. The
+engine is created on first use; the callbacks given to 'on_engine_created'
+(the migrations) run once right before, on a short-lived blocking engine,
+since they use the sqlite3 driver directly.
+
+aiosqlite is an optional dependency, only needed when the engine is created.
+"""
+
+import logging
+import threading
+from dataclasses import replace
+from typing import Any, Callable
+
+from sqlalchemy import Engine, event
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool, StaticPool
+from src.drivers.database.connection import DBConnection
+from src.drivers.database.settings import DatabaseSettings, load_database_settings
+from src.drivers.database.types import AsyncConnectionInterface
+
+logger = logging.getLogger(__name__)
+
+_ASYNC_DRIVERS = {"sqlite": "sqlite+aiosqlite"}
+
+_POOLS = {
+    "queue": AsyncAdaptedQueuePool,
+    "static": StaticPool,
+    "null": NullPool,
+}
+
+
+def async_url(url: str) -> str:
+    """The url with the asyncio driver of its backend, unchanged if it has one"""
+    parsed = make_url(url)
+    drivername = _ASYNC_DRIVERS.get(parsed.drivername, parsed.drivername)
+    return parsed.set(drivername=drivername).render_as_string(hide_password=False)
+
+
+class AsyncDBConnection(AsyncConnectionInterface):
+    """Connection implementation for the sqlalchemy asyncio engine"""
+
+    def __init__(self, settings: DatabaseSettings | None = None):
+        self.__settings = settings
+        self.__engine: AsyncEngine | None = None
+        self.__on_engine_created: list[Callable[[Engine], Any]] = []
+        self.__lock = threading.RLock()
+
+    def configure(self, settings: DatabaseSettings):
+        with self.__lock:
+            if self.__engine is not None and settings != self.__settings:
+                raise RuntimeError(
+                    "The database settings cannot change once the engine is created."
+                )
+            self.__settings = settings
+
+    def on_engine_created(self, callback: Callable[[Engine], Any]):
+        with self.__lock:
+            if callback not in self.__on_engine_created:
+                self.__on_engine_created.append(callback)
+
+    def get_engine(self) -> AsyncEngine:
+        engine = self.__engine
+        if engine is None:
+            with self.__lock:
+                if self.__engine is None:
+                    self.__engine = self.__create_engine()
+                engine = self.__engine
+        return engine
+
+    def get_settings(self) -> DatabaseSettings | None:
+        """Return the settings used by the current engine"""
+        return self.__settings
+
+    def connect(self):
+        return self.get_engine().connect()
+
+    def begin(self):
+        return self.get_engine().begin()
+
+    async def disconnect(self):
+        with self.__lock:
+            engine, self.__engine = self.__engine, None
+        if engine is not None:
+            await engine.dispose()
+
+    def __create_engine(self) -> AsyncEngine:
+        if self.__settings is None:
+            self.__settings = load_database_settings()
+        settings = self.__settings
+        if settings.pool_class not in _POOLS:
+            raise ValueError(
+                f"The pool class {settings.pool_class!r} cannot be used with asyncio,"
+                f" expected one of {', '.join(_POOLS)}."
+            )
+        if self.__on_engine_created:
+            # Blocks the event loop once, before the first query of the process.
+            blocking = DBConnection(replace(settings, pool_class="null"))
+            for callback in self.__on_engine_created:
+                blocking.on_engine_created(callback)
+            try:
+                blocking.get_engine()
+            finally:
+                blocking.disconnect()
+        engine = create_async_engine(
+            async_url(settings.url), **self.__engine_options(settings)
+        )
+        if engine.dialect.name == "sqlite":
+            event.listen(engine.sync_engine, "connect", self.__apply_pragmas)
+        logger.info("Asyncio database engine on %s", engine.url)
+        return engine
+
+    @staticmethod
+    def __engine_options(settings: DatabaseSettings) -> dict:
+        pool_class = _POOLS[settings.pool_class]
+        options = {"poolclass": pool_class, "pool_pre_ping": settings.pool_pre_ping}
+        if pool_class is AsyncAdaptedQueuePool:
+            options.update(
+                pool_size=settings.pool_size,
+                max_overflow=settings.max_overflow,
+                pool_timeout=settings.pool_timeout,
+            )
+        if pool_class is not NullPool:
+            options["pool_recycle"] = settings.pool_recycle
+        return options
+
+    def __apply_pragmas(self, dbapi_connection, _connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in self.__settings.pragmas().items():
+                cursor.execute(f"PRAGMA {name} = {value}")
+        finally:
+            cursor.close()
+
+
+async_connection = AsyncDBConnection()
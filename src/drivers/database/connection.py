@@ -1,24 +1,211 @@
-from sqlalchemy import create_engine
+import logging
+import os
+import threading
+import weakref
+from contextlib import nullcontext
+from typing import Any, Callable
+
+from sqlalchemy import Engine, create_engine, event
+from sqlalchemy.pool import NullPool, QueuePool, SingletonThreadPool, StaticPool
+from src.drivers.database.settings import DatabaseSettings, load_database_settings
 from src.drivers.database.types import ConnectionInterface
+from src.drivers.database.unit_of_work import UnitOfWork
+
+logger = logging.getLogger(__name__)
+
+_POOLS = {
+    "queue": QueuePool,
+    "singleton": SingletonThreadPool,
+    "static": StaticPool,
+    "null": NullPool,
+}
+
+_SYNCHRONOUS_NAMES = {0: "off", 1: "normal", 2: "full", 3: "extra"}
+
+
+# Every connection of the process, so a forked child can drop their pools.
+_connections: "weakref.WeakSet[DBConnection]" = weakref.WeakSet()
 
 
 class DBConnection(ConnectionInterface):
-    """Connection implementation for the sqlalchemy database connection"""
+    """
+    Connection implementation for the sqlalchemy database connection.
+    The engine is created by 'make_connection' or by the first call that needs
+    it, then the callbacks given to 'on_engine_created' run once on it.
+    """
 
-    def __init__(self):
-        self.__connection_string = "sqlite:///instance/pass_in.db"
+    def __init__(self, settings: DatabaseSettings | None = None):
+        self.__settings = settings
         self.__engine = None
+        self.__on_engine_created: list[Callable[[Engine], Any]] = []
+        self.__lock = threading.RLock()
+        _connections.add(self)
+
+    def configure(self, settings: DatabaseSettings):
+        with self.__lock:
+            if self.__engine is not None and settings != self.__settings:
+                raise RuntimeError(
+                    "The database settings cannot change once the engine is created."
+                )
+            self.__settings = settings
+
+    def on_engine_created(self, callback: Callable[[Engine], Any]):
+        with self.__lock:
+            if callback in self.__on_engine_created:
+                return
+            self.__on_engine_created.append(callback)
+            if self.__engine is not None:
+                callback(self.__engine)
 
     def make_connection(self):
-        self.__engine = create_engine(self.__connection_string)
+        with self.__lock:
+            if self.__settings is None:
+                self.__settings = load_database_settings()
+            engine = create_engine(
+                self.__settings.url, **self.__engine_options(self.__settings)
+            )
+            if engine.dialect.name == "sqlite":
+                event.listen(engine, "connect", self.__apply_pragmas)
+                database = engine.url.database
+                if database and database != ":memory:":
+                    os.makedirs(os.path.dirname(database) or ".", exist_ok=True)
+            try:
+                for callback in self.__on_engine_created:
+                    callback(engine)
+            except Exception:
+                engine.dispose()
+                raise
+            self.__engine = engine
+            logger.info(
+                "Database engine settings: %s",
+                describe_engine(engine, self.__settings),
+            )
 
     def get_engine(self):
-        return self.__engine
+        engine = self.__engine
+        if engine is None:
+            with self.__lock:
+                if self.__engine is None:
+                    self.make_connection()
+                engine = self.__engine
+        return engine
+
+    def dispose_after_fork(self):
+        """
+        Drop the pooled connections inherited from the parent process without
+        closing them, they still belong to the parent. The child opens its own.
+        """
+        self.__lock = threading.RLock()
+        if self.__engine is not None:
+            self.__engine.dispose(close=False)
+
+    def get_settings(self) -> DatabaseSettings | None:
+        """Return the settings used by the current engine"""
+        return self.__settings
+
+    def connect(self):
+        unit_of_work = UnitOfWork.current()
+        if unit_of_work is not None:
+            return nullcontext(unit_of_work.connection)
+        return self.get_engine().connect()
+
+    def begin(self):
+        unit_of_work = UnitOfWork.current()
+        if unit_of_work is not None:
+            return nullcontext(unit_of_work.connection)
+        return self.get_engine().begin()
+
+    def stream(self):
+        """
+        A connection that ignores the active unit of work, for the reads
+        that go on after the request, like a streamed response body.
+        """
+        return self.get_engine().connect()
+
+    def unit_of_work(self) -> UnitOfWork:
+        """Create a unit of work bound to this engine, to be started by the caller"""
+        return UnitOfWork(self.get_engine())
 
     def disconnect(self):
-        if self.__engine:
-            self.__engine.dispose()
-            self.__engine = None
+        with self.__lock:
+            if self.__engine:
+                self.__engine.dispose()
+                self.__engine = None
+
+    @staticmethod
+    def __engine_options(settings: DatabaseSettings) -> dict:
+        pool_class = _POOLS[settings.pool_class]
+        options = {
+            "poolclass": pool_class,
+            "pool_pre_ping": settings.pool_pre_ping,
+        }
+        if pool_class is QueuePool:
+            options.update(
+                pool_size=settings.pool_size,
+                max_overflow=settings.max_overflow,
+                pool_timeout=settings.pool_timeout,
+            )
+        elif pool_class is SingletonThreadPool:
+            options["pool_size"] = settings.pool_size
+        if pool_class is not NullPool:
+            options["pool_recycle"] = settings.pool_recycle
+        if pool_class in (QueuePool, StaticPool):
+            # The pooled connections are handed to other threads.
+            options["connect_args"] = {"check_same_thread": False}
+        return options
+
+    def __apply_pragmas(self, dbapi_connection, _connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in self.__settings.pragmas().items():
+                cursor.execute(f"PRAGMA {name} = {value}")
+        finally:
+            cursor.close()
+
+
+def describe_engine(engine: Engine, settings: DatabaseSettings) -> dict:
+    """
+    Read the effective pool options and sqlite PRAGMAs of an engine.
+    The options the pool does not expose are taken from the settings it was built with.
+    """
+    pool = engine.pool
+    description = {
+        "url": engine.url.render_as_string(hide_password=True),
+        "pool": type(pool).__name__,
+    }
+    if isinstance(pool, QueuePool):
+        description.update(
+            pool_size=pool.size(),
+            max_overflow=settings.max_overflow,
+            pool_timeout=pool.timeout(),
+        )
+    if not isinstance(pool, NullPool):
+        description["pool_recycle"] = settings.pool_recycle
+    description["pool_pre_ping"] = settings.pool_pre_ping
+    if engine.dialect.name == "sqlite":
+        with engine.connect() as db_connection:
+            for name in (
+                "journal_mode",
+                "synchronous",
+                "busy_timeout",
+                "cache_size",
+                "mmap_size",
+            ):
+                description[name] = db_connection.exec_driver_sql(
+                    f"PRAGMA {name}"
+                ).scalar()
+        description["synchronous"] = _SYNCHRONOUS_NAMES.get(
+            description["synchronous"], description["synchronous"]
+        )
+    return description
+
+
+def _dispose_inherited_pools():
+    for db_connection in list(_connections):
+        db_connection.dispose_after_fork()
+
 
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_dispose_inherited_pools)
 
 connection = DBConnection()
@@ -0,0 +1,90 @@
+"""
+This module checks the denormalized counters kept on the events table.
+
+The 'attendee_count' and 'checked_in_count' columns are maintained by
+triggers. Anything that bypasses them (manual edits, restored backups)
+makes the counters drift, so they can be compared with the real rows
+and recomputed here.
+"""
+
+from dataclasses import dataclass
+
+from sqlalchemy import Engine, bindparam, text
+
+_FIND_DRIFT_SQL = text(
+    """
+    SELECT
+        ev.id,
+        ev.attendee_count,
+        COALESCE(registered.amount, 0),
+        ev.checked_in_count,
+        COALESCE(checked_in.amount, 0)
+    FROM events AS ev
+    LEFT JOIN (
+        SELECT at.event_id, COUNT(*) AS amount
+        FROM attendees AS at
+        GROUP BY at.event_id
+    ) AS registered
+    ON registered.event_id = ev.id
+    LEFT JOIN (
+        SELECT at.event_id, COUNT(*) AS amount
+        FROM check_ins AS chk
+        JOIN attendees AS at
+        ON at.id = chk.attendee_id
+        GROUP BY at.event_id
+    ) AS checked_in
+    ON checked_in.event_id = ev.id
+    WHERE ev.attendee_count <> COALESCE(registered.amount, 0)
+    OR ev.checked_in_count <> COALESCE(checked_in.amount, 0)
+    ORDER BY ev.id
+    """
+)
+
+_REPAIR_SQL = text(
+    """
+    UPDATE events SET
+    attendee_count = (
+        SELECT COUNT(*)
+        FROM attendees AS at
+        WHERE at.event_id = events.id
+    ),
+    checked_in_count = (
+        SELECT COUNT(*)
+        FROM check_ins AS chk
+        JOIN attendees AS at
+        ON at.id = chk.attendee_id
+        WHERE at.event_id = events.id
+    )
+    WHERE events.id IN :event_ids
+    """
+).bindparams(bindparam("event_ids", expanding=True))
+
+
+@dataclass(frozen=True)
+class CounterDrift:
+    """The stored and the real counters of an event"""
+
+    event_id: str
+    stored_attendee_count: int
+    actual_attendee_count: int
+    stored_checked_in_count: int
+    actual_checked_in_count: int
+
+
+def find_counter_drift(engine: Engine) -> list[CounterDrift]:
+    """List the events whose counters do not match their rows"""
+    with engine.connect() as connection:
+        rows = connection.execute(_FIND_DRIFT_SQL).fetchall()
+        return [CounterDrift(*row) for row in rows]
+
+
+def repair_counter_drift(engine: Engine) -> list[CounterDrift]:
+    """Recompute the counters of the drifted events and return what was fixed"""
+    with engine.begin() as connection:
+        rows = connection.execute(_FIND_DRIFT_SQL).fetchall()
+        drifts = [CounterDrift(*row) for row in rows]
+        if drifts:
+            connection.execute(
+                _REPAIR_SQL, {"event_ids": [drift.event_id for drift in drifts]}
+            )
+        return drifts
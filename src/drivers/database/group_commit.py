@@ -0,0 +1,252 @@
+"""
+This module contains the group commit pipeline for the small writes.
+
+Without it every registration and check-in commits its own transaction, so
+the database pays one commit (and, with SQLITE_SYNCHRONOUS=full or outside
+of WAL, one fsync) per attendee, and the concurrent writers queue on the
+sqlite lock one at a time. With it the request thread hands its write to an
+in-process queue and waits on a future: a writer thread runs the writes
+gathered during 'window_ms', or until 'max_batch' of them, in one unit of
+work and commits them together, then resolves every future with its own
+result or exception.
+
+With no window a group is whatever was queued while the previous one was
+committed, which adds no wait to a lone write. A window of a few
+milliseconds only pays when a commit costs more than the wait, like a real
+fsync with SQLITE_SYNCHRONOUS=full on a slow disk (see
+benchmarks/group_commit.py).
+
+The writes run one after the other in the batch, on the connection of the
+writer's unit of work, so they are the same DAO calls as without the
+pipeline. When one of them raises, the batch is rolled back and its writes
+are run again, each committed on its own, so a failure only reaches its
+own caller. A write only sees what was committed before its batch, and
+the request waiting on it must not hold a write transaction of its own,
+which would lock the writer out.
+
+A caller waits 'timeout_ms' at most for its write, then gets a
+GroupCommitTimeoutError. Its write is dropped if it was still queued, but
+one that already started is still committed.
+
+The pipeline is off by default; its settings are read from the environment:
+
+    GROUP_COMMIT_ENABLED     false
+    GROUP_COMMIT_WINDOW_MS   0 (milliseconds a batch waits for more writes)
+    GROUP_COMMIT_MAX_BATCH   64 (writes committed together at most)
+    GROUP_COMMIT_TIMEOUT_MS  5000 (milliseconds a caller waits for its write)
+
+The writer thread is started by the first write of the process, so a
+pre-forking server may build the pipeline in its master process, and it is
+started again by the next write if it ever died.
+"""
+
+import os
+import queue
+import threading
+import time
+import weakref
+from concurrent.futures import Future
+from dataclasses import dataclass, fields, replace
+from typing import Any, Callable, Mapping, TypeVar
+
+from src.drivers.database.types import ConnectionInterface
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class GroupCommitSettings:
+    """Whether the writes are committed in groups, and how large the groups get"""
+
+    enabled: bool = False
+    window_ms: float = 0.0
+    max_batch: int = 64
+    timeout_ms: float = 5000.0
+
+    def __post_init__(self):
+        if self.window_ms < 0:
+            raise ValueError("The group commit window cannot be negative.")
+        if self.max_batch < 1:
+            raise ValueError("A group commit batch holds at least one write.")
+        if self.timeout_ms <= 0:
+            raise ValueError("The group commit timeout should be positive.")
+
+
+class GroupCommitTimeoutError(TimeoutError):
+    """The writer did not commit the write before the caller stopped waiting"""
+
+
+def load_group_commit_settings(
+    environ: Mapping[str, str] | None = None,
+) -> GroupCommitSettings:
+    """
+    Build the settings from the defaults and the GROUP_COMMIT_* variables.
+    Raises: ValueError when a value is invalid
+    """
+    environ = os.environ if environ is None else environ
+    values = {}
+    for field in fields(GroupCommitSettings):
+        variable = f"GROUP_COMMIT_{field.name.upper()}"
+        if variable not in environ:
+            continue
+        raw = environ[variable].strip().lower()
+        if isinstance(field.default, bool):
+            values[field.name] = raw in ("1", "true", "yes", "on")
+            continue
+        try:
+            values[field.name] = type(field.default)(raw)
+        except ValueError as exc:
+            raise ValueError(
+                f"Invalid group commit setting {variable}={raw!r}."
+            ) from exc
+    return replace(GroupCommitSettings(), **values)
+
+
+# Every writer of the process, so a forked child can forget their threads.
+_writers: "weakref.WeakSet[GroupCommitWriter]" = weakref.WeakSet()
+
+_STOP = object()
+
+
+class GroupCommitWriter:
+    """
+    Run writes on a writer thread and commit them in groups.
+    While disabled, 'run' calls the write in the caller's thread.
+    """
+
+    def __init__(
+        self,
+        connection: ConnectionInterface,
+        settings: GroupCommitSettings | None = None,
+    ):
+        self.__connection = connection
+        self.__settings = settings or GroupCommitSettings()
+        self.__queue: queue.SimpleQueue = queue.SimpleQueue()
+        self.__thread: threading.Thread | None = None
+        self.__lock = threading.Lock()
+        _writers.add(self)
+
+    @property
+    def settings(self) -> GroupCommitSettings:
+        """The settings the writes are grouped with"""
+        return self.__settings
+
+    def configure(self, settings: GroupCommitSettings):
+        """Set the settings of a writer that has not started yet"""
+        with self.__lock:
+            if self.__thread is not None and settings != self.__settings:
+                raise RuntimeError(
+                    "The group commit settings cannot change once the writer runs."
+                )
+            self.__settings = settings
+
+    def submit(self, write: Callable[[], T]) -> "Future[T]":
+        """Queue the write for the next group, its future holds the outcome"""
+        future: Future = Future()
+        self.__start()
+        self.__queue.put((write, future))
+        return future
+
+    def run(self, write: Callable[[], T]) -> T:
+        """
+        Commit the write, grouped with others when enabled, and return its result.
+        Raises: GroupCommitTimeoutError when the write is not done in 'timeout_ms'
+        """
+        if not self.__settings.enabled:
+            return write()
+        future = self.submit(write)
+        try:
+            return future.result(timeout=self.__settings.timeout_ms / 1000)
+        except TimeoutError as exc:
+            # Done in the meantime, or the write raised this error itself.
+            if future.done():
+                return future.result()
+            future.cancel()
+            raise GroupCommitTimeoutError(
+                "The write was not committed in time."
+            ) from exc
+
+    def close(self):
+        """Commit the writes already queued, then stop the writer thread"""
+        with self.__lock:
+            thread, self.__thread = self.__thread, None
+        if thread is not None and thread.is_alive():
+            self.__queue.put(_STOP)
+            thread.join()
+
+    def forget_after_fork(self):
+        """Drop the writer thread and the queue inherited from the parent process"""
+        self.__lock = threading.Lock()
+        self.__queue = queue.SimpleQueue()
+        self.__thread = None
+
+    def __start(self):
+        thread = self.__thread
+        if thread is not None and thread.is_alive():
+            return
+        with self.__lock:
+            if self.__thread is None or not self.__thread.is_alive():
+                self.__thread = threading.Thread(
+                    target=self.__write_groups,
+                    args=(self.__queue,),
+                    name="group-commit-writer",
+                    daemon=True,
+                )
+                self.__thread.start()
+
+    def __write_groups(self, pending: queue.SimpleQueue):
+        window = self.__settings.window_ms / 1000
+        max_batch = self.__settings.max_batch
+        stopping = False
+        while not stopping:
+            item = pending.get()
+            if item is _STOP:
+                return
+            batch = [item]
+            deadline = time.monotonic() + window
+            while len(batch) < max_batch:
+                try:
+                    item = pending.get(timeout=max(deadline - time.monotonic(), 0))
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stopping = True
+                    break
+                batch.append(item)
+            self.__commit(batch)
+
+    def __commit(self, batch: list[tuple[Callable[[], Any], Future]]):
+        # The writes whose caller gave up before they started are dropped.
+        batch = [item for item in batch if item[1].set_running_or_notify_cancel()]
+        if not batch:
+            return
+        results = []
+        try:
+            with self.__connection.unit_of_work():
+                for write, _ in batch:
+                    results.append(write())
+        except Exception:  # pylint: disable=broad-exception-caught
+            # Rolled back: each write is committed alone, to fail on its own.
+            for write, future in batch:
+                self.__commit_alone(write, future)
+            return
+        for (_, future), result in zip(batch, results):
+            future.set_result(result)
+
+    def __commit_alone(self, write: Callable[[], Any], future: Future):
+        try:
+            with self.__connection.unit_of_work():
+                result = write()
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            future.set_exception(exc)
+            return
+        future.set_result(result)
+
+
+def _forget_inherited_writers():
+    for writer in list(_writers):
+        writer.forget_after_fork()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_forget_inherited_writers)
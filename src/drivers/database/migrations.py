@@ -0,0 +1,361 @@
+"""
+This module contains the versioned schema of the application database.
+
+Each migration is applied once and in order. The current version is kept in
+the sqlite 'user_version' pragma, so a database created by hand is adopted
+by the first migration and only the pending ones run at startup.
+"""
+
+from dataclasses import dataclass
+
+from sqlalchemy import Engine
+
+
+@dataclass(frozen=True)
+class Migration:
+    """A set of DDL statements that moves the schema to the given version"""
+
+    version: int
+    description: str
+    statements: tuple[str, ...]
+
+
+def _bump_version(scope: str) -> str:
+    """Trigger statement moving the version of a scope forward"""
+    return f"""
+                INSERT INTO data_versions (scope, version, updated_at)
+                VALUES ({scope}, 1, strftime('%Y-%m-%d %H:%M:%f', 'now') || '000')
+                ON CONFLICT (scope) DO UPDATE SET
+                version = version + 1, updated_at = excluded.updated_at;"""
+
+
+MIGRATIONS: tuple[Migration, ...] = (
+    Migration(
+        version=1,
+        description="Create events, attendees and check-ins with their indexes",
+        statements=(
+            """
+            CREATE TABLE IF NOT EXISTS events (
+                id TEXT NOT NULL PRIMARY KEY,
+                title TEXT NOT NULL,
+                details TEXT,
+                slug TEXT NOT NULL UNIQUE,
+                maximum_attendees INTEGER,
+                created_at DATETIME NOT NULL DEFAULT (
+                    strftime('%Y-%m-%d %H:%M:%f', 'now') || '000'
+                )
+            )
+            """,
+            """
+            CREATE TABLE IF NOT EXISTS attendees (
+                id TEXT NOT NULL PRIMARY KEY,
+                name TEXT NOT NULL,
+                email TEXT NOT NULL,
+                event_id TEXT NOT NULL REFERENCES events (id),
+                created_at DATETIME NOT NULL DEFAULT (
+                    strftime('%Y-%m-%d %H:%M:%f', 'now') || '000'
+                )
+            )
+            """,
+            """
+            CREATE TABLE IF NOT EXISTS check_ins (
+                id INTEGER NOT NULL PRIMARY KEY AUTOINCREMENT,
+                created_at DATETIME NOT NULL DEFAULT (
+                    strftime('%Y-%m-%d %H:%M:%f', 'now') || '000'
+                ),
+                attendee_id TEXT NOT NULL REFERENCES attendees (id)
+            )
+            """,
+            # Event listing: ORDER BY created_at DESC, id DESC and its cursor.
+            """
+            CREATE INDEX IF NOT EXISTS events_created_at_id_idx
+            ON events (created_at, id)
+            """,
+            # Duplicate checks and registration: WHERE event_id = ? AND email = ?
+            """
+            CREATE UNIQUE INDEX IF NOT EXISTS attendees_event_id_email_key
+            ON attendees (event_id, email)
+            """,
+            # Participants page and count: WHERE event_id = ? AND name LIKE ?
+            # ORDER BY name DESC, id DESC, plus its cursor.
+            """
+            CREATE INDEX IF NOT EXISTS attendees_event_id_name_id_idx
+            ON attendees (event_id, name, id)
+            """,
+            # Attendee lookups join check_ins ON attendee_id; one check-in each.
+            """
+            CREATE UNIQUE INDEX IF NOT EXISTS check_ins_attendee_id_key
+            ON check_ins (attendee_id)
+            """,
+        ),
+    ),
+    Migration(
+        version=2,
+        description="Keep attendee and check-in counters on events",
+        statements=(
+            "ALTER TABLE events ADD COLUMN attendee_count INTEGER NOT NULL DEFAULT 0",
+            "ALTER TABLE events ADD COLUMN checked_in_count INTEGER NOT NULL DEFAULT 0",
+            """
+            UPDATE events SET
+            attendee_count = (
+                SELECT COUNT(*)
+                FROM attendees AS at
+                WHERE at.event_id = events.id
+            ),
+            checked_in_count = (
+                SELECT COUNT(*)
+                FROM check_ins AS chk
+                JOIN attendees AS at
+                ON at.id = chk.attendee_id
+                WHERE at.event_id = events.id
+            )
+            """,
+            """
+            CREATE TRIGGER attendees_count_after_insert
+            AFTER INSERT ON attendees
+            BEGIN
+                UPDATE events SET attendee_count = attendee_count + 1
+                WHERE id = NEW.event_id;
+            END
+            """,
+            """
+            CREATE TRIGGER attendees_count_after_delete
+            AFTER DELETE ON attendees
+            BEGIN
+                UPDATE events SET attendee_count = attendee_count - 1
+                WHERE id = OLD.event_id;
+            END
+            """,
+            """
+            CREATE TRIGGER attendees_count_after_update
+            AFTER UPDATE OF event_id ON attendees
+            WHEN OLD.event_id IS NOT NEW.event_id
+            BEGIN
+                UPDATE events SET attendee_count = attendee_count - 1
+                WHERE id = OLD.event_id;
+                UPDATE events SET attendee_count = attendee_count + 1
+                WHERE id = NEW.event_id;
+            END
+            """,
+            """
+            CREATE TRIGGER check_ins_count_after_insert
+            AFTER INSERT ON check_ins
+            BEGIN
+                UPDATE events SET checked_in_count = checked_in_count + 1
+                WHERE id = (
+                    SELECT at.event_id FROM attendees AS at
+                    WHERE at.id = NEW.attendee_id
+                );
+            END
+            """,
+            """
+            CREATE TRIGGER check_ins_count_after_delete
+            AFTER DELETE ON check_ins
+            BEGIN
+                UPDATE events SET checked_in_count = checked_in_count - 1
+                WHERE id = (
+                    SELECT at.event_id FROM attendees AS at
+                    WHERE at.id = OLD.attendee_id
+                );
+            END
+            """,
+        ),
+    ),
+    Migration(
+        version=3,
+        description="Index attendee names and event titles for substring search",
+        statements=(
+            """
+            CREATE VIRTUAL TABLE attendees_search USING fts5(
+                name, content='attendees', content_rowid='rowid', tokenize='trigram'
+            )
+            """,
+            "INSERT INTO attendees_search (attendees_search) VALUES ('rebuild')",
+            """
+            CREATE TRIGGER attendees_search_after_insert
+            AFTER INSERT ON attendees
+            BEGIN
+                INSERT INTO attendees_search (rowid, name)
+                VALUES (NEW.rowid, NEW.name);
+            END
+            """,
+            """
+            CREATE TRIGGER attendees_search_after_delete
+            AFTER DELETE ON attendees
+            BEGIN
+                INSERT INTO attendees_search (attendees_search, rowid, name)
+                VALUES ('delete', OLD.rowid, OLD.name);
+            END
+            """,
+            """
+            CREATE TRIGGER attendees_search_after_update
+            AFTER UPDATE OF name ON attendees
+            BEGIN
+                INSERT INTO attendees_search (attendees_search, rowid, name)
+                VALUES ('delete', OLD.rowid, OLD.name);
+                INSERT INTO attendees_search (rowid, name)
+                VALUES (NEW.rowid, NEW.name);
+            END
+            """,
+            """
+            CREATE VIRTUAL TABLE events_search USING fts5(
+                title, content='events', content_rowid='rowid', tokenize='trigram'
+            )
+            """,
+            "INSERT INTO events_search (events_search) VALUES ('rebuild')",
+            """
+            CREATE TRIGGER events_search_after_insert
+            AFTER INSERT ON events
+            BEGIN
+                INSERT INTO events_search (rowid, title)
+                VALUES (NEW.rowid, NEW.title);
+            END
+            """,
+            """
+            CREATE TRIGGER events_search_after_delete
+            AFTER DELETE ON events
+            BEGIN
+                INSERT INTO events_search (events_search, rowid, title)
+                VALUES ('delete', OLD.rowid, OLD.title);
+            END
+            """,
+            """
+            CREATE TRIGGER events_search_after_update
+            AFTER UPDATE OF title ON events
+            BEGIN
+                INSERT INTO events_search (events_search, rowid, title)
+                VALUES ('delete', OLD.rowid, OLD.title);
+                INSERT INTO events_search (rowid, title)
+                VALUES (NEW.rowid, NEW.title);
+            END
+            """,
+        ),
+    ),
+    Migration(
+        version=4,
+        description="Store event creation times with microseconds",
+        statements=(
+            # Typed statements and the column default write
+            # 'YYYY-MM-DD HH:MM:SS.ffffff'; rows written by hand or by the
+            # CURRENT_TIMESTAMP default of databases created before it miss
+            # the fraction, which breaks the text comparison of the
+            # (created_at, id) listing cursor.
+            """
+            UPDATE events SET created_at = created_at || '.000000'
+            WHERE length(created_at) = 19
+            """,
+        ),
+    ),
+    Migration(
+        version=5,
+        description="Keep change markers for the event listing and each event",
+        statements=(
+            # 'events' changes with any event row, 'event:<id>' with the event,
+            # its counters (so its attendees and check-ins) or its attendees.
+            """
+            CREATE TABLE data_versions (
+                scope TEXT NOT NULL PRIMARY KEY,
+                version INTEGER NOT NULL,
+                updated_at DATETIME NOT NULL
+            ) WITHOUT ROWID
+            """,
+            """
+            INSERT INTO data_versions (scope, version, updated_at)
+            SELECT 'event:' || id, 1, created_at FROM events
+            """,
+            """
+            INSERT INTO data_versions (scope, version, updated_at)
+            SELECT 'events', 1, COALESCE(
+                MAX(created_at), strftime('%Y-%m-%d %H:%M:%f', 'now') || '000'
+            )
+            FROM events
+            """,
+            f"""
+            CREATE TRIGGER events_version_after_insert
+            AFTER INSERT ON events
+            BEGIN{_bump_version("'events'")}{_bump_version("'event:' || NEW.id")}
+            END
+            """,
+            f"""
+            CREATE TRIGGER events_version_after_update
+            AFTER UPDATE ON events
+            BEGIN{_bump_version("'events'")}{_bump_version("'event:' || NEW.id")}
+            END
+            """,
+            f"""
+            CREATE TRIGGER events_version_after_delete
+            AFTER DELETE ON events
+            BEGIN{_bump_version("'events'")}
+                DELETE FROM data_versions WHERE scope = 'event:' || OLD.id;
+            END
+            """,
+            # Inserts and deletes of attendees already touch the event counters.
+            f"""
+            CREATE TRIGGER attendees_version_after_update
+            AFTER UPDATE ON attendees
+            BEGIN{_bump_version("'event:' || NEW.event_id")}
+            END
+            """,
+            f"""
+            CREATE TRIGGER attendees_version_after_move
+            AFTER UPDATE OF event_id ON attendees
+            WHEN OLD.event_id IS NOT NEW.event_id
+            BEGIN{_bump_version("'event:' || OLD.event_id")}
+            END
+            """,
+        ),
+    ),
+    Migration(
+        version=6,
+        description="Keep the device that scanned each check-in",
+        statements=(
+            # NULL for the check-ins made online, one request each.
+            "ALTER TABLE check_ins ADD COLUMN device_id TEXT",
+        ),
+    ),
+)
+
+
+def get_schema_version(engine: Engine) -> int:
+    """Read the version of the schema applied to the database"""
+    with engine.connect() as connection:
+        return int(connection.exec_driver_sql("PRAGMA user_version").scalar() or 0)
+
+
+def apply_migrations(
+    engine: Engine, migrations: tuple[Migration, ...] = MIGRATIONS
+) -> list[int]:
+    """
+    Apply the pending migrations in a single immediate transaction.
+    Returns the versions that were applied, empty when the schema is up to date.
+    """
+    raw_connection = engine.raw_connection()
+    try:
+        dbapi_connection = raw_connection.driver_connection
+        isolation_level = dbapi_connection.isolation_level
+        # Take the write lock before reading the version, so concurrent
+        # workers starting together do not apply the same migration twice.
+        dbapi_connection.isolation_level = None
+        try:
+            dbapi_connection.execute("BEGIN IMMEDIATE")
+            current_version = dbapi_connection.execute(
+                "PRAGMA user_version"
+            ).fetchone()[0]
+            applied = []
+            for migration in sorted(migrations, key=lambda item: item.version):
+                if migration.version <= current_version:
+                    continue
+                for statement in migration.statements:
+                    dbapi_connection.execute(statement)
+                dbapi_connection.execute(f"PRAGMA user_version = {migration.version:d}")
+                applied.append(migration.version)
+            dbapi_connection.execute("COMMIT")
+            return applied
+        except Exception:
+            if dbapi_connection.in_transaction:
+                dbapi_connection.execute("ROLLBACK")
+            raise
+        finally:
+            dbapi_connection.isolation_level = isolation_level
+    finally:
+        raw_connection.close()
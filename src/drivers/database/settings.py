@@ -0,0 +1,135 @@
+"""
+This module contains the configuration of the database engine.
+
+The settings are read from a JSON file pointed by 'DATABASE_CONFIG_FILE'
+and then from the environment, so a variable always overrides the file:
+
+    DATABASE_URL              sqlite:///instance/pass_in.db
+    DATABASE_POOL_CLASS       queue | singleton | static | null
+    DATABASE_POOL_SIZE        5
+    DATABASE_MAX_OVERFLOW     10
+    DATABASE_POOL_TIMEOUT     30 (seconds waiting for a pooled connection)
+    DATABASE_POOL_RECYCLE     -1 (seconds before a connection is replaced)
+    DATABASE_POOL_PRE_PING    false
+    SQLITE_JOURNAL_MODE       wal
+    SQLITE_SYNCHRONOUS        normal
+    SQLITE_BUSY_TIMEOUT       5000 (milliseconds)
+    SQLITE_CACHE_SIZE         -16000 (negative values are KiB)
+    SQLITE_MMAP_SIZE          134217728 (bytes)
+
+The file uses the same names in lower case, e.g. {"pool_size": 8}.
+"""
+
+import json
+import os
+from dataclasses import dataclass, fields, replace
+from typing import Mapping
+
+CONFIG_FILE_VARIABLE = "DATABASE_CONFIG_FILE"
+
+POOL_CLASSES = ("queue", "singleton", "static", "null")
+JOURNAL_MODES = ("delete", "truncate", "persist", "memory", "wal", "off")
+SYNCHRONOUS_MODES = ("off", "normal", "full", "extra")
+
+_ENVIRONMENT_PREFIXES = {
+    "url": "DATABASE_",
+    "pool_class": "DATABASE_",
+    "pool_size": "DATABASE_",
+    "max_overflow": "DATABASE_",
+    "pool_timeout": "DATABASE_",
+    "pool_recycle": "DATABASE_",
+    "pool_pre_ping": "DATABASE_",
+    "journal_mode": "SQLITE_",
+    "synchronous": "SQLITE_",
+    "busy_timeout": "SQLITE_",
+    "cache_size": "SQLITE_",
+    "mmap_size": "SQLITE_",
+}
+
+
+@dataclass(frozen=True)
+class DatabaseSettings:
+    """The options used to build the engine and to set up each sqlite connection"""
+
+    url: str = "sqlite:///instance/pass_in.db"
+    pool_class: str = "queue"
+    pool_size: int = 5
+    max_overflow: int = 10
+    pool_timeout: float = 30.0
+    pool_recycle: int = -1
+    pool_pre_ping: bool = False
+    journal_mode: str = "wal"
+    synchronous: str = "normal"
+    busy_timeout: int = 5000
+    cache_size: int = -16000
+    mmap_size: int = 134217728
+
+    def __post_init__(self):
+        for name, allowed in (
+            ("pool_class", POOL_CLASSES),
+            ("journal_mode", JOURNAL_MODES),
+            ("synchronous", SYNCHRONOUS_MODES),
+        ):
+            if getattr(self, name) not in allowed:
+                raise ValueError(
+                    f"Invalid database setting {name}={getattr(self, name)!r},"
+                    f" expected one of {', '.join(allowed)}."
+                )
+
+    def pragmas(self) -> dict[str, str | int]:
+        """The PRAGMA statements run on every new sqlite connection, in order"""
+        return {
+            "journal_mode": self.journal_mode,
+            "synchronous": self.synchronous,
+            "busy_timeout": self.busy_timeout,
+            "cache_size": self.cache_size,
+            "mmap_size": self.mmap_size,
+        }
+
+
+def _convert(name: str, value):
+    """Cast a raw value from the file or the environment to the field type"""
+    default = getattr(DatabaseSettings, name)
+    if isinstance(default, bool):
+        if isinstance(value, bool):
+            return value
+        return str(value).strip().lower() in ("1", "true", "yes", "on")
+    try:
+        if isinstance(default, int):
+            return int(value)
+        if isinstance(default, float):
+            return float(value)
+    except (TypeError, ValueError) as exc:
+        raise ValueError(f"Invalid database setting {name}={value!r}.") from exc
+    return str(value).strip().lower() if name != "url" else str(value)
+
+
+def load_database_settings(
+    environ: Mapping[str, str] | None = None,
+) -> DatabaseSettings:
+    """
+    Build the settings from the defaults, the config file and the environment.
+    Raises: ValueError when a value is invalid or the file has unknown keys
+    """
+    environ = os.environ if environ is None else environ
+    names = {field.name for field in fields(DatabaseSettings)}
+    values = {}
+    config_file = environ.get(CONFIG_FILE_VARIABLE)
+    if config_file:
+        with open(config_file, encoding="utf-8") as file:
+            content = json.load(file)
+        unknown = set(content) - names
+        if unknown:
+            raise ValueError(
+                f"Unknown database settings in {config_file}:"
+                f" {', '.join(sorted(unknown))}."
+            )
+        values.update(content)
+    for name in names:
+        variable = _ENVIRONMENT_PREFIXES[name] + name.upper()
+        if variable in environ:
+            values[name] = environ[variable]
+    return replace(
+        DatabaseSettings(),
+        **{name: _convert(name, value) for name, value in values.items()},
+    )
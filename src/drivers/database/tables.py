@@ -0,0 +1,51 @@
+"""
+This module describes the application tables for SQLAlchemy Core.
+
+The schema itself is owned by the migrations; these definitions only give
+the statements typed columns, so timestamps come back as datetime objects
+and counters as integers whatever the sqlite storage class is.
+"""
+
+from sqlalchemy import Column, DateTime, Integer, MetaData, String, Table
+
+metadata = MetaData()
+
+events = Table(
+    "events",
+    metadata,
+    Column("id", String, primary_key=True),
+    Column("title", String, nullable=False),
+    Column("details", String),
+    Column("slug", String, nullable=False, unique=True),
+    Column("maximum_attendees", Integer),
+    Column("created_at", DateTime, nullable=False),
+    Column("attendee_count", Integer, nullable=False),
+    Column("checked_in_count", Integer, nullable=False),
+)
+
+attendees = Table(
+    "attendees",
+    metadata,
+    Column("id", String, primary_key=True),
+    Column("name", String, nullable=False),
+    Column("email", String, nullable=False),
+    Column("event_id", String, nullable=False),
+    Column("created_at", DateTime, nullable=False),
+)
+
+check_ins = Table(
+    "check_ins",
+    metadata,
+    Column("id", Integer, primary_key=True),
+    Column("created_at", DateTime, nullable=False),
+    Column("attendee_id", String, nullable=False, unique=True),
+    Column("device_id", String),
+)
+
+data_versions = Table(
+    "data_versions",
+    metadata,
+    Column("scope", String, primary_key=True),
+    Column("version", Integer, nullable=False),
+    Column("updated_at", DateTime, nullable=False),
+)
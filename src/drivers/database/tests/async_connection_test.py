@@ -0,0 +1,58 @@
+import asyncio
+import importlib.util
+
+from pytest import mark, raises
+from sqlalchemy import text
+
+from src.drivers.database.async_connection import AsyncDBConnection, async_url
+from src.drivers.database.migrations import apply_migrations, get_schema_version
+from src.drivers.database.settings import DatabaseSettings
+
+needs_aiosqlite = mark.skipif(
+    importlib.util.find_spec("aiosqlite") is None, reason="aiosqlite is not installed"
+)
+
+
+def test_async_url_swaps_the_sqlite_driver():
+    assert async_url("sqlite:///instance/pass_in.db") == (
+        "sqlite+aiosqlite:///instance/pass_in.db"
+    )
+    assert async_url("sqlite+aiosqlite:///db") == "sqlite+aiosqlite:///db"
+
+
+def test_singleton_pool_is_rejected(tmp_path):
+    connection = AsyncDBConnection(
+        DatabaseSettings(url=f"sqlite:///{tmp_path / 'db'}", pool_class="singleton")
+    )
+    with raises(ValueError):
+        connection.get_engine()
+
+
+@needs_aiosqlite
+def test_engine_migrates_once_and_applies_pragmas(tmp_path):
+    settings = DatabaseSettings(url=f"sqlite:///{tmp_path / 'db'}", busy_timeout=1234)
+    connection = AsyncDBConnection(settings)
+    migrated = []
+
+    def migrate(engine):
+        migrated.append(get_schema_version(engine))
+        apply_migrations(engine)
+
+    connection.on_engine_created(migrate)
+    connection.on_engine_created(migrate)
+    assert not (tmp_path / "db").exists()
+
+    async def scenario():
+        async with connection.connect() as conn:
+            busy_timeout = (await conn.execute(text("PRAGMA busy_timeout"))).scalar()
+            journal_mode = (await conn.execute(text("PRAGMA journal_mode"))).scalar()
+            version = (await conn.execute(text("PRAGMA user_version"))).scalar()
+        with raises(RuntimeError):
+            connection.configure(DatabaseSettings(url="sqlite:///other.db"))
+        await connection.disconnect()
+        return busy_timeout, journal_mode, version
+
+    busy_timeout, journal_mode, version = asyncio.run(scenario())
+    assert migrated == [0]
+    assert (busy_timeout, journal_mode) == (1234, "wal")
+    assert version > 0
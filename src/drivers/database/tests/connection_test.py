@@ -0,0 +1,94 @@
+import os
+
+from pytest import mark, raises
+from sqlalchemy.pool import NullPool, QueuePool
+
+from src.drivers.database.connection import DBConnection, describe_engine
+from src.drivers.database.settings import DatabaseSettings
+
+
+def test_engine_applies_pool_options_and_pragmas(tmp_path):
+    connection = DBConnection(
+        DatabaseSettings(
+            url=f"sqlite:///{tmp_path / 'instance' / 'pass_in.db'}",
+            pool_size=3,
+            max_overflow=2,
+            pool_recycle=600,
+            busy_timeout=1234,
+            cache_size=-2000,
+        )
+    )
+    connection.make_connection()
+    try:
+        engine = connection.get_engine()
+        assert isinstance(engine.pool, QueuePool)
+        description = describe_engine(engine, connection.get_settings())
+        assert description["pool_size"] == 3
+        assert description["max_overflow"] == 2
+        assert description["pool_recycle"] == 600
+        assert description["journal_mode"] == "wal"
+        assert description["synchronous"] == "normal"
+        assert description["busy_timeout"] == 1234
+        assert description["cache_size"] == -2000
+    finally:
+        connection.disconnect()
+
+
+def test_engine_without_pooling(tmp_path):
+    connection = DBConnection(
+        DatabaseSettings(
+            url=f"sqlite:///{tmp_path / 'pass_in.db'}",
+            pool_class="null",
+            journal_mode="delete",
+            synchronous="full",
+        )
+    )
+    connection.make_connection()
+    try:
+        engine = connection.get_engine()
+        assert isinstance(engine.pool, NullPool)
+        description = describe_engine(engine, connection.get_settings())
+        assert "pool_size" not in description
+        assert "pool_recycle" not in description
+        assert description["journal_mode"] == "delete"
+        assert description["synchronous"] == "full"
+    finally:
+        connection.disconnect()
+
+
+def test_engine_is_created_on_first_use(tmp_path):
+    database = tmp_path / "lazy.db"
+    connection = DBConnection(DatabaseSettings(url=f"sqlite:///{database}"))
+    created = []
+    connection.on_engine_created(created.append)
+    connection.on_engine_created(created.append)
+    assert not database.exists()
+    try:
+        with connection.connect() as db_connection:
+            assert db_connection.exec_driver_sql("SELECT 1").scalar() == 1
+        assert created == [connection.get_engine()]
+        assert database.exists()
+        with raises(RuntimeError):
+            connection.configure(DatabaseSettings(url="sqlite://"))
+    finally:
+        connection.disconnect()
+
+
+@mark.skipif(not hasattr(os, "fork"), reason="fork is not available")
+def test_forked_child_does_not_reuse_the_parent_pool(tmp_path):
+    connection = DBConnection(DatabaseSettings(url=f"sqlite:///{tmp_path / 'f.db'}"))
+    try:
+        engine = connection.get_engine()
+        with engine.connect() as db_connection:
+            db_connection.exec_driver_sql("SELECT 1")
+        parent_pool = engine.pool
+        pid = os.fork()
+        if pid == 0:  # pragma: no cover - runs in the child
+            reused = engine.pool is parent_pool or engine.pool.checkedin() > 0
+            os._exit(1 if reused else 0)
+        _, status = os.waitpid(pid, 0)
+        assert os.waitstatus_to_exitcode(status) == 0
+        assert engine.pool is parent_pool
+        assert parent_pool.checkedin() == 1
+    finally:
+        connection.disconnect()
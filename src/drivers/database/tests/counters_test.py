@@ -0,0 +1,75 @@
+from pytest import fixture
+from sqlalchemy import create_engine, text
+
+from src.drivers.database.counters import (
+    CounterDrift,
+    find_counter_drift,
+    repair_counter_drift,
+)
+from src.drivers.database.migrations import apply_migrations
+
+
+@fixture(name="engine")
+def migrated_engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'pass_in.db'}")
+    apply_migrations(engine)
+    with engine.begin() as connection:
+        connection.execute(
+            text(
+                "INSERT INTO events (id, title, slug, created_at)"
+                " VALUES ('ev-1', 'Event', 'event', '2024-01-01 00:00:00')"
+            )
+        )
+        for attendee_id in ("at-1", "at-2"):
+            connection.execute(
+                text(
+                    "INSERT INTO attendees (id, name, email, event_id)"
+                    " VALUES (:id, 'Attendee', :email, 'ev-1')"
+                ),
+                {"id": attendee_id, "email": f"{attendee_id}@gmail.com"},
+            )
+        connection.execute(text("INSERT INTO check_ins (attendee_id) VALUES ('at-1')"))
+    yield engine
+    engine.dispose()
+
+
+def read_counters(engine) -> tuple[int, int]:
+    with engine.connect() as connection:
+        return tuple(
+            connection.execute(
+                text(
+                    "SELECT attendee_count, checked_in_count FROM events"
+                    " WHERE id = 'ev-1'"
+                )
+            ).one()
+        )
+
+
+def test_triggers_keep_counters(engine):
+    assert read_counters(engine) == (2, 1)
+    with engine.begin() as connection:
+        connection.execute(text("DELETE FROM check_ins WHERE attendee_id = 'at-1'"))
+        connection.execute(text("DELETE FROM attendees WHERE id = 'at-2'"))
+    assert read_counters(engine) == (1, 0)
+    assert find_counter_drift(engine) == []
+
+
+def test_find_and_repair_counter_drift(engine):
+    with engine.begin() as connection:
+        connection.execute(
+            text("UPDATE events SET attendee_count = 7, checked_in_count = 0")
+        )
+    expected = [
+        CounterDrift(
+            event_id="ev-1",
+            stored_attendee_count=7,
+            actual_attendee_count=2,
+            stored_checked_in_count=0,
+            actual_checked_in_count=1,
+        )
+    ]
+    assert find_counter_drift(engine) == expected
+    assert read_counters(engine) == (7, 0)
+    assert repair_counter_drift(engine) == expected
+    assert read_counters(engine) == (2, 1)
+    assert find_counter_drift(engine) == []
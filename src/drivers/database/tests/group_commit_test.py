@@ -0,0 +1,149 @@
+import threading
+
+from pytest import fixture, raises
+from sqlalchemy import event, text
+
+from src.drivers.database.connection import DBConnection
+from src.drivers.database.group_commit import (
+    GroupCommitSettings,
+    GroupCommitTimeoutError,
+    GroupCommitWriter,
+    load_group_commit_settings,
+)
+from src.drivers.database.settings import DatabaseSettings
+
+
+@fixture(name="connection")
+def database_connection(tmp_path):
+    connection = DBConnection(DatabaseSettings(url=f"sqlite:///{tmp_path / 'db'}"))
+    connection.make_connection()
+    with connection.begin() as db_connection:
+        db_connection.execute(text("CREATE TABLE items (name TEXT NOT NULL UNIQUE)"))
+    yield connection
+    connection.disconnect()
+
+
+def count_commits(connection: DBConnection) -> list:
+    commits = []
+    event.listen(connection.get_engine(), "commit", commits.append)
+    return commits
+
+
+def insert_item(connection: DBConnection, name: str):
+    def write() -> str:
+        with connection.begin() as db_connection:
+            db_connection.execute(
+                text("INSERT INTO items VALUES (:name)"), {"name": name}
+            )
+        return name
+
+    return write
+
+
+def read_names(connection: DBConnection) -> list[str]:
+    with connection.connect() as db_connection:
+        return list(db_connection.execute(text("SELECT name FROM items")).scalars())
+
+
+def test_settings_are_read_from_the_environment():
+    assert load_group_commit_settings({}) == GroupCommitSettings()
+    settings = load_group_commit_settings(
+        {
+            "GROUP_COMMIT_ENABLED": "true",
+            "GROUP_COMMIT_WINDOW_MS": "2.5",
+            "GROUP_COMMIT_MAX_BATCH": "32",
+            "GROUP_COMMIT_TIMEOUT_MS": "250",
+        }
+    )
+    assert settings == GroupCommitSettings(
+        enabled=True, window_ms=2.5, max_batch=32, timeout_ms=250
+    )
+    with raises(ValueError):
+        load_group_commit_settings({"GROUP_COMMIT_MAX_BATCH": "many"})
+    with raises(ValueError):
+        GroupCommitSettings(max_batch=0)
+    with raises(ValueError):
+        GroupCommitSettings(timeout_ms=0)
+
+
+def test_disabled_writer_runs_in_the_caller_thread(connection):
+    writer = GroupCommitWriter(connection=connection)
+    assert writer.run(threading.get_ident) == threading.get_ident()
+    assert writer.run(insert_item(connection, "a")) == "a"
+    assert read_names(connection) == ["a"]
+
+
+def test_writes_of_a_window_share_one_commit(connection):
+    writer = GroupCommitWriter(
+        connection=connection,
+        settings=GroupCommitSettings(enabled=True, window_ms=1000, max_batch=3),
+    )
+    commits = count_commits(connection)
+    futures = [writer.submit(insert_item(connection, name)) for name in "abc"]
+    assert [future.result(timeout=5) for future in futures] == ["a", "b", "c"]
+    assert len(commits) == 1
+    assert sorted(read_names(connection)) == ["a", "b", "c"]
+    with raises(RuntimeError):
+        writer.configure(GroupCommitSettings())
+    writer.close()
+
+
+def test_a_failed_write_only_fails_its_caller(connection):
+    writer = GroupCommitWriter(
+        connection=connection,
+        settings=GroupCommitSettings(enabled=True, window_ms=1000, max_batch=3),
+    )
+    futures = [writer.submit(insert_item(connection, name)) for name in "aab"]
+    assert futures[0].result(timeout=5) == "a"
+    with raises(Exception, match="UNIQUE"):
+        futures[1].result(timeout=5)
+    assert futures[2].result(timeout=5) == "b"
+    assert sorted(read_names(connection)) == ["a", "b"]
+    writer.close()
+
+
+def test_close_commits_the_queued_writes(connection):
+    writer = GroupCommitWriter(
+        connection=connection,
+        settings=GroupCommitSettings(enabled=True, window_ms=1000, max_batch=10),
+    )
+    future = writer.submit(insert_item(connection, "a"))
+    writer.close()
+    assert future.result(timeout=0) == "a"
+    assert read_names(connection) == ["a"]
+
+
+def test_a_caller_stops_waiting_after_the_timeout(connection):
+    writer = GroupCommitWriter(
+        connection=connection,
+        settings=GroupCommitSettings(enabled=True, max_batch=1, timeout_ms=50),
+    )
+    release = threading.Event()
+    blocked = writer.submit(lambda: release.wait(timeout=5))
+    with raises(GroupCommitTimeoutError):
+        writer.run(insert_item(connection, "a"))
+    release.set()
+    assert blocked.result(timeout=5) is True
+    writer.close()
+    # The write was still queued when its caller gave up, so it was dropped.
+    assert read_names(connection) == []
+
+
+def test_a_dead_writer_thread_is_replaced(connection, monkeypatch):
+    monkeypatch.setattr(threading, "excepthook", lambda args: None)
+    writer = GroupCommitWriter(
+        connection=connection,
+        settings=GroupCommitSettings(enabled=True, timeout_ms=5000),
+    )
+    crashed = []
+
+    def crash():
+        crashed.append(threading.current_thread())
+        raise KeyboardInterrupt
+
+    writer.submit(crash)
+    while not crashed:
+        threading.Event().wait(0.01)
+    crashed[0].join(timeout=5)
+    assert writer.run(insert_item(connection, "a")) == "a"
+    writer.close()
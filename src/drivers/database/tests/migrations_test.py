@@ -0,0 +1,191 @@
+from pytest import fixture, raises
+from sqlalchemy import create_engine, text
+
+from src.drivers.database.migrations import (
+    MIGRATIONS,
+    Migration,
+    apply_migrations,
+    get_schema_version,
+)
+
+
+@fixture(name="engine")
+def sqlite_engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'pass_in.db'}")
+    yield engine
+    engine.dispose()
+
+
+def query_plan(engine, sql: str, params: dict) -> str:
+    with engine.connect() as connection:
+        rows = connection.execute(text(f"EXPLAIN QUERY PLAN {sql}"), params)
+        return " | ".join(row[-1] for row in rows)
+
+
+def test_apply_migrations_from_empty_database(engine):
+    applied = apply_migrations(engine)
+    assert applied == [migration.version for migration in MIGRATIONS]
+    assert get_schema_version(engine) == MIGRATIONS[-1].version
+    with engine.connect() as connection:
+        tables = connection.execute(
+            text("SELECT name FROM sqlite_master WHERE type = 'table'")
+        ).scalars()
+        assert {"events", "attendees", "check_ins"} <= set(tables)
+
+
+def test_apply_migrations_is_idempotent(engine):
+    apply_migrations(engine)
+    assert apply_migrations(engine) == []
+    assert get_schema_version(engine) == MIGRATIONS[-1].version
+
+
+def test_failed_migration_is_rolled_back(engine):
+    apply_migrations(engine)
+    version = get_schema_version(engine)
+    broken = MIGRATIONS + (
+        Migration(
+            version=version + 1,
+            description="broken",
+            statements=("CREATE TABLE broken (id INTEGER)", "NOT SQL"),
+        ),
+    )
+    with raises(Exception):
+        apply_migrations(engine, migrations=broken)
+    assert get_schema_version(engine) == version
+    with engine.connect() as connection:
+        broken_table = connection.execute(
+            text("SELECT name FROM sqlite_master WHERE name = 'broken'")
+        ).first()
+        assert broken_table is None
+
+
+def test_default_created_at_keeps_microseconds(engine):
+    apply_migrations(engine)
+    with engine.begin() as connection:
+        connection.execute(
+            text(
+                "INSERT INTO events (id, title, slug)"
+                " VALUES ('ev-1', 'Python Brasil', 'python-brasil')"
+            )
+        )
+        connection.execute(
+            text(
+                "INSERT INTO attendees (id, name, email, event_id)"
+                " VALUES ('at-1', 'Maria Silva', 'maria@gmail.com', 'ev-1')"
+            )
+        )
+        connection.execute(text("INSERT INTO check_ins (attendee_id) VALUES ('at-1')"))
+    with engine.connect() as connection:
+        created_at = connection.execute(
+            text(
+                "SELECT created_at FROM events UNION ALL"
+                " SELECT created_at FROM attendees UNION ALL"
+                " SELECT created_at FROM check_ins"
+            )
+        ).scalars()
+        assert [len(value) for value in created_at] == [26, 26, 26]
+
+
+def test_hot_queries_use_indexes(engine):
+    apply_migrations(engine)
+    duplicate_plan = query_plan(
+        engine,
+        "SELECT 1 FROM attendees WHERE event_id = :id AND email = :email",
+        {"id": "1", "email": "a@a.com"},
+    )
+    assert "attendees_event_id_email_key" in duplicate_plan
+    participants_plan = query_plan(
+        engine,
+        "SELECT id, name FROM attendees WHERE event_id = :id AND name LIKE :query"
+        " ORDER BY name DESC, id DESC LIMIT 10",
+        {"id": "1", "query": "%a%"},
+    )
+    assert "attendees_event_id_name_id_idx" in participants_plan
+    assert "TEMP B-TREE" not in participants_plan
+    events_plan = query_plan(
+        engine,
+        "SELECT * FROM events ORDER BY created_at DESC, id DESC LIMIT 10",
+        {},
+    )
+    assert "events_created_at_id_idx" in events_plan
+    check_in_plan = query_plan(
+        engine,
+        "SELECT created_at FROM check_ins WHERE attendee_id = :id",
+        {"id": "1"},
+    )
+    assert "check_ins_attendee_id_key" in check_in_plan
+
+
+def test_search_indexes_follow_writes(engine):
+    apply_migrations(engine)
+    with engine.begin() as connection:
+        connection.execute(
+            text(
+                "INSERT INTO events (id, title, slug)"
+                " VALUES ('ev-1', 'Python Brasil', 'python-brasil')"
+            )
+        )
+        connection.execute(
+            text(
+                "INSERT INTO attendees (id, name, email, event_id)"
+                " VALUES ('at-1', 'Maria Silva', 'maria@gmail.com', 'ev-1')"
+            )
+        )
+    search_attendees = text(
+        "SELECT rowid FROM attendees_search WHERE attendees_search MATCH :search"
+    )
+    search_events = text(
+        "SELECT rowid FROM events_search WHERE events_search MATCH :search"
+    )
+    with engine.connect() as connection:
+        assert connection.execute(search_attendees, {"search": '"ria sil"'}).all()
+        assert connection.execute(search_events, {"search": '"brasil"'}).all()
+    with engine.begin() as connection:
+        connection.execute(text("UPDATE attendees SET name = 'Joana Souza'"))
+        connection.execute(text("UPDATE events SET title = 'PyCon'"))
+    with engine.connect() as connection:
+        assert not connection.execute(search_attendees, {"search": '"silva"'}).all()
+        assert connection.execute(search_attendees, {"search": '"souza"'}).all()
+        assert not connection.execute(search_events, {"search": '"brasil"'}).all()
+    with engine.begin() as connection:
+        connection.execute(text("DELETE FROM attendees"))
+    with engine.connect() as connection:
+        assert not connection.execute(search_attendees, {"search": '"souza"'}).all()
+
+
+def test_versions_follow_writes(engine):
+    apply_migrations(engine)
+
+    def read_versions() -> dict[str, int]:
+        with engine.connect() as connection:
+            return dict(
+                connection.execute(
+                    text("SELECT scope, version FROM data_versions")
+                ).all()
+            )
+
+    with engine.begin() as connection:
+        connection.execute(
+            text(
+                "INSERT INTO events (id, title, slug)"
+                " VALUES ('ev-1', 'Python Brasil', 'python-brasil')"
+            )
+        )
+    assert read_versions() == {"events": 2, "event:ev-1": 1}
+    with engine.begin() as connection:
+        connection.execute(
+            text(
+                "INSERT INTO attendees (id, name, email, event_id)"
+                " VALUES ('at-1', 'Maria Silva', 'maria@gmail.com', 'ev-1')"
+            )
+        )
+    assert read_versions() == {"events": 3, "event:ev-1": 2}
+    with engine.begin() as connection:
+        connection.execute(text("INSERT INTO check_ins (attendee_id) VALUES ('at-1')"))
+        connection.execute(text("UPDATE attendees SET name = 'Joana Souza'"))
+    assert read_versions() == {"events": 4, "event:ev-1": 4}
+    with engine.begin() as connection:
+        connection.execute(text("DELETE FROM check_ins"))
+        connection.execute(text("DELETE FROM attendees"))
+        connection.execute(text("DELETE FROM events"))
+    assert read_versions() == {"events": 7}
@@ -0,0 +1,49 @@
+import json
+
+from pytest import raises
+
+from src.drivers.database.settings import DatabaseSettings, load_database_settings
+
+
+def test_defaults_without_configuration():
+    settings = load_database_settings({})
+    assert settings == DatabaseSettings()
+    assert settings.pragmas() == {
+        "journal_mode": "wal",
+        "synchronous": "normal",
+        "busy_timeout": 5000,
+        "cache_size": -16000,
+        "mmap_size": 134217728,
+    }
+
+
+def test_environment_overrides_the_config_file(tmp_path):
+    config_file = tmp_path / "database.json"
+    config_file.write_text(
+        json.dumps({"pool_size": 8, "pool_pre_ping": True, "synchronous": "full"})
+    )
+    settings = load_database_settings(
+        {
+            "DATABASE_CONFIG_FILE": str(config_file),
+            "DATABASE_POOL_SIZE": "12",
+            "DATABASE_POOL_RECYCLE": "3600",
+            "SQLITE_JOURNAL_MODE": "DELETE",
+        }
+    )
+    assert settings.pool_size == 12
+    assert settings.pool_pre_ping is True
+    assert settings.pool_recycle == 3600
+    assert settings.synchronous == "full"
+    assert settings.journal_mode == "delete"
+
+
+def test_invalid_settings_are_rejected(tmp_path):
+    with raises(ValueError):
+        load_database_settings({"DATABASE_POOL_SIZE": "many"})
+    with raises(ValueError):
+        load_database_settings({"SQLITE_JOURNAL_MODE": "fast"})
+    config_file = tmp_path / "database.json"
+    config_file.write_text(json.dumps({"pool_sise": 8}))
+    with raises(ValueError) as exc:
+        load_database_settings({"DATABASE_CONFIG_FILE": str(config_file)})
+    assert "pool_sise" in str(exc.value)
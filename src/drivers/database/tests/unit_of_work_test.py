@@ -0,0 +1,90 @@
+from pytest import fixture, raises
+from sqlalchemy import event, text
+
+from src.drivers.database.connection import DBConnection
+from src.drivers.database.settings import DatabaseSettings
+from src.drivers.database.unit_of_work import UnitOfWork
+
+
+@fixture(name="connection")
+def database_connection(tmp_path):
+    connection = DBConnection(DatabaseSettings(url=f"sqlite:///{tmp_path / 'db'}"))
+    connection.make_connection()
+    with connection.begin() as db_connection:
+        db_connection.execute(text("CREATE TABLE items (name TEXT NOT NULL)"))
+    yield connection
+    connection.disconnect()
+
+
+def count_activity(connection: DBConnection) -> dict[str, int]:
+    activity = {"checkouts": 0, "commits": 0}
+    engine = connection.get_engine()
+
+    @event.listens_for(engine, "checkout")
+    def on_checkout(*_):
+        activity["checkouts"] += 1
+
+    @event.listens_for(engine, "commit")
+    def on_commit(*_):
+        activity["commits"] += 1
+
+    return activity
+
+
+def read_names(connection: DBConnection) -> list[str]:
+    with connection.connect() as db_connection:
+        return list(db_connection.execute(text("SELECT name FROM items")).scalars())
+
+
+def test_calls_share_one_connection_and_commit(connection):
+    activity = count_activity(connection)
+    with connection.unit_of_work():
+        assert UnitOfWork.current() is not None
+        for name in ("first", "second"):
+            with connection.begin() as db_connection:
+                db_connection.execute(
+                    text("INSERT INTO items (name) VALUES (:name)"), {"name": name}
+                )
+        assert read_names(connection) == ["first", "second"]
+    assert UnitOfWork.current() is None
+    assert activity == {"checkouts": 1, "commits": 1}
+    assert read_names(connection) == ["first", "second"]
+
+
+def test_work_is_rolled_back_on_error(connection):
+    with raises(RuntimeError):
+        with connection.unit_of_work():
+            with connection.begin() as db_connection:
+                db_connection.execute(text("INSERT INTO items (name) VALUES ('x')"))
+            raise RuntimeError("request failed")
+    assert UnitOfWork.current() is None
+    assert read_names(connection) == []
+
+
+def test_unused_unit_of_work_does_not_take_a_connection(connection):
+    activity = count_activity(connection)
+    with connection.unit_of_work():
+        pass
+    assert activity == {"checkouts": 0, "commits": 0}
+
+
+def test_calls_outside_a_unit_of_work_use_their_own_connection(connection):
+    activity = count_activity(connection)
+    with connection.begin() as db_connection:
+        db_connection.execute(text("INSERT INTO items (name) VALUES ('x')"))
+    assert read_names(connection) == ["x"]
+    assert activity == {"checkouts": 2, "commits": 1}
+
+
+def test_after_commit_callbacks_only_run_on_commit(connection):
+    calls = []
+    with connection.unit_of_work() as unit_of_work:
+        unit_of_work.after_commit(lambda: calls.append("committed"))
+        assert not calls
+    assert calls == ["committed"]
+
+    with raises(RuntimeError):
+        with connection.unit_of_work() as unit_of_work:
+            unit_of_work.after_commit(lambda: calls.append("rolled back"))
+            raise RuntimeError("request failed")
+    assert calls == ["committed"]
@@ -1,11 +1,26 @@
 from abc import ABC, abstractmethod
+from contextlib import AbstractAsyncContextManager, AbstractContextManager
+from typing import TYPE_CHECKING, Any, Callable
 
-from sqlalchemy import Engine
+from sqlalchemy import Connection, Engine
+from src.drivers.database.settings import DatabaseSettings
+from src.drivers.database.unit_of_work import UnitOfWork
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
 
 
 class ConnectionInterface(ABC):
     """Facade for sqlalchemy database connection"""
 
+    @abstractmethod
+    def configure(self, settings: DatabaseSettings):
+        """This method will set the settings of the engine not yet created"""
+
+    @abstractmethod
+    def on_engine_created(self, callback: Callable[[Engine], Any]):
+        """This method will run the callback once on the engine, when it exists"""
+
     @abstractmethod
     def make_connection(self):
         """This method will start a connection with the database"""
@@ -16,4 +31,48 @@ class ConnectionInterface(ABC):
 
     @abstractmethod
     def get_engine(self) -> Engine:
-        """This method will send the engine used to make sql operations"""
+        """This method will send the engine used to make sql operations, creating it"""
+
+    @abstractmethod
+    def connect(self) -> AbstractContextManager[Connection]:
+        """This method will lend a connection to read from the database"""
+
+    @abstractmethod
+    def begin(self) -> AbstractContextManager[Connection]:
+        """This method will lend a connection inside a transaction to write data"""
+
+    @abstractmethod
+    def stream(self) -> AbstractContextManager[Connection]:
+        """This method will lend a connection of its own, outside of any unit of work"""
+
+    @abstractmethod
+    def unit_of_work(self) -> UnitOfWork:
+        """This method will create a unit of work shared by the DAO calls"""
+
+
+class AsyncConnectionInterface(ABC):
+    """Facade for the sqlalchemy asyncio engine, used by the ASGI application"""
+
+    @abstractmethod
+    def configure(self, settings: DatabaseSettings):
+        """This method will set the settings of the engine not yet created"""
+
+    @abstractmethod
+    def on_engine_created(self, callback: Callable[[Engine], Any]):
+        """This method will run the callback once on a blocking engine of the database"""
+
+    @abstractmethod
+    def get_engine(self) -> "AsyncEngine":
+        """This method will send the asyncio engine, creating it"""
+
+    @abstractmethod
+    def connect(self) -> AbstractAsyncContextManager["AsyncConnection"]:
+        """This method will lend a connection to read from the database"""
+
+    @abstractmethod
+    def begin(self) -> AbstractAsyncContextManager["AsyncConnection"]:
+        """This method will lend a connection inside a transaction to write data"""
+
+    @abstractmethod
+    async def disconnect(self):
+        """This method will close the pooled connections"""
@@ -0,0 +1,85 @@
+"""
+This module contains the unit of work shared by the DAOs during a request.
+
+While a unit of work is active in the current context, every DAO call borrows
+the same pooled connection and transaction instead of opening its own, and
+the work is committed once when the unit ends. Outside of a unit of work
+(scripts, CLI commands, tests) the DAOs keep using one connection per call.
+"""
+
+from contextvars import ContextVar, Token
+from typing import Callable
+
+from sqlalchemy import Connection, Engine
+
+_current: ContextVar["UnitOfWork | None"] = ContextVar("unit_of_work", default=None)
+
+
+class UnitOfWork:
+    """A connection and a transaction lent to every DAO call of the same context"""
+
+    def __init__(self, engine: Engine):
+        self.__engine = engine
+        self.__connection: Connection | None = None
+        self.__token: Token | None = None
+        self.__after_commit: list[Callable[[], None]] = []
+
+    @staticmethod
+    def current() -> "UnitOfWork | None":
+        """Return the unit of work active in the current context, if any"""
+        return _current.get()
+
+    @property
+    def connection(self) -> Connection:
+        """The shared connection, checked out from the pool on first use"""
+        if self.__connection is None:
+            self.__connection = self.__engine.connect()
+            self.__connection.begin()
+        return self.__connection
+
+    def start(self) -> "UnitOfWork":
+        """Make this unit of work the active one in the current context"""
+        self.__token = _current.set(self)
+        return self
+
+    def after_commit(self, callback: Callable[[], None]):
+        """Run the callback once the pending work is committed, never on rollback"""
+        self.__after_commit.append(callback)
+
+    def commit(self):
+        """Commit the pending work, if any connection was used"""
+        if self.__connection is not None and self.__connection.in_transaction():
+            self.__connection.commit()
+        callbacks, self.__after_commit = self.__after_commit, []
+        for callback in callbacks:
+            callback()
+
+    def rollback(self):
+        """Discard the pending work, if any connection was used"""
+        self.__after_commit = []
+        if self.__connection is not None and self.__connection.in_transaction():
+            self.__connection.rollback()
+
+    def close(self):
+        """Roll back what was not committed, return the connection and deactivate"""
+        self.__after_commit = []
+        try:
+            if self.__connection is not None:
+                self.__connection.close()
+                self.__connection = None
+        finally:
+            if self.__token is not None:
+                _current.reset(self.__token)
+                self.__token = None
+
+    def __enter__(self) -> "UnitOfWork":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        try:
+            if exc_type is None:
+                self.commit()
+            else:
+                self.rollback()
+        finally:
+            self.close()
@@ -0,0 +1,126 @@
+"""
+### Async Attendee DAO
+This module contains the asyncio counterpart of the attendee DAO, used by
+the ASGI application, for the calls the routes make.
+"""
+
+from abc import ABC, abstractmethod
+
+from sqlalchemy.exc import IntegrityError
+
+from src.drivers.database.types import AsyncConnectionInterface
+from src.modules.events.dao import statements
+from src.modules.events.dtos.attendee import AttendeeRegistrationStatus, AttendeeRow
+from src.modules.events.dtos.event_credentials import EventCredentialsDTO
+from src.modules.events.entities.attendee import AttendeeEntity
+from src.utils.pagination import DEFAULT_PAGE_SIZE
+
+
+class AsyncAttendeeDaoInterface(ABC):
+    @abstractmethod
+    async def get_event_participant_rows(
+        self,
+        event_id: str,
+        query: str,
+        offset: int,
+        limit: int = DEFAULT_PAGE_SIZE,
+        after: tuple[str, str] | None = None,
+    ) -> tuple[list[AttendeeRow], int] | None:
+        """Retrieve a page of attendees as mappings and the total, None if the event not exists"""
+
+    @abstractmethod
+    async def register_participant_in_event(
+        self, attendee: AttendeeEntity
+    ) -> AttendeeRegistrationStatus:
+        """Check the event and register the attendee in a single statement"""
+
+    @abstractmethod
+    async def get_attendee_credential(
+        self, attendee_id: str
+    ) -> EventCredentialsDTO | None:
+        """Retrieve the attendee name and email with the title of their event"""
+
+
+class AsyncAttendeeDAO(AsyncAttendeeDaoInterface):
+    def __init__(self, connection: AsyncConnectionInterface):
+        self.__connection = connection
+
+    async def get_event_participant_rows(
+        self, event_id, query="", offset=0, limit=DEFAULT_PAGE_SIZE, after=None
+    ):
+        search, search_params = statements.search_params(query)
+        params = {"id": event_id, "limit": limit, **search_params}
+        if after is None:
+            params["offset"] = offset
+        else:
+            params["after_name"] = after[0]
+            params["after_id"] = after[1]
+        async with self.__connection.connect() as connection:
+            result = await connection.execute(
+                statements.participants_page_with_total(
+                    search, keyset=after is not None
+                ),
+                params,
+            )
+            all_rows = result.fetchall()
+        if len(all_rows) == 0:
+            return None
+        attendees = [
+            {
+                "attendee_id": attendee_id,
+                "name": name,
+                "email": email,
+                "event_id": attendee_event_id,
+                "created_at": created_at,
+                "checked_in_at": checked_in_at,
+            }
+            for (
+                _,
+                attendee_id,
+                name,
+                email,
+                created_at,
+                attendee_event_id,
+                checked_in_at,
+            ) in all_rows
+            if attendee_id is not None
+        ]
+        return attendees, int(all_rows[0][0])
+
+    async def register_participant_in_event(self, attendee):
+        async with self.__connection.begin() as connection:
+            try:
+                result = await connection.execute(
+                    statements.REGISTER_ATTENDEE_IN_EVENT,
+                    {
+                        "attendee_id": attendee.id,
+                        "name": attendee.name,
+                        "email": attendee.email,
+                        "event_id": attendee.event_id,
+                        "created_at": attendee.created_at,
+                    },
+                )
+                if result.rowcount == 1:
+                    return AttendeeRegistrationStatus.CREATED
+            except IntegrityError:
+                return AttendeeRegistrationStatus.ALREADY_REGISTERED
+            result = await connection.execute(
+                statements.REGISTRATION_REJECTION_REASON,
+                {"event_id": attendee.event_id, "email": attendee.email},
+            )
+            event_exists, already_registered = result.one()
+            if not event_exists:
+                return AttendeeRegistrationStatus.EVENT_NOT_FOUND
+            if already_registered:
+                return AttendeeRegistrationStatus.ALREADY_REGISTERED
+            return AttendeeRegistrationStatus.SOLD_OUT
+
+    async def get_attendee_credential(self, attendee_id):
+        async with self.__connection.connect() as connection:
+            result = await connection.execute(
+                statements.ATTENDEE_CREDENTIAL, {"id": attendee_id}
+            )
+            row = result.first()
+            if row is None:
+                return None
+            return EventCredentialsDTO(event_title=row[0], name=row[1], email=row[2])
@@ -0,0 +1,44 @@
+"""
+### Async Check-in DAO
+This module contains the asyncio counterpart of the check-in DAO, used by
+the ASGI application.
+"""
+
+from abc import ABC, abstractmethod
+
+from src.drivers.database.types import AsyncConnectionInterface
+from src.modules.events.dao import statements
+from src.modules.events.dtos.check_in import CheckInStatus
+from src.modules.events.entities.check_in import CheckInEntity
+
+
+class AsyncCheckInDaoInterface(ABC):
+    @abstractmethod
+    async def check_in_attendee(
+        self, attendee_id: str
+    ) -> tuple[CheckInStatus, CheckInEntity | None]:
+        """Check in the attendee if they exist and have not checked in yet"""
+
+
+class AsyncCheckInDAO(AsyncCheckInDaoInterface):
+    def __init__(self, connection: AsyncConnectionInterface):
+        self.__connection = connection
+
+    async def check_in_attendee(self, attendee_id):
+        async with self.__connection.begin() as connection:
+            result = await connection.execute(
+                statements.CHECK_IN_ATTENDEE, {"attendee_id": attendee_id}
+            )
+            check_in_data = result.first()
+            if check_in_data is not None:
+                return CheckInStatus.CREATED, CheckInEntity(
+                    check_in_id=check_in_data[0],
+                    created_at=check_in_data[1],
+                    attendee_id=check_in_data[2],
+                )
+            result = await connection.execute(
+                statements.ATTENDEE_EXISTS, {"attendee_id": attendee_id}
+            )
+            if result.scalar():
+                return CheckInStatus.ALREADY_CHECKED_IN, None
+            return CheckInStatus.ATTENDEE_NOT_FOUND, None
@@ -0,0 +1,155 @@
+"""
+### Async Event DAO
+This module contains the asyncio counterpart of the event DAO, used by the
+ASGI application. It runs the statements of the registry on an
+AsyncConnectionInterface and returns the same DTOs and rows as EventDAO, for
+the calls the routes make.
+"""
+
+from abc import ABC, abstractmethod
+from datetime import datetime
+
+from sqlalchemy.exc import IntegrityError
+
+from src.drivers.database.types import AsyncConnectionInterface
+from src.modules.events.dao import statements
+from src.modules.events.dtos.event import (
+    EventDTOWithAmount,
+    EventRow,
+    EventVersionDTO,
+)
+from src.modules.events.entities.event import EventEntity
+from src.modules.events.exc.event import EventAlreadyExistsError
+from src.utils.pagination import DEFAULT_PAGE_SIZE
+
+
+class AsyncEventDaoInterface(ABC):
+    @abstractmethod
+    async def get_event_info(self, event_id: str) -> EventDTOWithAmount | None:
+        """Retrieves data about an event without participants"""
+
+    @abstractmethod
+    async def retrieve_event_rows(
+        self,
+        offset: int,
+        query: str,
+        limit: int = DEFAULT_PAGE_SIZE,
+        after: tuple[datetime, str] | None = None,
+    ) -> list[EventRow]:
+        """Retrieves a page of events as mappings ready to be sent"""
+
+    @abstractmethod
+    async def create_event(self, event_data: EventEntity) -> EventEntity | None:
+        """Creates a new event using the given event_data"""
+
+    @abstractmethod
+    async def check_event_exists(self, event_id: str) -> bool:
+        """Checks for the existence of the event"""
+
+    @abstractmethod
+    async def get_events_version(self) -> EventVersionDTO | None:
+        """Retrieves the change marker of the whole event listing"""
+
+    @abstractmethod
+    async def get_event_version(self, event_id: str) -> EventVersionDTO | None:
+        """Retrieves the change marker of the event and its attendees"""
+
+
+class AsyncEventDAO(AsyncEventDaoInterface):
+    def __init__(self, connection: AsyncConnectionInterface):
+        self.__connection = connection
+
+    async def get_event_info(self, event_id):
+        async with self.__connection.connect() as connection:
+            result = await connection.execute(statements.EVENT_INFO, {"id": event_id})
+            row = result.first()
+            if row is None:
+                return None
+            return EventDTOWithAmount(
+                event_id=row[0],
+                title=row[1],
+                details=row[2],
+                slug=row[3],
+                maximum_attendees=row[4],
+                created_at=row[5],
+                attendee_amount=row[6],
+            )
+
+    async def retrieve_event_rows(
+        self,
+        offset: int = 0,
+        query: str = "",
+        limit: int = DEFAULT_PAGE_SIZE,
+        after: tuple[datetime, str] | None = None,
+    ) -> list[EventRow]:
+        search, params = statements.search_params(query)
+        params["limit"] = limit
+        if after is None:
+            params["offset"] = offset
+        else:
+            params["after_created_at"] = after[0]
+            params["after_id"] = after[1]
+        async with self.__connection.connect() as connection:
+            result = await connection.execute(
+                statements.events_page(search, keyset=after is not None), params
+            )
+            rows = result.fetchall()
+        return [
+            {
+                "event_id": event_id,
+                "title": title,
+                "slug": slug,
+                "created_at": created_at,
+                "details": details,
+                "maximum_attendees": maximum_attendees,
+                "attendee_amount": attendee_count,
+            }
+            for (
+                event_id,
+                title,
+                details,
+                slug,
+                maximum_attendees,
+                created_at,
+                attendee_count,
+            ) in rows
+        ]
+
+    async def create_event(self, event_data):
+        async with self.__connection.begin() as connection:
+            try:
+                await connection.execute(
+                    statements.INSERT_EVENT,
+                    {
+                        "id": event_data.id,
+                        "title": event_data.title,
+                        "details": event_data.details,
+                        "slug": event_data.slug,
+                        "maximum_attendees": event_data.maximum_attendees,
+                        "created_at": event_data.created_at,
+                    },
+                )
+                return event_data
+            except IntegrityError as exc:
+                raise EventAlreadyExistsError(
+                    "An event with this slug already exists."
+                ) from exc
+
+    async def check_event_exists(self, event_id):
+        async with self.__connection.connect() as connection:
+            result = await connection.execute(statements.EVENT_EXISTS, {"id": event_id})
+            return bool(result.scalar())
+
+    async def __get_version(self, scope: str) -> EventVersionDTO | None:
+        async with self.__connection.connect() as connection:
+            result = await connection.execute(statements.DATA_VERSION, {"scope": scope})
+            row = result.first()
+            if row is None:
+                return None
+            return EventVersionDTO(version=row[0], updated_at=row[1])
+
+    async def get_events_version(self):
+        return await self.__get_version("events")
+
+    async def get_event_version(self, event_id):
+        return await self.__get_version(f"event:{event_id}")
@@ -1,134 +1,155 @@
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Iterator
 
-from sqlalchemy import Row, text
 from sqlalchemy.exc import IntegrityError
 from src.drivers.database.types import ConnectionInterface
+from src.modules.events.dao import statements
+from src.modules.events.dtos.attendee import AttendeeRegistrationStatus, AttendeeRow
+from src.modules.events.dtos.event_credentials import EventCredentialsDTO
 from src.modules.events.entities.attendee import AttendeeEntity
-from src.modules.events.exc.attendee import AttendeeAlreadyExistsError
+from src.utils.pagination import DEFAULT_PAGE_SIZE
+
+# Rows fetched from the cursor at once by a streamed export.
+EXPORT_BATCH_SIZE = 500
 
 
 class AttendeeDaoInterface(ABC):
 
     @abstractmethod
-    def get_event_participants(
-        self, event_id: str, query: str, offset: int
-    ) -> list[AttendeeEntity]:
-        """Retrieve registered attendees for the event with the given Id"""
+    def get_event_participant_rows(
+        self,
+        event_id: str,
+        query: str,
+        offset: int,
+        limit: int = DEFAULT_PAGE_SIZE,
+        after: tuple[str, str] | None = None,
+    ) -> tuple[list[AttendeeRow], int] | None:
+        """Retrieve a page of attendees and the total found, None if the event not exists"""
+
+    @abstractmethod
+    def stream_event_participant_rows(
+        self, event_id: str, batch_size: int = EXPORT_BATCH_SIZE
+    ) -> Iterator[list[AttendeeRow]]:
+        """Read every attendee of the event in name order, a batch of rows at a time"""
 
     @abstractmethod
-    def register_participant(self, attendee: AttendeeEntity) -> AttendeeEntity | None:
-        """Register a attendee in a event"""
+    def register_participant_in_event(
+        self, attendee: AttendeeEntity
+    ) -> AttendeeRegistrationStatus:
+        """Check the event and register the attendee in a single statement"""
 
     @abstractmethod
-    def get_attendee_data(self, attendee_id: str) -> AttendeeEntity | None:
-        """Retrieve data related to the given attendee id"""
+    def register_participants(
+        self, event_id: str, attendees: list[AttendeeEntity]
+    ) -> list[AttendeeRegistrationStatus]:
+        """Register a batch of attendees in one transaction, one status for each"""
 
     @abstractmethod
-    def count_event_participants(self, event_id: str, query: str) -> int:
-        """Count all registered participants in the given event id"""
+    def get_attendee_credential(self, attendee_id: str) -> EventCredentialsDTO | None:
+        """Retrieve the attendee name and email with the title of their event"""
 
 
 class AttendeeDAO(AttendeeDaoInterface):
     def __init__(self, connection: ConnectionInterface):
         self.__connection = connection
 
-    def __row_to_entity(self, row: Row[Any]) -> AttendeeEntity:
-        return AttendeeEntity(
-            attendee_id=row[0],
-            name=row[1],
-            email=row[2],
-            created_at=row[3],
-            event_id=row[4],
-            checked_in_at=row[5],
-        )
-
-    def get_attendee_data(self, attendee_id):
-        engine = self.__connection.get_engine()
-        with engine.connect() as connection:
-            get_attendee_data_sql = text(
-                """
-            SELECT
-                at.id AS attendee_id,
-                at.name AS attendee_name,
-                at.email AS attendee_email,
-                at.created_at AS attendee_registered_at,
-                at.event_id,
-                chk.created_at AS checked_in_at
-            FROM attendees AS at
-            LEFT JOIN check_ins AS chk
-            ON chk.attendee_id = at.id
-            WHERE at.id = :id;
-            """
+    @staticmethod
+    def __page_params(
+        event_id: str, search_params: dict, offset: int, limit: int, after
+    ) -> dict:
+        params = {"id": event_id, "limit": limit, **search_params}
+        if after is None:
+            params["offset"] = offset
+        else:
+            params["after_name"] = after[0]
+            params["after_id"] = after[1]
+        return params
+
+    def get_attendee_credential(self, attendee_id):
+        with self.__connection.connect() as connection:
+            result = connection.execute(
+                statements.ATTENDEE_CREDENTIAL, {"id": attendee_id}
             )
-            result = connection.execute(get_attendee_data_sql, {"id": attendee_id})
             row = result.first()
             if row is None:
                 return None
-            return self.__row_to_entity(row=row)
-
-    def count_event_participants(self, event_id: str, query: str) -> int:
-        engine = self.__connection.get_engine()
-        with engine.connect() as connection:
-            count_attendees_query = text(
-                """
-                SELECT COUNT(*)
-                FROM attendees AS at
-                WHERE at.event_id = :id
-                AND at.name LIKE :query
-            """
-            )
+            return EventCredentialsDTO(event_title=row[0], name=row[1], email=row[2])
+
+    def __participants_page(self, event_id, query, offset, limit, after) -> list:
+        """The total then the attendee columns, a single row of NULLs if none"""
+        with self.__connection.connect() as connection:
+            search, search_params = statements.search_params(query)
             result = connection.execute(
-                count_attendees_query,
-                {"id": event_id, "query": f"%{query}%"},
-            )
-            all_rows = result.scalar()
-            return int(all_rows) if all_rows is not None else 0
-
-    def get_event_participants(self, event_id, query="", offset=0):
-        engine = self.__connection.get_engine()
-        with engine.connect() as connection:
-            get_attendee_data_sql = text(
-                """
-                SELECT
-                    at.id AS attendee_id,
-                    at.name AS attendee_name,
-                    at.email AS attendee_email,
-                    at.created_at AS attendee_registered_at,
-                    at.event_id,
-                    chk.created_at AS checked_in_at
-                FROM events AS ev
-                LEFT JOIN attendees AS at
-                ON at.event_id=ev.id
-                LEFT JOIN check_ins AS chk
-                ON chk.attendee_id = at.id
-                WHERE ev.id = :id AND at.name LIKE :query
-                ORDER BY at.name DESC
-                LIMIT 10
-                OFFSET 10 * :offset
-            """
+                statements.participants_page_with_total(
+                    search, keyset=after is not None
+                ),
+                self.__page_params(event_id, search_params, offset, limit, after),
             )
-            result = connection.execute(
-                get_attendee_data_sql,
-                {"id": event_id, "query": f"%{query}%", "offset": offset},
+            return result.fetchall()
+
+    def get_event_participant_rows(
+        self, event_id, query="", offset=0, limit=DEFAULT_PAGE_SIZE, after=None
+    ):
+        all_rows = self.__participants_page(event_id, query, offset, limit, after)
+        if len(all_rows) == 0:
+            return None
+        # Read-only listing: one dict per row, no entity nor DTO in between.
+        attendees = [
+            {
+                "attendee_id": attendee_id,
+                "name": name,
+                "email": email,
+                "event_id": attendee_event_id,
+                "created_at": created_at,
+                "checked_in_at": checked_in_at,
+            }
+            for (
+                _,
+                attendee_id,
+                name,
+                email,
+                created_at,
+                attendee_event_id,
+                checked_in_at,
+            ) in all_rows
+            if attendee_id is not None
+        ]
+        return attendees, int(all_rows[0][0])
+
+    def stream_event_participant_rows(self, event_id, batch_size=EXPORT_BATCH_SIZE):
+        # Read while the response is sent, once the unit of work of the
+        # request is gone: the connection is its own and is given back when
+        # the generator is closed. pysqlite steps the statement as rows are
+        # fetched, so only a batch is held; yield_per streams the other drivers.
+        with self.__connection.stream() as connection:
+            result = connection.execution_options(yield_per=batch_size).execute(
+                statements.EXPORT_PARTICIPANTS, {"id": event_id}
             )
-            all_rows = result.fetchall()
-            if len(all_rows) == 0:
-                return []
-            return [self.__row_to_entity(row=row) for row in all_rows]
-
-    def register_participant(self, attendee) -> AttendeeEntity | None:
-        engine = self.__connection.get_engine()
-        with engine.connect() as connection:
+            for rows in result.partitions(batch_size):
+                yield [
+                    {
+                        "attendee_id": attendee_id,
+                        "name": name,
+                        "email": email,
+                        "event_id": attendee_event_id,
+                        "created_at": created_at,
+                        "checked_in_at": checked_in_at,
+                    }
+                    for (
+                        attendee_id,
+                        name,
+                        email,
+                        attendee_event_id,
+                        created_at,
+                        checked_in_at,
+                    ) in rows
+                ]
+
+    def register_participant_in_event(self, attendee) -> AttendeeRegistrationStatus:
+        with self.__connection.begin() as connection:
             try:
-                sql_query = text(
-                    """
-                    INSERT INTO attendees (id,name,email,event_id,created_at)
-                    VALUES(:attendee_id,:name,:email,:event_id,:created_at)
-                    """
-                )
                 result = connection.execute(
-                    sql_query,
+                    statements.REGISTER_ATTENDEE_IN_EVENT,
                     {
                         "attendee_id": attendee.id,
                         "name": attendee.name,
@@ -137,9 +158,79 @@ class AttendeeDAO(AttendeeDaoInterface):
                         "created_at": attendee.created_at,
                     },
                 )
-                connection.commit()
-                return attendee
-            except IntegrityError as exc:
-                raise AttendeeAlreadyExistsError(
-                    "An attendee with the given email is already registered in this event."
-                ) from exc
+                if result.rowcount == 1:
+                    return AttendeeRegistrationStatus.CREATED
+            except IntegrityError:
+                return AttendeeRegistrationStatus.ALREADY_REGISTERED
+            result = connection.execute(
+                statements.REGISTRATION_REJECTION_REASON,
+                {"event_id": attendee.event_id, "email": attendee.email},
+            )
+            event_exists, already_registered = result.one()
+            if not event_exists:
+                return AttendeeRegistrationStatus.EVENT_NOT_FOUND
+            if already_registered:
+                return AttendeeRegistrationStatus.ALREADY_REGISTERED
+            return AttendeeRegistrationStatus.SOLD_OUT
+
+    def register_participants(self, event_id, attendees):
+        if not attendees:
+            return []
+        with self.__connection.begin() as connection:
+            taken = set(
+                connection.scalars(
+                    statements.REGISTERED_EMAILS,
+                    {
+                        "event_id": event_id,
+                        "emails": [attendee.email for attendee in attendees],
+                    },
+                )
+            )
+            candidates = [
+                attendee for attendee in attendees if attendee.email not in taken
+            ]
+            created = set()
+            if candidates:
+                # The guarded insert keeps the capacity and the e-mails right
+                # against registrations made since the read above.
+                connection.execute(
+                    statements.REGISTER_ATTENDEE_IN_EVENT,
+                    [
+                        {
+                            "attendee_id": attendee.id,
+                            "name": attendee.name,
+                            "email": attendee.email,
+                            "event_id": event_id,
+                            "created_at": attendee.created_at,
+                        }
+                        for attendee in candidates
+                    ],
+                )
+                created = set(
+                    connection.scalars(
+                        statements.REGISTERED_ATTENDEE_IDS,
+                        {"ids": [attendee.id for attendee in candidates]},
+                    )
+                )
+            refused = [
+                attendee.email for attendee in candidates if attendee.id not in created
+            ]
+            refusal = AttendeeRegistrationStatus.SOLD_OUT
+            if refused:
+                taken.update(
+                    connection.scalars(
+                        statements.REGISTERED_EMAILS,
+                        {"event_id": event_id, "emails": refused},
+                    )
+                )
+                if not connection.scalar(statements.EVENT_EXISTS, {"id": event_id}):
+                    refusal = AttendeeRegistrationStatus.EVENT_NOT_FOUND
+        statuses = []
+        for attendee in attendees:
+            if attendee.id in created:
+                statuses.append(AttendeeRegistrationStatus.CREATED)
+            elif attendee.email in taken:
+                statuses.append(AttendeeRegistrationStatus.ALREADY_REGISTERED)
+            else:
+                statuses.append(refusal)
+        return statuses
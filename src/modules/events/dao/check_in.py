@@ -1,41 +1,86 @@
 from abc import ABC, abstractmethod
-from sqlalchemy import text
-from sqlalchemy.exc import IntegrityError
 from src.drivers.database.types import ConnectionInterface
+from src.modules.events.dao import statements
+from src.modules.events.dtos.check_in import CheckInScanDTO, CheckInStatus
 from src.modules.events.entities.check_in import CheckInEntity
-from src.modules.events.exc.check_in import CheckInNotRegistered
 
 
 class CheckInDaoInterface(ABC):
     @abstractmethod
-    def register_check_in(self, attendee_id: str) -> CheckInEntity | None:
-        """Realize the check in for the attendee in their event"""
+    def check_in_attendee(
+        self, attendee_id: str
+    ) -> tuple[CheckInStatus, CheckInEntity | None]:
+        """Check in the attendee if they exist and have not checked in yet"""
+
+    @abstractmethod
+    def check_in_scans(
+        self, scans: list[CheckInScanDTO]
+    ) -> list[tuple[CheckInStatus, CheckInEntity | None]]:
+        """Check in a batch of scans at their scan time, one outcome for each"""
 
 
 class CheckInDAO(CheckInDaoInterface):
     def __init__(self, connection: ConnectionInterface):
         self.__connection = connection
 
-    def register_check_in(self, attendee_id) -> CheckInEntity | None:
-        engine = self.__connection.get_engine()
-        with engine.connect() as connection:
-            try:
-                register_check_in_sql = text(
-                    "INSERT INTO check_ins (attendee_id) VALUES (:attendee_id) RETURNING *"
-                )
-                result = connection.execute(
-                    register_check_in_sql, {"attendee_id": attendee_id}
-                )
-                check_in_data = result.first()
-                if check_in_data is None:
-                    raise CheckInNotRegistered(
-                        "An error ocurred while registering the check in for the given attendee."
-                    )
-                connection.commit()
-                return CheckInEntity(
+    def check_in_attendee(self, attendee_id):
+        with self.__connection.begin() as connection:
+            check_in_data = connection.execute(
+                statements.CHECK_IN_ATTENDEE, {"attendee_id": attendee_id}
+            ).first()
+            if check_in_data is not None:
+                return CheckInStatus.CREATED, CheckInEntity(
                     check_in_id=check_in_data[0],
                     created_at=check_in_data[1],
                     attendee_id=check_in_data[2],
                 )
-            except IntegrityError as exc:
-                raise CheckInNotRegistered("Attendee already made check-in.") from exc
+            attendee_exists = connection.execute(
+                statements.ATTENDEE_EXISTS, {"attendee_id": attendee_id}
+            ).scalar()
+            if attendee_exists:
+                return CheckInStatus.ALREADY_CHECKED_IN, None
+            return CheckInStatus.ATTENDEE_NOT_FOUND, None
+
+    def check_in_scans(self, scans):
+        if not scans:
+            return []
+        with self.__connection.begin() as connection:
+            # attendee id -> id of their check-in, None when not checked in
+            known = dict(
+                connection.execute(
+                    statements.ATTENDEE_CHECK_INS,
+                    {"ids": list({scan.attendee_id for scan in scans})},
+                ).all()
+            )
+            pending: dict[str, CheckInScanDTO] = {}
+            for scan in scans:
+                if scan.attendee_id in known and known[scan.attendee_id] is None:
+                    pending.setdefault(scan.attendee_id, scan)
+            created: dict[str, CheckInEntity] = {}
+            if pending:
+                result = connection.execute(
+                    statements.INSERT_SCANNED_CHECK_IN,
+                    [
+                        {
+                            "attendee_id": scan.attendee_id,
+                            "created_at": scan.scanned_at,
+                            "device_id": scan.device_id,
+                        }
+                        for scan in pending.values()
+                    ],
+                )
+                for check_in_id, created_at, attendee_id in result:
+                    created[attendee_id] = CheckInEntity(
+                        check_in_id=check_in_id,
+                        created_at=created_at,
+                        attendee_id=attendee_id,
+                    )
+        outcomes = []
+        for scan in scans:
+            if scan.attendee_id not in known:
+                outcomes.append((CheckInStatus.ATTENDEE_NOT_FOUND, None))
+            elif pending.get(scan.attendee_id) is scan and scan.attendee_id in created:
+                outcomes.append((CheckInStatus.CREATED, created[scan.attendee_id]))
+            else:
+                outcomes.append((CheckInStatus.ALREADY_CHECKED_IN, None))
+        return outcomes
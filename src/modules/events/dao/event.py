@@ -1,12 +1,17 @@
 from abc import ABC, abstractmethod
-from typing import Any
+from datetime import datetime
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy import Row, text
 
 from src.drivers.database.types import ConnectionInterface
-from src.modules.events.dtos.event import EventDTOWithAmount
+from src.modules.events.dao import statements
+from src.modules.events.dtos.event import (
+    EventDTOWithAmount,
+    EventRow,
+    EventVersionDTO,
+)
 from src.modules.events.entities.event import EventEntity
 from src.modules.events.exc.event import EventAlreadyExistsError
+from src.utils.pagination import DEFAULT_PAGE_SIZE
 
 
 class EventDaoInterface(ABC):
@@ -15,8 +20,14 @@ class EventDaoInterface(ABC):
         """Retrieves data about an event without participants"""
 
     @abstractmethod
-    def retrieve_events(self, offset: int, query: str) -> list[EventEntity]:
-        """Retrieves all valid Events from the database"""
+    def retrieve_event_rows(
+        self,
+        offset: int,
+        query: str,
+        limit: int = DEFAULT_PAGE_SIZE,
+        after: tuple[datetime, str] | None = None,
+    ) -> list[EventRow]:
+        """Retrieves a page of Events, after the given (created_at, id) key if any"""
 
     @abstractmethod
     def create_event(self, event_data: EventEntity) -> EventEntity | None:
@@ -27,47 +38,21 @@ class EventDaoInterface(ABC):
         """Checks for the existence of the event"""
 
     @abstractmethod
-    def check_event_has_vacancies(self, event_id=str) -> bool:
-        """Check if the event has vacancies for new attendees"""
+    def get_events_version(self) -> EventVersionDTO | None:
+        """Retrieves the change marker of the whole event listing"""
 
     @abstractmethod
-    def check_attendee_in_event(self, attendee_email: str, event_id: str) -> bool:
-        """Check if the attendee is registered in the given event"""
+    def get_event_version(self, event_id: str) -> EventVersionDTO | None:
+        """Retrieves the change marker of the event and its attendees"""
 
 
 class EventDAO(EventDaoInterface):
     def __init__(self, connection: ConnectionInterface):
         self.__connection = connection
 
-    def __row_to_event_entity(self, row: Row[Any]) -> EventEntity:
-
-        return EventEntity(
-            id=row[0],
-            title=row[1],
-            details=row[2],
-            slug=row[3],
-            maximum_attendees=row[4],
-            created_at=row[5],
-        )
-
     def get_event_info(self, event_id) -> EventDTOWithAmount | None:
-        engine = self.__connection.get_engine()
-        with engine.connect() as connection:
-            result = connection.execute(
-                text(
-                    """
-                    SELECT
-                    ev.*,
-                    COUNT(at.id) AS attendees_amount
-                    FROM attendees AS at
-                    LEFT JOIN events AS ev
-                    ON at.event_id = ev.id
-                    WHERE ev.id = :id
-                    GROUP BY ev.id
-                     """
-                ),
-                {"id": event_id},
-            )
+        with self.__connection.connect() as connection:
+            result = connection.execute(statements.EVENT_INFO, {"id": event_id})
             row = result.first()
             if row is None:
                 return None
@@ -82,15 +67,10 @@ class EventDAO(EventDaoInterface):
             )
 
     def create_event(self, event_data) -> EventEntity | None:
-        engine = self.__connection.get_engine()
-        with engine.connect() as connection:
+        with self.__connection.begin() as connection:
             try:
-                query_sql = text(
-                    "INSERT INTO events (id,title,details,slug,maximum_attendees,created_at)"
-                    " VALUES(:id,:title,:details,:slug,:maximum_attendees,:created_at)"
-                )
                 connection.execute(
-                    query_sql,
+                    statements.INSERT_EVENT,
                     {
                         "id": event_data.id,
                         "title": event_data.title,
@@ -100,100 +80,70 @@ class EventDAO(EventDaoInterface):
                         "created_at": event_data.created_at,
                     },
                 )
-                connection.commit()
                 return event_data
             except IntegrityError as exc:
                 raise EventAlreadyExistsError(
                     "An event with this slug already exists."
                 ) from exc
 
-    def retrieve_events(self, offset: int = 0, query: str = "") -> list[EventEntity]:
-        engine = self.__connection.get_engine()
-        with engine.connect() as connection:
+    def retrieve_event_rows(
+        self,
+        offset: int = 0,
+        query: str = "",
+        limit: int = DEFAULT_PAGE_SIZE,
+        after: tuple[datetime, str] | None = None,
+    ) -> list[EventRow]:
+        # Read-only listing: one dict per row, no entity nor DTO in between.
+        return [
+            {
+                "event_id": event_id,
+                "title": title,
+                "slug": slug,
+                "created_at": created_at,
+                "details": details,
+                "maximum_attendees": maximum_attendees,
+                "attendee_amount": attendee_count,
+            }
+            for (
+                event_id,
+                title,
+                details,
+                slug,
+                maximum_attendees,
+                created_at,
+                attendee_count,
+            ) in self.__events_page(offset, query, limit, after)
+        ]
+
+    def __events_page(self, offset, query, limit, after) -> list:
+        with self.__connection.connect() as connection:
+            search, params = statements.search_params(query)
+            params["limit"] = limit
+            if after is None:
+                params["offset"] = offset
+            else:
+                params["after_created_at"] = after[0]
+                params["after_id"] = after[1]
             result = connection.execute(
-                text(
-                    """
-                    SELECT * FROM events
-                    WHERE events.title LIKE :query
-                    ORDER BY events.created_at DESC
-                    LIMIT 10
-                    OFFSET 10 * :offset
-                    """
-                ),
-                {"offset": offset, "query": f"%{query}%"},
+                statements.events_page(search, keyset=after is not None), params
             )
-            rows = result.fetchall()
-            if len(rows) == 0:
-                return []
-            events = [self.__row_to_event_entity(row=event_row) for event_row in rows]
-            return events
-
-    def check_event_has_vacancies(self, event_id=str):
-        engine = self.__connection.get_engine()
-        with engine.connect() as connection:
-            has_vacancy_query = text(
-                """
-                SELECT CASE 
-                WHEN (
-                    SELECT ev.maximum_attendees
-                    FROM events as ev
-                    WHERE ev.id =  :id
-                ) is NULL 
-                    THEN CAST (1 AS BIT)
-                WHEN (
-                    SELECT COUNT(*) 
-                    FROM attendees AS at
-                    WHERE at.event_id = :id
-                ) < (
-                    SELECT ev.maximum_attendees
-                    FROM events AS ev
-                    WHERE ev.id = :id
-                )
-                THEN CAST(1 AS BIT)
-                ELSE CAST(0 AS BIT) END;
+            return result.fetchall()
 
-            """
-            )
-            result = connection.execute(has_vacancy_query, {"id": event_id})
+    def check_event_exists(self, event_id=str):
+        with self.__connection.connect() as connection:
+            result = connection.execute(statements.EVENT_EXISTS, {"id": event_id})
             return bool(result.scalar())
 
-    def check_attendee_in_event(self, attendee_email, event_id):
-        engine = self.__connection.get_engine()
-        with engine.connect() as connection:
-            check_event_existence_query = text(
-                """
-                    SELECT
-                    CASE WHEN EXISTS(
-                        SELECT at.event_id
-                        FROM attendees AS at
-                        JOIN events AS ev
-                        ON at.event_id = ev.id
-                        WHERE at.event_id = :id
-                        AND at.email = :email
-                    )
-                    THEN CAST(1 AS BIT)
-                    ELSE CAST (0 AS BIT) END;
-                """
-            )
-            result = connection.execute(
-                check_event_existence_query, {"id": event_id, "email": attendee_email}
-            )
-            return bool(result.scalar())
+    def __get_version(self, scope: str) -> EventVersionDTO | None:
+        with self.__connection.connect() as connection:
+            result = connection.execute(statements.DATA_VERSION, {"scope": scope})
+            row = result.first()
+            if row is None:
+                return None
+            return EventVersionDTO(version=row[0], updated_at=row[1])
 
-    def check_event_exists(self, event_id=str):
-        engine = self.__connection.get_engine()
-        with engine.connect() as connection:
-            check_event_existence_query = text(
-                """
-                SELECT
-                CASE WHEN EXISTS(
-                    SELECT events.id 
-                    FROM events 
-                    WHERE events.id = :id
-                ) 
-                THEN CAST(1 AS BIT)
-                ELSE CAST (0 AS BIT) END;
-            """
-            )
-            result = connection.execute(check_event_existence_query, {"id": event_id})
-            return bool(result.scalar())
+    def get_events_version(self):
+        return self.__get_version("events")
+
+    def get_event_version(self, event_id):
+        return self.__get_version(f"event:{event_id}")
@@ -0,0 +1,322 @@
+"""
+### Statements
+This module is the registry of the SQL statements run by the DAOs.
+
+Every statement is built once, at import or on the first use of its shape,
+and reused by every call. SQLAlchemy keys its compiled cache on the
+statement, so a reused construct skips parsing and compilation, and the
+identical SQL string lets the sqlite driver reuse its prepared statement.
+
+The listings change their SQL with the kind of search and of pagination,
+so they are built per shape by cached factories.
+"""
+
+from enum import Enum
+from functools import cache
+
+from sqlalchemy import (
+    DateTime,
+    Integer,
+    String,
+    TextClause,
+    and_,
+    bindparam,
+    column,
+    exists,
+    insert,
+    or_,
+    select,
+    text,
+)
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+from src.drivers.database.tables import attendees, check_ins, data_versions, events
+from src.utils.search import escape_like, fts_phrase
+
+
+class SearchMode(Enum):
+    """How a listing filters its rows by the search query"""
+
+    NONE = "none"
+    LIKE = "like"
+    FULL_TEXT = "full_text"
+
+
+def search_params(query: str) -> tuple[SearchMode, dict]:
+    """Pick the kind of search for the query and the parameters it binds"""
+    phrase = fts_phrase(query)
+    if phrase is not None:
+        return SearchMode.FULL_TEXT, {"search": phrase}
+    if query:
+        return SearchMode.LIKE, {"query": f"%{escape_like(query)}%"}
+    return SearchMode.NONE, {}
+
+
+# Events
+
+EVENT_EXISTS = select(exists().where(events.c.id == bindparam("id", type_=String)))
+
+EVENT_INFO = select(
+    events.c.id,
+    events.c.title,
+    events.c.details,
+    events.c.slug,
+    events.c.maximum_attendees,
+    events.c.created_at,
+    events.c.attendee_count,
+).where(events.c.id == bindparam("id", type_=String))
+
+INSERT_EVENT = insert(events).values(
+    id=bindparam("id", type_=String),
+    title=bindparam("title", type_=String),
+    details=bindparam("details", type_=String),
+    slug=bindparam("slug", type_=String),
+    maximum_attendees=bindparam("maximum_attendees", type_=Integer),
+    created_at=bindparam("created_at", type_=DateTime),
+)
+
+DATA_VERSION = select(data_versions.c.version, data_versions.c.updated_at).where(
+    data_versions.c.scope == bindparam("scope", type_=String)
+)
+
+_EVENT_COLUMNS = (
+    column("id", String),
+    column("title", String),
+    column("details", String),
+    column("slug", String),
+    column("maximum_attendees", Integer),
+    column("created_at", DateTime),
+    column("attendee_count", Integer),
+)
+
+_EVENT_SEARCH = {
+    SearchMode.NONE: ("events", None),
+    SearchMode.LIKE: ("events", "events.title LIKE :query ESCAPE '\\'"),
+    # CROSS JOIN keeps the full-text index as the outer loop.
+    SearchMode.FULL_TEXT: (
+        "events_search CROSS JOIN events ON events.rowid = events_search.rowid",
+        "events_search MATCH :search",
+    ),
+}
+
+
+@cache
+def events_page(search: SearchMode, keyset: bool) -> TextClause:
+    """A page of events ordered by creation, by offset or after a (created_at, id) key"""
+    source, search_filter = _EVENT_SEARCH[search]
+    filters = [search_filter] if search_filter else []
+    if keyset:
+        filters.append(
+            "(events.created_at, events.id) < (:after_created_at, :after_id)"
+        )
+    where_clause = f"WHERE {' AND '.join(filters)}" if filters else ""
+    page_offset = "" if keyset else "OFFSET :limit * :offset"
+    statement = text(
+        f"""
+        SELECT
+        events.id,
+        events.title,
+        events.details,
+        events.slug,
+        events.maximum_attendees,
+        events.created_at,
+        events.attendee_count
+        FROM {source}
+        {where_clause}
+        ORDER BY events.created_at DESC, events.id DESC
+        LIMIT :limit
+        {page_offset}
+        """
+    )
+    if keyset:
+        statement = statement.bindparams(bindparam("after_created_at", type_=DateTime))
+    return statement.columns(*_EVENT_COLUMNS)
+
+
+# Attendees
+
+_ATTENDEE_COLUMNS = (
+    column("attendee_id", String),
+    column("attendee_name", String),
+    column("attendee_email", String),
+    column("attendee_registered_at", DateTime),
+    column("event_id", String),
+    column("checked_in_at", DateTime),
+)
+
+# Only what a badge prints: no check-in join and no event counters.
+ATTENDEE_CREDENTIAL = (
+    select(events.c.title, attendees.c.name, attendees.c.email)
+    .select_from(attendees.join(events, events.c.id == attendees.c.event_id))
+    .where(attendees.c.id == bindparam("id", type_=String))
+)
+
+_event = events.alias("ev")
+_registered = attendees.alias("at")
+
+# The event row is the source of the insert: no row is written when the
+# event is missing, the email is taken or the event has sold out.
+REGISTER_ATTENDEE_IN_EVENT = insert(attendees).from_select(
+    ["id", "name", "email", "event_id", "created_at"],
+    select(
+        bindparam("attendee_id", type_=String),
+        bindparam("name", type_=String),
+        bindparam("email", type_=String),
+        _event.c.id,
+        bindparam("created_at", type_=DateTime),
+    ).where(
+        _event.c.id == bindparam("event_id", type_=String),
+        ~exists().where(
+            _registered.c.event_id == _event.c.id,
+            _registered.c.email == bindparam("email", type_=String),
+        ),
+        or_(
+            _event.c.maximum_attendees.is_(None),
+            _event.c.attendee_count < _event.c.maximum_attendees,
+        ),
+    ),
+)
+
+REGISTRATION_REJECTION_REASON = select(
+    exists().where(events.c.id == bindparam("event_id", type_=String)),
+    exists().where(
+        and_(
+            attendees.c.event_id == bindparam("event_id", type_=String),
+            attendees.c.email == bindparam("email", type_=String),
+        )
+    ),
+)
+
+# Bulk registration: which e-mails of a batch are taken, which ids got in.
+REGISTERED_EMAILS = select(attendees.c.email).where(
+    attendees.c.event_id == bindparam("event_id", type_=String),
+    attendees.c.email.in_(bindparam("emails", expanding=True)),
+)
+
+REGISTERED_ATTENDEE_IDS = select(attendees.c.id).where(
+    attendees.c.id.in_(bindparam("ids", expanding=True))
+)
+
+# Every attendee of an event in name order, walking the (event_id, name, id)
+# index: the first rows come out without sorting the event.
+EXPORT_PARTICIPANTS = (
+    select(
+        attendees.c.id,
+        attendees.c.name,
+        attendees.c.email,
+        attendees.c.event_id,
+        attendees.c.created_at,
+        check_ins.c.created_at,
+    )
+    .select_from(
+        attendees.outerjoin(check_ins, check_ins.c.attendee_id == attendees.c.id)
+    )
+    .where(attendees.c.event_id == bindparam("id", type_=String))
+    .order_by(attendees.c.name, attendees.c.id)
+)
+
+_ATTENDEE_SEARCH = {
+    SearchMode.NONE: ("attendees AS at", ""),
+    SearchMode.LIKE: ("attendees AS at", "AND at.name LIKE :query ESCAPE '\\'"),
+    # CROSS JOIN keeps the full-text index as the outer loop, so the
+    # cost follows the matches and not the size of the event.
+    SearchMode.FULL_TEXT: (
+        "attendees_search CROSS JOIN attendees AS at"
+        " ON at.rowid = attendees_search.rowid",
+        "AND attendees_search MATCH :search",
+    ),
+}
+
+
+def _participants_page_sql(search: SearchMode, keyset: bool) -> str:
+    source, search_filter = _ATTENDEE_SEARCH[search]
+    keyset_filter = "AND (at.name, at.id) < (:after_name, :after_id)" if keyset else ""
+    page_offset = "" if keyset else "OFFSET :limit * :offset"
+    return f"""
+        SELECT
+            at.id AS attendee_id,
+            at.name AS attendee_name,
+            at.email AS attendee_email,
+            at.created_at AS attendee_registered_at,
+            at.event_id,
+            chk.created_at AS checked_in_at
+        FROM {source}
+        LEFT JOIN check_ins AS chk
+        ON chk.attendee_id = at.id
+        WHERE at.event_id = :id
+        {search_filter}
+        {keyset_filter}
+        ORDER BY at.name DESC, at.id DESC
+        LIMIT :limit
+        {page_offset}
+    """
+
+
+@cache
+def participants_page_with_total(search: SearchMode, keyset: bool) -> TextClause:
+    """
+    A page of attendees and their total in a single statement.
+    The event row anchors the result: no row means no event, and an
+    empty page still brings the total in a row of NULL attendees.
+    """
+    source, search_filter = _ATTENDEE_SEARCH[search]
+    return text(
+        f"""
+        SELECT
+            (
+                SELECT COUNT(*)
+                FROM {source}
+                WHERE at.event_id = :id
+                {search_filter}
+            ) AS total,
+            page.*
+        FROM events AS ev
+        LEFT JOIN ({_participants_page_sql(search, keyset)}) AS page
+        ON page.event_id = ev.id
+        WHERE ev.id = :id
+        ORDER BY page.attendee_name DESC, page.attendee_id DESC
+        """
+    ).columns(column("total", Integer), *_ATTENDEE_COLUMNS)
+
+
+# Check-ins
+
+# The unique index on attendee_id turns a second check-in into a no-op, and
+# selecting from attendees skips unknown ids, so RETURNING only brings a row
+# when the check-in was created.
+CHECK_IN_ATTENDEE = (
+    sqlite_insert(check_ins)
+    .from_select(
+        ["attendee_id"],
+        select(attendees.c.id).where(
+            attendees.c.id == bindparam("attendee_id", type_=String)
+        ),
+    )
+    .on_conflict_do_nothing(index_elements=[check_ins.c.attendee_id])
+    .returning(check_ins.c.id, check_ins.c.created_at, check_ins.c.attendee_id)
+)
+
+# Batched check-ins: each known attendee of the batch with its check-in id,
+# NULL when it has none, then the inserts keeping the time of the scan.
+ATTENDEE_CHECK_INS = (
+    select(attendees.c.id, check_ins.c.id)
+    .select_from(
+        attendees.outerjoin(check_ins, check_ins.c.attendee_id == attendees.c.id)
+    )
+    .where(attendees.c.id.in_(bindparam("ids", expanding=True)))
+)
+
+INSERT_SCANNED_CHECK_IN = (
+    sqlite_insert(check_ins)
+    .values(
+        attendee_id=bindparam("attendee_id", type_=String),
+        created_at=bindparam("created_at", type_=DateTime),
+        device_id=bindparam("device_id", type_=String),
+    )
+    .on_conflict_do_nothing(index_elements=[check_ins.c.attendee_id])
+    .returning(check_ins.c.id, check_ins.c.created_at, check_ins.c.attendee_id)
+)
+
+ATTENDEE_EXISTS = select(
+    exists().where(attendees.c.id == bindparam("attendee_id", type_=String))
+)
@@ -0,0 +1,135 @@
+import asyncio
+from datetime import datetime
+
+from pytest import fixture, importorskip, raises
+
+from src.drivers.database.async_connection import AsyncDBConnection
+from src.drivers.database.connection import DBConnection
+from src.drivers.database.migrations import apply_migrations
+from src.drivers.database.settings import DatabaseSettings
+from src.modules.events.dao.async_attendee import AsyncAttendeeDAO
+from src.modules.events.dao.async_check_in import AsyncCheckInDAO
+from src.modules.events.dao.async_event import AsyncEventDAO
+from src.modules.events.dao.attendee import AttendeeDAO
+from src.modules.events.dao.event import EventDAO
+from src.modules.events.dtos.attendee import AttendeeRegistrationStatus
+from src.modules.events.dtos.check_in import CheckInStatus
+from src.modules.events.entities.attendee import AttendeeEntity
+from src.modules.events.entities.event import EventEntity
+from src.modules.events.exc.event import EventAlreadyExistsError
+
+importorskip("aiosqlite")
+
+
+@fixture(name="settings")
+def database_settings(tmp_path):
+    return DatabaseSettings(url=f"sqlite:///{tmp_path / 'db'}")
+
+
+@fixture(name="connection")
+def async_connection(settings):
+    connection = AsyncDBConnection(settings)
+    connection.on_engine_created(apply_migrations)
+    yield connection
+    asyncio.run(connection.disconnect())
+
+
+@fixture(name="sync_connection")
+def blocking_connection(settings, connection):
+    connection.get_engine()
+    sync_connection = DBConnection(settings)
+    yield sync_connection
+    sync_connection.disconnect()
+
+
+def make_attendee(email: str, event_id: str = "ev-1") -> AttendeeEntity:
+    return AttendeeEntity(
+        attendee_id=None,
+        name="Attendee",
+        email=email,
+        event_id=event_id,
+        created_at=datetime(2024, 1, 2),
+    )
+
+
+def test_event_dao_matches_the_blocking_one(connection, sync_connection):
+    dao = AsyncEventDAO(connection=connection)
+    event = EventEntity(
+        id="ev-1",
+        title="Python Conference",
+        slug="python-conference",
+        maximum_attendees=2,
+        created_at=datetime(2024, 1, 1, 10, 30),
+    )
+
+    async def scenario():
+        assert not await dao.check_event_exists(event_id="ev-1")
+        assert await dao.create_event(event_data=event) is event
+        with raises(EventAlreadyExistsError):
+            await dao.create_event(
+                event_data=EventEntity(id="ev-2", title="Other", slug=event.slug)
+            )
+        return (
+            await dao.check_event_exists(event_id="ev-1"),
+            await dao.get_event_info(event_id="ev-1"),
+            await dao.get_event_info(event_id="missing"),
+            await dao.retrieve_event_rows(offset=0, query="pyth"),
+            await dao.get_event_version(event_id="ev-1"),
+            await dao.get_events_version(),
+        )
+
+    exists, info, missing, rows, version, versions = asyncio.run(scenario())
+    blocking = EventDAO(connection=sync_connection)
+    assert exists and missing is None
+    assert info == blocking.get_event_info(event_id="ev-1")
+    assert rows == blocking.retrieve_event_rows(offset=0, query="pyth")
+    assert version == blocking.get_event_version(event_id="ev-1")
+    assert versions == blocking.get_events_version()
+
+
+def test_attendee_and_check_in_daos(connection, sync_connection):
+    events = AsyncEventDAO(connection=connection)
+    attendees = AsyncAttendeeDAO(connection=connection)
+    check_ins = AsyncCheckInDAO(connection=connection)
+    first, second, third = (make_attendee(f"a{index}@gmail.com") for index in range(3))
+
+    async def scenario():
+        await events.create_event(
+            event_data=EventEntity(
+                id="ev-1", title="Python Conference", slug="py", maximum_attendees=2
+            )
+        )
+        statuses = [
+            await attendees.register_participant_in_event(attendee=attendee)
+            for attendee in (first, first, second, third, make_attendee("x", "none"))
+        ]
+        outcomes = [
+            (await check_ins.check_in_attendee(attendee_id=attendee_id))[0]
+            for attendee_id in (first.id, first.id, "missing")
+        ]
+        return (
+            statuses,
+            outcomes,
+            await attendees.get_event_participant_rows(event_id="ev-1", limit=1),
+            await attendees.get_event_participant_rows(event_id="missing"),
+            await attendees.get_attendee_credential(attendee_id=second.id),
+        )
+
+    statuses, outcomes, page, missing, credential = asyncio.run(scenario())
+    assert statuses == [
+        AttendeeRegistrationStatus.CREATED,
+        AttendeeRegistrationStatus.ALREADY_REGISTERED,
+        AttendeeRegistrationStatus.CREATED,
+        AttendeeRegistrationStatus.SOLD_OUT,
+        AttendeeRegistrationStatus.EVENT_NOT_FOUND,
+    ]
+    assert outcomes == [
+        CheckInStatus.CREATED,
+        CheckInStatus.ALREADY_CHECKED_IN,
+        CheckInStatus.ATTENDEE_NOT_FOUND,
+    ]
+    blocking = AttendeeDAO(connection=sync_connection)
+    assert page == blocking.get_event_participant_rows(event_id="ev-1", limit=1)
+    assert page[1] == 2
+    assert missing is None
+    assert credential == blocking.get_attendee_credential(attendee_id=second.id)
@@ -7,5 +7,5 @@ from .fixture_connection import get_connection  # pylint: disable=unused-import
 @pytest.mark.skip(reason="Database integration")
 def test_get_all_events(connection):
     dao = EventDAO(connection=connection)
-    events = dao.retrieve_events()
+    events = dao.retrieve_event_rows()
     assert isinstance(events, list)
@@ -0,0 +1,194 @@
+from dataclasses import asdict
+from datetime import datetime
+
+from pytest import fixture
+
+from src.drivers.database.connection import DBConnection
+from src.drivers.database.migrations import apply_migrations
+from src.drivers.database.settings import DatabaseSettings
+from src.modules.events.dao import statements
+from src.modules.events.dao.attendee import AttendeeDAO
+from src.modules.events.dao.check_in import CheckInDAO
+from src.modules.events.dao.event import EventDAO
+from src.modules.events.dao.statements import SearchMode
+from src.modules.events.dtos.attendee import AttendeeDTO, AttendeeRegistrationStatus
+from src.modules.events.dtos.check_in import CheckInScanDTO, CheckInStatus
+from src.modules.events.entities.attendee import AttendeeEntity
+from src.modules.events.entities.event import EventEntity
+
+
+@fixture(name="connection")
+def migrated_connection(tmp_path):
+    connection = DBConnection(DatabaseSettings(url=f"sqlite:///{tmp_path / 'db'}"))
+    connection.make_connection()
+    apply_migrations(connection.get_engine())
+    EventDAO(connection=connection).create_event(
+        EventEntity(
+            id="ev-1",
+            title="Python Conference",
+            details=None,
+            slug="python-conference",
+            maximum_attendees=2,
+            created_at=datetime(2024, 1, 1, 10, 30),
+        )
+    )
+    yield connection
+    connection.disconnect()
+
+
+def make_attendee(email: str, event_id: str = "ev-1") -> AttendeeEntity:
+    return AttendeeEntity(
+        attendee_id=None,
+        name="Attendee",
+        email=email,
+        event_id=event_id,
+        created_at=datetime(2024, 1, 2),
+        checked_in_at=None,
+    )
+
+
+def test_listing_statements_are_built_once_per_shape():
+    assert statements.participants_page_with_total(
+        SearchMode.LIKE, True
+    ) is statements.participants_page_with_total(SearchMode.LIKE, True)
+    assert statements.events_page(SearchMode.NONE, False) is not (
+        statements.events_page(SearchMode.NONE, True)
+    )
+
+
+def test_statements_return_typed_columns(connection):
+    event = EventDAO(connection=connection).get_event_info(event_id="ev-1")
+    assert event.created_at == datetime(2024, 1, 1, 10, 30)
+    assert event.attendee_amount == 0
+    events = EventDAO(connection=connection).retrieve_event_rows(query="Python")
+    assert events[0]["created_at"] == datetime(2024, 1, 1, 10, 30)
+
+
+def test_registration_statement_outcomes(connection):
+    dao = AttendeeDAO(connection=connection)
+    register = dao.register_participant_in_event
+    assert register(make_attendee("a@gmail.com")) is AttendeeRegistrationStatus.CREATED
+    assert (
+        register(make_attendee("a@gmail.com"))
+        is AttendeeRegistrationStatus.ALREADY_REGISTERED
+    )
+    assert (
+        register(make_attendee("a@gmail.com", event_id="ev-2"))
+        is AttendeeRegistrationStatus.EVENT_NOT_FOUND
+    )
+    assert register(make_attendee("b@gmail.com")) is AttendeeRegistrationStatus.CREATED
+    assert register(make_attendee("c@gmail.com")) is AttendeeRegistrationStatus.SOLD_OUT
+    attendees, total = dao.get_event_participant_rows(event_id="ev-1")
+    assert total == 2
+    assert attendees[0]["created_at"] == datetime(2024, 1, 2)
+
+
+def test_batch_registration_outcomes(connection):
+    dao = AttendeeDAO(connection=connection)
+    assert dao.register_participants(event_id="ev-1", attendees=[]) == []
+    dao.register_participant_in_event(make_attendee("a@gmail.com"))
+    batch = [
+        make_attendee(email) for email in ("a@gmail.com", "b@gmail.com", "c@gmail.com")
+    ]
+    assert dao.register_participants(event_id="ev-1", attendees=batch) == [
+        AttendeeRegistrationStatus.ALREADY_REGISTERED,
+        AttendeeRegistrationStatus.CREATED,
+        AttendeeRegistrationStatus.SOLD_OUT,
+    ]
+    assert dao.register_participants(
+        event_id="ev-2", attendees=[make_attendee("d@gmail.com", event_id="ev-2")]
+    ) == [AttendeeRegistrationStatus.EVENT_NOT_FOUND]
+    assert EventDAO(connection=connection).get_event_info("ev-1").attendee_amount == 2
+
+
+def test_row_projections_match_the_dtos(connection):
+    attendee_dao = AttendeeDAO(connection=connection)
+    attendee = make_attendee("a@gmail.com")
+    attendee_dao.register_participant_in_event(attendee)
+    rows, total = attendee_dao.get_event_participant_rows(event_id="ev-1")
+    assert total == 1
+    assert rows == [
+        asdict(
+            AttendeeDTO(
+                attendee.id,
+                attendee.name,
+                attendee.email,
+                attendee.event_id,
+                attendee.created_at,
+                None,
+            )
+        )
+    ]
+    assert attendee_dao.get_event_participant_rows(event_id="ev-2") is None
+    event_dao = EventDAO(connection=connection)
+    event = event_dao.get_event_info(event_id="ev-1")
+    assert event_dao.retrieve_event_rows(query="Python") == [asdict(event)]
+
+
+def test_check_in_statement_outcomes(connection):
+    attendee = make_attendee("a@gmail.com")
+    AttendeeDAO(connection=connection).register_participant_in_event(attendee)
+    dao = CheckInDAO(connection=connection)
+    status, check_in = dao.check_in_attendee(attendee_id=attendee.id)
+    assert status is CheckInStatus.CREATED
+    assert isinstance(check_in.created_at, datetime)
+    assert dao.check_in_attendee(attendee_id=attendee.id) == (
+        CheckInStatus.ALREADY_CHECKED_IN,
+        None,
+    )
+    assert dao.check_in_attendee(attendee_id="unknown") == (
+        CheckInStatus.ATTENDEE_NOT_FOUND,
+        None,
+    )
+
+
+def test_credential_statement_reads_the_event_title(connection):
+    attendee = make_attendee("a@gmail.com")
+    dao = AttendeeDAO(connection=connection)
+    dao.register_participant_in_event(attendee)
+    credential = dao.get_attendee_credential(attendee_id=attendee.id)
+    assert credential.event_title == "Python Conference"
+    assert (credential.name, credential.email) == ("Attendee", "a@gmail.com")
+    assert dao.get_attendee_credential(attendee_id="unknown") is None
+
+
+def test_batch_check_in_outcomes(connection):
+    first, second = make_attendee("a@gmail.com"), make_attendee("b@gmail.com")
+    attendee_dao = AttendeeDAO(connection=connection)
+    attendee_dao.register_participants(event_id="ev-1", attendees=[first, second])
+    dao = CheckInDAO(connection=connection)
+    dao.check_in_attendee(attendee_id=second.id)
+    scanned_at = datetime(2024, 5, 1, 8, 30)
+    scans = [
+        CheckInScanDTO(attendee_id=first.id, scanned_at=scanned_at, device_id="d-1"),
+        CheckInScanDTO(attendee_id=first.id, scanned_at=scanned_at, device_id="d-2"),
+        CheckInScanDTO(attendee_id=second.id, scanned_at=scanned_at, device_id="d-1"),
+        CheckInScanDTO(attendee_id="unknown", scanned_at=scanned_at, device_id="d-1"),
+    ]
+    assert dao.check_in_scans(scans=[]) == []
+    outcomes = dao.check_in_scans(scans=scans)
+    assert [status for status, _ in outcomes] == [
+        CheckInStatus.CREATED,
+        CheckInStatus.ALREADY_CHECKED_IN,
+        CheckInStatus.ALREADY_CHECKED_IN,
+        CheckInStatus.ATTENDEE_NOT_FOUND,
+    ]
+    assert outcomes[0][1].created_at == scanned_at
+    rows, _ = attendee_dao.get_event_participant_rows(event_id="ev-1")
+    checked_in_at = {row["attendee_id"]: row["checked_in_at"] for row in rows}
+    assert checked_in_at[first.id] == scanned_at
+
+
+def test_export_streams_batches_in_name_order(connection):
+    carol, alice = make_attendee("c@gmail.com"), make_attendee("a@gmail.com")
+    carol.name, alice.name = "Carol", "Alice"
+    AttendeeDAO(connection=connection).register_participants("ev-1", [carol, alice])
+    with connection.unit_of_work():
+        stream = AttendeeDAO(connection=connection).stream_event_participant_rows(
+            event_id="ev-1", batch_size=1
+        )
+    # Read after the unit of work is closed, like a streamed response body.
+    batches = list(stream)
+    assert [[row["name"] for row in rows] for rows in batches] == [["Alice"], ["Carol"]]
+    assert batches[0][0]["created_at"] == datetime(2024, 1, 2)
+    assert batches[0][0]["checked_in_at"] is None
@@ -1,8 +1,10 @@
 from datetime import datetime
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock
 from src.drivers.database.types import ConnectionInterface
+from src.modules.events.dao import statements
+from src.modules.events.dao.statements import SearchMode
 from src.modules.events.dao.attendee import AttendeeDAO
-from src.modules.events.entities.attendee import AttendeeEntity
+from src.modules.events.dtos.event_credentials import EventCredentialsDTO
 
 
 class TestAttendeeInfo:
@@ -10,59 +12,15 @@ class TestAttendeeInfo:
         self.connection = MagicMock(spec=ConnectionInterface)
         self.query = None
 
-    def test_attendee_info_not_found_returns_none(self):
-        with patch("src.modules.events.dao.attendee.text") as text:
-            self.query = text(
-                """
-            SELECT
-                at.id AS attendee_id,
-                at.name AS attendee_name,
-                at.email AS attendee_email,
-                at.created_at AS attendee_registered_at,
-                at.event_id,
-                chk.created_at AS checked_in_at
-            FROM attendees AS at
-            LEFT JOIN check_ins AS chk
-            ON chk.attendee_id = at.id
-            WHERE at.id = :id;
-            """
-            )
-            dao = AttendeeDAO(connection=self.connection)
-            attendee_id = "23"
-            db_connection = (
-                self.connection.get_engine.return_value.connect.return_value.__enter__.return_value
-            )
-            db_connection.execute.return_value.first.return_value = None
-            result = dao.get_attendee_data(attendee_id=attendee_id)
-            db_connection.execute.return_value.first.assert_called_once()
-            db_connection.execute.assert_called_once_with(
-                self.query, {"id": attendee_id}
-            )
-            assert result is None
-
-    def test_attendee_info(self):
-        with patch("src.modules.events.dao.attendee.text") as text:
-            self.query = text(
-                """
-            SELECT
-                at.id AS attendee_id,
-                at.name AS attendee_name,
-                at.email AS attendee_email,
-                at.created_at AS attendee_registered_at,
-                at.event_id,
-                chk.created_at AS checked_in_at
-            FROM attendees AS at
-            LEFT JOIN check_ins AS chk
-            ON chk.attendee_id = at.id
-            WHERE at.id = :id;
-            """
-            )
-            dao = AttendeeDAO(connection=self.connection)
-            attendee_id = "23"
-            db_connection = (
-                self.connection.get_engine.return_value.connect.return_value.__enter__.return_value
-            )
-            row = (
+    def test_attendee_info_list(self):
+        self.query = statements.participants_page_with_total(
+            SearchMode.FULL_TEXT, keyset=False
+        )
+        dao = AttendeeDAO(connection=self.connection)
+        db_connection = self.connection.connect.return_value.__enter__.return_value
+        rows = [
+            (
+                1,  # total
                 "attendee_id",
                 "name",
                 "email@email.com",
@@ -70,108 +28,119 @@ class TestAttendeeInfo:
                 "event_id",
                 datetime(2024, 1, 1),  # checked_in_at
             )
-            db_connection.execute.return_value.first.return_value = row
-            result = dao.get_attendee_data(attendee_id=attendee_id)
-            self.connection.get_engine.assert_called_once()
-            self.connection.get_engine.return_value.connect.assert_called_once()
-            db_connection.execute.return_value.first.assert_called_once()
-            db_connection.execute.assert_called_once_with(
-                self.query, {"id": attendee_id}
-            )
-            assert isinstance(result, AttendeeEntity)
-            assert result.id == row[0]
-            assert result.name == row[1]
-            assert result.email == row[2]
-            assert result.created_at == row[3]
-            assert result.event_id == row[4]
-            assert result.checked_in_at == row[5]
-
-    def test_attendee_info_list(self):
-        with patch("src.modules.events.dao.attendee.text") as text:
-            self.query = text(
-                """
-                SELECT
-                    at.id AS attendee_id,
-                    at.name AS attendee_name,
-                    at.email AS attendee_email,
-                    at.created_at AS attendee_registered_at,
-                    at.event_id,
-                    chk.created_at AS checked_in_at
-                FROM events AS ev
-                LEFT JOIN attendees AS at
-                ON at.event_id=ev.id
-                LEFT JOIN check_ins AS chk
-                ON chk.attendee_id = at.id
-                WHERE ev.id = :id AND at.name LIKE :query
-                LIMIT 10 * :offset
-                ORDER BY at.name DESC;
-            """
-            )
-            dao = AttendeeDAO(connection=self.connection)
-            db_connection = (
-                self.connection.get_engine.return_value.connect.return_value.__enter__.return_value
-            )
-            rows = [
-                (
-                    "attendee_id",
-                    "name",
-                    "email@email.com",
-                    datetime(2024, 1, 1),  # created_at
-                    "event_id",
-                    datetime(2024, 1, 1),  # checked_in_at
-                )
-            ]
-            db_connection.execute.return_value.fetchall.return_value = rows
-            query = "test"
-            offset = 1
-            result = dao.get_event_participants(
-                event_id="1", offset=offset, query=query
-            )
-            db_connection.execute.return_value.fetchall.assert_called_once()
-            db_connection.execute.assert_called_once_with(
-                self.query, {"id": "1", "offset": offset, "query": f"%{query}%"}
-            )
-            assert result[0].id == rows[0][0]
-            assert result[0].name == rows[0][1]
-            assert result[0].email == rows[0][2]
-            assert result[0].created_at == rows[0][3]
-            assert result[0].event_id == rows[0][4]
-            assert result[0].checked_in_at == rows[0][5]
+        ]
+        db_connection.execute.return_value.fetchall.return_value = rows
+        query = "test"
+        offset = 1
+        result, total = dao.get_event_participant_rows(
+            event_id="1", offset=offset, query=query
+        )
+        db_connection.execute.return_value.fetchall.assert_called_once()
+        db_connection.execute.assert_called_once_with(
+            self.query,
+            {"id": "1", "offset": offset, "search": f'"{query}"', "limit": 10},
+        )
+        assert total == rows[0][0]
+        assert result[0]["attendee_id"] == rows[0][1]
+        assert result[0]["name"] == rows[0][2]
+        assert result[0]["email"] == rows[0][3]
+        assert result[0]["created_at"] == rows[0][4]
+        assert result[0]["event_id"] == rows[0][5]
+        assert result[0]["checked_in_at"] == rows[0][6]
 
     def test_attendee_info_list_empty(self):
-        with patch("src.modules.events.dao.attendee.text") as text:
-            self.query = text(
-                """
-                SELECT
-                    at.id AS attendee_id,
-                    at.name AS attendee_name,
-                    at.email AS attendee_email,
-                    at.created_at AS attendee_registered_at,
-                    at.event_id,
-                    chk.created_at AS checked_in_at
-                FROM events AS ev
-                LEFT JOIN attendees AS at
-                ON at.event_id=ev.id
-                LEFT JOIN check_ins AS chk
-                ON chk.attendee_id = at.id
-                WHERE ev.id = :id AND at.name LIKE :query
-                LIMIT 10 * :offset
-                ORDER BY at.name DESC;
-            """
-            )
-            dao = AttendeeDAO(connection=self.connection)
-            db_connection = (
-                self.connection.get_engine.return_value.connect.return_value.__enter__.return_value
-            )
-            rows = []
-            db_connection.execute.return_value.fetchall.return_value = rows
-            query = ""
-            offset = 0
-            result = dao.get_event_participants(
-                event_id="1", offset=offset, query=query
-            )
-            db_connection.execute.return_value.fetchall.assert_called_once()
-            db_connection.execute.assert_called_once_with(
-                self.query, {"id": "1", "offset": offset, "query": f"%{query}%"}
-            )
-            assert len(result) == 0
+        self.query = statements.participants_page_with_total(
+            SearchMode.NONE, keyset=False
+        )
+        dao = AttendeeDAO(connection=self.connection)
+        db_connection = self.connection.connect.return_value.__enter__.return_value
+        rows = [(0, None, None, None, None, None, None)]
+        db_connection.execute.return_value.fetchall.return_value = rows
+        query = ""
+        offset = 0
+        result = dao.get_event_participant_rows(
+            event_id="1", offset=offset, query=query
+        )
+        db_connection.execute.return_value.fetchall.assert_called_once()
+        db_connection.execute.assert_called_once_with(
+            self.query,
+            {"id": "1", "offset": offset, "limit": 10},
+        )
+        assert result == ([], 0)
+
+    def test_attendee_rows_with_short_query(self):
+        dao = AttendeeDAO(connection=self.connection)
+        db_connection = self.connection.connect.return_value.__enter__.return_value
+        db_connection.execute.return_value.fetchall.return_value = []
+        dao.get_event_participant_rows(event_id="1", query="a%")
+        db_connection.execute.assert_called_once_with(
+            statements.participants_page_with_total(SearchMode.LIKE, keyset=False),
+            {"id": "1", "query": "%a\\%%", "offset": 0, "limit": 10},
+        )
+
+    def test_attendee_rows_with_full_text_query(self):
+        dao = AttendeeDAO(connection=self.connection)
+        db_connection = self.connection.connect.return_value.__enter__.return_value
+        db_connection.execute.return_value.fetchall.return_value = []
+        dao.get_event_participant_rows(event_id="1", query='jo "o')
+        db_connection.execute.assert_called_once_with(
+            statements.participants_page_with_total(SearchMode.FULL_TEXT, keyset=False),
+            {"id": "1", "search": '"jo ""o"', "offset": 0, "limit": 10},
+        )
+
+    def test_attendee_rows_with_total(self):
+        dao = AttendeeDAO(connection=self.connection)
+        db_connection = self.connection.connect.return_value.__enter__.return_value
+        created_at = datetime(2024, 1, 1)
+        db_connection.execute.return_value.fetchall.return_value = [
+            (2, "attendee_id", "name", "email@email.com", created_at, "event_id", None)
+        ]
+        result = dao.get_event_participant_rows(event_id="1", limit=1)
+        db_connection.execute.assert_called_once()
+        _, params = db_connection.execute.call_args.args
+        assert params == {"id": "1", "offset": 0, "limit": 1}
+        assert result == (
+            [
+                {
+                    "attendee_id": "attendee_id",
+                    "name": "name",
+                    "email": "email@email.com",
+                    "event_id": "event_id",
+                    "created_at": created_at,
+                    "checked_in_at": None,
+                }
+            ],
+            2,
+        )
+
+    def test_attendee_rows_without_attendees(self):
+        dao = AttendeeDAO(connection=self.connection)
+        db_connection = self.connection.connect.return_value.__enter__.return_value
+        db_connection.execute.return_value.fetchall.return_value = [
+            (0, None, None, None, None, None, None)
+        ]
+        assert dao.get_event_participant_rows(event_id="1") == ([], 0)
+        db_connection.execute.return_value.fetchall.return_value = []
+        assert dao.get_event_participant_rows(event_id="1") is None
+
+    def test_attendee_credential(self):
+        dao = AttendeeDAO(connection=self.connection)
+        db_connection = self.connection.connect.return_value.__enter__.return_value
+        db_connection.execute.return_value.first.return_value = (
+            "event title",
+            "name",
+            "email@email.com",
+        )
+        result = dao.get_attendee_credential(attendee_id="23")
+        db_connection.execute.assert_called_once_with(
+            statements.ATTENDEE_CREDENTIAL, {"id": "23"}
+        )
+        assert result == EventCredentialsDTO(
+            event_title="event title", name="name", email="email@email.com"
+        )
+
+    def test_attendee_credential_not_found_returns_none(self):
+        dao = AttendeeDAO(connection=self.connection)
+        db_connection = self.connection.connect.return_value.__enter__.return_value
+        db_connection.execute.return_value.first.return_value = None
+        assert dao.get_attendee_credential(attendee_id="23") is None
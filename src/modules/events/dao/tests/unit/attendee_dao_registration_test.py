@@ -0,0 +1,74 @@
+from datetime import datetime
+from unittest.mock import MagicMock
+from sqlalchemy.exc import IntegrityError
+from src.drivers.database.types import ConnectionInterface
+from src.modules.events.dao.attendee import AttendeeDAO
+from src.modules.events.dtos.attendee import AttendeeRegistrationStatus
+from src.modules.events.entities.attendee import AttendeeEntity
+
+
+class TestAttendeeRegistrationDAO:
+    def setup_method(self):
+        self.connection = MagicMock(spec=ConnectionInterface)
+        self.attendee = AttendeeEntity(
+            created_at=datetime.now(),
+            checked_in_at=None,
+            event_id="1",
+            email="any@gmail.com",
+            name="anyname",
+            attendee_id=None,
+        )
+        self.db_connection = self.connection.begin.return_value.__enter__.return_value
+
+    def test_register_participant_in_event_created(self):
+        dao = AttendeeDAO(connection=self.connection)
+        self.db_connection.execute.return_value.rowcount = 1
+        status = dao.register_participant_in_event(attendee=self.attendee)
+        self.connection.begin.assert_called_once()
+        self.db_connection.execute.assert_called_once()
+        _, params = self.db_connection.execute.call_args.args
+        assert params == {
+            "attendee_id": self.attendee.id,
+            "name": self.attendee.name,
+            "email": self.attendee.email,
+            "event_id": self.attendee.event_id,
+            "created_at": self.attendee.created_at,
+        }
+        assert status is AttendeeRegistrationStatus.CREATED
+
+    def test_register_participant_in_event_not_found(self):
+        dao = AttendeeDAO(connection=self.connection)
+        self.db_connection.execute.return_value.rowcount = 0
+        self.db_connection.execute.return_value.one.return_value = (0, 0)
+        status = dao.register_participant_in_event(attendee=self.attendee)
+        assert self.db_connection.execute.call_count == 2
+        self.db_connection.commit.assert_not_called()
+        assert status is AttendeeRegistrationStatus.EVENT_NOT_FOUND
+
+    def test_register_participant_in_event_duplicated(self):
+        dao = AttendeeDAO(connection=self.connection)
+        self.db_connection.execute.return_value.rowcount = 0
+        self.db_connection.execute.return_value.one.return_value = (1, 1)
+        status = dao.register_participant_in_event(attendee=self.attendee)
+        self.db_connection.commit.assert_not_called()
+        assert status is AttendeeRegistrationStatus.ALREADY_REGISTERED
+
+    def test_register_participant_in_event_sold_out(self):
+        dao = AttendeeDAO(connection=self.connection)
+        self.db_connection.execute.return_value.rowcount = 0
+        self.db_connection.execute.return_value.one.return_value = (1, 0)
+        status = dao.register_participant_in_event(attendee=self.attendee)
+        self.db_connection.commit.assert_not_called()
+        assert status is AttendeeRegistrationStatus.SOLD_OUT
+
+    def test_register_participant_in_event_integrity_error(self):
+        dao = AttendeeDAO(connection=self.connection)
+
+        def side_effect(*_):
+            raise IntegrityError("Integrity error", orig=None, params={})
+
+        self.db_connection.execute.side_effect = side_effect
+        status = dao.register_participant_in_event(attendee=self.attendee)
+        self.db_connection.execute.assert_called_once()
+        self.db_connection.commit.assert_not_called()
+        assert status is AttendeeRegistrationStatus.ALREADY_REGISTERED
@@ -5,16 +5,25 @@ This module contains Data Access Objects representations for a Attendee of a Eve
 Classes: 
 
     AttendeeDTO
+    AttendeeRow
+    AttendeePageDTO
+    AttendeeRegistrationDTO
+    AttendeeRegistrationStatus
+    AttendeeImportStatus
+    AttendeeImportRowDTO
+    AttendeeImportReportDTO
 """
 
 from dataclasses import dataclass
 from datetime import datetime
+from enum import Enum
+from typing import TypedDict
 
 from src.modules.events.exc.common import ValidationError
 from src.utils.validators import email_validator, name_validator
 
 
-@dataclass
+@dataclass(slots=True)
 class AttendeeDTO:
     attendee_id: str
     name: str
@@ -24,7 +33,59 @@ class AttendeeDTO:
     checked_in_at: datetime | None
 
 
-@dataclass
+class AttendeeRow(TypedDict):
+    """An AttendeeDTO as a plain mapping, read straight from a listing row"""
+
+    attendee_id: str
+    name: str
+    email: str
+    event_id: str
+    created_at: datetime
+    checked_in_at: datetime | None
+
+
+@dataclass(frozen=True, slots=True)
+class AttendeePageDTO:
+    attendees: list[AttendeeDTO] | list[AttendeeRow]
+    total: int
+
+
+class AttendeeRegistrationStatus(Enum):
+    """Outcome of an atomic attendee registration"""
+
+    CREATED = "created"
+    EVENT_NOT_FOUND = "event_not_found"
+    ALREADY_REGISTERED = "already_registered"
+    SOLD_OUT = "sold_out"
+
+
+class AttendeeImportStatus(Enum):
+    """Outcome of one row of a bulk import"""
+
+    CREATED = "created"
+    INVALID = "invalid"
+    DUPLICATE = "duplicate"
+    ALREADY_REGISTERED = "already_registered"
+    SOLD_OUT = "sold_out"
+
+
+@dataclass(frozen=True, slots=True)
+class AttendeeImportRowDTO:
+    row: int
+    status: AttendeeImportStatus
+    email: str | None = None
+    attendee_id: str | None = None
+    error: str | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class AttendeeImportReportDTO:
+    rows: list[AttendeeImportRowDTO]
+    created: int
+    rejected: int
+
+
+@dataclass(frozen=True, slots=True)
 class AttendeeRegistrationDTO:
     name: str
     email: str
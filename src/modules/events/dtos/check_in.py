@@ -5,15 +5,64 @@ This module contains Data Access Objects representation of a Event CheckIn.
 Classes: 
 
     CheckInDTO
+    CheckInStatus
+    CheckInScanDTO
+    CheckInBatchStatus
+    CheckInBatchResultDTO
 """
 
 from dataclasses import dataclass
 from datetime import datetime
+from enum import Enum
 
+from src.modules.events.exc.common import ValidationError
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class CheckInDTO:
 
     check_in_id: int
     created_at: datetime
     attendee_id: str
+
+
+class CheckInStatus(Enum):
+    """Outcome of an atomic attendee check-in"""
+
+    CREATED = "created"
+    ATTENDEE_NOT_FOUND = "attendee_not_found"
+    ALREADY_CHECKED_IN = "already_checked_in"
+
+
+@dataclass(frozen=True, slots=True)
+class CheckInScanDTO:
+    """A check-in scanned at the door, sent later by the scanning device"""
+
+    attendee_id: str
+    scanned_at: datetime
+    device_id: str
+
+    def __post_init__(self):
+        if not (isinstance(self.attendee_id, str) and self.attendee_id):
+            raise ValidationError("The attendee id should be a string.")
+        if not isinstance(self.scanned_at, datetime):
+            raise ValidationError("The scan time should be a date and time.")
+        if not (isinstance(self.device_id, str) and self.device_id):
+            raise ValidationError("The device id should be a string.")
+
+
+class CheckInBatchStatus(Enum):
+    """Outcome of one scan of a check-in batch"""
+
+    CREATED = "created"
+    DUPLICATE = "duplicate"
+    UNKNOWN = "unknown"
+
+
+@dataclass(frozen=True, slots=True)
+class CheckInBatchResultDTO:
+    attendee_id: str
+    device_id: str
+    status: CheckInBatchStatus
+    check_in_id: int | None = None
+    checked_in_at: datetime | None = None
@@ -5,15 +5,18 @@ This module contains Data Access Objects representation of a Event.
 Classes: 
 
     EventDTO
+    EventRow
+    EventVersionDTO
 """
 
 from dataclasses import dataclass
 from datetime import datetime
+from typing import TypedDict
 
 from src.modules.events.exc.common import ValidationError
 
 
-@dataclass
+@dataclass(slots=True)
 class EventDTO:
 
     event_id: str
@@ -24,12 +27,32 @@ class EventDTO:
     maximum_attendees: int | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class EventDTOWithAmount(EventDTO):
     attendee_amount: int = 0
 
 
-@dataclass
+class EventRow(TypedDict):
+    """An EventDTOWithAmount as a plain mapping, read straight from a listing row"""
+
+    event_id: str
+    title: str
+    slug: str
+    created_at: datetime
+    details: str | None
+    maximum_attendees: int | None
+    attendee_amount: int
+
+
+@dataclass(frozen=True, slots=True)
+class EventVersionDTO:
+    """A marker that changes whenever the data it covers changes"""
+
+    version: int
+    updated_at: datetime
+
+
+@dataclass(frozen=True, slots=True)
 class EventRegistrationDTO:
     title: str
     slug: str
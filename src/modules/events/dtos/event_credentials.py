@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class EventCredentialsDTO:
     """Represents the data related to a attendee and a event to make an event credential"""
 
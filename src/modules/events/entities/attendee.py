@@ -8,7 +8,7 @@ Classes:
 """
 
 from datetime import datetime
-from typing import TypedDict, Unpack
+from typing import TypedDict
 from src.drivers.uuid.driver import UUIDProvider
 
 
@@ -22,13 +22,25 @@ class AttendeeAttributes(TypedDict):
 
 
 class AttendeeEntity:
-    """The event participant subscribed"""
-
-    def __init__(self, **attendee_info: Unpack[AttendeeAttributes]):
-
-        self.id: str = attendee_info["attendee_id"] or UUIDProvider.make_uuid()
-        self.name: str = attendee_info["name"]
-        self.email: str = attendee_info["email"]
-        self.event_id: str = attendee_info["event_id"]
-        self.created_at = attendee_info["created_at"] or datetime.now()
-        self.checked_in_at = attendee_info["checked_in_at"]
+    """
+    The event participant subscribed.
+    Slotted and positional, since the listings build one per row.
+    """
+
+    __slots__ = ("id", "name", "email", "event_id", "created_at", "checked_in_at")
+
+    def __init__(
+        self,
+        attendee_id: str | None,
+        name: str,
+        email: str,
+        event_id: str,
+        created_at: datetime | None = None,
+        checked_in_at: datetime | None = None,
+    ):
+        self.id: str = attendee_id or UUIDProvider.make_uuid()
+        self.name: str = name
+        self.email: str = email
+        self.event_id: str = event_id
+        self.created_at: datetime = created_at or datetime.now()
+        self.checked_in_at: datetime | None = checked_in_at
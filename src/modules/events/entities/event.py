@@ -8,7 +8,7 @@ Classes:
 """
 
 from datetime import datetime
-from typing import TypedDict, Unpack
+from typing import NotRequired, TypedDict
 
 from src.drivers.uuid.driver import UUIDProvider
 
@@ -22,15 +22,39 @@ class EventAttributes(TypedDict):
     details: str | None
     maximum_attendees: int | None
     created_at: datetime | None
+    attendee_count: NotRequired[int]
 
 
 class EventEntity:
-    """The event for the pass in"""
-
-    def __init__(self, **event: Unpack[EventAttributes]):
-        self.id = event.get("id") or UUIDProvider.make_uuid()
-        self.title = event["title"]
-        self.slug = event["slug"]
-        self.details = event["details"]
-        self.maximum_attendees = event["maximum_attendees"]
-        self.created_at = event.get("created_at") or datetime.now()
+    """
+    The event for the pass in.
+    Slotted and positional, since the listings build one per row.
+    """
+
+    __slots__ = (
+        "id",
+        "title",
+        "slug",
+        "details",
+        "maximum_attendees",
+        "created_at",
+        "attendee_count",
+    )
+
+    def __init__(
+        self,
+        id: str | None,  # pylint: disable=redefined-builtin
+        title: str,
+        slug: str,
+        details: str | None = None,
+        maximum_attendees: int | None = None,
+        created_at: datetime | None = None,
+        attendee_count: int = 0,
+    ):
+        self.id: str = id or UUIDProvider.make_uuid()
+        self.title: str = title
+        self.slug: str = slug
+        self.details: str | None = details
+        self.maximum_attendees: int | None = maximum_attendees
+        self.created_at: datetime = created_at or datetime.now()
+        self.attendee_count: int = attendee_count
@@ -2,3 +2,9 @@ class ValidationError(Exception):
     def __init__(self, message: str):
         """The field provided is not valid"""
         super().__init__(message)
+
+
+class UnsupportedMediaTypeError(Exception):
+    def __init__(self, message: str):
+        """The request body is not in a format the route reads"""
+        super().__init__(message)
@@ -5,9 +5,13 @@ from src.modules.events.exc.attendee import (
     AttendeeNotCreatedError,
     AttendeeNotFoundError,
 )
-from src.modules.events.exc.check_in import CheckInNotRegistered
-from src.modules.events.exc.common import ValidationError
-from src.modules.events.exc.event import EventNotCreatedError, EventNotFoundError
+from src.modules.events.exc.check_in import AlreadyCheckedInError, CheckInNotRegistered
+from src.modules.events.exc.common import UnsupportedMediaTypeError, ValidationError
+from src.modules.events.exc.event import (
+    EventNotCreatedError,
+    EventNotFoundError,
+    EventSoldOutError,
+)
 
 
 class HttpResponseError(Exception):
@@ -26,9 +30,15 @@ def map_exception_to_http_response(exc: Exception) -> HttpResponseError:
             HTTPStatus.UNPROCESSABLE_ENTITY,
             "Unprocessable Entity.",
         ),
+        UnsupportedMediaTypeError: (
+            HTTPStatus.UNSUPPORTED_MEDIA_TYPE,
+            "Unsupported Media Type.",
+        ),
         AttendeeNotFoundError: (HTTPStatus.NOT_FOUND, "Not Found Event."),
         EventNotFoundError: (HTTPStatus.NOT_FOUND, "Not Found Event."),
         AttendeeAlreadyExistsError: (HTTPStatus.CONFLICT, "Attendee Already Exists."),
+        AlreadyCheckedInError: (HTTPStatus.CONFLICT, "Attendee Already Checked In."),
+        EventSoldOutError: (HTTPStatus.CONFLICT, "Event Sold Out."),
         AttendeeNotCreatedError: (
             HTTPStatus.SERVICE_UNAVAILABLE,
             "Service Unavailable",
@@ -0,0 +1,52 @@
+from abc import ABC, abstractmethod
+
+from src.modules.events.dao.async_attendee import AsyncAttendeeDaoInterface
+from src.modules.events.dtos.attendee import AttendeeRegistrationStatus, AttendeeRow
+from src.modules.events.dtos.event_credentials import EventCredentialsDTO
+from src.modules.events.entities.attendee import AttendeeEntity
+from src.utils.pagination import DEFAULT_PAGE_SIZE
+
+
+class AsyncAttendeeRepositoryInterface(ABC):
+    """Asyncio counterpart of AttendeeRepositoryInterface, for the ASGI routes"""
+
+    @abstractmethod
+    async def register_in_event(
+        self, data: AttendeeEntity
+    ) -> AttendeeRegistrationStatus:
+        """Register the attendee if the event exists and still has vacancies"""
+
+    @abstractmethod
+    async def get_event_participant_rows(
+        self,
+        event_id: str,
+        query: str,
+        offset: int,
+        limit: int = DEFAULT_PAGE_SIZE,
+        after: tuple[str, str] | None = None,
+    ) -> tuple[list[AttendeeRow], int] | None:
+        """Retrive a page of participants as mappings, None if the event not exists"""
+
+    @abstractmethod
+    async def get_attendee_credential(
+        self, attendee_id: str
+    ) -> EventCredentialsDTO | None:
+        """Retrieve the badge data of the given attendee_id"""
+
+
+class AsyncAttendeeRepository(AsyncAttendeeRepositoryInterface):
+    def __init__(self, dao: AsyncAttendeeDaoInterface):
+        self.__dao = dao
+
+    async def register_in_event(self, data):
+        return await self.__dao.register_participant_in_event(attendee=data)
+
+    async def get_event_participant_rows(
+        self, event_id, query, offset, limit=DEFAULT_PAGE_SIZE, after=None
+    ):
+        return await self.__dao.get_event_participant_rows(
+            event_id=event_id, query=query, offset=offset, limit=limit, after=after
+        )
+
+    async def get_attendee_credential(self, attendee_id):
+        return await self.__dao.get_attendee_credential(attendee_id=attendee_id)
@@ -0,0 +1,21 @@
+from abc import ABC, abstractmethod
+
+from src.modules.events.dao.async_check_in import AsyncCheckInDaoInterface
+from src.modules.events.dtos.check_in import CheckInStatus
+from src.modules.events.entities.check_in import CheckInEntity
+
+
+class AsyncCheckInRepositoryInterface(ABC):
+    @abstractmethod
+    async def check_in_attendee(
+        self, attendee_id: str
+    ) -> tuple[CheckInStatus, CheckInEntity | None]:
+        """Check in the Attendee in a single statement and tell the outcome"""
+
+
+class AsyncCheckInRepository(AsyncCheckInRepositoryInterface):
+    def __init__(self, dao: AsyncCheckInDaoInterface):
+        self.__dao = dao
+
+    async def check_in_attendee(self, attendee_id: str):
+        return await self.__dao.check_in_attendee(attendee_id=attendee_id)
@@ -0,0 +1,66 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+
+from src.modules.events.dao.async_event import AsyncEventDaoInterface
+from src.modules.events.dtos.event import EventDTOWithAmount, EventRow, EventVersionDTO
+from src.modules.events.entities.event import EventEntity
+from src.utils.pagination import DEFAULT_PAGE_SIZE
+
+
+class AsyncEventRepositoryInterface(ABC):
+    """Asyncio counterpart of EventRepositoryInterface, for the ASGI routes"""
+
+    @abstractmethod
+    async def create(self, data: EventEntity) -> EventEntity | None:
+        """Create a new event"""
+
+    @abstractmethod
+    async def get_event_by_id(self, event_id: str) -> EventDTOWithAmount | None:
+        """Retrieve a event information with the given id"""
+
+    @abstractmethod
+    async def check_event_existence(self, event_id: str) -> bool:
+        """Checks the existence of a event with the given id"""
+
+    @abstractmethod
+    async def load_event_rows(
+        self,
+        offset: int,
+        query: str,
+        limit: int = DEFAULT_PAGE_SIZE,
+        after: tuple[datetime, str] | None = None,
+    ) -> list[EventRow]:
+        """Retrieve a page of events as plain mappings"""
+
+    @abstractmethod
+    async def get_events_version(self) -> EventVersionDTO | None:
+        """Retrieve the marker that changes with any event"""
+
+    @abstractmethod
+    async def get_event_version(self, event_id: str) -> EventVersionDTO | None:
+        """Retrieve the marker that changes with the event or its attendees"""
+
+
+class AsyncEventRepository(AsyncEventRepositoryInterface):
+    def __init__(self, dao: AsyncEventDaoInterface):
+        self.__event_dao = dao
+
+    async def create(self, data):
+        return await self.__event_dao.create_event(event_data=data)
+
+    async def get_event_by_id(self, event_id):
+        return await self.__event_dao.get_event_info(event_id=event_id)
+
+    async def check_event_existence(self, event_id):
+        return await self.__event_dao.check_event_exists(event_id=event_id)
+
+    async def load_event_rows(self, offset, query, limit=DEFAULT_PAGE_SIZE, after=None):
+        return await self.__event_dao.retrieve_event_rows(
+            offset=offset, query=query, limit=limit, after=after
+        )
+
+    async def get_events_version(self):
+        return await self.__event_dao.get_events_version()
+
+    async def get_event_version(self, event_id):
+        return await self.__event_dao.get_event_version(event_id=event_id)
@@ -1,42 +1,82 @@
 from abc import ABC, abstractmethod
+from functools import partial
+from typing import Iterator
+from src.drivers.database.group_commit import (
+    GroupCommitTimeoutError,
+    GroupCommitWriter,
+)
 from src.modules.events.dao.attendee import AttendeeDaoInterface
+from src.modules.events.dtos.attendee import AttendeeRegistrationStatus, AttendeeRow
+from src.modules.events.dtos.event_credentials import EventCredentialsDTO
 from src.modules.events.entities.attendee import AttendeeEntity
+from src.modules.events.exc.attendee import AttendeeNotCreatedError
+from src.utils.pagination import DEFAULT_PAGE_SIZE
 
 
 class AttendeeRepositoryInterface(ABC):
     @abstractmethod
-    def create(self, data: AttendeeEntity) -> AttendeeEntity | None:
-        """Create a attendee for the event"""
+    def register_in_event(self, data: AttendeeEntity) -> AttendeeRegistrationStatus:
+        """Register the attendee if the event exists and still has vacancies"""
 
     @abstractmethod
-    def get_event_participants(
-        self, event_id: str, query: str, offset: int
-    ) -> list[AttendeeEntity]:
-        """Retrive a list of participants of the given event"""
+    def register_batch(
+        self, event_id: str, attendees: list[AttendeeEntity]
+    ) -> list[AttendeeRegistrationStatus]:
+        """Register a batch of attendees in the event, one status for each"""
 
     @abstractmethod
-    def get_attendee_by_id(self, attendee_id: str) -> AttendeeEntity | None:
-        """Retrieve the data of the given attendee_id"""
+    def get_event_participant_rows(
+        self,
+        event_id: str,
+        query: str,
+        offset: int,
+        limit: int = DEFAULT_PAGE_SIZE,
+        after: tuple[str, str] | None = None,
+    ) -> tuple[list[AttendeeRow], int] | None:
+        """Retrive a page of participants with the total, None if the event not exists"""
 
     @abstractmethod
-    def get_total_event_participants(self, event_id: str, query: str) -> int:
-        """Retrive the count of participants in the given event"""
+    def stream_event_participant_rows(
+        self, event_id: str
+    ) -> Iterator[list[AttendeeRow]]:
+        """Stream every participant of the given event as batches of mappings"""
+
+    @abstractmethod
+    def get_attendee_credential(self, attendee_id: str) -> EventCredentialsDTO | None:
+        """Retrieve the badge data of the given attendee_id"""
 
 
 class AttendeeRepository(AttendeeRepositoryInterface):
-    def __init__(self, dao: AttendeeDaoInterface):
+    def __init__(
+        self, dao: AttendeeDaoInterface, writer: GroupCommitWriter | None = None
+    ):
         self.__dao = dao
+        # Registrations are committed in groups by the writer, when enabled.
+        self.__writer = writer
+
+    def register_in_event(self, data):
+        register = partial(self.__dao.register_participant_in_event, attendee=data)
+        if self.__writer is None:
+            return register()
+        try:
+            return self.__writer.run(register)
+        except GroupCommitTimeoutError as exc:
+            raise AttendeeNotCreatedError(
+                "The registration was not committed in time."
+            ) from exc
 
-    def create(self, data):
-        return self.__dao.register_participant(attendee=data)
+    def register_batch(self, event_id, attendees):
+        return self.__dao.register_participants(event_id=event_id, attendees=attendees)
 
-    def get_event_participants(self, event_id, query, offset):
-        return self.__dao.get_event_participants(
-            event_id=event_id, query=query, offset=offset
+    def get_event_participant_rows(
+        self, event_id, query, offset, limit=DEFAULT_PAGE_SIZE, after=None
+    ):
+        return self.__dao.get_event_participant_rows(
+            event_id=event_id, query=query, offset=offset, limit=limit, after=after
         )
 
-    def get_attendee_by_id(self, attendee_id):
-        return self.__dao.get_attendee_data(attendee_id=attendee_id)
+    def stream_event_participant_rows(self, event_id):
+        return self.__dao.stream_event_participant_rows(event_id=event_id)
 
-    def get_total_event_participants(self, event_id: str, query: str) -> int:
-        return self.__dao.count_event_participants(event_id=event_id, query=query)
+    def get_attendee_credential(self, attendee_id):
+        return self.__dao.get_attendee_credential(attendee_id=attendee_id)
@@ -0,0 +1,92 @@
+"""
+### Cached Event Repository
+This module contains a read-through cache in front of an event repository.
+
+The event information, its attendee counter included, is served from memory
+for 'ttl' seconds, and unknown ids are remembered for 'negative_ttl' seconds
+so repeated lookups of missing events do not reach the database. Writes go
+through to the wrapped repository, and the services call 'invalidate_event'
+whenever they change an event or its attendees.
+
+The cache lives in the process: other workers only see a change when their
+own entry expires, so 'ttl' bounds how stale a counter can be across them.
+
+Classes:
+
+    CachedEventRepository
+"""
+
+from dataclasses import replace
+
+from src.drivers.database.unit_of_work import UnitOfWork
+from src.modules.events.dtos.event import EventDTOWithAmount
+from src.modules.events.entities.event import EventEntity
+from src.modules.events.repositories.event import EventRepositoryInterface
+from src.utils.cache import MISSING, CacheStats, TTLCache
+from src.utils.pagination import DEFAULT_PAGE_SIZE
+
+DEFAULT_CACHE_SIZE = 1024
+DEFAULT_TTL = 30.0
+DEFAULT_NEGATIVE_TTL = 5.0
+
+
+class CachedEventRepository(EventRepositoryInterface):
+    def __init__(
+        self,
+        repository: EventRepositoryInterface,
+        cache: TTLCache,
+        negative_ttl: float = DEFAULT_NEGATIVE_TTL,
+    ):
+        self.__repository = repository
+        self.__cache = cache
+        self.__negative_ttl = negative_ttl
+        self.__seen_versions = TTLCache(max_size=DEFAULT_CACHE_SIZE, ttl=float("inf"))
+
+    def create(self, data) -> EventEntity | None:
+        return self.__repository.create(data=data)
+
+    def get_event_by_id(self, event_id: str) -> EventDTOWithAmount | None:
+        event = self.__cache.get(event_id)
+        if event is MISSING:
+            event = self.__repository.get_event_by_id(event_id=event_id)
+            if event is None:
+                self.__cache.set(event_id, None, ttl=self.__negative_ttl)
+            else:
+                self.__cache.set(event_id, event)
+        # Callers get their own copy, so the cached entry cannot be altered.
+        return None if event is None else replace(event)
+
+    def check_event_existence(self, event_id: str) -> bool:
+        return self.get_event_by_id(event_id=event_id) is not None
+
+    def load_event_rows(self, offset, query, limit=DEFAULT_PAGE_SIZE, after=None):
+        return self.__repository.load_event_rows(
+            offset=offset, query=query, limit=limit, after=after
+        )
+
+    # The markers decide whether a client copy is fresh, so they are never cached.
+    def get_events_version(self):
+        return self.__repository.get_events_version()
+
+    def get_event_version(self, event_id):
+        marker = self.__repository.get_event_version(event_id=event_id)
+        version = None if marker is None else marker.version
+        # Another process changed the event: the cached copy is older than
+        # the marker a client is about to be tagged with, so drop it.
+        if self.__seen_versions.get(event_id) != version:
+            self.__cache.invalidate(event_id)
+            self.__seen_versions.set(event_id, version)
+        return marker
+
+    def invalidate_event(self, event_id: str):
+        self.__cache.invalidate(event_id)
+        self.__repository.invalidate_event(event_id=event_id)
+        # A concurrent request may read the old row again before this one
+        # commits, so the entry is dropped once more after the commit.
+        unit_of_work = UnitOfWork.current()
+        if unit_of_work is not None:
+            unit_of_work.after_commit(lambda: self.__cache.invalidate(event_id))
+
+    def cache_stats(self) -> CacheStats:
+        """Read the hit and miss counters of the event cache"""
+        return self.__cache.stats()
@@ -1,18 +1,48 @@
 from abc import ABC, abstractmethod
+from functools import partial
 
+from src.drivers.database.group_commit import (
+    GroupCommitTimeoutError,
+    GroupCommitWriter,
+)
 from src.modules.events.dao.check_in import CheckInDaoInterface
-from src.modules.events.dtos.check_in import CheckInDTO
+from src.modules.events.dtos.check_in import CheckInScanDTO, CheckInStatus
+from src.modules.events.entities.check_in import CheckInEntity
+from src.modules.events.exc.check_in import CheckInNotRegistered
 
 
 class CheckInRepositoryInterface(ABC):
     @abstractmethod
-    def register_check_in(self, attendee_id: str) -> CheckInDTO | None:
-        """Register the Attendee check-in in the Event"""
+    def check_in_attendee(
+        self, attendee_id: str
+    ) -> tuple[CheckInStatus, CheckInEntity | None]:
+        """Check in the Attendee in a single statement and tell the outcome"""
+
+    @abstractmethod
+    def check_in_scans(
+        self, scans: list[CheckInScanDTO]
+    ) -> list[tuple[CheckInStatus, CheckInEntity | None]]:
+        """Check in a batch of scans in one transaction and tell each outcome"""
 
 
 class CheckInRepository(CheckInRepositoryInterface):
-    def __init__(self, dao: CheckInDaoInterface):
+    def __init__(
+        self, dao: CheckInDaoInterface, writer: GroupCommitWriter | None = None
+    ):
         self.__dao = dao
+        # Check-ins are committed in groups by the writer, when enabled.
+        self.__writer = writer
+
+    def check_in_attendee(self, attendee_id: str):
+        check_in = partial(self.__dao.check_in_attendee, attendee_id=attendee_id)
+        if self.__writer is None:
+            return check_in()
+        try:
+            return self.__writer.run(check_in)
+        except GroupCommitTimeoutError as exc:
+            raise CheckInNotRegistered(
+                "The check-in was not committed in time."
+            ) from exc
 
-    def register_check_in(self, attendee_id: str):
-        return self.__dao.register_check_in(attendee_id=attendee_id)
+    def check_in_scans(self, scans: list[CheckInScanDTO]):
+        return self.__dao.check_in_scans(scans=scans)
@@ -1,7 +1,9 @@
 from abc import ABC, abstractmethod
+from datetime import datetime
 from src.modules.events.dao.event import EventDaoInterface
-from src.modules.events.dtos.event import EventDTOWithAmount
+from src.modules.events.dtos.event import EventDTOWithAmount, EventRow, EventVersionDTO
 from src.modules.events.entities.event import EventEntity
+from src.utils.pagination import DEFAULT_PAGE_SIZE
 
 
 class EventRepositoryInterface(ABC):
@@ -20,16 +22,26 @@ class EventRepositoryInterface(ABC):
         """Checks the existence of a event with the given id"""
 
     @abstractmethod
-    def check_event_capacity(self, event_id: str) -> bool:
-        """Check if the event has vacancies"""
+    def load_event_rows(
+        self,
+        offset: int,
+        query: str,
+        limit: int = DEFAULT_PAGE_SIZE,
+        after: tuple[datetime, str] | None = None,
+    ) -> list[EventRow]:
+        """Retrieve a page of the events available, as plain mappings"""
 
     @abstractmethod
-    def check_participant_existence(self, attendee_email: str, event_id: str) -> bool:
-        """Check if the participant is registered in the event"""
+    def get_events_version(self) -> EventVersionDTO | None:
+        """Retrieve the marker that changes with any event"""
 
     @abstractmethod
-    def load_events_list(self, offset: int, query: str) -> list[EventEntity]:
-        """Retrieve all events available"""
+    def get_event_version(self, event_id: str) -> EventVersionDTO | None:
+        """Retrieve the marker that changes with the event or its attendees"""
+
+    @abstractmethod
+    def invalidate_event(self, event_id: str):
+        """Discard what is kept in memory about the event with the given id"""
 
 
 class EventRepository(EventRepositoryInterface):
@@ -45,13 +57,17 @@ class EventRepository(EventRepositoryInterface):
     def check_event_existence(self, event_id: str) -> bool:
         return self.__event_dao.check_event_exists(event_id=event_id)
 
-    def check_event_capacity(self, event_id):
-        return self.__event_dao.check_event_has_vacancies(event_id=event_id)
-
-    def check_participant_existence(self, attendee_email: str, event_id: str) -> bool:
-        return self.__event_dao.check_attendee_in_event(
-            attendee_email=attendee_email, event_id=event_id
+    def load_event_rows(self, offset, query, limit=DEFAULT_PAGE_SIZE, after=None):
+        return self.__event_dao.retrieve_event_rows(
+            offset=offset, query=query, limit=limit, after=after
         )
 
-    def load_events_list(self, offset, query):
-        return self.__event_dao.retrieve_events(offset=offset, query=query)
+    def get_events_version(self):
+        return self.__event_dao.get_events_version()
+
+    def get_event_version(self, event_id):
+        return self.__event_dao.get_event_version(event_id=event_id)
+
+    def invalidate_event(self, event_id: str):
+        # Every call reads from the database, there is nothing to discard.
+        return None
@@ -1,9 +1,15 @@
 from datetime import datetime
 from unittest.mock import MagicMock
-from pytest import fixture
+from pytest import fixture, raises
 
+from src.drivers.database.group_commit import (
+    GroupCommitTimeoutError,
+    GroupCommitWriter,
+)
 from src.modules.events.dao.attendee import AttendeeDaoInterface
+from src.modules.events.dtos.attendee import AttendeeRegistrationStatus
 from src.modules.events.entities.attendee import AttendeeEntity
+from src.modules.events.exc.attendee import AttendeeNotCreatedError
 from src.modules.events.repositories.attendee import AttendeeRepository
 
 
@@ -31,47 +37,38 @@ result = AttendeeEntity(
 )
 
 
-def test_create_attendee_repository(dao: MagicMock):
+def test_get_attendee_credential_repository(dao: MagicMock):
     repository = AttendeeRepository(dao=dao)
 
-    dao.register_participant.return_value = result
-    created = repository.create(data=input_data)
-    dao.register_participant.assert_called_once_with(attendee=input_data)
-    assert created == result
+    dao.get_attendee_credential.return_value = "credential"
+    credential = repository.get_attendee_credential(attendee_id="23")
+    dao.get_attendee_credential.assert_called_once_with(attendee_id="23")
+    assert credential == "credential"
 
 
-def test_get_event_participants_repository(dao: MagicMock):
+def test_register_in_event_repository(dao: MagicMock):
     repository = AttendeeRepository(dao=dao)
-    offset = 0
-    query = ""
-    dao.get_event_participants.return_value = result
-    created = repository.get_event_participants(
-        event_id=input_data.event_id, query=query, offset=offset
-    )
-    dao.get_event_participants.assert_called_once_with(
-        event_id=input_data.event_id, query=query, offset=offset
-    )
-    assert created == result
 
+    dao.register_participant_in_event.return_value = AttendeeRegistrationStatus.CREATED
+    status = repository.register_in_event(data=input_data)
+    dao.register_participant_in_event.assert_called_once_with(attendee=input_data)
+    assert status is AttendeeRegistrationStatus.CREATED
 
-def test_get_attendee_by_id_repository(dao: MagicMock):
-    repository = AttendeeRepository(dao=dao)
 
-    dao.get_attendee_data.return_value = result
-    created = repository.get_attendee_by_id(attendee_id=input_data.id)
-    dao.get_attendee_data.assert_called_once_with(attendee_id=input_data.id)
-    assert created == result
+def test_register_in_event_times_out_as_not_created(dao: MagicMock):
+    writer = MagicMock(spec=GroupCommitWriter)
+    writer.run.side_effect = GroupCommitTimeoutError("late")
+    repository = AttendeeRepository(dao=dao, writer=writer)
+    with raises(AttendeeNotCreatedError):
+        repository.register_in_event(data=input_data)
 
 
-def test_get_event_count_participants(dao: MagicMock):
+def test_get_event_participant_rows_repository(dao: MagicMock):
     repository = AttendeeRepository(dao=dao)
-    query = ""
-    dao.count_event_participants.return_value = result
-    created = repository.get_total_event_participants(
-        event_id=input_data.event_id,
-        query=query,
+    page = repository.get_event_participant_rows(
+        event_id=input_data.event_id, query="", offset=0
     )
-    dao.count_event_participants.assert_called_once_with(
-        event_id=input_data.event_id, query=query
+    dao.get_event_participant_rows.assert_called_once_with(
+        event_id=input_data.event_id, query="", offset=0, limit=10, after=None
     )
-    assert created == result
+    assert page is dao.get_event_participant_rows.return_value
@@ -0,0 +1,145 @@
+from datetime import datetime
+from unittest.mock import MagicMock
+
+from pytest import fixture, raises
+
+from src.drivers.database.unit_of_work import UnitOfWork
+from src.modules.events.dtos.event import EventDTOWithAmount, EventVersionDTO
+from src.modules.events.repositories.cached_event import CachedEventRepository
+from src.modules.events.repositories.event import EventRepositoryInterface
+from src.utils.cache import TTLCache
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@fixture(name="clock")
+def fake_clock():
+    return Clock()
+
+
+@fixture(name="wrapped")
+def wrapped_repository():
+    repository = MagicMock(spec=EventRepositoryInterface)
+    repository.get_event_by_id.side_effect = lambda event_id: (
+        None if event_id == "missing" else make_event(event_id)
+    )
+    return repository
+
+
+@fixture(name="repository")
+def cached_repository(wrapped, clock):
+    cache = TTLCache(max_size=2, ttl=30, clock=clock)
+    return CachedEventRepository(repository=wrapped, cache=cache, negative_ttl=5)
+
+
+def make_event(event_id: str, attendee_amount: int = 0) -> EventDTOWithAmount:
+    return EventDTOWithAmount(
+        event_id=event_id,
+        title="test",
+        slug=f"slug-{event_id}",
+        created_at=datetime(2025, 1, 1),
+        attendee_amount=attendee_amount,
+    )
+
+
+def test_event_is_read_once_while_fresh(repository, wrapped):
+    first = repository.get_event_by_id(event_id="1")
+    second = repository.get_event_by_id(event_id="1")
+    wrapped.get_event_by_id.assert_called_once_with(event_id="1")
+    assert first == second == make_event("1")
+    assert first is not second
+    stats = repository.cache_stats()
+    assert (stats.hits, stats.misses) == (1, 1)
+
+
+def test_cached_event_is_not_altered_by_callers(repository):
+    repository.get_event_by_id(event_id="1").attendee_amount = 99
+    assert repository.get_event_by_id(event_id="1").attendee_amount == 0
+
+
+def test_event_expires_after_ttl(repository, wrapped, clock):
+    repository.get_event_by_id(event_id="1")
+    clock.now = 29.9
+    repository.get_event_by_id(event_id="1")
+    clock.now = 30
+    repository.get_event_by_id(event_id="1")
+    assert wrapped.get_event_by_id.call_count == 2
+
+
+def test_unknown_event_is_cached_for_negative_ttl(repository, wrapped, clock):
+    assert repository.get_event_by_id(event_id="missing") is None
+    assert repository.check_event_existence(event_id="missing") is False
+    wrapped.get_event_by_id.assert_called_once_with(event_id="missing")
+    wrapped.check_event_existence.assert_not_called()
+    clock.now = 5
+    assert repository.check_event_existence(event_id="missing") is False
+    assert wrapped.get_event_by_id.call_count == 2
+
+
+def test_least_recently_used_event_is_evicted(repository, wrapped):
+    repository.get_event_by_id(event_id="1")
+    repository.get_event_by_id(event_id="2")
+    repository.get_event_by_id(event_id="1")
+    repository.get_event_by_id(event_id="3")
+    assert repository.cache_stats().evictions == 1
+    repository.get_event_by_id(event_id="1")
+    repository.get_event_by_id(event_id="2")
+    assert [call.kwargs["event_id"] for call in wrapped.get_event_by_id.mock_calls] == [
+        "1",
+        "2",
+        "3",
+        "2",
+    ]
+
+
+def test_invalidation_reloads_the_event(repository, wrapped):
+    repository.get_event_by_id(event_id="1")
+    wrapped.get_event_by_id.side_effect = lambda event_id: make_event(event_id, 1)
+    repository.invalidate_event(event_id="1")
+    assert repository.get_event_by_id(event_id="1").attendee_amount == 1
+    wrapped.invalidate_event.assert_called_once_with(event_id="1")
+
+
+def test_invalidation_is_repeated_after_commit(repository, wrapped):
+    engine = MagicMock()
+    with UnitOfWork(engine):
+        repository.invalidate_event(event_id="1")
+        # A concurrent reader caches the row as it was before the commit.
+        repository.get_event_by_id(event_id="1")
+    repository.get_event_by_id(event_id="1")
+    assert wrapped.get_event_by_id.call_count == 2
+
+
+def test_new_version_drops_the_cached_event(repository, wrapped):
+    wrapped.get_event_version.return_value = EventVersionDTO(1, datetime(2025, 1, 1))
+    repository.get_event_version(event_id="1")
+    repository.get_event_by_id(event_id="1")
+    assert repository.get_event_version(event_id="1").version == 1
+    repository.get_event_by_id(event_id="1")
+    assert wrapped.get_event_by_id.call_count == 1
+
+    # Changed by another process: this one never saw the invalidation.
+    wrapped.get_event_version.return_value = EventVersionDTO(2, datetime(2025, 1, 2))
+    assert repository.get_event_version(event_id="1").version == 2
+    repository.get_event_by_id(event_id="1")
+    assert wrapped.get_event_by_id.call_count == 2
+
+
+def test_writes_and_listings_go_through(repository, wrapped):
+    repository.create(data="event")
+    repository.load_event_rows(offset=0, query="")
+    wrapped.create.assert_called_once_with(data="event")
+    wrapped.load_event_rows.assert_called_once_with(
+        offset=0, query="", limit=10, after=None
+    )
+
+
+def test_cache_size_should_be_positive():
+    with raises(ValueError):
+        TTLCache(max_size=0, ttl=1)
@@ -1,9 +1,15 @@
 from datetime import datetime
 from unittest.mock import MagicMock
-from pytest import fixture
+from pytest import fixture, raises
 
+from src.drivers.database.group_commit import (
+    GroupCommitTimeoutError,
+    GroupCommitWriter,
+)
 from src.modules.events.dao.check_in import CheckInDaoInterface
+from src.modules.events.dtos.check_in import CheckInStatus
 from src.modules.events.entities.check_in import CheckInEntity
+from src.modules.events.exc.check_in import CheckInNotRegistered
 from src.modules.events.repositories.check_in import CheckInRepository
 
 
@@ -20,10 +26,18 @@ result = CheckInEntity(
 )
 
 
-def test_register_check_in_repository(dao: MagicMock):
+def test_check_in_attendee_repository(dao: MagicMock):
     repository = CheckInRepository(dao=dao)
 
-    dao.register_check_in.return_value = result
-    created = repository.register_check_in(attendee_id="1")
-    dao.register_check_in.assert_called_once_with(attendee_id="1")
-    assert created == result
+    dao.check_in_attendee.return_value = (CheckInStatus.CREATED, result)
+    outcome = repository.check_in_attendee(attendee_id="1")
+    dao.check_in_attendee.assert_called_once_with(attendee_id="1")
+    assert outcome == (CheckInStatus.CREATED, result)
+
+
+def test_check_in_attendee_times_out_as_not_registered(dao: MagicMock):
+    writer = MagicMock(spec=GroupCommitWriter)
+    writer.run.side_effect = GroupCommitTimeoutError("late")
+    repository = CheckInRepository(dao=dao, writer=writer)
+    with raises(CheckInNotRegistered):
+        repository.check_in_attendee(attendee_id="1")
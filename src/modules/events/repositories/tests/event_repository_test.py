@@ -47,12 +47,13 @@ def test_event_get_by_id(dao):
     assert created == result
 
 
-def test_event_get_list(dao):
-    dao.retrieve_events.return_value = result
+def test_event_get_rows(dao):
     repository = EventRepository(dao=dao)
-    created = repository.load_events_list(offset=1, query="test")
-    dao.retrieve_events.assert_called_with(offset=1, query="test")
-    assert created == result
+    rows = repository.load_event_rows(offset=1, query="test")
+    dao.retrieve_event_rows.assert_called_with(
+        offset=1, query="test", limit=10, after=None
+    )
+    assert rows is dao.retrieve_event_rows.return_value
 
 
 def test_event_check_existence(dao):
@@ -63,21 +64,10 @@ def test_event_check_existence(dao):
     assert created is True
 
 
-def test_event_check_vacancy(dao):
-    dao.check_event_has_vacancies.return_value = False
+def test_event_versions(dao):
+    dao.get_events_version.return_value = "events version"
+    dao.get_event_version.return_value = "event version"
     repository = EventRepository(dao=dao)
-    created = repository.check_event_capacity(event_id=input_data.id)
-    dao.check_event_has_vacancies.assert_called_with(event_id=input_data.id)
-    assert created is False
-
-
-def test_event_check_participant_existence(dao):
-    dao.check_attendee_in_event.return_value = False
-    repository = EventRepository(dao=dao)
-    created = repository.check_participant_existence(
-        event_id=input_data.id, attendee_email="test@test.com"
-    )
-    dao.check_attendee_in_event.assert_called_with(
-        event_id=input_data.id, attendee_email="test@test.com"
-    )
-    assert created is False
+    assert repository.get_events_version() == "events version"
+    assert repository.get_event_version(event_id="12") == "event version"
+    dao.get_event_version.assert_called_once_with(event_id="12")
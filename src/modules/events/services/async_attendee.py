@@ -0,0 +1,98 @@
+"""
+This module contains the asyncio counterpart of the attendee service, used
+by the ASGI routes, with the same rules as AttendeeService.
+"""
+
+from abc import ABC, abstractmethod
+
+from src.modules.events.dtos.attendee import (
+    AttendeeDTO,
+    AttendeePageDTO,
+    AttendeeRegistrationDTO,
+)
+from src.modules.events.dtos.event_credentials import EventCredentialsDTO
+from src.modules.events.entities.attendee import AttendeeEntity
+from src.modules.events.exc.attendee import AttendeeNotFoundError
+from src.modules.events.exc.event import EventNotFoundError
+from src.modules.events.repositories.async_attendee import (
+    AsyncAttendeeRepositoryInterface,
+)
+from src.modules.events.services.attendee import (
+    check_registration_status,
+    registered_attendee,
+)
+from src.utils.cache import MISSING, TTLCache
+from src.utils.pagination import DEFAULT_PAGE_SIZE
+
+
+class AsyncAttendeeServiceInterface(ABC):
+    @abstractmethod
+    async def register_attendee_in_event(
+        self, data: AttendeeRegistrationDTO
+    ) -> AttendeeDTO | None:
+        """Verifies the event and register the attendee in that event"""
+
+    @abstractmethod
+    async def get_event_attendee_rows(
+        self,
+        event_id: str,
+        query: str,
+        offset: int,
+        limit: int = DEFAULT_PAGE_SIZE,
+        after: tuple[str, str] | None = None,
+    ) -> AttendeePageDTO:
+        """Retrieve a page of attendees as mappings with the total registered"""
+
+    @abstractmethod
+    async def get_attendee_event_credential(
+        self, attendee_id: str
+    ) -> EventCredentialsDTO | None:
+        """Retrieve the event credential for the given attendee"""
+
+
+class AsyncAttendeeService(AsyncAttendeeServiceInterface):
+    def __init__(
+        self,
+        repository: AsyncAttendeeRepositoryInterface,
+        credential_cache: TTLCache | None = None,
+    ):
+        self.__repository = repository
+        self.__credential_cache = credential_cache
+
+    async def register_attendee_in_event(self, data):
+        new_attendee = AttendeeEntity(
+            name=data.name,
+            email=data.email,
+            event_id=data.event_id,
+            created_at=None,
+            attendee_id=None,
+            checked_in_at=None,
+        )
+        status = await self.__repository.register_in_event(data=new_attendee)
+        check_registration_status(status)
+        return registered_attendee(new_attendee)
+
+    async def get_event_attendee_rows(
+        self, event_id, query, offset, limit=DEFAULT_PAGE_SIZE, after=None
+    ):
+        page = await self.__repository.get_event_participant_rows(
+            event_id=event_id, offset=offset, query=query, limit=limit, after=after
+        )
+        if page is None:
+            raise EventNotFoundError("The given event not exists.")
+        attendees, total = page
+        return AttendeePageDTO(attendees=attendees, total=total)
+
+    async def get_attendee_event_credential(self, attendee_id):
+        if self.__credential_cache is not None:
+            credential = self.__credential_cache.get(attendee_id)
+            if credential is not MISSING:
+                return credential
+        credential = await self.__repository.get_attendee_credential(
+            attendee_id=attendee_id
+        )
+        if credential is None:
+            raise AttendeeNotFoundError("Attendee not found.")
+        if self.__credential_cache is not None:
+            self.__credential_cache.set(attendee_id, credential)
+        return credential
@@ -0,0 +1,24 @@
+from abc import ABC, abstractmethod
+
+from src.modules.events.dtos.check_in import CheckInDTO
+from src.modules.events.repositories.async_check_in import (
+    AsyncCheckInRepositoryInterface,
+)
+from src.modules.events.services.check_in import check_in_outcome
+
+
+class AsyncCheckInServiceInterface(ABC):
+    @abstractmethod
+    async def make_event_check_in(self, attendee_id: str) -> CheckInDTO | None:
+        """Check-in the Attendee with the given id"""
+
+
+class AsyncCheckInService(AsyncCheckInServiceInterface):
+    def __init__(self, repository: AsyncCheckInRepositoryInterface):
+        self.__repository = repository
+
+    async def make_event_check_in(self, attendee_id):
+        status, check_in_data = await self.__repository.check_in_attendee(
+            attendee_id=attendee_id
+        )
+        return check_in_outcome(status, check_in_data)
@@ -0,0 +1,95 @@
+"""
+This module contains the asyncio counterpart of the event service, used by
+the ASGI routes. The rules are the ones of EventService; the ASGI stack has
+no event cache, so every read goes to the database.
+"""
+
+from abc import ABC, abstractmethod
+from datetime import datetime
+
+from src.modules.events.dtos.event import (
+    EventDTO,
+    EventDTOWithAmount,
+    EventRegistrationDTO,
+    EventRow,
+    EventVersionDTO,
+)
+from src.modules.events.entities.event import EventEntity
+from src.modules.events.exc.event import EventNotCreatedError
+from src.modules.events.repositories.async_event import AsyncEventRepositoryInterface
+from src.utils.pagination import DEFAULT_PAGE_SIZE
+
+
+class AsyncEventServiceInterface(ABC):
+    @abstractmethod
+    async def create_event(self, data: EventRegistrationDTO) -> EventDTO | None:
+        """Create a event"""
+
+    @abstractmethod
+    async def get_event_data(self, event_id: str) -> EventDTOWithAmount | None:
+        """Retrieve the event data with the given id"""
+
+    @abstractmethod
+    async def check_event_existence(self, event_id: str) -> bool:
+        """Check if the event with the given id exists"""
+
+    @abstractmethod
+    async def list_event_rows(
+        self,
+        offset: int,
+        query: str,
+        limit: int = DEFAULT_PAGE_SIZE,
+        after: tuple[datetime, str] | None = None,
+    ) -> list[EventRow]:
+        """Retrieve a page of events as mappings, ready to be sent"""
+
+    @abstractmethod
+    async def get_events_version(self) -> EventVersionDTO | None:
+        """Retrieve the marker that changes whenever the event listing changes"""
+
+    @abstractmethod
+    async def get_event_version(self, event_id: str) -> EventVersionDTO | None:
+        """Retrieve the marker that changes whenever the event or its attendees change"""
+
+
+class AsyncEventService(AsyncEventServiceInterface):
+    def __init__(self, repository: AsyncEventRepositoryInterface):
+        self.__repository = repository
+
+    async def create_event(self, data):
+        new_event = EventEntity(
+            title=data.title,
+            slug=data.slug,
+            details=data.details,
+            maximum_attendees=data.maximum_attendees,
+            id=None,
+            created_at=None,
+        )
+        created_entity = await self.__repository.create(data=new_event)
+        if created_entity is None:
+            raise EventNotCreatedError("An error ocurred while creating the event.")
+        return EventDTO(
+            title=created_entity.title,
+            details=created_entity.details,
+            event_id=created_entity.id,
+            slug=created_entity.slug,
+            maximum_attendees=created_entity.maximum_attendees,
+            created_at=created_entity.created_at,
+        )
+
+    async def get_event_data(self, event_id):
+        return await self.__repository.get_event_by_id(event_id=event_id)
+
+    async def check_event_existence(self, event_id):
+        return await self.__repository.check_event_existence(event_id=event_id)
+
+    async def list_event_rows(self, offset, query, limit=DEFAULT_PAGE_SIZE, after=None):
+        return await self.__repository.load_event_rows(
+            offset=offset, query=query, limit=limit, after=after
+        )
+
+    async def get_events_version(self):
+        return await self.__repository.get_events_version()
+
+    async def get_event_version(self, event_id):
+        return await self.__repository.get_event_version(event_id=event_id)
@@ -1,6 +1,18 @@
 from abc import ABC, abstractmethod
-
-from src.modules.events.dtos.attendee import AttendeeDTO, AttendeeRegistrationDTO
+from itertools import batched
+from typing import Any, Iterable, Iterator
+
+from src.drivers.database.unit_of_work import UnitOfWork
+from src.modules.events.dtos.attendee import (
+    AttendeeDTO,
+    AttendeeImportReportDTO,
+    AttendeeImportRowDTO,
+    AttendeeImportStatus,
+    AttendeePageDTO,
+    AttendeeRegistrationDTO,
+    AttendeeRegistrationStatus,
+    AttendeeRow,
+)
 from src.modules.events.dtos.event_credentials import EventCredentialsDTO
 from src.modules.events.entities.attendee import AttendeeEntity
 from src.modules.events.exc.attendee import (
@@ -8,9 +20,65 @@ from src.modules.events.exc.attendee import (
     AttendeeNotCreatedError,
     AttendeeNotFoundError,
 )
+from src.modules.events.exc.common import ValidationError
 from src.modules.events.exc.event import EventNotFoundError, EventSoldOutError
 from src.modules.events.repositories.attendee import AttendeeRepositoryInterface
 from src.modules.events.services.event import EventServiceInterface
+from src.utils.cache import MISSING, TTLCache
+from src.utils.pagination import DEFAULT_PAGE_SIZE
+
+# Rows validated and registered together, in one transaction per batch.
+IMPORT_BATCH_SIZE = 500
+
+_IMPORT_STATUSES = {
+    AttendeeRegistrationStatus.CREATED: AttendeeImportStatus.CREATED,
+    AttendeeRegistrationStatus.ALREADY_REGISTERED: (
+        AttendeeImportStatus.ALREADY_REGISTERED
+    ),
+    AttendeeRegistrationStatus.SOLD_OUT: AttendeeImportStatus.SOLD_OUT,
+}
+
+
+def check_registration_status(status: AttendeeRegistrationStatus):
+    """Raise the error telling why a registration was refused, if it was"""
+    if status is AttendeeRegistrationStatus.EVENT_NOT_FOUND:
+        raise EventNotFoundError(
+            "This registration failed because the given event was not Found."
+        )
+    if status is AttendeeRegistrationStatus.ALREADY_REGISTERED:
+        raise AttendeeAlreadyExistsError("This attendee is already registered")
+    if status is AttendeeRegistrationStatus.SOLD_OUT:
+        raise EventSoldOutError(
+            "This registration failed because the event has sold out."
+        )
+    if status is not AttendeeRegistrationStatus.CREATED:
+        raise AttendeeNotCreatedError(
+            "An error ocurred while registering the attendee."
+        )
+
+
+def imported_registration(record: Any, event_id: str) -> AttendeeRegistrationDTO:
+    """
+    Read a row of a bulk import with the rules of a single registration.
+    Raises: ValidationError when the row is not a valid attendee
+    """
+    if not isinstance(record, dict):
+        raise ValidationError("The row should be an attendee with a name and email.")
+    return AttendeeRegistrationDTO(
+        name=record.get("name", ""), email=record.get("email", ""), event_id=event_id
+    )
+
+
+def registered_attendee(attendee: AttendeeEntity) -> AttendeeDTO:
+    """The DTO sent back for an attendee that was just registered"""
+    return AttendeeDTO(
+        attendee_id=attendee.id,
+        event_id=attendee.event_id,
+        email=attendee.email,
+        created_at=attendee.created_at,
+        name=attendee.name,
+        checked_in_at=None,
+    )
 
 
 class AttendeeServiceInterface(ABC):
@@ -21,14 +89,28 @@ class AttendeeServiceInterface(ABC):
         """Verifies the event and register the attendee in that event"""
 
     @abstractmethod
-    def get_event_attendees(
-        self, event_id: str, query: str, offset: int
-    ) -> list[AttendeeDTO] | None:
-        """Retrieve the attendee list registered in the given event id"""
+    def import_attendees(
+        self,
+        event_id: str,
+        records: Iterable[Any],
+        batch_size: int = IMPORT_BATCH_SIZE,
+    ) -> AttendeeImportReportDTO:
+        """Register the rows of a bulk import in batches, reporting on each row"""
 
     @abstractmethod
-    def get_attendee_data(self, attendee_id: str) -> AttendeeDTO | None:
-        """Retrive the attendee data with the given id"""
+    def get_event_attendee_rows(
+        self,
+        event_id: str,
+        query: str,
+        offset: int,
+        limit: int = DEFAULT_PAGE_SIZE,
+        after: tuple[str, str] | None = None,
+    ) -> AttendeePageDTO:
+        """Retrieve a page of attendees with the total registered in the given event id"""
+
+    @abstractmethod
+    def export_event_attendees(self, event_id: str) -> Iterator[list[AttendeeRow]]:
+        """Verifies the event and stream all of its attendees, read as they are sent"""
 
     @abstractmethod
     def get_attendee_event_credential(
@@ -36,40 +118,21 @@ class AttendeeServiceInterface(ABC):
     ) -> EventCredentialsDTO | None:
         """Retrieve the event credential for the given attendee"""
 
-    @abstractmethod
-    def get_total_attendees_in_event(self, event_id: str, query: str) -> int:
-        """Retrieve the count of total participants in a given event"""
-
 
 class AttendeeService(AttendeeServiceInterface):
     def __init__(
         self,
         repository: AttendeeRepositoryInterface,
         event_service: EventServiceInterface,
+        credential_cache: TTLCache | None = None,
     ):
         self.__repository = repository
         self.__event_service = event_service
+        # Name, email and event title never change after the registration,
+        # so a badge can be kept until it is evicted.
+        self.__credential_cache = credential_cache
 
     def register_attendee_in_event(self, data) -> AttendeeDTO | None:
-        event_exists = self.__event_service.check_event_existence(
-            event_id=data.event_id
-        )
-        if not event_exists:
-            raise EventNotFoundError(
-                "This registration failed because the given event was not Found."
-            )
-        attendee_already_registered = self.__event_service.check_attendee_in_event(
-            attendee_email=data.email, event_id=data.event_id
-        )
-        if attendee_already_registered:
-            raise AttendeeAlreadyExistsError("This attendee is already registered")
-        has_vacancies = self.__event_service.evaluate_event_capacity(
-            event_id=data.event_id
-        )
-        if not has_vacancies:
-            raise EventSoldOutError(
-                "This registration failed because the event has sold out."
-            )
         new_attendee = AttendeeEntity(
             name=data.name,
             email=data.email,
@@ -78,73 +141,109 @@ class AttendeeService(AttendeeServiceInterface):
             attendee_id=None,
             checked_in_at=None,
         )
-        attendee_created = self.__repository.create(data=new_attendee)
+        status = self.__repository.register_in_event(data=new_attendee)
+        check_registration_status(status)
+        self.__event_service.invalidate_event(event_id=new_attendee.event_id)
+        return registered_attendee(new_attendee)
 
-        if attendee_created is None:
-            raise AttendeeNotCreatedError(
-                "An error ocurred while registering the attendee."
+    def import_attendees(self, event_id, records, batch_size=IMPORT_BATCH_SIZE):
+        if not self.__event_service.check_event_existence(event_id=event_id):
+            raise EventNotFoundError("The given event not exists.")
+        rows: list[AttendeeImportRowDTO] = []
+        seen_emails: set[str] = set()
+        created = 0
+        for batch in batched(enumerate(records, start=1), batch_size):
+            batch_rows: list[AttendeeImportRowDTO] = []
+            accepted: list[tuple[int, AttendeeEntity]] = []
+            for row, record in batch:
+                try:
+                    data = imported_registration(record, event_id)
+                except ValidationError as exc:
+                    email = record.get("email") if isinstance(record, dict) else None
+                    batch_rows.append(
+                        AttendeeImportRowDTO(
+                            row=row,
+                            status=AttendeeImportStatus.INVALID,
+                            email=email if isinstance(email, str) else None,
+                            error=str(exc),
+                        )
+                    )
+                    continue
+                if data.email in seen_emails:
+                    batch_rows.append(
+                        AttendeeImportRowDTO(
+                            row=row,
+                            status=AttendeeImportStatus.DUPLICATE,
+                            email=data.email,
+                            error="This email appears in an earlier row.",
+                        )
+                    )
+                    continue
+                seen_emails.add(data.email)
+                attendee = AttendeeEntity(
+                    attendee_id=None,
+                    name=data.name,
+                    email=data.email,
+                    event_id=event_id,
+                )
+                accepted.append((row, attendee))
+            statuses = self.__repository.register_batch(
+                event_id=event_id, attendees=[attendee for _, attendee in accepted]
             )
-        return AttendeeDTO(
-            attendee_id=attendee_created.id,
-            event_id=attendee_created.event_id,
-            email=attendee_created.email,
-            created_at=attendee_created.created_at,
-            name=attendee_created.name,
-            checked_in_at=None,
+            for (row, attendee), status in zip(accepted, statuses):
+                if status is AttendeeRegistrationStatus.EVENT_NOT_FOUND:
+                    raise EventNotFoundError("The given event not exists.")
+                batch_rows.append(
+                    AttendeeImportRowDTO(
+                        row=row,
+                        status=_IMPORT_STATUSES[status],
+                        email=attendee.email,
+                        attendee_id=(
+                            attendee.id
+                            if status is AttendeeRegistrationStatus.CREATED
+                            else None
+                        ),
+                    )
+                )
+            batch_created = statuses.count(AttendeeRegistrationStatus.CREATED)
+            if batch_created:
+                created += batch_created
+                self.__event_service.invalidate_event(event_id=event_id)
+            # Inside a request each batch is committed now, not with the response.
+            unit_of_work = UnitOfWork.current()
+            if unit_of_work is not None:
+                unit_of_work.commit()
+            rows.extend(sorted(batch_rows, key=lambda result: result.row))
+        return AttendeeImportReportDTO(
+            rows=rows, created=created, rejected=len(rows) - created
         )
 
-    @staticmethod
-    def __convert_entity_to_dto(attendee: AttendeeEntity) -> AttendeeDTO:
-        return AttendeeDTO(
-            attendee_id=attendee.id,
-            name=attendee.name,
-            email=attendee.email,
-            event_id=attendee.event_id,
-            created_at=attendee.created_at,
-            checked_in_at=attendee.checked_in_at,
+    def get_event_attendee_rows(
+        self, event_id, query, offset, limit=DEFAULT_PAGE_SIZE, after=None
+    ):
+        page = self.__repository.get_event_participant_rows(
+            event_id=event_id, offset=offset, query=query, limit=limit, after=after
         )
+        if page is None:
+            raise EventNotFoundError("The given event not exists.")
+        attendees, total = page
+        return AttendeePageDTO(attendees=attendees, total=total)
 
-    def get_event_attendees(self, event_id, query, offset):
-        event_exists = self.__event_service.check_event_existence(event_id=event_id)
-        if not event_exists:
+    def export_event_attendees(self, event_id):
+        # Checked now, so a missing event is still answered with a 404
+        # before the rows start to stream.
+        if not self.__event_service.check_event_existence(event_id=event_id):
             raise EventNotFoundError("The given event not exists.")
-        entity_participants = self.__repository.get_event_participants(
-            event_id=event_id, offset=offset, query=query
-        )
-        dto_participants = [
-            self.__convert_entity_to_dto(attendee=attendee)
-            for attendee in entity_participants
-        ]
-        return dto_participants
-
-    def get_attendee_data(self, attendee_id) -> AttendeeDTO | None:
-        attendee = self.__repository.get_attendee_by_id(attendee_id=attendee_id)
-        if attendee is None:
-            raise AttendeeNotFoundError("Attendee not found.")
-        return AttendeeDTO(
-            attendee_id=attendee.id,
-            checked_in_at=attendee.checked_in_at,
-            created_at=attendee.created_at,
-            email=attendee.email,
-            event_id=attendee.event_id,
-            name=attendee.name,
-        )
+        return self.__repository.stream_event_participant_rows(event_id=event_id)
 
     def get_attendee_event_credential(self, attendee_id):
-        attendee = self.__repository.get_attendee_by_id(attendee_id=attendee_id)
-        if attendee is None:
+        if self.__credential_cache is not None:
+            credential = self.__credential_cache.get(attendee_id)
+            if credential is not MISSING:
+                return credential
+        credential = self.__repository.get_attendee_credential(attendee_id=attendee_id)
+        if credential is None:
             raise AttendeeNotFoundError("Attendee not found.")
-        event_data = self.__event_service.get_event_data(event_id=attendee.event_id)
-        if event_data is None:
-            raise EventNotFoundError("The registered event was not found.")
-        return EventCredentialsDTO(
-            event_title=event_data.title,
-            email=attendee.email,
-            name=attendee.name,
-        )
-
-    def get_total_attendees_in_event(self, event_id: str, query: str) -> int:
-        total = self.__repository.get_total_event_participants(
-            event_id=event_id, query=query
-        )
-        return total
+        if self.__credential_cache is not None:
+            self.__credential_cache.set(attendee_id, credential)
+        return credential
@@ -1,11 +1,35 @@
 from abc import ABC, abstractmethod
 
-from src.modules.events.dtos.check_in import CheckInDTO
+from src.modules.events.dtos.check_in import (
+    CheckInBatchResultDTO,
+    CheckInBatchStatus,
+    CheckInDTO,
+    CheckInScanDTO,
+    CheckInStatus,
+)
 from src.modules.events.entities.check_in import CheckInEntity
 from src.modules.events.exc.attendee import AttendeeNotFoundError
 from src.modules.events.exc.check_in import AlreadyCheckedInError, CheckInNotRegistered
 from src.modules.events.repositories.check_in import CheckInRepositoryInterface
-from src.modules.events.services.attendee import AttendeeServiceInterface
+
+
+def check_in_outcome(
+    status: CheckInStatus, check_in_data: CheckInEntity | None
+) -> CheckInDTO:
+    """The DTO of a check-in that was made, else the error telling why not"""
+    if status is CheckInStatus.ATTENDEE_NOT_FOUND:
+        raise AttendeeNotFoundError(
+            "The given attendee is not registered in any event."
+        )
+    if status is CheckInStatus.ALREADY_CHECKED_IN:
+        raise AlreadyCheckedInError("Attendee has already made a check in.")
+    if not check_in_data:
+        raise CheckInNotRegistered("An error ocurred while making the checkin")
+    return CheckInDTO(
+        check_in_id=check_in_data.check_in_id,
+        created_at=check_in_data.created_at,
+        attendee_id=check_in_data.attendee_id,
+    )
 
 
 class CheckInServiceInterface(ABC):
@@ -13,25 +37,55 @@ class CheckInServiceInterface(ABC):
     def make_event_check_in(self, attendee_id: str) -> CheckInDTO | None:
         """Check-in the Attendee with the given id"""
 
+    @abstractmethod
+    def sync_check_ins(
+        self, scans: list[CheckInScanDTO]
+    ) -> list[CheckInBatchResultDTO]:
+        """Check-in the scans queued by a device, one result for each scan"""
+
 
 class CheckInService(CheckInServiceInterface):
-    def __init__(
-        self,
-        repository: CheckInRepositoryInterface,
-        attendee_service: AttendeeServiceInterface,
-    ):
+    def __init__(self, repository: CheckInRepositoryInterface):
         self.__repository = repository
-        self.__attendee_service = attendee_service
 
     def make_event_check_in(self, attendee_id) -> CheckInDTO | None:
-        attendee = self.__attendee_service.get_attendee_data(attendee_id=attendee_id)
-        if not attendee:
-            raise AttendeeNotFoundError(
-                "The given attendee is not registered in any event."
+        status, check_in_data = self.__repository.check_in_attendee(
+            attendee_id=attendee_id
+        )
+        return check_in_outcome(status, check_in_data)
+
+    def sync_check_ins(self, scans):
+        # Someone scanned twice while offline checked in at their first scan.
+        first_scans: dict[str, CheckInScanDTO] = {}
+        for scan in scans:
+            first = first_scans.get(scan.attendee_id)
+            if first is None or scan.scanned_at < first.scanned_at:
+                first_scans[scan.attendee_id] = scan
+        outcomes = dict(
+            zip(
+                first_scans,
+                self.__repository.check_in_scans(scans=list(first_scans.values())),
+            )
+        )
+        results = []
+        for scan in scans:
+            status, check_in_data = outcomes[scan.attendee_id]
+            created = status is CheckInStatus.CREATED and (
+                first_scans[scan.attendee_id] is scan
+            )
+            if status is CheckInStatus.ATTENDEE_NOT_FOUND:
+                batch_status = CheckInBatchStatus.UNKNOWN
+            elif created:
+                batch_status = CheckInBatchStatus.CREATED
+            else:
+                batch_status = CheckInBatchStatus.DUPLICATE
+            results.append(
+                CheckInBatchResultDTO(
+                    attendee_id=scan.attendee_id,
+                    device_id=scan.device_id,
+                    status=batch_status,
+                    check_in_id=check_in_data.check_in_id if created else None,
+                    checked_in_at=check_in_data.created_at if created else None,
+                )
             )
-        if attendee.checked_in_at is not None:
-            raise AlreadyCheckedInError("Attendee has already made a check in.")
-        check_in_data = self.__repository.register_check_in(attendee_id=attendee_id)
-        if not check_in_data:
-            raise CheckInNotRegistered("An error ocurred while making the checkin")
-        return check_in_data
+        return results
@@ -3,11 +3,14 @@ This module is responsible to contain all business logic related to the event.
 """
 
 from abc import ABC, abstractmethod
+from datetime import datetime
 
 from src.modules.events.dtos.event import (
     EventDTO,
     EventDTOWithAmount,
     EventRegistrationDTO,
+    EventRow,
+    EventVersionDTO,
 )
 from src.modules.events.entities.event import EventEntity
 
@@ -17,6 +20,7 @@ from src.modules.events.exc.event import (
 )
 
 from src.modules.events.repositories.event import EventRepositoryInterface
+from src.utils.pagination import DEFAULT_PAGE_SIZE
 
 
 class EventServiceInterface(ABC):
@@ -33,16 +37,26 @@ class EventServiceInterface(ABC):
         """Check if the event with the given id exists"""
 
     @abstractmethod
-    def check_attendee_in_event(self, attendee_email: str, event_id: str) -> bool:
-        """Check if the attendee is registered in the event"""
+    def list_event_rows(
+        self,
+        offset: int,
+        query: str,
+        limit: int = DEFAULT_PAGE_SIZE,
+        after: tuple[datetime, str] | None = None,
+    ) -> list[EventRow]:
+        """Retrieve a page of events ordered by the creation Date"""
 
     @abstractmethod
-    def evaluate_event_capacity(self, event_id: str) -> bool:
-        """Evaluate if the event with the given id has available vacancies"""
+    def get_events_version(self) -> EventVersionDTO | None:
+        """Retrieve the marker that changes whenever the event listing changes"""
 
     @abstractmethod
-    def list_events(self, offset: int, query: str) -> list[EventDTO]:
-        """Retrieve the first 10 events ordered by the creation Date"""
+    def get_event_version(self, event_id: str) -> EventVersionDTO | None:
+        """Retrieve the marker that changes whenever the event or its attendees change"""
+
+    @abstractmethod
+    def invalidate_event(self, event_id: str):
+        """Signal that the event or its attendees changed"""
 
 
 class EventService(EventServiceInterface):
@@ -64,6 +78,8 @@ class EventService(EventServiceInterface):
         created_entity = self.__repository.create(data=new_event)
         if created_entity is None:
             raise EventNotCreatedError("An error ocurred while creating the event.")
+        # The existence check above may have cached the id as unknown.
+        self.__repository.invalidate_event(event_id=created_entity.id)
 
         return EventDTO(
             title=created_entity.title,
@@ -80,24 +96,16 @@ class EventService(EventServiceInterface):
     def check_event_existence(self, event_id):
         return self.__repository.check_event_existence(event_id=event_id)
 
-    def evaluate_event_capacity(self, event_id):
-        return self.__repository.check_event_capacity(event_id=event_id)
+    def get_events_version(self):
+        return self.__repository.get_events_version()
 
-    def check_attendee_in_event(self, attendee_email, event_id):
-        return self.__repository.check_participant_existence(
-            attendee_email=attendee_email, event_id=event_id
-        )
+    def get_event_version(self, event_id):
+        return self.__repository.get_event_version(event_id=event_id)
 
-    def __from_entity_to_dto(self, entity: EventEntity) -> EventDTO:
-        return EventDTO(
-            title=entity.title,
-            details=entity.details,
-            event_id=entity.id,
-            slug=entity.slug,
-            maximum_attendees=entity.maximum_attendees,
-            created_at=entity.created_at,
-        )
+    def invalidate_event(self, event_id):
+        self.__repository.invalidate_event(event_id=event_id)
 
-    def list_events(self, offset, query):
-        event_list = self.__repository.load_events_list(offset=offset, query=query)
-        return [self.__from_entity_to_dto(event) for event in event_list]
+    def list_event_rows(self, offset, query, limit=DEFAULT_PAGE_SIZE, after=None):
+        return self.__repository.load_event_rows(
+            offset=offset, query=query, limit=limit, after=after
+        )
@@ -0,0 +1,95 @@
+import asyncio
+from datetime import datetime
+from unittest.mock import AsyncMock
+
+from pytest import raises
+from src.modules.events.dtos.attendee import (
+    AttendeeDTO,
+    AttendeeRegistrationDTO,
+    AttendeeRegistrationStatus,
+)
+from src.modules.events.dtos.check_in import CheckInStatus
+from src.modules.events.dtos.event_credentials import EventCredentialsDTO
+from src.modules.events.entities.check_in import CheckInEntity
+from src.modules.events.exc.attendee import (
+    AttendeeAlreadyExistsError,
+    AttendeeNotFoundError,
+)
+from src.modules.events.exc.check_in import AlreadyCheckedInError
+from src.modules.events.exc.event import EventNotFoundError, EventSoldOutError
+from src.modules.events.repositories.async_attendee import (
+    AsyncAttendeeRepositoryInterface,
+)
+from src.modules.events.repositories.async_check_in import (
+    AsyncCheckInRepositoryInterface,
+)
+from src.modules.events.services.async_attendee import AsyncAttendeeService
+from src.modules.events.services.async_check_in import AsyncCheckInService
+from src.utils.cache import TTLCache
+
+
+class TestAsyncAttendeeService:
+    def setup_method(self):
+        self.repository = AsyncMock(spec=AsyncAttendeeRepositoryInterface)
+        self.registration = AttendeeRegistrationDTO(
+            name="Ada Lovelace", email="ada@gmail.com", event_id="ev-1"
+        )
+
+    def test_register_attendee(self):
+        self.repository.register_in_event.return_value = (
+            AttendeeRegistrationStatus.CREATED
+        )
+        service = AsyncAttendeeService(repository=self.repository)
+        result = asyncio.run(service.register_attendee_in_event(self.registration))
+        assert isinstance(result, AttendeeDTO)
+        assert (result.name, result.event_id) == ("Ada Lovelace", "ev-1")
+        self.repository.register_in_event.assert_awaited_once()
+
+    def test_register_attendee_follows_the_blocking_rules(self):
+        service = AsyncAttendeeService(repository=self.repository)
+        for status, error in (
+            (AttendeeRegistrationStatus.EVENT_NOT_FOUND, EventNotFoundError),
+            (AttendeeRegistrationStatus.ALREADY_REGISTERED, AttendeeAlreadyExistsError),
+            (AttendeeRegistrationStatus.SOLD_OUT, EventSoldOutError),
+        ):
+            self.repository.register_in_event.return_value = status
+            with raises(error):
+                asyncio.run(service.register_attendee_in_event(self.registration))
+
+    def test_participants_of_a_missing_event(self):
+        self.repository.get_event_participant_rows.return_value = None
+        service = AsyncAttendeeService(repository=self.repository)
+        with raises(EventNotFoundError):
+            asyncio.run(service.get_event_attendee_rows("ev-1", query="", offset=0))
+
+    def test_credential_is_cached(self):
+        credential = EventCredentialsDTO(
+            event_title="PyCon", name="Ada", email="ada@gmail.com"
+        )
+        self.repository.get_attendee_credential.side_effect = [credential, None]
+        service = AsyncAttendeeService(
+            repository=self.repository, credential_cache=TTLCache(8, ttl=60)
+        )
+        assert asyncio.run(service.get_attendee_event_credential("a-1")) is credential
+        assert asyncio.run(service.get_attendee_event_credential("a-1")) is credential
+        with raises(AttendeeNotFoundError):
+            asyncio.run(service.get_attendee_event_credential("a-2"))
+        assert self.repository.get_attendee_credential.await_count == 2
+
+
+class TestAsyncCheckInService:
+    def test_check_in_outcomes(self):
+        repository = AsyncMock(spec=AsyncCheckInRepositoryInterface)
+        check_in = CheckInEntity(
+            attendee_id="1", created_at=datetime.now(), check_in_id="good_id"
+        )
+        service = AsyncCheckInService(repository=repository)
+        repository.check_in_attendee.return_value = (CheckInStatus.CREATED, check_in)
+        result = asyncio.run(service.make_event_check_in(attendee_id="1"))
+        assert result.check_in_id == "good_id"
+        repository.check_in_attendee.return_value = (
+            CheckInStatus.ALREADY_CHECKED_IN,
+            None,
+        )
+        with raises(AlreadyCheckedInError):
+            asyncio.run(service.make_event_check_in(attendee_id="1"))
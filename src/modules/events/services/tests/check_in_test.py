@@ -1,110 +1,99 @@
 from datetime import datetime
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock
 
 from pytest import raises
-from src.modules.events.dtos.attendee import AttendeeDTO
-from src.modules.events.dtos.check_in import CheckInDTO
-from src.modules.events.services.check_in import CheckInEntity
+from src.modules.events.dtos.check_in import (
+    CheckInBatchStatus,
+    CheckInDTO,
+    CheckInScanDTO,
+    CheckInStatus,
+)
+from src.modules.events.entities.check_in import CheckInEntity
 from src.modules.events.exc.attendee import AttendeeNotFoundError
 from src.modules.events.exc.check_in import AlreadyCheckedInError, CheckInNotRegistered
 from src.modules.events.repositories.check_in import CheckInRepositoryInterface
-from src.modules.events.services.attendee import AttendeeServiceInterface
 from src.modules.events.services.check_in import CheckInService
 
 
 class TestCheckInRegistration:
     def setup_method(self):
         self.repository = MagicMock(spec=CheckInRepositoryInterface)
-        self.service = MagicMock(spec=AttendeeServiceInterface)
-        self.check_in_result = CheckInDTO(
-            attendee_id="1", created_at=datetime.now(), check_in_id="good_id"
-        )
         self.check_in_entity = CheckInEntity(
             attendee_id="1", created_at=datetime.now(), check_in_id="good_id"
         )
 
     def test_check_in(self):
-        with patch(
-            "src.modules.events.services.check_in.CheckInEntity",
-            return_value=self.check_in_entity,
-        ):
-            self.repository.register_check_in.return_value = self.check_in_result
-            self.service.get_attendee_data.return_value = AttendeeDTO(
-                checked_in_at=None,
-                attendee_id="1",
-                event_id="2",
-                created_at=datetime.now(),
-                email="test@gmail.com",
-                name="test",
-            )
-            service = CheckInService(
-                repository=self.repository, attendee_service=self.service
-            )
-            result = service.make_event_check_in(attendee_id="1")
-            assert result.attendee_id == self.check_in_result.attendee_id
-            assert result.check_in_id == self.check_in_result.check_in_id
-            assert result.created_at == self.check_in_result.created_at
-            self.repository.register_check_in.assert_called_once_with(attendee_id="1")
-            self.service.get_attendee_data.assert_called_once_with(attendee_id="1")
+        self.repository.check_in_attendee.return_value = (
+            CheckInStatus.CREATED,
+            self.check_in_entity,
+        )
+        service = CheckInService(repository=self.repository)
+        result = service.make_event_check_in(attendee_id="1")
+        assert isinstance(result, CheckInDTO)
+        assert result.attendee_id == self.check_in_entity.attendee_id
+        assert result.check_in_id == self.check_in_entity.check_in_id
+        assert result.created_at == self.check_in_entity.created_at
+        self.repository.check_in_attendee.assert_called_once_with(attendee_id="1")
 
     def test_check_in_attendee_not_found(self):
-        with patch(
-            "src.modules.events.services.check_in.CheckInEntity",
-            return_value=self.check_in_entity,
-        ):
-            self.service.get_attendee_data.return_value = None
-            service = CheckInService(
-                repository=self.repository, attendee_service=self.service
-            )
-            with raises(AttendeeNotFoundError) as exc:
-                service.make_event_check_in(attendee_id="1")
-            self.repository.register_check_in.assert_not_called()
-            self.service.get_attendee_data.assert_called_once_with(attendee_id="1")
-            assert (
-                str(exc.value) == "The given attendee is not registered in any event."
-            )
+        self.repository.check_in_attendee.return_value = (
+            CheckInStatus.ATTENDEE_NOT_FOUND,
+            None,
+        )
+        service = CheckInService(repository=self.repository)
+        with raises(AttendeeNotFoundError) as exc:
+            service.make_event_check_in(attendee_id="1")
+        self.repository.check_in_attendee.assert_called_once_with(attendee_id="1")
+        assert str(exc.value) == "The given attendee is not registered in any event."
 
     def test_check_in_attendee_checked_in(self):
-        with patch(
-            "src.modules.events.services.check_in.CheckInEntity",
-            return_value=self.check_in_entity,
-        ):
-            self.service.get_attendee_data.return_value = AttendeeDTO(
-                checked_in_at=datetime.now(),
-                attendee_id="1",
-                event_id="2",
-                created_at=datetime.now(),
-                email="test@gmail.com",
-                name="test",
-            )
-            service = CheckInService(
-                repository=self.repository, attendee_service=self.service
-            )
-            with raises(AlreadyCheckedInError) as exc:
-                service.make_event_check_in(attendee_id="1")
-            self.repository.register_check_in.assert_not_called()
-            self.service.get_attendee_data.assert_called_once_with(attendee_id="1")
-            assert str(exc.value) == "Attendee has already made a check in."
+        self.repository.check_in_attendee.return_value = (
+            CheckInStatus.ALREADY_CHECKED_IN,
+            None,
+        )
+        service = CheckInService(repository=self.repository)
+        with raises(AlreadyCheckedInError) as exc:
+            service.make_event_check_in(attendee_id="1")
+        self.repository.check_in_attendee.assert_called_once_with(attendee_id="1")
+        assert str(exc.value) == "Attendee has already made a check in."
 
     def test_check_in_attendee_not_registered(self):
-        with patch(
-            "src.modules.events.services.check_in.CheckInEntity",
-            return_value=self.check_in_entity,
-        ):
-            self.repository.register_check_in.return_value = None
-            self.service.get_attendee_data.return_value = AttendeeDTO(
-                checked_in_at=None,
-                attendee_id="1",
-                event_id="2",
-                created_at=datetime.now(),
-                email="test@gmail.com",
-                name="test",
-            )
-            service = CheckInService(
-                repository=self.repository, attendee_service=self.service
-            )
-            with raises(CheckInNotRegistered) as exc:
-                service.make_event_check_in(attendee_id="1")
-            self.repository.register_check_in.assert_called_once()
-            self.service.get_attendee_data.assert_called_once_with(attendee_id="1")
-            assert str(exc.value) == "An error ocurred while making the checkin"
+        self.repository.check_in_attendee.return_value = (CheckInStatus.CREATED, None)
+        service = CheckInService(repository=self.repository)
+        with raises(CheckInNotRegistered) as exc:
+            service.make_event_check_in(attendee_id="1")
+        self.repository.check_in_attendee.assert_called_once()
+        assert str(exc.value) == "An error ocurred while making the checkin"
+
+
+class TestCheckInSync:
+    def setup_method(self):
+        self.repository = MagicMock(spec=CheckInRepositoryInterface)
+        self.service = CheckInService(repository=self.repository)
+
+    def test_sync_keeps_the_first_scan(self):
+        early, late = datetime(2024, 5, 1, 8), datetime(2024, 5, 1, 9)
+        scans = [
+            CheckInScanDTO(attendee_id="1", scanned_at=late, device_id="door-1"),
+            CheckInScanDTO(attendee_id="1", scanned_at=early, device_id="door-2"),
+            CheckInScanDTO(attendee_id="2", scanned_at=early, device_id="door-1"),
+            CheckInScanDTO(attendee_id="3", scanned_at=early, device_id="door-1"),
+        ]
+        self.repository.check_in_scans.return_value = [
+            (CheckInStatus.CREATED, CheckInEntity(7, "1", early)),
+            (CheckInStatus.ALREADY_CHECKED_IN, None),
+            (CheckInStatus.ATTENDEE_NOT_FOUND, None),
+        ]
+        results = self.service.sync_check_ins(scans=scans)
+        self.repository.check_in_scans.assert_called_once_with(
+            scans=[scans[1], scans[2], scans[3]]
+        )
+        assert [result.status for result in results] == [
+            CheckInBatchStatus.DUPLICATE,
+            CheckInBatchStatus.CREATED,
+            CheckInBatchStatus.DUPLICATE,
+            CheckInBatchStatus.UNKNOWN,
+        ]
+        assert (results[1].check_in_id, results[1].checked_in_at) == (7, early)
+        assert results[1].device_id == "door-2"
+        assert results[0].check_in_id is None
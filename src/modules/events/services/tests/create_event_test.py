@@ -36,6 +36,9 @@ class TestEventCreation:
                 event_id=self.new_event.id
             )
             self.repository.create.assert_called_once_with(data=self.new_event)
+            self.repository.invalidate_event.assert_called_once_with(
+                event_id=new_event.id
+            )
             assert issubclass(EventService, EventServiceInterface)
             assert created_event.event_id == new_event.id
             assert created_event.title == new_event.title
@@ -71,4 +74,5 @@ class TestEventCreation:
                 event_id=self.new_event.id
             )
             self.repository.create.assert_not_called()
+            self.repository.invalidate_event.assert_not_called()
             assert str(exc.value) == "This event is already registered."
@@ -0,0 +1,101 @@
+from unittest.mock import MagicMock
+
+from pytest import raises
+
+from src.drivers.database.unit_of_work import UnitOfWork
+from src.modules.events.dtos.attendee import (
+    AttendeeImportStatus,
+    AttendeeRegistrationStatus,
+)
+from src.modules.events.exc.event import EventNotFoundError
+from src.modules.events.repositories.attendee import AttendeeRepositoryInterface
+from src.modules.events.services.attendee import AttendeeService
+from src.modules.events.services.event import EventServiceInterface
+from src.utils.records import read_csv, read_ndjson
+
+
+def register_all_but(*refused_emails):
+    def register_batch(event_id, attendees):
+        return [
+            (
+                AttendeeRegistrationStatus.SOLD_OUT
+                if attendee.email in refused_emails
+                else AttendeeRegistrationStatus.CREATED
+            )
+            for attendee in attendees
+        ]
+
+    return register_batch
+
+
+class TestAttendeeImport:
+    def setup_method(self):
+        self.repository = MagicMock(spec=AttendeeRepositoryInterface)
+        self.event_service = MagicMock(spec=EventServiceInterface)
+        self.event_service.check_event_existence.return_value = True
+        self.service = AttendeeService(
+            repository=self.repository, event_service=self.event_service
+        )
+
+    def test_import_reports_every_row(self):
+        self.repository.register_batch.side_effect = register_all_but("c@gmail.com")
+        records = read_ndjson(
+            [
+                b'{"name": "Ada Lovelace", "email": "a@gmail.com"}\n',
+                b'{"name": "Ada Lovelace", "email": "a@gmail.com"}\n',
+                b"\n",
+                b'{"name": "X", "email": "b@gmail.com"}\n',
+                b"not json\n",
+                b'{"name": "Grace Hopper", "email": "c@gmail.com"}\n',
+            ]
+        )
+        report = self.service.import_attendees(
+            event_id="ev-1", records=records, batch_size=2
+        )
+        assert [(row.row, row.status) for row in report.rows] == [
+            (1, AttendeeImportStatus.CREATED),
+            (2, AttendeeImportStatus.DUPLICATE),
+            (3, AttendeeImportStatus.INVALID),
+            (4, AttendeeImportStatus.INVALID),
+            (5, AttendeeImportStatus.SOLD_OUT),
+        ]
+        assert report.rows[0].attendee_id is not None
+        assert report.rows[2].error == "The name is invalid."
+        assert (report.created, report.rejected) == (1, 4)
+        assert self.repository.register_batch.call_count == 3
+        self.event_service.invalidate_event.assert_called_once_with(event_id="ev-1")
+
+    def test_import_reads_csv_rows(self):
+        self.repository.register_batch.side_effect = register_all_but()
+        records = read_csv(
+            [b"Name,Email\r\n", b"Ada Lovelace, a@gmail.com\r\n", b"Grace,x,y\r\n"]
+        )
+        report = self.service.import_attendees(event_id="ev-1", records=records)
+        assert [row.status for row in report.rows] == [
+            AttendeeImportStatus.CREATED,
+            AttendeeImportStatus.INVALID,
+        ]
+        assert report.rows[0].email == "a@gmail.com"
+
+    def test_import_commits_every_batch(self):
+        committed = []
+
+        def register_batch(event_id, attendees):
+            # The previous batches are committed before this one is written.
+            assert len(committed) == self.repository.register_batch.call_count - 1
+            UnitOfWork.current().after_commit(lambda: committed.append(len(attendees)))
+            return register_all_but()(event_id, attendees)
+
+        self.repository.register_batch.side_effect = register_batch
+        records = [{"name": "Ada Lovelace", "email": f"{n}@gmail.com"} for n in "abc"]
+        with UnitOfWork(MagicMock()):
+            self.service.import_attendees(
+                event_id="ev-1", records=records, batch_size=2
+            )
+            assert committed == [2, 1]
+
+    def test_import_in_a_missing_event(self):
+        self.event_service.check_event_existence.return_value = False
+        with raises(EventNotFoundError):
+            self.service.import_attendees(event_id="ev-1", records=iter([]))
+        self.repository.register_batch.assert_not_called()
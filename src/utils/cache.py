@@ -0,0 +1,96 @@
+"""
+### Cache
+This module contains an in-process cache with LRU eviction and expiring entries.
+
+Classes:
+
+    CacheStats
+    TTLCache
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Hashable
+
+MISSING = object()
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """Counters of a cache since it was created or cleared"""
+
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+
+
+class TTLCache:
+    """
+    A thread-safe mapping bounded to 'max_size' entries, evicting the least
+    recently used one, where every entry expires 'ttl' seconds after it is set.
+    """
+
+    def __init__(
+        self,
+        max_size: int,
+        ttl: float,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if max_size < 1:
+            raise ValueError("The cache size should be at least 1.")
+        self.__max_size = max_size
+        self.__ttl = ttl
+        self.__clock = clock
+        self.__entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self.__lock = threading.Lock()
+        self.__hits = 0
+        self.__misses = 0
+        self.__evictions = 0
+
+    def get(self, key: Hashable) -> Any:
+        """Return the cached value, or MISSING when absent or expired"""
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at > self.__clock():
+                    self.__entries.move_to_end(key)
+                    self.__hits += 1
+                    return value
+                del self.__entries[key]
+            self.__misses += 1
+            return MISSING
+
+    def set(self, key: Hashable, value: Any, ttl: float | None = None):
+        """Store a value for 'ttl' seconds, or the cache default"""
+        expires_at = self.__clock() + (self.__ttl if ttl is None else ttl)
+        with self.__lock:
+            self.__entries[key] = (expires_at, value)
+            self.__entries.move_to_end(key)
+            while len(self.__entries) > self.__max_size:
+                self.__entries.popitem(last=False)
+                self.__evictions += 1
+
+    def invalidate(self, key: Hashable):
+        """Forget the value stored for the key, if any"""
+        with self.__lock:
+            self.__entries.pop(key, None)
+
+    def clear(self):
+        """Forget every value and reset the counters"""
+        with self.__lock:
+            self.__entries.clear()
+            self.__hits = self.__misses = self.__evictions = 0
+
+    def stats(self) -> CacheStats:
+        """Read the hit, miss and eviction counters"""
+        with self.__lock:
+            return CacheStats(
+                hits=self.__hits,
+                misses=self.__misses,
+                evictions=self.__evictions,
+                size=len(self.__entries),
+            )
@@ -0,0 +1,101 @@
+"""
+### HTTP Cache
+This module contains helpers for the validators of conditional requests.
+
+Functions:
+
+    strong_etag(payload:dict)->str
+    version_etag(version:int, *parts)->str
+    etag_matches(if_none_match:str|None, etag:str)->bool
+    http_date(moment:datetime)->str
+    is_not_modified(if_none_match, if_modified_since, etag, last_modified)->bool
+"""
+
+import hashlib
+import json
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+
+
+def strong_etag(payload: dict) -> str:
+    """
+    This function builds a strong entity tag from the content of a response.
+    Parameters:
+        payload (dict): The JSON serializable body of the response
+    Returns: etag (str) : A quoted tag that changes whenever the body changes
+    """
+    raw = json.dumps(payload, default=str, sort_keys=True, separators=(",", ":"))
+    return f'"{hashlib.sha256(raw.encode()).hexdigest()[:32]}"'
+
+
+def version_etag(version: int, *parts) -> str:
+    """
+    This function builds a weak entity tag from a change marker, without the body.
+    Parameters:
+        version (int): The marker of the data behind the response
+        parts: Whatever else shapes the response, e.g. the path and query
+    Returns: etag (str) : A weak tag, the same body may be encoded differently
+    """
+    raw = json.dumps([version, *parts], default=str, separators=(",", ":"))
+    return f'W/"{hashlib.sha256(raw.encode()).hexdigest()[:32]}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """
+    This function checks an If-None-Match header against the current tag.
+    Parameters:
+        if_none_match (str | None): The header sent by the client, if any
+        etag (str): The tag of the current representation
+    Returns: matches (bool) : True when the client copy is still valid
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    # If-None-Match compares weakly: a W/ prefix does not prevent a match.
+    candidates = (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+    return etag.removeprefix("W/") in candidates
+
+
+def http_date(moment: datetime) -> str:
+    """
+    This function formats a timestamp for the Last-Modified header.
+    Parameters:
+        moment (datetime): A timestamp, naive values are taken as UTC
+    Returns: date (str) : The IMF-fixdate, e.g. 'Sun, 06 Nov 1994 08:49:37 GMT'
+    """
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return format_datetime(moment.astimezone(timezone.utc), usegmt=True)
+
+
+def is_not_modified(
+    if_none_match: str | None,
+    if_modified_since: str | None,
+    etag: str,
+    last_modified: datetime,
+) -> bool:
+    """
+    This function evaluates the validators of a conditional GET.
+    Parameters:
+        if_none_match (str | None): The If-None-Match header, if any
+        if_modified_since (str | None): The If-Modified-Since header, if any
+        etag (str): The tag of the current representation
+        last_modified (datetime): When the current representation last changed
+    Returns: not_modified (bool) : True when a 304 should be sent instead
+    """
+    # If-Modified-Since is ignored whenever If-None-Match is sent (RFC 9110).
+    if if_none_match:
+        return etag_matches(if_none_match, etag)
+    if not if_modified_since:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=timezone.utc)
+    if last_modified.tzinfo is None:
+        last_modified = last_modified.replace(tzinfo=timezone.utc)
+    # The header has a resolution of one second.
+    return last_modified.replace(microsecond=0) <= since
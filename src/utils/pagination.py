@@ -0,0 +1,59 @@
+"""
+### Pagination
+This module contains helpers for the keyset (cursor) pagination of the listings.
+
+Functions:
+
+    encode_cursor(*values)->str
+    decode_cursor(cursor:str, size:int)->tuple
+    parse_page_size(limit)->int
+"""
+
+import base64
+import binascii
+import json
+
+DEFAULT_PAGE_SIZE = 10
+MAX_PAGE_SIZE = 100
+
+
+def encode_cursor(*values) -> str:
+    """
+    This function builds an opaque cursor from the sort key of the last row of a page.
+    Parameters:
+        values: The sort key values, e.g. (created_at, id)
+    Returns: cursor (str) : An url-safe token to be sent back by the client
+    """
+    raw = json.dumps(values, default=str, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, size: int) -> tuple:
+    """
+    This function restores the sort key values encoded in a cursor.
+    Parameters:
+        cursor (str): The token received from the client
+        size (int): The amount of values expected in the sort key
+    Returns: values (tuple) : The sort key values
+    Raises: ValueError when the cursor is malformed
+    """
+    try:
+        padding = "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(cursor + padding))
+    except (binascii.Error, UnicodeDecodeError, json.JSONDecodeError) as exc:
+        raise ValueError("You provided an invalid cursor.") from exc
+    if not isinstance(values, list) or len(values) != size:
+        raise ValueError("You provided an invalid cursor.")
+    return tuple(values)
+
+
+def parse_page_size(limit) -> int:
+    """
+    This function reads the page size asked by the client, capped by the server.
+    Parameters:
+        limit: The raw 'limit' parameter
+    Returns: page_size (int) : A value between 1 and MAX_PAGE_SIZE
+    """
+    if not str(limit).isdigit() or int(limit) < 1:
+        return DEFAULT_PAGE_SIZE
+    return min(int(limit), MAX_PAGE_SIZE)
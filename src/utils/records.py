@@ -0,0 +1,151 @@
+"""
+### Records
+This module reads the records of an uploaded body one at a time, and
+writes the records of a streamed body one batch at a time, so the body is
+never held in memory whatever its size.
+
+A record that cannot be read (a line that is not a JSON object, a CSV row
+with more fields than its header) comes out as None, for the caller to
+report it without stopping the upload.
+
+Functions:
+
+    stream_lines(stream: BinaryIO, chunk_size: int) -> Iterator[bytes]
+    read_ndjson(lines: Iterable[bytes]) -> Iterator[dict | None]
+    read_csv(lines: Iterable[bytes]) -> Iterator[dict | None]
+    record_reader(content_type: str) -> Callable | None
+    write_ndjson(batches: Iterable[list[dict]], dumps: Callable) -> Iterator[bytes]
+    write_csv(columns: Sequence[str], batches: Iterable[list[dict]]) -> Iterator[bytes]
+"""
+
+import codecs
+import csv
+import io
+from datetime import date, datetime, time
+from json import JSONDecodeError, loads
+from typing import Any, BinaryIO, Callable, Iterable, Iterator, Sequence
+
+CHUNK_SIZE = 64 * 1024
+
+
+def stream_lines(stream: BinaryIO, chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+    """
+    The lines of a binary stream with their line endings, read by chunks:
+    iterating a WSGI input stream directly reads it one byte at a time.
+    Parameters:
+        stream (BinaryIO): The stream to read until its end
+        chunk_size (int): The amount of bytes read at once
+    Returns: lines (Iterator[bytes]): The lines, the last one maybe unterminated
+    """
+    pending = b""
+    while chunk := stream.read(chunk_size):
+        lines = (pending + chunk).split(b"\n")
+        pending = lines.pop()
+        for line in lines:
+            yield line + b"\n"
+    if pending:
+        yield pending
+
+
+def read_ndjson(lines: Iterable[bytes]) -> Iterator[dict | None]:
+    """
+    One record per non blank line of newline delimited JSON.
+    Parameters:
+        lines (Iterable[bytes]): The lines of the body, e.g. from stream_lines
+    Returns: records (Iterator[dict | None]): The JSON objects, None for the others
+    """
+    for line in lines:
+        if not line.strip():
+            continue
+        try:
+            record = loads(line)
+        except (JSONDecodeError, UnicodeDecodeError):
+            yield None
+            continue
+        yield record if isinstance(record, dict) else None
+
+
+def read_csv(lines: Iterable[bytes]) -> Iterator[dict | None]:
+    """
+    One record per row of a CSV body whose first row names the columns.
+    Parameters:
+        lines (Iterable[bytes]): The lines of the body, e.g. from stream_lines
+    Returns: records (Iterator[dict | None]): The rows by column name, None
+        for the rows with more fields than the header
+    Raises: ValueError when the body has no header row
+    """
+    text = codecs.iterdecode(lines, "utf-8-sig", errors="replace")
+    reader = csv.DictReader(text)
+    if not reader.fieldnames:
+        raise ValueError("The CSV body should start with a header row.")
+    reader.fieldnames = [name.strip().lower() for name in reader.fieldnames]
+    for row in reader:
+        if None in row:
+            yield None
+            continue
+        yield {name: value.strip() if value else value for name, value in row.items()}
+
+
+_READERS: dict[str, Callable[[Iterable[bytes]], Iterator[dict | None]]] = {
+    "application/x-ndjson": read_ndjson,
+    "application/ndjson": read_ndjson,
+    "application/jsonl": read_ndjson,
+    "text/csv": read_csv,
+}
+
+
+def record_reader(
+    content_type: str,
+) -> Callable[[Iterable[bytes]], Iterator[dict | None]] | None:
+    """The reader of a body by its media type, None when it is not supported"""
+    return _READERS.get(content_type.split(";")[0].strip().lower())
+
+
+def write_ndjson(
+    batches: Iterable[list[dict]], dumps: Callable[[Any], bytes]
+) -> Iterator[bytes]:
+    """
+    Newline delimited JSON, one chunk per batch of records.
+    Parameters:
+        batches (Iterable[list[dict]]): The records, read a batch at a time
+        dumps (Callable): Serializes a record to bytes, without a line ending
+    Returns: chunks (Iterator[bytes]): The lines of each batch
+    """
+    for batch in batches:
+        if batch:
+            yield b"\n".join(map(dumps, batch)) + b"\n"
+
+
+def _csv_value(value: Any) -> Any:
+    if value is None:
+        return ""
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    return value
+
+
+def write_csv(columns: Sequence[str], batches: Iterable[list[dict]]) -> Iterator[bytes]:
+    """
+    CSV whose first row names the columns, readable again by read_csv.
+    Parameters:
+        columns (Sequence[str]): The keys of the records written, in order
+        batches (Iterable[list[dict]]): The records, read a batch at a time
+    Returns: chunks (Iterator[bytes]): The header row, then one chunk per batch
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    def flush() -> bytes:
+        chunk = buffer.getvalue().encode()
+        buffer.seek(0)
+        buffer.truncate()
+        return chunk
+
+    writer.writerow(columns)
+    yield flush()
+    for batch in batches:
+        if batch:
+            writer.writerows(
+                [_csv_value(record[column]) for column in columns] for record in batch
+            )
+            yield flush()
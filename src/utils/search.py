@@ -0,0 +1,34 @@
+"""
+### Search
+This module contains helpers to turn the user search input into safe patterns.
+
+Functions:
+
+    escape_like(query:str)->str
+    fts_phrase(query:str)->str|None
+"""
+
+# The trigram tokenizer cannot match anything shorter than one trigram.
+MINIMUM_FTS_QUERY_LENGTH = 3
+
+
+def escape_like(query: str) -> str:
+    """
+    This function escapes the LIKE wildcards of a given input, to be used with ESCAPE '\\'.
+    Parameters:
+        query (str): The raw search input
+    Returns: escaped (str) : The input matching itself literally
+    """
+    return query.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def fts_phrase(query: str) -> str | None:
+    """
+    This function quotes a given input as a full-text phrase for the trigram index.
+    Parameters:
+        query (str): The raw search input
+    Returns: phrase (str | None) : The MATCH expression, or None when the input is too short
+    """
+    if len(query) < MINIMUM_FTS_QUERY_LENGTH:
+        return None
+    return '"' + query.replace('"', '""') + '"'